@@ -37,11 +37,12 @@ from tests.auxil.slots import mro_slots
 
 # Define the namespace for type resolution. This helps dealing with the internal imports that
 # we do in many places
-# The .copy() is important to avoid modifying the original namespace
-TG_NAMESPACE = vars(telegram).copy()
+# The public names of telegram and telegram.ext are imported lazily, so we use dir() instead of
+# vars(), which also avoids modifying the original namespace
+TG_NAMESPACE = {name: getattr(telegram, name) for name in dir(telegram)}
 TG_NAMESPACE.update(vars(telegram._utils.types))
 TG_NAMESPACE.update(vars(telegram._utils.defaultvalue))
-TG_NAMESPACE.update(vars(telegram.ext))
+TG_NAMESPACE.update({name: getattr(telegram.ext, name) for name in dir(telegram.ext)})
 TG_NAMESPACE.update(vars(telegram.ext._utils.types))
 TG_NAMESPACE.update(vars(telegram.ext._applicationbuilder))
 TG_NAMESPACE.update({"socket": socket, "APSJob": APSJob})
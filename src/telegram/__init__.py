@@ -212,6 +212,7 @@ __all__ = (
     "MessageOriginUser",
     "MessageReactionCountUpdated",
     "MessageReactionUpdated",
+    "MessageTemplate",
     "OrderInfo",
     "OwnedGift",
     "OwnedGiftRegular",
@@ -340,336 +341,696 @@ __all__ = (
     "error",
     "helpers",
     "request",
+    "set_interning",
+    "warmup",
     "warnings",
 )
 
 __lazy_modules__: list[str] = ["constants", "error", "helpers", "request", "warnings"]
 
-from . import _version, constants, error, helpers, request, warnings
-from ._birthdate import Birthdate
-from ._bot import Bot
-from ._botaccesssettings import BotAccessSettings
-from ._botcommand import BotCommand
-from ._botcommandscope import (
-    BotCommandScope,
-    BotCommandScopeAllChatAdministrators,
-    BotCommandScopeAllGroupChats,
-    BotCommandScopeAllPrivateChats,
-    BotCommandScopeChat,
-    BotCommandScopeChatAdministrators,
-    BotCommandScopeChatMember,
-    BotCommandScopeDefault,
-)
-from ._botdescription import BotDescription, BotShortDescription
-from ._botname import BotName
-from ._business import (
-    BusinessBotRights,
-    BusinessConnection,
-    BusinessIntro,
-    BusinessLocation,
-    BusinessMessagesDeleted,
-    BusinessOpeningHours,
-    BusinessOpeningHoursInterval,
-)
-from ._callbackquery import CallbackQuery
-from ._chat import Chat
-from ._chatadministratorrights import ChatAdministratorRights
-from ._chatbackground import (
-    BackgroundFill,
-    BackgroundFillFreeformGradient,
-    BackgroundFillGradient,
-    BackgroundFillSolid,
-    BackgroundType,
-    BackgroundTypeChatTheme,
-    BackgroundTypeFill,
-    BackgroundTypePattern,
-    BackgroundTypeWallpaper,
-    ChatBackground,
-)
-from ._chatboost import (
-    ChatBoost,
-    ChatBoostAdded,
-    ChatBoostRemoved,
-    ChatBoostSource,
-    ChatBoostSourceGiftCode,
-    ChatBoostSourceGiveaway,
-    ChatBoostSourcePremium,
-    ChatBoostUpdated,
-    UserChatBoosts,
-)
-from ._chatfullinfo import ChatFullInfo
-from ._chatinvitelink import ChatInviteLink
-from ._chatjoinrequest import ChatJoinRequest
-from ._chatlocation import ChatLocation
-from ._chatmember import (
-    ChatMember,
-    ChatMemberAdministrator,
-    ChatMemberBanned,
-    ChatMemberLeft,
-    ChatMemberMember,
-    ChatMemberOwner,
-    ChatMemberRestricted,
-)
-from ._chatmemberupdated import ChatMemberUpdated
-from ._chatowner import ChatOwnerChanged, ChatOwnerLeft
-from ._chatpermissions import ChatPermissions
-from ._checklists import Checklist, ChecklistTask, ChecklistTasksAdded, ChecklistTasksDone
-from ._choseninlineresult import ChosenInlineResult
-from ._copytextbutton import CopyTextButton
-from ._dice import Dice
-from ._directmessagepricechanged import DirectMessagePriceChanged
-from ._directmessagestopic import DirectMessagesTopic
-from ._files.animation import Animation
-from ._files.audio import Audio
-from ._files.chatphoto import ChatPhoto
-from ._files.contact import Contact
-from ._files.document import Document
-from ._files.file import File
-from ._files.inputfile import InputFile
-from ._files.inputmedia import (
-    InputMedia,
-    InputMediaAnimation,
-    InputMediaAudio,
-    InputMediaDocument,
-    InputMediaLivePhoto,
-    InputMediaLocation,
-    InputMediaPhoto,
-    InputMediaSticker,
-    InputMediaVenue,
-    InputMediaVideo,
-    InputPaidMedia,
-    InputPaidMediaLivePhoto,
-    InputPaidMediaPhoto,
-    InputPaidMediaVideo,
-    InputPollMedia,
-    InputPollOptionMedia,
-)
-from ._files.inputprofilephoto import (
-    InputProfilePhoto,
-    InputProfilePhotoAnimated,
-    InputProfilePhotoStatic,
-)
-from ._files.inputsticker import InputSticker
-from ._files.inputstorycontent import (
-    InputStoryContent,
-    InputStoryContentPhoto,
-    InputStoryContentVideo,
-)
-from ._files.livephoto import LivePhoto
-from ._files.location import Location
-from ._files.photosize import PhotoSize
-from ._files.sticker import MaskPosition, Sticker, StickerSet
-from ._files.venue import Venue
-from ._files.video import Video
-from ._files.videonote import VideoNote
-from ._files.videoquality import VideoQuality
-from ._files.voice import Voice
-from ._forcereply import ForceReply
-from ._forumtopic import (
-    ForumTopic,
-    ForumTopicClosed,
-    ForumTopicCreated,
-    ForumTopicEdited,
-    ForumTopicReopened,
-    GeneralForumTopicHidden,
-    GeneralForumTopicUnhidden,
-)
-from ._games.callbackgame import CallbackGame
-from ._games.game import Game
-from ._games.gamehighscore import GameHighScore
-from ._gifts import AcceptedGiftTypes, Gift, GiftBackground, GiftInfo, Gifts
-from ._giveaway import Giveaway, GiveawayCompleted, GiveawayCreated, GiveawayWinners
-from ._inline.inlinekeyboardbutton import InlineKeyboardButton
-from ._inline.inlinekeyboardmarkup import InlineKeyboardMarkup
-from ._inline.inlinequery import InlineQuery
-from ._inline.inlinequeryresult import InlineQueryResult
-from ._inline.inlinequeryresultarticle import InlineQueryResultArticle
-from ._inline.inlinequeryresultaudio import InlineQueryResultAudio
-from ._inline.inlinequeryresultcachedaudio import InlineQueryResultCachedAudio
-from ._inline.inlinequeryresultcacheddocument import InlineQueryResultCachedDocument
-from ._inline.inlinequeryresultcachedgif import InlineQueryResultCachedGif
-from ._inline.inlinequeryresultcachedmpeg4gif import InlineQueryResultCachedMpeg4Gif
-from ._inline.inlinequeryresultcachedphoto import InlineQueryResultCachedPhoto
-from ._inline.inlinequeryresultcachedsticker import InlineQueryResultCachedSticker
-from ._inline.inlinequeryresultcachedvideo import InlineQueryResultCachedVideo
-from ._inline.inlinequeryresultcachedvoice import InlineQueryResultCachedVoice
-from ._inline.inlinequeryresultcontact import InlineQueryResultContact
-from ._inline.inlinequeryresultdocument import InlineQueryResultDocument
-from ._inline.inlinequeryresultgame import InlineQueryResultGame
-from ._inline.inlinequeryresultgif import InlineQueryResultGif
-from ._inline.inlinequeryresultlocation import InlineQueryResultLocation
-from ._inline.inlinequeryresultmpeg4gif import InlineQueryResultMpeg4Gif
-from ._inline.inlinequeryresultphoto import InlineQueryResultPhoto
-from ._inline.inlinequeryresultsbutton import InlineQueryResultsButton
-from ._inline.inlinequeryresultvenue import InlineQueryResultVenue
-from ._inline.inlinequeryresultvideo import InlineQueryResultVideo
-from ._inline.inlinequeryresultvoice import InlineQueryResultVoice
-from ._inline.inputcontactmessagecontent import InputContactMessageContent
-from ._inline.inputinvoicemessagecontent import InputInvoiceMessageContent
-from ._inline.inputlocationmessagecontent import InputLocationMessageContent
-from ._inline.inputmessagecontent import InputMessageContent
-from ._inline.inputtextmessagecontent import InputTextMessageContent
-from ._inline.inputvenuemessagecontent import InputVenueMessageContent
-from ._inline.preparedinlinemessage import PreparedInlineMessage
-from ._inputchecklist import InputChecklist, InputChecklistTask
-from ._keyboardbutton import KeyboardButton
-from ._keyboardbuttonpolltype import KeyboardButtonPollType
-from ._keyboardbuttonrequest import (
-    KeyboardButtonRequestChat,
-    KeyboardButtonRequestManagedBot,
-    KeyboardButtonRequestUsers,
-)
-from ._linkpreviewoptions import LinkPreviewOptions
-from ._loginurl import LoginUrl
-from ._managedbot import ManagedBotCreated, ManagedBotUpdated
-from ._menubutton import MenuButton, MenuButtonCommands, MenuButtonDefault, MenuButtonWebApp
-from ._message import InaccessibleMessage, MaybeInaccessibleMessage, Message
-from ._messageautodeletetimerchanged import MessageAutoDeleteTimerChanged
-from ._messageentity import MessageEntity
-from ._messageid import MessageId
-from ._messageorigin import (
-    MessageOrigin,
-    MessageOriginChannel,
-    MessageOriginChat,
-    MessageOriginHiddenUser,
-    MessageOriginUser,
-)
-from ._messagereactionupdated import MessageReactionCountUpdated, MessageReactionUpdated
-from ._ownedgift import OwnedGift, OwnedGiftRegular, OwnedGifts, OwnedGiftUnique
-from ._paidmedia import (
-    PaidMedia,
-    PaidMediaInfo,
-    PaidMediaLivePhoto,
-    PaidMediaPhoto,
-    PaidMediaPreview,
-    PaidMediaPurchased,
-    PaidMediaVideo,
-)
-from ._paidmessagepricechanged import PaidMessagePriceChanged
-from ._passport.credentials import (
-    Credentials,
-    DataCredentials,
-    EncryptedCredentials,
-    FileCredentials,
-    SecureData,
-    SecureValue,
-)
-from ._passport.data import IdDocumentData, PersonalDetails, ResidentialAddress
-from ._passport.encryptedpassportelement import EncryptedPassportElement
-from ._passport.passportdata import PassportData
-from ._passport.passportelementerrors import (
-    PassportElementError,
-    PassportElementErrorDataField,
-    PassportElementErrorFile,
-    PassportElementErrorFiles,
-    PassportElementErrorFrontSide,
-    PassportElementErrorReverseSide,
-    PassportElementErrorSelfie,
-    PassportElementErrorTranslationFile,
-    PassportElementErrorTranslationFiles,
-    PassportElementErrorUnspecified,
-)
-from ._passport.passportfile import PassportFile
-from ._payment.invoice import Invoice
-from ._payment.labeledprice import LabeledPrice
-from ._payment.orderinfo import OrderInfo
-from ._payment.precheckoutquery import PreCheckoutQuery
-from ._payment.refundedpayment import RefundedPayment
-from ._payment.shippingaddress import ShippingAddress
-from ._payment.shippingoption import ShippingOption
-from ._payment.shippingquery import ShippingQuery
-from ._payment.stars.affiliateinfo import AffiliateInfo
-from ._payment.stars.revenuewithdrawalstate import (
-    RevenueWithdrawalState,
-    RevenueWithdrawalStateFailed,
-    RevenueWithdrawalStatePending,
-    RevenueWithdrawalStateSucceeded,
-)
-from ._payment.stars.staramount import StarAmount
-from ._payment.stars.startransactions import StarTransaction, StarTransactions
-from ._payment.stars.transactionpartner import (
-    TransactionPartner,
-    TransactionPartnerAffiliateProgram,
-    TransactionPartnerChat,
-    TransactionPartnerFragment,
-    TransactionPartnerOther,
-    TransactionPartnerTelegramAds,
-    TransactionPartnerTelegramApi,
-    TransactionPartnerUser,
-)
-from ._payment.successfulpayment import SuccessfulPayment
-from ._poll import (
-    InputPollOption,
-    Poll,
-    PollAnswer,
-    PollMedia,
-    PollOption,
-    PollOptionAdded,
-    PollOptionDeleted,
-)
-from ._preparedkeyboardbutton import PreparedKeyboardButton
-from ._proximityalerttriggered import ProximityAlertTriggered
-from ._reaction import (
-    ReactionCount,
-    ReactionType,
-    ReactionTypeCustomEmoji,
-    ReactionTypeEmoji,
-    ReactionTypePaid,
-)
-from ._reply import ExternalReplyInfo, ReplyParameters, TextQuote
-from ._replykeyboardmarkup import ReplyKeyboardMarkup
-from ._replykeyboardremove import ReplyKeyboardRemove
-from ._sentguestmessage import SentGuestMessage
-from ._sentwebappmessage import SentWebAppMessage
-from ._shared import ChatShared, SharedUser, UsersShared
-from ._story import Story
-from ._storyarea import (
-    LocationAddress,
-    StoryArea,
-    StoryAreaPosition,
-    StoryAreaType,
-    StoryAreaTypeLink,
-    StoryAreaTypeLocation,
-    StoryAreaTypeSuggestedReaction,
-    StoryAreaTypeUniqueGift,
-    StoryAreaTypeWeather,
-)
-from ._suggestedpost import (
-    SuggestedPostApprovalFailed,
-    SuggestedPostApproved,
-    SuggestedPostDeclined,
-    SuggestedPostInfo,
-    SuggestedPostPaid,
-    SuggestedPostParameters,
-    SuggestedPostPrice,
-    SuggestedPostRefunded,
-)
-from ._switchinlinequerychosenchat import SwitchInlineQueryChosenChat
-from ._telegramobject import TelegramObject
-from ._uniquegift import (
-    UniqueGift,
-    UniqueGiftBackdrop,
-    UniqueGiftBackdropColors,
-    UniqueGiftColors,
-    UniqueGiftInfo,
-    UniqueGiftModel,
-    UniqueGiftSymbol,
-)
-from ._update import Update
-from ._user import User
-from ._userprofileaudios import UserProfileAudios
-from ._userprofilephotos import UserProfilePhotos
-from ._userrating import UserRating
-from ._videochat import (
-    VideoChatEnded,
-    VideoChatParticipantsInvited,
-    VideoChatScheduled,
-    VideoChatStarted,
-)
-from ._webappdata import WebAppData
-from ._webappinfo import WebAppInfo
-from ._webhookinfo import WebhookInfo
-from ._writeaccessallowed import WriteAccessAllowed
+from typing import TYPE_CHECKING
+
+from . import _version, constants
+
+# The public names are only imported on first access to keep the startup time low, see PEP 562.
+# Type checkers and IDEs still see the imports below.
+if TYPE_CHECKING:
+    from . import error, helpers, request, warnings
+    from ._birthdate import Birthdate
+    from ._bot import Bot
+    from ._botaccesssettings import BotAccessSettings
+    from ._botcommand import BotCommand
+    from ._botcommandscope import (
+        BotCommandScope,
+        BotCommandScopeAllChatAdministrators,
+        BotCommandScopeAllGroupChats,
+        BotCommandScopeAllPrivateChats,
+        BotCommandScopeChat,
+        BotCommandScopeChatAdministrators,
+        BotCommandScopeChatMember,
+        BotCommandScopeDefault,
+    )
+    from ._botdescription import BotDescription, BotShortDescription
+    from ._botname import BotName
+    from ._business import (
+        BusinessBotRights,
+        BusinessConnection,
+        BusinessIntro,
+        BusinessLocation,
+        BusinessMessagesDeleted,
+        BusinessOpeningHours,
+        BusinessOpeningHoursInterval,
+    )
+    from ._callbackquery import CallbackQuery
+    from ._chat import Chat
+    from ._chatadministratorrights import ChatAdministratorRights
+    from ._chatbackground import (
+        BackgroundFill,
+        BackgroundFillFreeformGradient,
+        BackgroundFillGradient,
+        BackgroundFillSolid,
+        BackgroundType,
+        BackgroundTypeChatTheme,
+        BackgroundTypeFill,
+        BackgroundTypePattern,
+        BackgroundTypeWallpaper,
+        ChatBackground,
+    )
+    from ._chatboost import (
+        ChatBoost,
+        ChatBoostAdded,
+        ChatBoostRemoved,
+        ChatBoostSource,
+        ChatBoostSourceGiftCode,
+        ChatBoostSourceGiveaway,
+        ChatBoostSourcePremium,
+        ChatBoostUpdated,
+        UserChatBoosts,
+    )
+    from ._chatfullinfo import ChatFullInfo
+    from ._chatinvitelink import ChatInviteLink
+    from ._chatjoinrequest import ChatJoinRequest
+    from ._chatlocation import ChatLocation
+    from ._chatmember import (
+        ChatMember,
+        ChatMemberAdministrator,
+        ChatMemberBanned,
+        ChatMemberLeft,
+        ChatMemberMember,
+        ChatMemberOwner,
+        ChatMemberRestricted,
+    )
+    from ._chatmemberupdated import ChatMemberUpdated
+    from ._chatowner import ChatOwnerChanged, ChatOwnerLeft
+    from ._chatpermissions import ChatPermissions
+    from ._checklists import Checklist, ChecklistTask, ChecklistTasksAdded, ChecklistTasksDone
+    from ._choseninlineresult import ChosenInlineResult
+    from ._copytextbutton import CopyTextButton
+    from ._dice import Dice
+    from ._directmessagepricechanged import DirectMessagePriceChanged
+    from ._directmessagestopic import DirectMessagesTopic
+    from ._files.animation import Animation
+    from ._files.audio import Audio
+    from ._files.chatphoto import ChatPhoto
+    from ._files.contact import Contact
+    from ._files.document import Document
+    from ._files.file import File
+    from ._files.inputfile import InputFile
+    from ._files.inputmedia import (
+        InputMedia,
+        InputMediaAnimation,
+        InputMediaAudio,
+        InputMediaDocument,
+        InputMediaLivePhoto,
+        InputMediaLocation,
+        InputMediaPhoto,
+        InputMediaSticker,
+        InputMediaVenue,
+        InputMediaVideo,
+        InputPaidMedia,
+        InputPaidMediaLivePhoto,
+        InputPaidMediaPhoto,
+        InputPaidMediaVideo,
+        InputPollMedia,
+        InputPollOptionMedia,
+    )
+    from ._files.inputprofilephoto import (
+        InputProfilePhoto,
+        InputProfilePhotoAnimated,
+        InputProfilePhotoStatic,
+    )
+    from ._files.inputsticker import InputSticker
+    from ._files.inputstorycontent import (
+        InputStoryContent,
+        InputStoryContentPhoto,
+        InputStoryContentVideo,
+    )
+    from ._files.livephoto import LivePhoto
+    from ._files.location import Location
+    from ._files.photosize import PhotoSize
+    from ._files.sticker import MaskPosition, Sticker, StickerSet
+    from ._files.venue import Venue
+    from ._files.video import Video
+    from ._files.videonote import VideoNote
+    from ._files.videoquality import VideoQuality
+    from ._files.voice import Voice
+    from ._forcereply import ForceReply
+    from ._forumtopic import (
+        ForumTopic,
+        ForumTopicClosed,
+        ForumTopicCreated,
+        ForumTopicEdited,
+        ForumTopicReopened,
+        GeneralForumTopicHidden,
+        GeneralForumTopicUnhidden,
+    )
+    from ._games.callbackgame import CallbackGame
+    from ._games.game import Game
+    from ._games.gamehighscore import GameHighScore
+    from ._gifts import AcceptedGiftTypes, Gift, GiftBackground, GiftInfo, Gifts
+    from ._giveaway import Giveaway, GiveawayCompleted, GiveawayCreated, GiveawayWinners
+    from ._inline.inlinekeyboardbutton import InlineKeyboardButton
+    from ._inline.inlinekeyboardmarkup import InlineKeyboardMarkup
+    from ._inline.inlinequery import InlineQuery
+    from ._inline.inlinequeryresult import InlineQueryResult
+    from ._inline.inlinequeryresultarticle import InlineQueryResultArticle
+    from ._inline.inlinequeryresultaudio import InlineQueryResultAudio
+    from ._inline.inlinequeryresultcachedaudio import InlineQueryResultCachedAudio
+    from ._inline.inlinequeryresultcacheddocument import InlineQueryResultCachedDocument
+    from ._inline.inlinequeryresultcachedgif import InlineQueryResultCachedGif
+    from ._inline.inlinequeryresultcachedmpeg4gif import InlineQueryResultCachedMpeg4Gif
+    from ._inline.inlinequeryresultcachedphoto import InlineQueryResultCachedPhoto
+    from ._inline.inlinequeryresultcachedsticker import InlineQueryResultCachedSticker
+    from ._inline.inlinequeryresultcachedvideo import InlineQueryResultCachedVideo
+    from ._inline.inlinequeryresultcachedvoice import InlineQueryResultCachedVoice
+    from ._inline.inlinequeryresultcontact import InlineQueryResultContact
+    from ._inline.inlinequeryresultdocument import InlineQueryResultDocument
+    from ._inline.inlinequeryresultgame import InlineQueryResultGame
+    from ._inline.inlinequeryresultgif import InlineQueryResultGif
+    from ._inline.inlinequeryresultlocation import InlineQueryResultLocation
+    from ._inline.inlinequeryresultmpeg4gif import InlineQueryResultMpeg4Gif
+    from ._inline.inlinequeryresultphoto import InlineQueryResultPhoto
+    from ._inline.inlinequeryresultsbutton import InlineQueryResultsButton
+    from ._inline.inlinequeryresultvenue import InlineQueryResultVenue
+    from ._inline.inlinequeryresultvideo import InlineQueryResultVideo
+    from ._inline.inlinequeryresultvoice import InlineQueryResultVoice
+    from ._inline.inputcontactmessagecontent import InputContactMessageContent
+    from ._inline.inputinvoicemessagecontent import InputInvoiceMessageContent
+    from ._inline.inputlocationmessagecontent import InputLocationMessageContent
+    from ._inline.inputmessagecontent import InputMessageContent
+    from ._inline.inputtextmessagecontent import InputTextMessageContent
+    from ._inline.inputvenuemessagecontent import InputVenueMessageContent
+    from ._inline.preparedinlinemessage import PreparedInlineMessage
+    from ._inputchecklist import InputChecklist, InputChecklistTask
+    from ._interning import set_interning
+    from ._keyboardbutton import KeyboardButton
+    from ._keyboardbuttonpolltype import KeyboardButtonPollType
+    from ._keyboardbuttonrequest import (
+        KeyboardButtonRequestChat,
+        KeyboardButtonRequestManagedBot,
+        KeyboardButtonRequestUsers,
+    )
+    from ._linkpreviewoptions import LinkPreviewOptions
+    from ._loginurl import LoginUrl
+    from ._managedbot import ManagedBotCreated, ManagedBotUpdated
+    from ._menubutton import MenuButton, MenuButtonCommands, MenuButtonDefault, MenuButtonWebApp
+    from ._message import InaccessibleMessage, MaybeInaccessibleMessage, Message
+    from ._messageautodeletetimerchanged import MessageAutoDeleteTimerChanged
+    from ._messageentity import MessageEntity
+    from ._messageid import MessageId
+    from ._messageorigin import (
+        MessageOrigin,
+        MessageOriginChannel,
+        MessageOriginChat,
+        MessageOriginHiddenUser,
+        MessageOriginUser,
+    )
+    from ._messagereactionupdated import MessageReactionCountUpdated, MessageReactionUpdated
+    from ._messagetemplate import MessageTemplate
+    from ._ownedgift import OwnedGift, OwnedGiftRegular, OwnedGifts, OwnedGiftUnique
+    from ._paidmedia import (
+        PaidMedia,
+        PaidMediaInfo,
+        PaidMediaLivePhoto,
+        PaidMediaPhoto,
+        PaidMediaPreview,
+        PaidMediaPurchased,
+        PaidMediaVideo,
+    )
+    from ._paidmessagepricechanged import PaidMessagePriceChanged
+    from ._passport.credentials import (
+        Credentials,
+        DataCredentials,
+        EncryptedCredentials,
+        FileCredentials,
+        SecureData,
+        SecureValue,
+    )
+    from ._passport.data import IdDocumentData, PersonalDetails, ResidentialAddress
+    from ._passport.encryptedpassportelement import EncryptedPassportElement
+    from ._passport.passportdata import PassportData
+    from ._passport.passportelementerrors import (
+        PassportElementError,
+        PassportElementErrorDataField,
+        PassportElementErrorFile,
+        PassportElementErrorFiles,
+        PassportElementErrorFrontSide,
+        PassportElementErrorReverseSide,
+        PassportElementErrorSelfie,
+        PassportElementErrorTranslationFile,
+        PassportElementErrorTranslationFiles,
+        PassportElementErrorUnspecified,
+    )
+    from ._passport.passportfile import PassportFile
+    from ._payment.invoice import Invoice
+    from ._payment.labeledprice import LabeledPrice
+    from ._payment.orderinfo import OrderInfo
+    from ._payment.precheckoutquery import PreCheckoutQuery
+    from ._payment.refundedpayment import RefundedPayment
+    from ._payment.shippingaddress import ShippingAddress
+    from ._payment.shippingoption import ShippingOption
+    from ._payment.shippingquery import ShippingQuery
+    from ._payment.stars.affiliateinfo import AffiliateInfo
+    from ._payment.stars.revenuewithdrawalstate import (
+        RevenueWithdrawalState,
+        RevenueWithdrawalStateFailed,
+        RevenueWithdrawalStatePending,
+        RevenueWithdrawalStateSucceeded,
+    )
+    from ._payment.stars.staramount import StarAmount
+    from ._payment.stars.startransactions import StarTransaction, StarTransactions
+    from ._payment.stars.transactionpartner import (
+        TransactionPartner,
+        TransactionPartnerAffiliateProgram,
+        TransactionPartnerChat,
+        TransactionPartnerFragment,
+        TransactionPartnerOther,
+        TransactionPartnerTelegramAds,
+        TransactionPartnerTelegramApi,
+        TransactionPartnerUser,
+    )
+    from ._payment.successfulpayment import SuccessfulPayment
+    from ._poll import (
+        InputPollOption,
+        Poll,
+        PollAnswer,
+        PollMedia,
+        PollOption,
+        PollOptionAdded,
+        PollOptionDeleted,
+    )
+    from ._preparedkeyboardbutton import PreparedKeyboardButton
+    from ._proximityalerttriggered import ProximityAlertTriggered
+    from ._reaction import (
+        ReactionCount,
+        ReactionType,
+        ReactionTypeCustomEmoji,
+        ReactionTypeEmoji,
+        ReactionTypePaid,
+    )
+    from ._reply import ExternalReplyInfo, ReplyParameters, TextQuote
+    from ._replykeyboardmarkup import ReplyKeyboardMarkup
+    from ._replykeyboardremove import ReplyKeyboardRemove
+    from ._sentguestmessage import SentGuestMessage
+    from ._sentwebappmessage import SentWebAppMessage
+    from ._shared import ChatShared, SharedUser, UsersShared
+    from ._story import Story
+    from ._storyarea import (
+        LocationAddress,
+        StoryArea,
+        StoryAreaPosition,
+        StoryAreaType,
+        StoryAreaTypeLink,
+        StoryAreaTypeLocation,
+        StoryAreaTypeSuggestedReaction,
+        StoryAreaTypeUniqueGift,
+        StoryAreaTypeWeather,
+    )
+    from ._suggestedpost import (
+        SuggestedPostApprovalFailed,
+        SuggestedPostApproved,
+        SuggestedPostDeclined,
+        SuggestedPostInfo,
+        SuggestedPostPaid,
+        SuggestedPostParameters,
+        SuggestedPostPrice,
+        SuggestedPostRefunded,
+    )
+    from ._switchinlinequerychosenchat import SwitchInlineQueryChosenChat
+    from ._telegramobject import TelegramObject
+    from ._uniquegift import (
+        UniqueGift,
+        UniqueGiftBackdrop,
+        UniqueGiftBackdropColors,
+        UniqueGiftColors,
+        UniqueGiftInfo,
+        UniqueGiftModel,
+        UniqueGiftSymbol,
+    )
+    from ._update import Update
+    from ._user import User
+    from ._userprofileaudios import UserProfileAudios
+    from ._userprofilephotos import UserProfilePhotos
+    from ._userrating import UserRating
+    from ._videochat import (
+        VideoChatEnded,
+        VideoChatParticipantsInvited,
+        VideoChatScheduled,
+        VideoChatStarted,
+    )
+    from ._warmup import warmup
+    from ._webappdata import WebAppData
+    from ._webappinfo import WebAppInfo
+    from ._webhookinfo import WebhookInfo
+    from ._writeaccessallowed import WriteAccessAllowed
+else:
+    from telegram._utils.lazyimport import build_lazy_loader
+
+    # Maps the modules to the public names imported from them
+    _LAZY_IMPORTS = {
+        "._birthdate": ("Birthdate",),
+        "._bot": ("Bot",),
+        "._botaccesssettings": ("BotAccessSettings",),
+        "._botcommand": ("BotCommand",),
+        "._botcommandscope": (
+            "BotCommandScope",
+            "BotCommandScopeAllChatAdministrators",
+            "BotCommandScopeAllGroupChats",
+            "BotCommandScopeAllPrivateChats",
+            "BotCommandScopeChat",
+            "BotCommandScopeChatAdministrators",
+            "BotCommandScopeChatMember",
+            "BotCommandScopeDefault",
+        ),
+        "._botdescription": ("BotDescription", "BotShortDescription"),
+        "._botname": ("BotName",),
+        "._business": (
+            "BusinessBotRights",
+            "BusinessConnection",
+            "BusinessIntro",
+            "BusinessLocation",
+            "BusinessMessagesDeleted",
+            "BusinessOpeningHours",
+            "BusinessOpeningHoursInterval",
+        ),
+        "._callbackquery": ("CallbackQuery",),
+        "._chat": ("Chat",),
+        "._chatadministratorrights": ("ChatAdministratorRights",),
+        "._chatbackground": (
+            "BackgroundFill",
+            "BackgroundFillFreeformGradient",
+            "BackgroundFillGradient",
+            "BackgroundFillSolid",
+            "BackgroundType",
+            "BackgroundTypeChatTheme",
+            "BackgroundTypeFill",
+            "BackgroundTypePattern",
+            "BackgroundTypeWallpaper",
+            "ChatBackground",
+        ),
+        "._chatboost": (
+            "ChatBoost",
+            "ChatBoostAdded",
+            "ChatBoostRemoved",
+            "ChatBoostSource",
+            "ChatBoostSourceGiftCode",
+            "ChatBoostSourceGiveaway",
+            "ChatBoostSourcePremium",
+            "ChatBoostUpdated",
+            "UserChatBoosts",
+        ),
+        "._chatfullinfo": ("ChatFullInfo",),
+        "._chatinvitelink": ("ChatInviteLink",),
+        "._chatjoinrequest": ("ChatJoinRequest",),
+        "._chatlocation": ("ChatLocation",),
+        "._chatmember": (
+            "ChatMember",
+            "ChatMemberAdministrator",
+            "ChatMemberBanned",
+            "ChatMemberLeft",
+            "ChatMemberMember",
+            "ChatMemberOwner",
+            "ChatMemberRestricted",
+        ),
+        "._chatmemberupdated": ("ChatMemberUpdated",),
+        "._chatowner": ("ChatOwnerChanged", "ChatOwnerLeft"),
+        "._chatpermissions": ("ChatPermissions",),
+        "._checklists": (
+            "Checklist",
+            "ChecklistTask",
+            "ChecklistTasksAdded",
+            "ChecklistTasksDone",
+        ),
+        "._choseninlineresult": ("ChosenInlineResult",),
+        "._copytextbutton": ("CopyTextButton",),
+        "._dice": ("Dice",),
+        "._directmessagepricechanged": ("DirectMessagePriceChanged",),
+        "._directmessagestopic": ("DirectMessagesTopic",),
+        "._files.animation": ("Animation",),
+        "._files.audio": ("Audio",),
+        "._files.chatphoto": ("ChatPhoto",),
+        "._files.contact": ("Contact",),
+        "._files.document": ("Document",),
+        "._files.file": ("File",),
+        "._files.inputfile": ("InputFile",),
+        "._files.inputmedia": (
+            "InputMedia",
+            "InputMediaAnimation",
+            "InputMediaAudio",
+            "InputMediaDocument",
+            "InputMediaLivePhoto",
+            "InputMediaLocation",
+            "InputMediaPhoto",
+            "InputMediaSticker",
+            "InputMediaVenue",
+            "InputMediaVideo",
+            "InputPaidMedia",
+            "InputPaidMediaLivePhoto",
+            "InputPaidMediaPhoto",
+            "InputPaidMediaVideo",
+            "InputPollMedia",
+            "InputPollOptionMedia",
+        ),
+        "._files.inputprofilephoto": (
+            "InputProfilePhoto",
+            "InputProfilePhotoAnimated",
+            "InputProfilePhotoStatic",
+        ),
+        "._files.inputsticker": ("InputSticker",),
+        "._files.inputstorycontent": (
+            "InputStoryContent",
+            "InputStoryContentPhoto",
+            "InputStoryContentVideo",
+        ),
+        "._files.livephoto": ("LivePhoto",),
+        "._files.location": ("Location",),
+        "._files.photosize": ("PhotoSize",),
+        "._files.sticker": ("MaskPosition", "Sticker", "StickerSet"),
+        "._files.venue": ("Venue",),
+        "._files.video": ("Video",),
+        "._files.videonote": ("VideoNote",),
+        "._files.videoquality": ("VideoQuality",),
+        "._files.voice": ("Voice",),
+        "._forcereply": ("ForceReply",),
+        "._forumtopic": (
+            "ForumTopic",
+            "ForumTopicClosed",
+            "ForumTopicCreated",
+            "ForumTopicEdited",
+            "ForumTopicReopened",
+            "GeneralForumTopicHidden",
+            "GeneralForumTopicUnhidden",
+        ),
+        "._games.callbackgame": ("CallbackGame",),
+        "._games.game": ("Game",),
+        "._games.gamehighscore": ("GameHighScore",),
+        "._gifts": ("AcceptedGiftTypes", "Gift", "GiftBackground", "GiftInfo", "Gifts"),
+        "._giveaway": ("Giveaway", "GiveawayCompleted", "GiveawayCreated", "GiveawayWinners"),
+        "._inline.inlinekeyboardbutton": ("InlineKeyboardButton",),
+        "._inline.inlinekeyboardmarkup": ("InlineKeyboardMarkup",),
+        "._inline.inlinequery": ("InlineQuery",),
+        "._inline.inlinequeryresult": ("InlineQueryResult",),
+        "._inline.inlinequeryresultarticle": ("InlineQueryResultArticle",),
+        "._inline.inlinequeryresultaudio": ("InlineQueryResultAudio",),
+        "._inline.inlinequeryresultcachedaudio": ("InlineQueryResultCachedAudio",),
+        "._inline.inlinequeryresultcacheddocument": ("InlineQueryResultCachedDocument",),
+        "._inline.inlinequeryresultcachedgif": ("InlineQueryResultCachedGif",),
+        "._inline.inlinequeryresultcachedmpeg4gif": ("InlineQueryResultCachedMpeg4Gif",),
+        "._inline.inlinequeryresultcachedphoto": ("InlineQueryResultCachedPhoto",),
+        "._inline.inlinequeryresultcachedsticker": ("InlineQueryResultCachedSticker",),
+        "._inline.inlinequeryresultcachedvideo": ("InlineQueryResultCachedVideo",),
+        "._inline.inlinequeryresultcachedvoice": ("InlineQueryResultCachedVoice",),
+        "._inline.inlinequeryresultcontact": ("InlineQueryResultContact",),
+        "._inline.inlinequeryresultdocument": ("InlineQueryResultDocument",),
+        "._inline.inlinequeryresultgame": ("InlineQueryResultGame",),
+        "._inline.inlinequeryresultgif": ("InlineQueryResultGif",),
+        "._inline.inlinequeryresultlocation": ("InlineQueryResultLocation",),
+        "._inline.inlinequeryresultmpeg4gif": ("InlineQueryResultMpeg4Gif",),
+        "._inline.inlinequeryresultphoto": ("InlineQueryResultPhoto",),
+        "._inline.inlinequeryresultsbutton": ("InlineQueryResultsButton",),
+        "._inline.inlinequeryresultvenue": ("InlineQueryResultVenue",),
+        "._inline.inlinequeryresultvideo": ("InlineQueryResultVideo",),
+        "._inline.inlinequeryresultvoice": ("InlineQueryResultVoice",),
+        "._inline.inputcontactmessagecontent": ("InputContactMessageContent",),
+        "._inline.inputinvoicemessagecontent": ("InputInvoiceMessageContent",),
+        "._inline.inputlocationmessagecontent": ("InputLocationMessageContent",),
+        "._inline.inputmessagecontent": ("InputMessageContent",),
+        "._inline.inputtextmessagecontent": ("InputTextMessageContent",),
+        "._inline.inputvenuemessagecontent": ("InputVenueMessageContent",),
+        "._inline.preparedinlinemessage": ("PreparedInlineMessage",),
+        "._inputchecklist": ("InputChecklist", "InputChecklistTask"),
+        "._interning": ("set_interning",),
+        "._keyboardbutton": ("KeyboardButton",),
+        "._keyboardbuttonpolltype": ("KeyboardButtonPollType",),
+        "._keyboardbuttonrequest": (
+            "KeyboardButtonRequestChat",
+            "KeyboardButtonRequestManagedBot",
+            "KeyboardButtonRequestUsers",
+        ),
+        "._linkpreviewoptions": ("LinkPreviewOptions",),
+        "._loginurl": ("LoginUrl",),
+        "._managedbot": ("ManagedBotCreated", "ManagedBotUpdated"),
+        "._menubutton": (
+            "MenuButton",
+            "MenuButtonCommands",
+            "MenuButtonDefault",
+            "MenuButtonWebApp",
+        ),
+        "._message": ("InaccessibleMessage", "MaybeInaccessibleMessage", "Message"),
+        "._messageautodeletetimerchanged": ("MessageAutoDeleteTimerChanged",),
+        "._messageentity": ("MessageEntity",),
+        "._messageid": ("MessageId",),
+        "._messageorigin": (
+            "MessageOrigin",
+            "MessageOriginChannel",
+            "MessageOriginChat",
+            "MessageOriginHiddenUser",
+            "MessageOriginUser",
+        ),
+        "._messagereactionupdated": ("MessageReactionCountUpdated", "MessageReactionUpdated"),
+        "._messagetemplate": ("MessageTemplate",),
+        "._ownedgift": ("OwnedGift", "OwnedGiftRegular", "OwnedGifts", "OwnedGiftUnique"),
+        "._paidmedia": (
+            "PaidMedia",
+            "PaidMediaInfo",
+            "PaidMediaLivePhoto",
+            "PaidMediaPhoto",
+            "PaidMediaPreview",
+            "PaidMediaPurchased",
+            "PaidMediaVideo",
+        ),
+        "._paidmessagepricechanged": ("PaidMessagePriceChanged",),
+        "._passport.credentials": (
+            "Credentials",
+            "DataCredentials",
+            "EncryptedCredentials",
+            "FileCredentials",
+            "SecureData",
+            "SecureValue",
+        ),
+        "._passport.data": ("IdDocumentData", "PersonalDetails", "ResidentialAddress"),
+        "._passport.encryptedpassportelement": ("EncryptedPassportElement",),
+        "._passport.passportdata": ("PassportData",),
+        "._passport.passportelementerrors": (
+            "PassportElementError",
+            "PassportElementErrorDataField",
+            "PassportElementErrorFile",
+            "PassportElementErrorFiles",
+            "PassportElementErrorFrontSide",
+            "PassportElementErrorReverseSide",
+            "PassportElementErrorSelfie",
+            "PassportElementErrorTranslationFile",
+            "PassportElementErrorTranslationFiles",
+            "PassportElementErrorUnspecified",
+        ),
+        "._passport.passportfile": ("PassportFile",),
+        "._payment.invoice": ("Invoice",),
+        "._payment.labeledprice": ("LabeledPrice",),
+        "._payment.orderinfo": ("OrderInfo",),
+        "._payment.precheckoutquery": ("PreCheckoutQuery",),
+        "._payment.refundedpayment": ("RefundedPayment",),
+        "._payment.shippingaddress": ("ShippingAddress",),
+        "._payment.shippingoption": ("ShippingOption",),
+        "._payment.shippingquery": ("ShippingQuery",),
+        "._payment.stars.affiliateinfo": ("AffiliateInfo",),
+        "._payment.stars.revenuewithdrawalstate": (
+            "RevenueWithdrawalState",
+            "RevenueWithdrawalStateFailed",
+            "RevenueWithdrawalStatePending",
+            "RevenueWithdrawalStateSucceeded",
+        ),
+        "._payment.stars.staramount": ("StarAmount",),
+        "._payment.stars.startransactions": ("StarTransaction", "StarTransactions"),
+        "._payment.stars.transactionpartner": (
+            "TransactionPartner",
+            "TransactionPartnerAffiliateProgram",
+            "TransactionPartnerChat",
+            "TransactionPartnerFragment",
+            "TransactionPartnerOther",
+            "TransactionPartnerTelegramAds",
+            "TransactionPartnerTelegramApi",
+            "TransactionPartnerUser",
+        ),
+        "._payment.successfulpayment": ("SuccessfulPayment",),
+        "._poll": (
+            "InputPollOption",
+            "Poll",
+            "PollAnswer",
+            "PollMedia",
+            "PollOption",
+            "PollOptionAdded",
+            "PollOptionDeleted",
+        ),
+        "._preparedkeyboardbutton": ("PreparedKeyboardButton",),
+        "._proximityalerttriggered": ("ProximityAlertTriggered",),
+        "._reaction": (
+            "ReactionCount",
+            "ReactionType",
+            "ReactionTypeCustomEmoji",
+            "ReactionTypeEmoji",
+            "ReactionTypePaid",
+        ),
+        "._reply": ("ExternalReplyInfo", "ReplyParameters", "TextQuote"),
+        "._replykeyboardmarkup": ("ReplyKeyboardMarkup",),
+        "._replykeyboardremove": ("ReplyKeyboardRemove",),
+        "._sentguestmessage": ("SentGuestMessage",),
+        "._sentwebappmessage": ("SentWebAppMessage",),
+        "._shared": ("ChatShared", "SharedUser", "UsersShared"),
+        "._story": ("Story",),
+        "._storyarea": (
+            "LocationAddress",
+            "StoryArea",
+            "StoryAreaPosition",
+            "StoryAreaType",
+            "StoryAreaTypeLink",
+            "StoryAreaTypeLocation",
+            "StoryAreaTypeSuggestedReaction",
+            "StoryAreaTypeUniqueGift",
+            "StoryAreaTypeWeather",
+        ),
+        "._suggestedpost": (
+            "SuggestedPostApprovalFailed",
+            "SuggestedPostApproved",
+            "SuggestedPostDeclined",
+            "SuggestedPostInfo",
+            "SuggestedPostPaid",
+            "SuggestedPostParameters",
+            "SuggestedPostPrice",
+            "SuggestedPostRefunded",
+        ),
+        "._switchinlinequerychosenchat": ("SwitchInlineQueryChosenChat",),
+        "._telegramobject": ("TelegramObject",),
+        "._uniquegift": (
+            "UniqueGift",
+            "UniqueGiftBackdrop",
+            "UniqueGiftBackdropColors",
+            "UniqueGiftColors",
+            "UniqueGiftInfo",
+            "UniqueGiftModel",
+            "UniqueGiftSymbol",
+        ),
+        "._update": ("Update",),
+        "._user": ("User",),
+        "._userprofileaudios": ("UserProfileAudios",),
+        "._userprofilephotos": ("UserProfilePhotos",),
+        "._userrating": ("UserRating",),
+        "._videochat": (
+            "VideoChatEnded",
+            "VideoChatParticipantsInvited",
+            "VideoChatScheduled",
+            "VideoChatStarted",
+        ),
+        "._warmup": ("warmup",),
+        "._webappdata": ("WebAppData",),
+        "._webappinfo": ("WebAppInfo",),
+        "._webhookinfo": ("WebhookInfo",),
+        "._writeaccessallowed": ("WriteAccessAllowed",),
+    }
+    _LAZY_SUBMODULES = ("error", "helpers", "request", "warnings")
+
+    __getattr__, __dir__ = build_lazy_loader(
+        __name__, globals(), _LAZY_IMPORTS, lazy_submodules=_LAZY_SUBMODULES
+    )
 
 #: :obj:`str`: The version of the `python-telegram-bot` library as string.
 #: To get detailed information about the version number, please use :data:`__version_info__`
@@ -23,8 +23,17 @@ import asyncio
 import contextlib
 import copy
 import datetime as dtm
+import functools
 import pickle
-from collections.abc import Callable, Sequence
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
 from types import TracebackType
 from typing import (
     TYPE_CHECKING,
@@ -84,6 +93,7 @@ from telegram._keyboardbutton import KeyboardButton
 from telegram._menubutton import MenuButton
 from telegram._message import Message
 from telegram._messageid import MessageId
+from telegram._messagetemplate import MessageTemplate
 from telegram._ownedgift import OwnedGifts
 from telegram._payment.stars.staramount import StarAmount
 from telegram._payment.stars.startransactions import StarTransactions
@@ -99,6 +109,7 @@ from telegram._update import Update
 from telegram._user import User
 from telegram._userprofilephotos import UserProfilePhotos
 from telegram._utils.argumentparsing import parse_lpo_and_dwpp, parse_sequence_arg
+from telegram._utils.defaultinsertion import DefaultKind, copy_with, get_default_kind
 from telegram._utils.defaultvalue import DEFAULT_NONE, DefaultValue
 from telegram._utils.files import is_local_file, parse_file_input
 from telegram._utils.logging import get_logger
@@ -114,7 +125,7 @@ from telegram._utils.types import (
 )
 from telegram._utils.warnings import warn
 from telegram._webhookinfo import WebhookInfo
-from telegram.constants import InlineQueryLimit, ReactionEmoji
+from telegram.constants import BulkRequestLimit, InlineQueryLimit, ReactionEmoji
 from telegram.error import EndPointNotFound, InvalidToken
 from telegram.request import BaseRequest, RequestData
 from telegram.request._httpxrequest import HTTPXRequest
@@ -146,6 +157,7 @@ if TYPE_CHECKING:
     from telegram._utils.types import ReplyMarkup
 
 BT = TypeVar("BT", bound="Bot")
+RT = TypeVar("RT")
 
 
 # Even though we document only {token} as supported insertion, we are a bit more flexible
@@ -154,6 +166,9 @@ BT = TypeVar("BT", bound="Bot")
 _SUPPORTED_INSERTIONS = {"token", "TOKEN", "bot_token", "BOT_TOKEN", "bot-token", "BOT-TOKEN"}
 _INSERTION_STRINGS = {f"{{{insertion}}}" for insertion in _SUPPORTED_INSERTIONS}
 
+# Used by Bot.map if the request object doesn't limit the number of concurrent requests
+_DEFAULT_MAP_CONCURRENCY = 256
+
 
 class _TokenDict(dict):
     __slots__ = ("token",)
@@ -639,7 +654,7 @@ class Bot(TelegramObject, contextlib.AbstractAsyncContextManager["Bot"]):
             local_mode=self._local_mode,
         )
 
-    def _insert_defaults(self, data: dict[str, object]) -> None:
+    def _insert_defaults(self, data: dict[str, object]) -> dict[str, object]:
         """This method is here to make ext.Defaults work. Because we need to be able to tell
         e.g. `send_message(chat_id, text)` from `send_message(chat_id, text, parse_mode=None)`, the
         default values for `parse_mode` etc are not `None` but `DEFAULT_NONE`. While this *could*
@@ -655,32 +670,50 @@ class Bot(TelegramObject, contextlib.AbstractAsyncContextManager["Bot"]):
 
         If in the future we come up with a better way of making `Defaults` work, we can cut this
         link as well.
+
+        Returns a new dict and drops all `None` values, because Telegram doesn't handle them well.
+        Objects are only copied if a value actually has to be replaced, `data` and the objects in
+        it are never edited in-place.
         """
         # We
         # 1) set the correct parse_mode for all InputMedia objects
         # 2) replace all DefaultValue instances with the corresponding normal value.
-        for key, val in data.items():
+        # Which of these applies only depends on the type of the value, see get_default_kind
+        result: dict[str, object] = {}
+        for key, value in data.items():
+            kind = get_default_kind(value)
+            new_value = value
             # 1)
-            if isinstance(val, InputMedia):
-                # Copy object as not to edit it in-place
-                new = copy.copy(val)
-                with new._unfrozen():
-                    new.parse_mode = DefaultValue.get_value(new.parse_mode)
-                data[key] = new
-            elif (
-                key == "media"
-                and isinstance(val, Sequence)
-                and not isinstance(val[0], InputPaidMedia)
-            ):
-                # Copy objects as not to edit them in-place
-                copy_list = [copy.copy(media) for media in val]
-                for media in copy_list:
-                    with media._unfrozen():
-                        media.parse_mode = DefaultValue.get_value(media.parse_mode)
-                data[key] = copy_list
+            if kind is DefaultKind.INPUT_MEDIA:
+                media = cast("InputMedia", value)
+                if isinstance(media.parse_mode, DefaultValue):
+                    new_value = copy_with(media, parse_mode=media.parse_mode.value)
+            elif kind is DefaultKind.SEQUENCE and key == "media":
+                new_value = self.__insert_media_group_parse_mode(
+                    cast("Sequence[InputMedia]", value)
+                )
             # 2)
-            else:
-                data[key] = DefaultValue.get_value(val)
+            elif kind is DefaultKind.DEFAULT_VALUE:
+                new_value = cast("DefaultValue[object]", value).value
+
+            if new_value is not None:
+                result[key] = new_value
+        return result
+
+    @staticmethod
+    def __insert_media_group_parse_mode(media_group: Sequence[InputMedia]) -> Sequence[InputMedia]:
+        if not media_group or isinstance(media_group[0], InputPaidMedia):
+            return media_group
+        if not any(isinstance(media.parse_mode, DefaultValue) for media in media_group):
+            return media_group
+        return [
+            (
+                copy_with(media, parse_mode=media.parse_mode.value)
+                if isinstance(media.parse_mode, DefaultValue)
+                else media
+            )
+            for media in media_group
+        ]
 
     async def _post(
         self,
@@ -702,11 +735,8 @@ class Bot(TelegramObject, contextlib.AbstractAsyncContextManager["Bot"]):
         if api_kwargs:
             data.update(api_kwargs)
 
-        # Insert is in-place, so no return value for data
-        self._insert_defaults(data)
-
-        # Drop any None values because Telegram doesn't handle them well
-        data = {key: value for key, value in data.items() if value is not None}
+        # This also drops any None values because Telegram doesn't handle them well
+        data = self._insert_defaults(data)
 
         return await self._do_post(
             endpoint=endpoint,
@@ -860,11 +890,14 @@ class Bot(TelegramObject, contextlib.AbstractAsyncContextManager["Bot"]):
         # Initialize bot user
         # Since the bot is to be initialized only once, we can also use it for
         # verifying the token passed and raising an exception if it's invalid.
-        try:
-            await self.get_me()
-            self._bot_initialized = True
-        except InvalidToken as exc:
-            raise InvalidToken(f"The token `{self._token}` was rejected by the server.") from exc
+        if not self._bot_initialized:
+            try:
+                await self.get_me()
+                self._bot_initialized = True
+            except InvalidToken as exc:
+                raise InvalidToken(
+                    f"The token `{self._token}` was rejected by the server."
+                ) from exc
 
     async def shutdown(self) -> None:
         """Stop & clear resources used by this class. Currently just calls
@@ -882,6 +915,159 @@ class Bot(TelegramObject, contextlib.AbstractAsyncContextManager["Bot"]):
         self._requests_initialized = False
         self._bot_initialized = False
 
+    async def map(
+        self,
+        method: Callable[..., Awaitable[RT]],
+        arguments: Iterable[Mapping[str, Any]],
+        *,
+        concurrency: int | None = None,
+        ordered: bool = True,
+    ) -> AsyncIterator[tuple[Mapping[str, Any], RT | Exception]]:
+        """Calls a method of this bot once for each set of arguments, with a limited number of
+        calls running concurrently. This is useful for making many independent requests at once,
+        e.g. calling :meth:`get_chat_member` for many users or :meth:`delete_message` for many
+        messages.
+
+        Compared to passing all calls to :func:`asyncio.gather`, this method
+
+        * limits the number of concurrent calls. By default, this is the
+          :attr:`~telegram.request.BaseRequest.connection_pool_size` of :attr:`request`, such
+          that the calls don't run into pool timeouts.
+        * gives the results as soon as they are available, either in the order of
+          :paramref:`arguments` or in the order they are completed.
+        * gives exceptions raised by single calls as results instead of raising them, such that
+          one failing call doesn't abort the other ones.
+
+        For :class:`telegram.ext.ExtBot`, every call is still processed by the
+        :attr:`~telegram.ext.ExtBot.rate_limiter`, if set.
+
+        Example:
+            .. code:: python
+
+                async for arguments, result in bot.map(
+                    bot.ban_chat_member,
+                    ({"chat_id": chat_id, "user_id": user_id} for user_id in user_ids),
+                ):
+                    if isinstance(result, TelegramError):
+                        print(f"Banning {arguments['user_id']} failed: {result}")
+
+        Note:
+            Calls of :meth:`delete_message` that pass only ``chat_id`` and ``message_id`` are
+            combined into calls of :meth:`delete_messages` with up to
+            :tg-const:`telegram.constants.BulkRequestLimit.MAX_LIMIT` messages of the same chat.
+            All messages of such a call share its result. Unlike :meth:`delete_message`,
+            :meth:`delete_messages` skips messages that can't be found instead of failing.
+            To combine the calls, all of :paramref:`arguments` are read before the first combined
+            call is made.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            method (Callable[..., Awaitable]): The method to call, e.g. ``bot.send_message``.
+            arguments (Iterable[Mapping[:obj:`str`, ...]]): The keyword arguments for the calls,
+                one mapping per call. Except for combined calls of :meth:`delete_message`, the
+                arguments are read lazily, so this may also be e.g. a generator.
+
+        Keyword Args:
+            concurrency (:obj:`int`, optional): The maximum number of calls running concurrently.
+                Defaults to the :attr:`~telegram.request.BaseRequest.connection_pool_size` of
+                :attr:`request`, if set.
+            ordered (:obj:`bool`, optional): Whether the results are given in the order of
+                :paramref:`arguments`. Pass :obj:`False` to get the results in the order they
+                are completed instead. Defaults to :obj:`True`.
+
+                Note:
+                    In ordered mode, results that can't be given yet because an earlier call is
+                    still running are buffered. While :paramref:`concurrency` results are
+                    buffered, no new calls are made.
+
+        Yields:
+            tuple[Mapping[:obj:`str`, ...], ...]: The arguments of a call and its result or the
+            exception it raised.
+
+        Raises:
+            :exc:`ValueError`: If :paramref:`concurrency` is less than ``1``.
+        """
+        if concurrency is None:
+            concurrency = self.request.connection_pool_size or _DEFAULT_MAP_CONCURRENCY
+        if concurrency < 1:
+            raise ValueError("`concurrency` must be at least 1.")
+
+        calls = self._get_map_calls(method, arguments)
+        # Maps the running calls to the indices and arguments they were made for
+        running: dict[asyncio.Task, list[tuple[int, Mapping[str, Any]]]] = {}
+        # Results that can't be given yet because the results of earlier arguments are missing
+        finished: dict[int, tuple[Mapping[str, Any], RT | Exception]] = {}
+        next_index = 0
+        try:
+            while True:
+                # In ordered mode, the results of later calls are buffered until the earlier ones
+                # are done. To keep the buffer small, no new calls are made while it is full.
+                while len(running) < concurrency and (not running or len(finished) < concurrency):
+                    if (next_call := next(calls, None)) is None:
+                        break
+                    items, call = next_call
+                    running[asyncio.create_task(call())] = items
+                if not running:
+                    return
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=lambda task: running[task][0][0]):
+                    exc = task.exception()
+                    result = task.result() if exc is None else exc
+                    for index, kwargs in running.pop(task):
+                        if not ordered:
+                            yield kwargs, result
+                            continue
+
+                        finished[index] = (kwargs, result)
+                        while next_index in finished:
+                            yield finished.pop(next_index)
+                            next_index += 1
+        finally:
+            # Only relevant if the caller stopped iterating early, e.g. because of an exception
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+
+    def _get_map_calls(
+        self,
+        method: Callable[..., Awaitable[RT]],
+        arguments: Iterable[Mapping[str, Any]],
+    ) -> Iterator[tuple[list[tuple[int, Mapping[str, Any]]], Callable[[], Awaitable[Any]]]]:
+        """Gives the calls to make for :meth:`map` along with the indices and arguments they are
+        made for. Simple calls of :meth:`delete_message` are combined, see :meth:`map`.
+        """
+        if (
+            getattr(method, "__self__", None) is not self
+            or getattr(method, "__name__", None) != "delete_message"
+        ):
+            for index, kwargs in enumerate(arguments):
+                yield [(index, kwargs)], functools.partial(method, **kwargs)
+            return
+
+        chats: dict[int | str, list[tuple[int, Mapping[str, Any]]]] = {}
+        for index, kwargs in enumerate(arguments):
+            if kwargs.keys() == {"chat_id", "message_id"}:
+                chats.setdefault(kwargs["chat_id"], []).append((index, kwargs))
+            else:
+                yield [(index, kwargs)], functools.partial(method, **kwargs)
+
+        for chat_id, items in chats.items():
+            for start in range(0, len(items), BulkRequestLimit.MAX_LIMIT):
+                chunk = items[start : start + BulkRequestLimit.MAX_LIMIT]
+                if len(chunk) == 1:
+                    yield chunk, functools.partial(method, **chunk[0][1])
+                else:
+                    yield (
+                        chunk,
+                        functools.partial(
+                            self.delete_messages,
+                            chat_id=chat_id,
+                            message_ids=[kwargs["message_id"] for _, kwargs in chunk],
+                        ),
+                    )
+
     async def do_api_request(
         self,
         endpoint: str,
@@ -1158,6 +1344,138 @@ class Bot(TelegramObject, contextlib.AbstractAsyncContextManager["Bot"]):
             api_kwargs=api_kwargs,
         )
 
+    def create_message_template(
+        self,
+        text: str,
+        parse_mode: ODVInput[str] = DEFAULT_NONE,
+        entities: Sequence["MessageEntity"] | None = None,
+        disable_notification: ODVInput[bool] = DEFAULT_NONE,
+        protect_content: ODVInput[bool] = DEFAULT_NONE,
+        reply_markup: "ReplyMarkup | None" = None,
+        link_preview_options: ODVInput["LinkPreviewOptions"] = DEFAULT_NONE,
+        message_effect_id: str | None = None,
+        allow_paid_broadcast: bool | None = None,
+        *,
+        api_kwargs: JSONDict | None = None,
+    ) -> MessageTemplate:
+        """Prepares a text message that is sent to many chats, e.g. for broadcasts. The
+        parameters are converted and encoded only once instead of once per chat. Use
+        :meth:`send_message_template` to send the returned template.
+
+        Note:
+            * This method does not make a request to the Bot API.
+            * When using :paramref:`telegram.ext.ExtBot.arbitrary_callback_data`, the callback data
+              of :paramref:`reply_markup` is stored only once and shared by all messages sent
+              from the template. Dropping it, e.g. via
+              :meth:`telegram.ext.CallbackContext.drop_callback_data` after one user pressed a
+              button, or its removal from the cache once the cache is full, invalidates the
+              buttons of all these messages.
+
+        .. seealso:: :meth:`send_message`
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            text (:obj:`str`): Text of the message to be sent. Max
+                :tg-const:`telegram.constants.MessageLimit.MAX_TEXT_LENGTH` characters after
+                entities parsing.
+            parse_mode (:obj:`str`): |parse_mode|
+            entities (Sequence[:class:`telegram.MessageEntity`], optional): Sequence of special
+                entities that appear in message text, which can be specified instead of
+                :paramref:`parse_mode`.
+            disable_notification (:obj:`bool`, optional): |disable_notification|
+            protect_content (:obj:`bool`, optional): |protect_content|
+            reply_markup (:class:`InlineKeyboardMarkup` | :class:`ReplyKeyboardMarkup` | \
+                :class:`ReplyKeyboardRemove` | :class:`ForceReply`, optional):
+                Additional interface options. An object for an inline keyboard, custom reply
+                keyboard, instructions to remove reply keyboard or to force a reply from the user.
+            link_preview_options (:obj:`LinkPreviewOptions`, optional): Link preview generation
+                options for the message.
+            message_effect_id (:obj:`str`, optional): |message_effect_id|
+            allow_paid_broadcast (:obj:`bool`, optional): |allow_paid_broadcast|
+
+        Keyword Args:
+            api_kwargs (:obj:`dict`, optional): Arbitrary keyword arguments to be passed to the
+                Telegram API on every call of :meth:`send_message_template`.
+
+        Returns:
+            :class:`telegram.MessageTemplate`: The prepared message.
+        """
+        data: JSONDict = {
+            "allow_paid_broadcast": allow_paid_broadcast,
+            "disable_notification": disable_notification,
+            "entities": entities,
+            "link_preview_options": link_preview_options,
+            "message_effect_id": message_effect_id,
+            "parse_mode": parse_mode,
+            "protect_content": protect_content,
+            "reply_markup": reply_markup,
+            "text": text,
+        }
+        if api_kwargs:
+            data.update(api_kwargs)
+
+        # This also drops any None values because Telegram doesn't handle them well
+        return MessageTemplate(self._insert_defaults(data))
+
+    async def send_message_template(
+        self,
+        chat_id: int | str,
+        template: MessageTemplate,
+        message_thread_id: int | None = None,
+        reply_parameters: "ReplyParameters | None" = None,
+        business_connection_id: str | None = None,
+        direct_messages_topic_id: int | None = None,
+        *,
+        read_timeout: ODVInput[float] = DEFAULT_NONE,
+        write_timeout: ODVInput[float] = DEFAULT_NONE,
+        connect_timeout: ODVInput[float] = DEFAULT_NONE,
+        pool_timeout: ODVInput[float] = DEFAULT_NONE,
+        api_kwargs: JSONDict | None = None,
+    ) -> Message:
+        """Sends a text message that was prepared with :meth:`create_message_template`. Only the
+        parameters passed to this method are encoded, the prepared parameters of the template are
+        sent as they are.
+
+        .. seealso:: :meth:`send_message`
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            chat_id (:obj:`int` | :obj:`str`): |chat_id_channel|
+            template (:class:`telegram.MessageTemplate`): The prepared message.
+            message_thread_id (:obj:`int`, optional): |message_thread_id_arg|
+            reply_parameters (:class:`telegram.ReplyParameters`, optional): |reply_parameters|
+            business_connection_id (:obj:`str`, optional): |business_id_str|
+            direct_messages_topic_id (:obj:`int`, optional): |direct_messages_topic_id|
+
+        Returns:
+            :class:`telegram.Message`: On success, the sent message is returned.
+
+        Raises:
+            :class:`telegram.error.TelegramError`
+
+        """
+        data: JSONDict = {
+            "business_connection_id": business_connection_id,
+            "chat_id": chat_id,
+            "direct_messages_topic_id": direct_messages_topic_id,
+            "message_thread_id": message_thread_id,
+            "reply_parameters": reply_parameters,
+            # The values are instances of RequestParameter, which _do_post passes through
+            **template._parameters,  # pylint: disable=protected-access
+        }
+        result = await self._post(
+            "sendMessage",
+            data,
+            read_timeout=read_timeout,
+            write_timeout=write_timeout,
+            connect_timeout=connect_timeout,
+            pool_timeout=pool_timeout,
+            api_kwargs=api_kwargs,
+        )
+        return cast("Message", Message.de_json(result, self))
+
     async def delete_message(
         self,
         chat_id: str | int,
@@ -32,6 +32,7 @@ from telegram._reaction import ReactionType
 from telegram._telegramobject import TelegramObject
 from telegram._utils import enum
 from telegram._utils.defaultvalue import DEFAULT_NONE
+from telegram._utils.interning import InterningCache
 from telegram._utils.types import (
     CorrectOptionIds,
     FileInput,
@@ -48,6 +49,7 @@ if TYPE_CHECKING:
     from telegram import (
         Animation,
         Audio,
+        Bot,
         ChatInviteLink,
         ChatMember,
         Contact,
@@ -4209,6 +4211,10 @@ class _ChatBase(TelegramObject):
         )
 
 
+# The most recently decoded chats, see Chat.de_json
+_INTERNED_CHATS: "InterningCache[Chat]" = InterningCache(maxsize=1024)
+
+
 class Chat(_ChatBase):
     """This object represents a chat.
 
@@ -4272,3 +4278,15 @@ class Chat(_ChatBase):
     """
 
     __slots__ = ()
+
+    @classmethod
+    def de_json(cls, data: JSONDict, bot: "Bot | None" = None) -> "Chat":
+        """See :meth:`telegram.TelegramObject.de_json`.
+
+        .. versionchanged:: NEXT.VERSION
+            Chats are decoded from the same data over and over again, e.g. for all messages in
+            the same chat. Decoding the same data again can therefore return the previously
+            decoded object, which is shared since it's immutable, if this is enabled via
+            :func:`telegram.set_interning`.
+        """
+        return _INTERNED_CHATS.de_json(cls, data, bot, super().de_json)
@@ -354,6 +354,11 @@ class InlineKeyboardButton(TelegramObject):
             self.callback_data = callback_data
             self._set_id_attrs()
 
+    def _is_deeply_immutable(self) -> bool:
+        # The callback data is changed in place by update_callback_data, so buttons must
+        # never be shared
+        return False
+
     MIN_CALLBACK_DATA: Final[int] = constants.InlineKeyboardButtonLimit.MIN_CALLBACK_DATA
     """:const:`telegram.constants.InlineKeyboardButtonLimit.MIN_CALLBACK_DATA`
 
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2026
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the set_interning function."""
+
+from telegram._chat import _INTERNED_CHATS
+from telegram._user import _INTERNED_USERS
+
+
+def set_interning(enabled: bool) -> None:
+    """Enables or disables the interning of :class:`telegram.User` and :class:`telegram.Chat`
+    objects, which is disabled by default.
+
+    Users and chats are decoded from the same data over and over again, e.g. for all messages
+    in the same chat. While interning is enabled, :meth:`telegram.User.de_json` and
+    :meth:`telegram.Chat.de_json` may return a previously decoded object for identical data
+    instead of a new one. This saves allocations and memory, e.g. for messages stored in
+    :attr:`telegram.ext.Application.chat_data`.
+
+    Only frozen objects whose attributes are all immutable are shared. Still, sharing can be
+    noticed, e.g. calling :meth:`~telegram.TelegramObject.set_bot` on a user changes the bot of
+    all messages that contain the same user object. Moreover, the interned objects are cached
+    for the whole process and keep their bot alive. Only enable interning if your code does not
+    rely on getting distinct objects.
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        enabled (:obj:`bool`): Whether to intern users and chats. Disabling interning also
+            removes all objects that were interned so far.
+    """
+    for cache in (_INTERNED_USERS, _INTERNED_CHATS):
+        cache.enabled = enabled
+        if not enabled:
+            cache.clear()
@@ -21,7 +21,7 @@
 
 import datetime as dtm
 import re
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from html import escape
 from typing import TYPE_CHECKING, ClassVar, TypedDict
 
@@ -78,7 +78,13 @@ from telegram._user import User
 from telegram._utils.argumentparsing import parse_sequence_arg
 from telegram._utils.datetime import to_timestamp
 from telegram._utils.defaultvalue import DEFAULT_NONE, DefaultValue
-from telegram._utils.entities import parse_message_entities, parse_message_entity
+from telegram._utils.entities import (
+    NestedEntities,
+    get_utf_16_slicer,
+    nest_message_entities,
+    parse_message_entities,
+    parse_message_entity,
+)
 from telegram._utils.strings import TextEncoding
 from telegram._utils.types import (
     CorrectOptionIds,
@@ -1204,6 +1210,7 @@ class Message(MaybeInaccessibleMessage):
     # fmt: on
     __slots__ = (
         "_effective_attachment",
+        "_formatted_texts",
         "animation",
         "audio",
         "author_signature",
@@ -1573,6 +1580,7 @@ class Message(MaybeInaccessibleMessage):
             self.live_photo: LivePhoto | None = live_photo
 
             self._effective_attachment = DEFAULT_NONE
+            self._formatted_texts: dict[str, str] | None = None
 
             self._id_attrs = (self.message_id, self.chat)
 
@@ -5333,40 +5341,67 @@ class Message(MaybeInaccessibleMessage):
         """
         return parse_message_entities(self.caption, self.caption_entities, types=types)
 
+    def _unfreeze(self) -> None:
+        super()._unfreeze()
+        # The text and entities may be changed now
+        self._formatted_texts = None
+
+    def _get_formatted_text(self, name: str, formatter: Callable[[], str]) -> str:
+        """Memoizes the results of the properties like :attr:`text_html` per message. This is
+        safe since messages are immutable. The memo is reset by :meth:`_unfreeze`.
+        """
+        if not self._frozen:
+            # Attributes of unfrozen objects may change, so the result may be outdated
+            return formatter()
+
+        # Objects unpickled from older versions don't have this attribute
+        formatted_texts = getattr(self, "_formatted_texts", None)
+        if formatted_texts is None:
+            formatted_texts = self._formatted_texts = {}
+        if (formatted_text := formatted_texts.get(name)) is None:
+            formatted_text = formatted_texts[name] = formatter()
+        return formatted_text
+
     @classmethod
     def _parse_html(
         cls,
         message_text: str | None,
         entities: dict[MessageEntity, str],
         urled: bool = False,
-        offset: int = 0,
     ) -> str | None:
         if message_text is None:
             return None
 
-        utf_16_text = message_text.encode(TextEncoding.UTF_16_LE)
-        html_text = ""
-        last_offset = 0
-
-        sorted_entities = sorted(entities.items(), key=lambda item: item[0].offset)
-        parsed_entities = []
-
-        for entity, text in sorted_entities:
-            if entity in parsed_entities:
-                continue
-
-            nested_entities = {
-                e: t
-                for (e, t) in sorted_entities
-                if e.offset >= entity.offset
-                and e.offset + e.length <= entity.offset + entity.length
-                and e != entity
-            }
-            parsed_entities.extend(list(nested_entities.keys()))
-
-            if nested_entities:
-                escaped_text = cls._parse_html(
-                    text, nested_entities, urled=urled, offset=entity.offset
+        return cls._render_html(
+            get_utf_16_slicer(message_text),
+            entities,
+            nest_message_entities(entities),
+            urled=urled,
+        )
+
+    @classmethod
+    def _render_html(
+        cls,
+        slice_text: Callable[[int, int | None], str],
+        entities: dict[MessageEntity, str],
+        nested_entities: NestedEntities,
+        urled: bool,
+        start: int = 0,
+        end: int | None = None,
+    ) -> str:
+        parts = []
+        last_offset = start
+
+        for entity, children in nested_entities:
+            text = entities[entity]
+            if children:
+                escaped_text = cls._render_html(
+                    slice_text,
+                    entities,
+                    children,
+                    urled=urled,
+                    start=entity.offset,
+                    end=entity.offset + entity.length,
                 )
             else:
                 escaped_text = escape(text)
@@ -5417,21 +5452,15 @@ class Message(MaybeInaccessibleMessage):
             # Make sure to escape the text that is not part of the entity
             # if we're in a nested entity, this is still required, since in that case this
             # text is part of the parent entity
-            html_text += (
-                escape(
-                    utf_16_text[last_offset * 2 : (entity.offset - offset) * 2].decode(
-                        TextEncoding.UTF_16_LE
-                    )
-                )
-                + insert
-            )
+            parts.append(escape(slice_text(last_offset, entity.offset)))
+            parts.append(insert)
 
-            last_offset = entity.offset - offset + entity.length
+            last_offset = entity.offset + entity.length
 
         # see comment above
-        html_text += escape(utf_16_text[last_offset * 2 :].decode(TextEncoding.UTF_16_LE))
+        parts.append(escape(slice_text(last_offset, end)))
 
-        return html_text
+        return "".join(parts)
 
     @property
     def text_html(self) -> str:
@@ -5456,7 +5485,10 @@ class Message(MaybeInaccessibleMessage):
             :obj:`str`: Message text with entities formatted as HTML.
 
         """
-        return self._parse_html(self.text, self.parse_entities(), urled=False)
+        return self._get_formatted_text(
+            "text_html",
+            lambda: self._parse_html(self.text, self.parse_entities(), urled=False),
+        )
 
     @property
     def text_html_urled(self) -> str:
@@ -5481,7 +5513,10 @@ class Message(MaybeInaccessibleMessage):
             :obj:`str`: Message text with entities formatted as HTML.
 
         """
-        return self._parse_html(self.text, self.parse_entities(), urled=True)
+        return self._get_formatted_text(
+            "text_html_urled",
+            lambda: self._parse_html(self.text, self.parse_entities(), urled=True),
+        )
 
     @property
     def caption_html(self) -> str:
@@ -5506,7 +5541,10 @@ class Message(MaybeInaccessibleMessage):
         Returns:
             :obj:`str`: Message caption with caption entities formatted as HTML.
         """
-        return self._parse_html(self.caption, self.parse_caption_entities(), urled=False)
+        return self._get_formatted_text(
+            "caption_html",
+            lambda: self._parse_html(self.caption, self.parse_caption_entities(), urled=False),
+        )
 
     @property
     def caption_html_urled(self) -> str:
@@ -5531,7 +5569,10 @@ class Message(MaybeInaccessibleMessage):
         Returns:
             :obj:`str`: Message caption with caption entities formatted as HTML.
         """
-        return self._parse_html(self.caption, self.parse_caption_entities(), urled=True)
+        return self._get_formatted_text(
+            "caption_html_urled",
+            lambda: self._parse_html(self.caption, self.parse_caption_entities(), urled=True),
+        )
 
     @classmethod
     def _parse_markdown(
@@ -5540,7 +5581,6 @@ class Message(MaybeInaccessibleMessage):
         entities: dict[MessageEntity, str],
         urled: bool = False,
         version: MarkdownVersion = 1,
-        offset: int = 0,
     ) -> str | None:
         if version == 1:
             for entity_type in (
@@ -5559,36 +5599,42 @@ class Message(MaybeInaccessibleMessage):
         if message_text is None:
             return None
 
-        utf_16_text = message_text.encode(TextEncoding.UTF_16_LE)
-        markdown_text = ""
-        last_offset = 0
-
-        sorted_entities = sorted(entities.items(), key=lambda item: item[0].offset)
-        parsed_entities = []
-
-        for entity, text in sorted_entities:
-            if entity in parsed_entities:
-                continue
-
-            nested_entities = {
-                e: t
-                for (e, t) in sorted_entities
-                if e.offset >= entity.offset
-                and e.offset + e.length <= entity.offset + entity.length
-                and e != entity
-            }
-            parsed_entities.extend(list(nested_entities.keys()))
+        return cls._render_markdown(
+            get_utf_16_slicer(message_text),
+            entities,
+            nest_message_entities(entities),
+            urled=urled,
+            version=version,
+        )
 
-            if nested_entities:
+    @classmethod
+    def _render_markdown(
+        cls,
+        slice_text: Callable[[int, int | None], str],
+        entities: dict[MessageEntity, str],
+        nested_entities: NestedEntities,
+        urled: bool,
+        version: MarkdownVersion,
+        start: int = 0,
+        end: int | None = None,
+    ) -> str:
+        parts = []
+        last_offset = start
+
+        for entity, children in nested_entities:
+            text = entities[entity]
+            if children:
                 if version < 2:
                     raise ValueError("Nested entities are not supported for Markdown version 1")
 
-                escaped_text = cls._parse_markdown(
-                    text,
-                    nested_entities,
+                escaped_text = cls._render_markdown(
+                    slice_text,
+                    entities,
+                    children,
                     urled=urled,
-                    offset=entity.offset,
                     version=version,
+                    start=entity.offset,
+                    end=entity.offset + entity.length,
                 )
             else:
                 escaped_text = escape_markdown(text, version=version)
@@ -5657,25 +5703,15 @@ class Message(MaybeInaccessibleMessage):
             # Make sure to escape the text that is not part of the entity
             # if we're in a nested entity, this is still required, since in that case this
             # text is part of the parent entity
-            markdown_text += (
-                escape_markdown(
-                    utf_16_text[last_offset * 2 : (entity.offset - offset) * 2].decode(
-                        TextEncoding.UTF_16_LE
-                    ),
-                    version=version,
-                )
-                + insert
-            )
+            parts.append(escape_markdown(slice_text(last_offset, entity.offset), version=version))
+            parts.append(insert)
 
-            last_offset = entity.offset - offset + entity.length
+            last_offset = entity.offset + entity.length
 
         # see comment above
-        markdown_text += escape_markdown(
-            utf_16_text[last_offset * 2 :].decode(TextEncoding.UTF_16_LE),
-            version=version,
-        )
+        parts.append(escape_markdown(slice_text(last_offset, end), version=version))
 
-        return markdown_text
+        return "".join(parts)
 
     @property
     def text_markdown(self) -> str:
@@ -5706,7 +5742,10 @@ class Message(MaybeInaccessibleMessage):
                 blockquote or nested entities.
 
         """
-        return self._parse_markdown(self.text, self.parse_entities(), urled=False)
+        return self._get_formatted_text(
+            "text_markdown",
+            lambda: self._parse_markdown(self.text, self.parse_entities(), urled=False),
+        )
 
     @property
     def text_markdown_v2(self) -> str:
@@ -5731,7 +5770,10 @@ class Message(MaybeInaccessibleMessage):
         Returns:
             :obj:`str`: Message text with entities formatted as Markdown.
         """
-        return self._parse_markdown(self.text, self.parse_entities(), urled=False, version=2)
+        return self._get_formatted_text(
+            "text_markdown_v2",
+            lambda: self._parse_markdown(self.text, self.parse_entities(), urled=False, version=2),
+        )
 
     @property
     def text_markdown_urled(self) -> str:
@@ -5763,7 +5805,10 @@ class Message(MaybeInaccessibleMessage):
                 blockquote or nested entities.
 
         """
-        return self._parse_markdown(self.text, self.parse_entities(), urled=True)
+        return self._get_formatted_text(
+            "text_markdown_urled",
+            lambda: self._parse_markdown(self.text, self.parse_entities(), urled=True),
+        )
 
     @property
     def text_markdown_v2_urled(self) -> str:
@@ -5788,7 +5833,10 @@ class Message(MaybeInaccessibleMessage):
         Returns:
             :obj:`str`: Message text with entities formatted as Markdown.
         """
-        return self._parse_markdown(self.text, self.parse_entities(), urled=True, version=2)
+        return self._get_formatted_text(
+            "text_markdown_v2_urled",
+            lambda: self._parse_markdown(self.text, self.parse_entities(), urled=True, version=2),
+        )
 
     @property
     def caption_markdown(self) -> str:
@@ -5818,7 +5866,10 @@ class Message(MaybeInaccessibleMessage):
                 blockquote or nested entities.
 
         """
-        return self._parse_markdown(self.caption, self.parse_caption_entities(), urled=False)
+        return self._get_formatted_text(
+            "caption_markdown",
+            lambda: self._parse_markdown(self.caption, self.parse_caption_entities(), urled=False),
+        )
 
     @property
     def caption_markdown_v2(self) -> str:
@@ -5843,8 +5894,11 @@ class Message(MaybeInaccessibleMessage):
         Returns:
             :obj:`str`: Message caption with caption entities formatted as Markdown.
         """
-        return self._parse_markdown(
-            self.caption, self.parse_caption_entities(), urled=False, version=2
+        return self._get_formatted_text(
+            "caption_markdown_v2",
+            lambda: self._parse_markdown(
+                self.caption, self.parse_caption_entities(), urled=False, version=2
+            ),
         )
 
     @property
@@ -5877,7 +5931,10 @@ class Message(MaybeInaccessibleMessage):
                 blockquote or nested entities.
 
         """
-        return self._parse_markdown(self.caption, self.parse_caption_entities(), urled=True)
+        return self._get_formatted_text(
+            "caption_markdown_urled",
+            lambda: self._parse_markdown(self.caption, self.parse_caption_entities(), urled=True),
+        )
 
     @property
     def caption_markdown_v2_urled(self) -> str:
@@ -5902,6 +5959,9 @@ class Message(MaybeInaccessibleMessage):
         Returns:
             :obj:`str`: Message caption with caption entities formatted as Markdown.
         """
-        return self._parse_markdown(
-            self.caption, self.parse_caption_entities(), urled=True, version=2
+        return self._get_formatted_text(
+            "caption_markdown_v2_urled",
+            lambda: self._parse_markdown(
+                self.caption, self.parse_caption_entities(), urled=True, version=2
+            ),
         )
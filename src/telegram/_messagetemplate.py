@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2026
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the MessageTemplate class."""
+
+from types import MappingProxyType
+from typing import TYPE_CHECKING, cast, final
+
+from telegram._utils.repr import build_repr_with_selected_attrs
+from telegram._utils.types import JSONDict
+from telegram.request._requestparameter import RequestParameter
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+@final
+class MessageTemplate:
+    """A text message that was prepared once to be sent to many chats, e.g. for broadcasts.
+
+    All parameters of the message are converted and JSON encoded when the template is created.
+    Sending the template with :meth:`telegram.Bot.send_message_template` only needs to encode
+    the parameters that differ between the chats, like the chat id. This makes sending the same
+    large :class:`~telegram.InlineKeyboardMarkup` or long list of
+    :class:`~telegram.MessageEntity` objects to many chats considerably cheaper than calling
+    :meth:`telegram.Bot.send_message` repeatedly.
+
+    Instances of this class are immutable and should be created with
+    :meth:`telegram.Bot.create_message_template` instead of manually.
+
+    Note:
+        Default values of :class:`telegram.ext.Defaults` and the replacement of arbitrary
+        callback data are applied when the template is created. Templates should therefore only
+        be sent by the bot that created them.
+
+    .. seealso:: :meth:`telegram.Bot.create_message_template`,
+        :meth:`telegram.Bot.send_message_template`
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        parameters (dict[:obj:`str`, :obj:`object`]): The parameters of the message as passed to
+            the Bot API. Must not contain files to upload.
+
+    Raises:
+        :exc:`ValueError`: If one of the parameters contains a file that needs to be uploaded.
+    """
+
+    __slots__ = ("_parameters",)
+
+    def __init__(self, parameters: JSONDict):
+        request_parameters: dict[str, RequestParameter] = {}
+        for name, value in parameters.items():
+            request_parameter = RequestParameter.from_input(name, value)
+            # File contents can only be read once, so they can't be reused across requests
+            if request_parameter.input_files:
+                raise ValueError(f"Parameter `{name}` of a message template can't upload files.")
+            # Encode the value right away. The result is cached by the RequestParameter
+            _ = request_parameter.json_value
+            request_parameters[name] = request_parameter
+
+        self._parameters: Mapping[str, RequestParameter] = MappingProxyType(request_parameters)
+
+    def __repr__(self) -> str:
+        """Give a string representation of the template in the form
+        ``MessageTemplate[text=...]``.
+
+        As this class doesn't implement :meth:`object.__str__`, the default implementation
+        will be used, which is equivalent to :meth:`__repr__`.
+
+        Returns:
+            :obj:`str`
+        """
+        return build_repr_with_selected_attrs(self, text=self.text)
+
+    @property
+    def text(self) -> str:
+        """:obj:`str`: The text of the message."""
+        return cast("str", self._parameters["text"].value)
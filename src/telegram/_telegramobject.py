@@ -19,12 +19,14 @@
 """Base class for Telegram Objects."""
 
 import contextlib
+import copyreg
 import datetime as dtm
 import inspect
 import json
-from collections.abc import Iterator, Mapping, Sequence, Sized
+from collections.abc import Callable, Iterator, Mapping, Sequence, Sized
 from contextlib import contextmanager
 from copy import deepcopy
+from enum import Enum
 from itertools import chain
 from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, ClassVar, TypeVar, cast, get_args, get_origin
@@ -46,6 +48,36 @@ if TYPE_CHECKING:
 Tele_co = TypeVar("Tele_co", bound="TelegramObject", covariant=True)
 Tele = TypeVar("Tele", bound="TelegramObject")
 _DATETIME_FIELD = object()  # Sentinel that marks datetime fields in the de_json plan.
+# Version of the format produced by TelegramObject.__reduce__. When changing the format, increase
+# this and keep _reconstruct_telegram_object able to load all previous versions.
+_STATE_FORMAT_VERSION = 1
+# Attributes that cache values derived from the other attributes. They are recomputed on demand
+# and hence neither pickled nor deep copied.
+_CACHE_ATTRS = frozenset(("_deeply_immutable", "_formatted_texts"))
+# Attributes that are passed separately or not at all in the state produced by __reduce__
+_NON_STATE_ATTRS = frozenset(("_bot", "_frozen", "api_kwargs")) | _CACHE_ATTRS
+# Values of these types are included in TelegramObject.to_dict as they are
+_JSON_SCALAR_TYPES = frozenset((str, int, float, bool))
+
+
+def _reconstruct_telegram_object(
+    version: int,
+    cls: type[Tele],
+    names: tuple[str, ...],
+    values: tuple[object, ...],
+    api_kwargs: JSONDict | None,
+    frozen: bool,
+    bot: "Bot | None",
+) -> Tele:
+    """Unpickles objects pickled by :meth:`TelegramObject.__reduce__`. This function should be
+    kept in place for backwards compatibility even if the pickling logic is changed, since
+    references to it are stored in the pickled data.
+    """
+    if version != _STATE_FORMAT_VERSION:
+        raise ValueError(f"Unknown version {version} of the pickled state of {cls.__name__}")
+    return cls._from_state(  # pylint: disable=protected-access
+        names, values, api_kwargs, frozen, bot
+    )
 
 
 class TelegramObject:
@@ -53,7 +85,7 @@ class TelegramObject:
 
     Objects of this type are subscriptable with strings. See :meth:`__getitem__` for more details.
     The :mod:`pickle` and :func:`~copy.deepcopy` behavior of objects of this type are defined by
-    :meth:`__getstate__`, :meth:`__setstate__` and :meth:`__deepcopy__`.
+    :meth:`__reduce__`, :meth:`__setstate__` and :meth:`__deepcopy__`.
 
     Tip:
         Objects of this type can be serialized via Python's :mod:`pickle` module and pickled
@@ -85,7 +117,7 @@ class TelegramObject:
 
     """
 
-    __slots__ = ("_bot", "_frozen", "_id_attrs", "api_kwargs")
+    __slots__ = ("_bot", "_deeply_immutable", "_frozen", "_id_attrs", "api_kwargs")
 
     # Names accepted by this class' __init__. Built alongside the transformation plan.
     __INIT_PARAMS: ClassVar[set[str]] = set()
@@ -113,12 +145,20 @@ class TelegramObject:
     # The values are class name strings, e.g. "TransactionPartnerChat".
     __DE_JSON_DISPATCH__: ClassVar[tuple[str, dict[str, str]] | None] = None
 
+    # Per-class names of the slot attributes built once by _build_attr_names().
+    # Format: (all names, names without the private ones, names pickled by __reduce__), see
+    # _get_attrs_names and _reduce.
+    __ATTR_NAMES__: ClassVar[tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...]]]
+
     def __init__(self, *, api_kwargs: JSONDict | None = None) -> None:
         # Setting _frozen to `False` here means that classes without arguments still need to
         # implement __init__. However, with `True` would mean increased usage of
         # `with self._unfrozen()` in the `__init__` of subclasses and we have fewer empty
         # classes than classes with arguments.
         self._frozen: bool = False
+        # Computed on demand by _is_deeply_immutable and reset when the object is unfrozen. Only
+        # cached for objects that don't contain other TelegramObjects, see there.
+        self._deeply_immutable: bool | None = None
         self._id_attrs: tuple[object, ...] = ()
         self._bot: Bot | None = None
         # We don't do anything with api_kwargs here - see docstring of _apply_api_kwargs
@@ -290,6 +330,9 @@ class TelegramObject:
         # MappingProxyType is not pickable, so we convert it to a dict and revert in
         # __setstate__
         out["api_kwargs"] = dict(self.api_kwargs)
+        # These are recomputed on demand after unpickling
+        for key in _CACHE_ATTRS:
+            out.pop(key, None)
         return out
 
     def __setstate__(self, state: dict[str, object]) -> None:
@@ -352,6 +395,109 @@ class TelegramObject:
         if frozen:
             self._freeze()
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        """
+        Customizes how :mod:`pickle` and :func:`copy.copy` process objects of this type.
+
+        Instead of a dictionary per object as returned by :meth:`__getstate__`, the state is
+        stored as a tuple of the attribute values along with a tuple of the attribute names. The
+        latter is the same object for all objects of a class and is hence stored only once per
+        pickle by :mod:`pickle`, which makes pickles of many objects smaller and faster to create
+        and load. Like for :meth:`__getstate__`, the :class:`telegram.Bot` instance set with
+        :meth:`set_bot` (if any) is not part of the state.
+
+        When loading objects that were pickled with a different version of the class, i.e. with
+        different attribute names, :meth:`__setstate__` is used to handle the differences.
+
+        Subclasses that override :meth:`__getstate__` or :meth:`__setstate__` are pickled with
+        the default protocol instead, such that their overrides are used.
+
+        .. versionadded:: NEXT.VERSION
+
+        Returns:
+            tuple[Callable, tuple[:obj:`object`, ...], ...]: The function reconstructing the
+            object, its arguments and optionally the state.
+        """
+        if not self._has_default_state():
+            return copyreg.__newobj__, (self.__class__,), self.__getstate__()
+        return self._reduce(remove_bot=True)
+
+    @classmethod
+    def _has_default_state(cls) -> bool:
+        """Checks whether the class uses :meth:`__getstate__` and :meth:`__setstate__` of this
+        class. Only then the compact state of :meth:`_reduce` can be used, as it bypasses these
+        methods.
+        """
+        return (
+            cls.__getstate__ is TelegramObject.__getstate__
+            and cls.__setstate__ is TelegramObject.__setstate__
+        )
+
+    def _reduce(
+        self, remove_bot: bool
+    ) -> tuple[Callable[..., "TelegramObject"], tuple[object, ...]]:
+        """Gives the arguments for :func:`_reconstruct_telegram_object`, see :meth:`__reduce__`.
+
+        Args:
+            remove_bot (:obj:`bool`): Whether the bot should be excluded from the state.
+        """
+        cls = self.__class__
+        names = (
+            cls.__ATTR_NAMES__ if "__ATTR_NAMES__" in cls.__dict__ else cls._build_attr_names()
+        )[2]
+        if hasattr(self, "__dict__"):
+            # User defined subclasses without slots. These names differ from the class' names,
+            # so __setstate__ is used on unpickling.
+            names = (*names, *self.__dict__)
+        return _reconstruct_telegram_object, (
+            _STATE_FORMAT_VERSION,
+            cls,
+            names,
+            tuple(getattr(self, name, None) for name in names),
+            # MappingProxyType is not pickable, so we convert it to a dict
+            dict(self.api_kwargs) if self.api_kwargs else None,
+            self._frozen,
+            None if remove_bot else self._bot,
+        )
+
+    @classmethod
+    def _from_state(
+        cls: type[Tele],
+        names: tuple[str, ...],
+        values: tuple[object, ...],
+        api_kwargs: JSONDict | None,
+        frozen: bool,
+        bot: "Bot | None",
+    ) -> Tele:
+        """Creates an object from the state produced by :meth:`_reduce`."""
+        obj = cls.__new__(cls)
+        all_names = (
+            cls.__ATTR_NAMES__ if "__ATTR_NAMES__" in cls.__dict__ else cls._build_attr_names()
+        )
+        if names != all_names[2]:
+            # The class changed since the object was pickled
+            state = dict(zip(names, values, strict=True))
+            state["api_kwargs"] = api_kwargs or {}
+            state["_frozen"] = frozen
+            obj.__setstate__(state)
+            obj._bot = bot
+            return obj
+
+        # The object is not frozen yet, so we can skip TelegramObject.__setattr__
+        set_attr = object.__setattr__
+        set_attr(obj, "_frozen", False)
+        set_attr(obj, "_deeply_immutable", None)
+        set_attr(obj, "_bot", bot)
+        for name, value in zip(names, values, strict=True):
+            set_attr(obj, name, value)
+        if api_kwargs:
+            # See __setstate__
+            obj._apply_api_kwargs(api_kwargs)
+        set_attr(obj, "api_kwargs", MappingProxyType(api_kwargs or {}))
+        if frozen:
+            obj._freeze()
+        return obj
+
     def __deepcopy__(self: Tele_co, memodict: dict[int, object]) -> Tele_co:
         """
         Customizes how :func:`copy.deepcopy` processes objects of this type.
@@ -377,8 +523,9 @@ class TelegramObject:
 
         # now we set the attributes in the deepcopied object
         for k in self._get_attrs_names(include_private=True):
-            if k == "_frozen":
-                # Setting the frozen status to True would prevent the attributes from being set
+            if k == "_frozen" or k in _CACHE_ATTRS:
+                # Setting the frozen status to True would prevent the attributes from being set.
+                # Cached values are recomputed on demand.
                 continue
             if k == "api_kwargs":
                 # Need to copy api_kwargs manually, since it's a MappingProxyType is not
@@ -387,7 +534,11 @@ class TelegramObject:
                 continue
 
             try:
-                setattr(result, k, deepcopy(getattr(self, k), memodict))
+                value = getattr(self, k)
+                # deepcopy returns these values unchanged, so we can skip the call
+                if type(value) not in _ATOMIC_TYPES:
+                    value = deepcopy(value, memodict)
+                setattr(result, k, value)
             except AttributeError:
                 # Skip missing attributes. This can happen if the object was loaded from a pickle
                 # file that was created with an older version of the library, where the class
@@ -621,6 +772,41 @@ class TelegramObject:
 
     def _unfreeze(self) -> None:
         self._frozen = False
+        # The attributes may be changed now
+        self._deeply_immutable = None
+
+    def _is_deeply_immutable(self) -> bool:
+        """Checks whether this object is frozen and all its attributes and :attr:`api_kwargs`
+        are immutable, recursively. Such objects can be interned, see
+        :func:`telegram.set_interning`.
+
+        The result is cached until :meth:`_unfreeze` is called, but only if the object does not
+        contain other :class:`TelegramObject` instances. Unfreezing those would not reset the
+        cached result of this object.
+
+        Private attributes are checked as well, since subclasses may keep mutable state in them.
+        Only the bot and the values cached on demand are skipped.
+
+        Returns:
+            :obj:`bool`
+        """
+        if not self._frozen:
+            return False
+
+        # getattr, since objects unpickled or deep copied don't necessarily have the attribute
+        deeply_immutable = getattr(self, "_deeply_immutable", None)
+        if deeply_immutable is not None:
+            return deeply_immutable
+
+        children: list[TelegramObject] = []
+        deeply_immutable = all(
+            _is_immutable_value(getattr(self, key, None), children)
+            for key in self._get_attrs_names(include_private=True)
+            if key not in _NON_STATE_ATTRS
+        ) and all(_is_immutable_value(value, children) for value in self.api_kwargs.values())
+        if not children:
+            self._deeply_immutable = deeply_immutable
+        return deeply_immutable
 
     def _apply_api_kwargs(self, api_kwargs: JSONDict) -> None:
         """Loops through the api kwargs and for every key that exists as attribute of the
@@ -653,6 +839,31 @@ class TelegramObject:
             class_name := self.__class__.__name__
         ) in _TIME_PERIOD_DEPRECATIONS and attr in _TIME_PERIOD_DEPRECATIONS[class_name]
 
+    @classmethod
+    def _build_attr_names(cls) -> tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...]]:
+        """Builds the names of the slot attributes of this class. Called once per class on the
+        first call of :meth:`_get_attrs_names` or :meth:`_reduce`.
+
+        Returns:
+            tuple[tuple[:obj:`str`, ...], tuple[:obj:`str`, ...], tuple[:obj:`str`, ...]]: The
+            names of all attributes, the names of the non-private attributes and the names of the
+            attributes pickled by :meth:`__reduce__`.
+        """
+        # We want to get all attributes for the class, using cls.__slots__ only includes the
+        # attributes used by that class itself, and not its superclass(es). Hence, we get its MRO
+        # and then get their attributes. The `[:-1]` slice excludes the `object` class
+        all_slots = tuple(s for c in cls.__mro__[:-1] for s in c.__slots__)  # type: ignore
+        deprecated_attrs = _TIME_PERIOD_DEPRECATIONS.get(cls.__name__, ())
+        public_slots = tuple(
+            attr
+            for attr in all_slots
+            # Include deprecated private attributes, which are exposed via properties
+            if not attr.startswith("_") or attr in deprecated_attrs
+        )
+        state_slots = tuple(attr for attr in all_slots if attr not in _NON_STATE_ATTRS)
+        cls.__ATTR_NAMES__ = (all_slots, public_slots, state_slots)
+        return cls.__ATTR_NAMES__
+
     def _get_attrs_names(self, include_private: bool) -> Iterator[str]:
         """
         Returns the names of the attributes of this object. This is used to determine which
@@ -664,22 +875,24 @@ class TelegramObject:
         Returns:
             Iterator[:obj:`str`]: An iterator over the names of the attributes of this object.
         """
-        # We want to get all attributes for the class, using self.__slots__ only includes the
-        # attributes used by that class itself, and not its superclass(es). Hence, we get its MRO
-        # and then get their attributes. The `[:-1]` slice excludes the `object` class
-        all_slots = (s for c in self.__class__.__mro__[:-1] for s in c.__slots__)  # type: ignore
-        # chain the class's slots with the user defined subclass __dict__ (class has no slots)
-        all_attrs = (
-            chain(all_slots, self.__dict__.keys()) if hasattr(self, "__dict__") else all_slots
+        cls = self.__class__
+        all_slots, public_slots, _ = (
+            cls.__ATTR_NAMES__ if "__ATTR_NAMES__" in cls.__dict__ else cls._build_attr_names()
         )
+        slots = all_slots if include_private else public_slots
+        if not hasattr(self, "__dict__"):
+            return iter(slots)
 
+        # chain the class's slots with the user defined subclass __dict__ (class has no slots)
         if include_private:
-            return all_attrs
-        return (
-            attr
-            for attr in all_attrs
-            # Include deprecated private attributes, which are exposed via properties
-            if not attr.startswith("_") or self._is_deprecated_attr(attr)
+            return chain(slots, self.__dict__.keys())
+        return chain(
+            slots,
+            (
+                attr
+                for attr in self.__dict__
+                if not attr.startswith("_") or self._is_deprecated_attr(attr)
+            ),
         )
 
     def _get_attrs(
@@ -756,18 +969,38 @@ class TelegramObject:
         Returns:
             :obj:`dict`
         """
-        out = self._get_attrs(recursive=recursive)
+        out: JSONDict = {}
+        # These are added after the other attributes
+        from_user: JSONDict | None = None
+        timedelta_dict: JSONDict = {}
+
+        # This is called for every object sent to Telegram, so we convert all attributes in a
+        # single pass over the cached attribute names. Converting TGObjects to dicts inside
+        # objects such as sequences and datetimes to timestamps here mostly eliminates the need
+        # for subclasses to override `to_dict`
+        for key in self._get_attrs_names(include_private=False):
+            value = getattr(self, key, None)
+            # By far the most common cases, so we check them first
+            if value.__class__ in _JSON_SCALAR_TYPES:
+                out[key] = value
+                continue
+            if value is None or (
+                isinstance(value, DefaultValue) and (value := value.value) is None
+            ):
+                if not recursive:
+                    out[key] = value
+                continue
 
-        # Now we should convert TGObjects to dicts inside objects such as sequences, and convert
-        # datetimes to timestamps. This mostly eliminates the need for subclasses to override
-        # `to_dict`
-        pop_keys: set[str] = set()
-        timedelta_dict: dict = {}
-        for key, value in out.items():
-            if isinstance(value, tuple | list):
+            if key == "api_kwargs":
+                continue
+            if recursive and hasattr(value, "to_dict"):
+                if key == "from_user":
+                    from_user = value.to_dict(recursive=True)
+                else:
+                    out[key] = value.to_dict(recursive=True)
+            elif isinstance(value, tuple | list):
+                # Empty sequences are not included
                 if not value:
-                    # not popping directly to avoid changing the dict size during iteration
-                    pop_keys.add(key)
                     continue
 
                 val = []  # empty list to append our converted values to
@@ -785,7 +1018,6 @@ class TelegramObject:
                     else:  # if it's not a TGObject, just append it. E.g. [TGObject, 2]
                         val.append(item)
                 out[key] = val
-
             elif isinstance(value, dtm.datetime):
                 out[key] = to_timestamp(value)
             elif isinstance(value, dtm.timedelta):
@@ -793,23 +1025,18 @@ class TelegramObject:
                 # 'BadRquest' when expecting integers (e.g. InputMediaVideo.duration).
                 # Other times, floats are accepted but the Bot API handles ints just as well
                 # (e.g. InputStoryContentVideo.duration).
-                # Not updating `out` directly to avoid changing the dict size during iteration
+                # Deprecated time period attributes are private and exposed without the prefix
                 timedelta_dict[key.removeprefix("_")] = (
                     int(seconds) if (seconds := value.total_seconds()).is_integer() else seconds
                 )
-                # This will sometimes add non-deprecated timedelta attributes to pop_keys.
-                # We'll restore them shortly.
-                pop_keys.add(key)
+            else:
+                out[key] = value
 
-        for key in pop_keys:
-            out.pop(key)
-
-        # `out.update` must to be called *after* we pop deprecated time period attributes
-        # this ensures that we restore attributes that were already using datetime.timdelta
+        if from_user:
+            out["from"] = from_user
         out.update(timedelta_dict)
-
-        # Effectively "unpack" api_kwargs into `out`:
-        out.update(out.pop("api_kwargs", {}))  # type: ignore[call-overload]
+        # Effectively "unpack" api_kwargs into `out`
+        out.update(self.api_kwargs)
         return out
 
     def get_bot(self) -> "Bot":
@@ -842,6 +1069,40 @@ class TelegramObject:
 
 
 # We use str keys to avoid importing which causes circular dependencies
+# Types that copy.deepcopy returns unchanged
+_ATOMIC_TYPES = frozenset((type(None), str, bytes, int, float, bool, complex))
+# Types whose instances can't be changed, see TelegramObject._is_deeply_immutable
+_IMMUTABLE_TYPES = (
+    str,
+    bytes,
+    int,
+    float,
+    complex,
+    dtm.date,
+    dtm.time,
+    dtm.timedelta,
+    dtm.tzinfo,
+    Enum,
+)
+
+
+def _is_immutable_value(value: object, children: list[TelegramObject]) -> bool:
+    """Checks whether a value of an attribute of a :class:`TelegramObject` is immutable,
+    including all values contained in it. Used by :meth:`TelegramObject._is_deeply_immutable`.
+    The :class:`TelegramObject` instances found on the way are appended to ``children``.
+    """
+    if value is None or isinstance(value, _IMMUTABLE_TYPES):
+        return True
+    if isinstance(value, TelegramObject):
+        children.append(value)
+        return value._is_deeply_immutable()  # pylint: disable=protected-access
+    if isinstance(value, tuple | frozenset):
+        return all(_is_immutable_value(item, children) for item in value)
+    if isinstance(value, DefaultValue):
+        return _is_immutable_value(value.value, children)
+    return False
+
+
 _TIME_PERIOD_DEPRECATIONS: dict[str, tuple[str, ...]] = {
     "ChatFullInfo": ("_message_auto_delete_time", "_slow_mode_delay"),
     "Animation": ("_duration",),
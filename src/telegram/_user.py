@@ -27,6 +27,7 @@ from telegram._inline.inlinekeyboardbutton import InlineKeyboardButton
 from telegram._menubutton import MenuButton
 from telegram._telegramobject import TelegramObject
 from telegram._utils.defaultvalue import DEFAULT_NONE
+from telegram._utils.interning import InterningCache
 from telegram._utils.types import (
     CorrectOptionIds,
     JSONDict,
@@ -41,6 +42,7 @@ if TYPE_CHECKING:
     from telegram import (
         Animation,
         Audio,
+        Bot,
         BotAccessSettings,
         Contact,
         Document,
@@ -77,6 +79,10 @@ if TYPE_CHECKING:
     from telegram._utils.types import FileInput, ReplyMarkup
 
 
+# The most recently decoded users, see User.de_json
+_INTERNED_USERS: "InterningCache[User]" = InterningCache(maxsize=1024)
+
+
 class User(TelegramObject):
     """This object represents a Telegram user or bot.
 
@@ -259,6 +265,18 @@ class User(TelegramObject):
 
         self._freeze()
 
+    @classmethod
+    def de_json(cls, data: JSONDict, bot: "Bot | None" = None) -> "User":
+        """See :meth:`telegram.TelegramObject.de_json`.
+
+        .. versionchanged:: NEXT.VERSION
+            Users are decoded from the same data over and over again, e.g. for all messages in
+            the same chat. Decoding the same data again can therefore return the previously
+            decoded object, which is shared since it's immutable, if this is enabled via
+            :func:`telegram.set_interning`.
+        """
+        return _INTERNED_USERS.de_json(cls, data, bot, super().de_json)
+
     @property
     def name(self) -> str:
         """:obj:`str`: Convenience property. If available, returns the user's :attr:`username`
@@ -27,7 +27,7 @@ Warning:
 import importlib
 from collections.abc import Callable, Sequence
 from functools import lru_cache
-from types import UnionType
+from types import ModuleType, UnionType
 from typing import TYPE_CHECKING, TypeAlias, Union, cast, get_args, get_origin
 
 if TYPE_CHECKING:
@@ -37,10 +37,30 @@ if TYPE_CHECKING:
 DeJsonValueTransformer: TypeAlias = Callable[[object, "Bot | None"], object]
 
 
+class _LazyModuleNamespace(dict[str, object]):
+    """Namespace that imports the lazily loaded public names of a package on first lookup."""
+
+    __slots__ = ("_module",)
+
+    def __init__(self, module: ModuleType):
+        super().__init__(vars(module))
+        self._module = module
+
+    def __missing__(self, key: str) -> object:
+        try:
+            value = getattr(self._module, key)
+        except AttributeError as exc:
+            raise KeyError(key) from exc
+        self[key] = value
+        return value
+
+
 @lru_cache(maxsize=1)
 def get_telegram_namespace() -> dict[str, object]:
-    """Return the live package namespace used to resolve forward references."""
-    return vars(importlib.import_module("telegram"))
+    """Return the package namespace used to resolve forward references. As the public names of
+    ``telegram`` are imported lazily, missing names are imported on first lookup.
+    """
+    return _LazyModuleNamespace(importlib.import_module("telegram"))
 
 
 def resolve_annotation(
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2026
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains helper functions for inserting default values into the parameters of
+requests to the Bot API, see ``Bot._insert_defaults`` and ``ExtBot._insert_defaults``.
+
+Warning:
+    Contents of this module are intended to be used internally by the library and *not* by the
+    user. Changes to this module are not considered breaking changes and may not be documented in
+    the changelog.
+"""
+
+import datetime as dtm
+from collections.abc import Sequence
+from copy import copy
+from enum import Enum, auto
+from typing import TypeVar
+
+from telegram._files.inputmedia import InputMedia
+from telegram._linkpreviewoptions import LinkPreviewOptions
+from telegram._reply import ReplyParameters
+from telegram._telegramobject import TelegramObject
+from telegram._utils.defaultvalue import DefaultValue
+
+_TO = TypeVar("_TO", bound=TelegramObject)
+
+
+class DefaultKind(Enum):
+    """The kinds of parameter values that need special treatment when inserting defaults."""
+
+    OTHER = auto()
+    DEFAULT_VALUE = auto()
+    DATETIME = auto()
+    INPUT_MEDIA = auto()
+    LINK_PREVIEW_OPTIONS = auto()
+    REPLY_PARAMETERS = auto()
+    SEQUENCE = auto()
+
+
+# Caches the kinds of the types seen so far
+_KINDS: dict[type, DefaultKind] = {}
+
+
+def _compute_default_kind(value_type: type) -> DefaultKind:
+    if issubclass(value_type, DefaultValue):
+        return DefaultKind.DEFAULT_VALUE
+    if issubclass(value_type, dtm.datetime):
+        return DefaultKind.DATETIME
+    if issubclass(value_type, InputMedia):
+        return DefaultKind.INPUT_MEDIA
+    if issubclass(value_type, LinkPreviewOptions):
+        return DefaultKind.LINK_PREVIEW_OPTIONS
+    if issubclass(value_type, ReplyParameters):
+        return DefaultKind.REPLY_PARAMETERS
+    if issubclass(value_type, Sequence) and not issubclass(value_type, str | bytes):
+        return DefaultKind.SEQUENCE
+    return DefaultKind.OTHER
+
+
+def get_default_kind(value: object) -> DefaultKind:
+    """Gives the kind of a parameter value. As the kind only depends on the type of the value,
+    it is cached per type, such that the type checks are done only once per type instead of once
+    per parameter and request.
+
+    Args:
+        value (:obj:`object`): The parameter value.
+
+    Returns:
+        :class:`DefaultKind`
+    """
+    value_type = type(value)
+    kind = _KINDS.get(value_type)
+    if kind is None:
+        kind = _KINDS[value_type] = _compute_default_kind(value_type)
+    return kind
+
+
+def copy_with(obj: _TO, **attributes: object) -> _TO:
+    """Gives a shallow copy of a frozen object with some attributes replaced. Used so that
+    objects passed by the user are not edited in-place.
+
+    Args:
+        obj (:class:`telegram.TelegramObject`): The object to copy.
+        **attributes: The attributes to replace.
+
+    Returns:
+        :class:`telegram.TelegramObject`: The copy.
+    """
+    new = copy(obj)
+    with new._unfrozen():  # pylint: disable=protected-access
+        for name, value in attributes.items():
+            setattr(new, name, value)
+    return new
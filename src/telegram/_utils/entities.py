@@ -24,11 +24,16 @@ Warning:
     the changelog.
 """
 
-from collections.abc import Sequence
+from collections.abc import Callable, Iterable, Sequence
+from typing import TypeAlias
 
 from telegram._messageentity import MessageEntity
 from telegram._utils.strings import TextEncoding
 
+NestedEntities: TypeAlias = list[tuple[MessageEntity, "NestedEntities"]]
+"""The entities of a text in the order in which they appear, each together with the entities
+nested within it."""
+
 
 def parse_message_entity(text: str, entity: MessageEntity) -> str:
     """Returns the text from a given :class:`telegram.MessageEntity`.
@@ -68,6 +73,78 @@ def parse_message_entities(
     if types is None:
         types = MessageEntity.ALL_TYPES
 
+    if not entities:
+        return {}
+
+    slice_text = get_utf_16_slicer(text)
     return {
-        entity: parse_message_entity(text, entity) for entity in entities if entity.type in types
+        entity: slice_text(entity.offset, entity.offset + entity.length)
+        for entity in entities
+        if entity.type in types
     }
+
+
+def get_utf_16_slicer(text: str) -> Callable[[int, int | None], str]:
+    """Returns a function that gives the part of a text between two offsets, which are measured
+    in UTF-16 code units like the offsets of :class:`telegram.MessageEntity`. The text is encoded
+    at most once, such that the function can be called once per entity without re-encoding the
+    whole text each time.
+
+    Args:
+        text (:obj:`str`): The text.
+
+    Returns:
+        Callable[[:obj:`int`, :obj:`int` | :obj:`None`], :obj:`str`]: The function, which accepts
+        the start and end offset. If the end offset is :obj:`None`, the rest of the text is
+        returned.
+    """
+    if not text.isascii():
+        utf_16_text = text.encode(TextEncoding.UTF_16_LE)
+        if len(utf_16_text) != 2 * len(text):
+            # Characters outside the BMP take up two UTF-16 code units but only one index
+
+            def slice_utf_16(start: int, end: int | None) -> str:
+                return utf_16_text[start * 2 : None if end is None else end * 2].decode(
+                    TextEncoding.UTF_16_LE
+                )
+
+            return slice_utf_16
+
+    # Otherwise, the offsets are the same as the indices of the string
+    def slice_str(start: int, end: int | None) -> str:
+        return text[start:end]
+
+    return slice_str
+
+
+def nest_message_entities(entities: Iterable[MessageEntity]) -> NestedEntities:
+    """Sorts the entities of a text by their offset and nests each entity within the shortest
+    entity that contains it. Works in a single pass over the sorted entities, independent of how
+    deeply the entities are nested.
+
+    Entities that overlap without one containing the other are not nested within each other. If
+    two entities cover exactly the same part of the text, the one that comes later in
+    :paramref:`entities` is nested within the other one.
+
+    Args:
+        entities (Iterable[:class:`telegram.MessageEntity`]): The entities.
+
+    Returns:
+        list[tuple[:class:`telegram.MessageEntity`, list]]: The entities that are not nested in
+        any other entity, each together with the entities nested within it in the same format.
+    """
+    nested_entities: NestedEntities = []
+    # The entities that may still contain the next entity, together with their end offsets
+    stack: list[tuple[int, NestedEntities]] = []
+
+    # Sorting is stable, so for entities with the same range the original order is preserved
+    for entity in sorted(entities, key=lambda e: (e.offset, -e.length)):
+        end = entity.offset + entity.length
+        while stack and stack[-1][0] < end:
+            stack.pop()
+
+        children: NestedEntities = []
+        (stack[-1][1] if stack else nested_entities).append((entity, children))
+        stack.append((end, children))
+
+    return nested_entities
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2026
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains a cache for interning Telegram objects that are decoded from the same
+data over and over again, like :class:`telegram.User` and :class:`telegram.Chat`.
+
+Warning:
+    Contents of this module are intended to be used internally by the library and *not* by the
+    user. Changes to this module are not considered breaking changes and may not be documented in
+    the changelog.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+from telegram._utils.types import JSONDict
+
+if TYPE_CHECKING:
+    from telegram import Bot
+    from telegram._telegramobject import TelegramObject
+
+_TO = TypeVar("_TO", bound="TelegramObject")
+
+
+class InterningCache(Generic[_TO]):
+    """A least recently used cache of Telegram objects keyed by the JSON data they were decoded
+    from. Decoding the same data again gives the same object instead of a new one, which saves
+    allocations and memory when the same objects are contained in many updates.
+
+    Only objects that are frozen and whose attributes are all immutable are cached, such that
+    sharing them can't be noticed. Objects that were unfrozen after being cached are not returned
+    anymore. The cache is disabled by default and can be used from multiple threads.
+
+    Args:
+        maxsize (:obj:`int`): The maximum number of cached objects.
+
+    Attributes:
+        maxsize (:obj:`int`): The maximum number of cached objects.
+        enabled (:obj:`bool`): Whether objects are cached. See :func:`telegram.set_interning`.
+    """
+
+    __slots__ = ("_cache", "_lock", "enabled", "maxsize")
+
+    def __init__(self, maxsize: int):
+        self.maxsize: int = maxsize
+        self.enabled: bool = False
+        self._cache: OrderedDict[Hashable, _TO] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def de_json(
+        self,
+        cls: type[_TO],
+        data: JSONDict,
+        bot: "Bot | None",
+        de_json: Callable[[JSONDict, "Bot | None"], _TO],
+    ) -> _TO:
+        """Gives the cached object for the data or decodes and caches a new one.
+
+        Args:
+            cls (:obj:`type`): The class of the object.
+            data (dict[:obj:`str`, ...]): The JSON data.
+            bot (:class:`telegram.Bot`): The bot associated with the object.
+            de_json (Callable[[dict, :class:`telegram.Bot`], :class:`telegram.TelegramObject`]):
+                Decodes the data if there is no cached object for it.
+
+        Returns:
+            :class:`telegram.TelegramObject`: The object.
+        """
+        if not self.enabled:
+            return de_json(data, bot)
+
+        # The id of the object is part of the data, so it's also part of the key. The order of
+        # the keys is the same for all data sent by Telegram.
+        key = tuple(data.items())
+        with self._lock:
+            try:
+                cached = self._cache.get(key)
+            except TypeError:
+                # The data contains values that can't be hashed and would not be immutable anyway
+                hashable = False
+            else:
+                hashable = True
+                if (
+                    cached is not None
+                    and type(cached) is cls
+                    and cached._bot is bot  # pylint: disable=protected-access
+                    # This is reset when the object is unfrozen, i.e. possibly changed. It's not
+                    # set for objects containing other TelegramObjects, so those are never
+                    # returned.
+                    and cached._deeply_immutable  # pylint: disable=protected-access
+                ):
+                    self._cache.move_to_end(key)
+                    return cached
+
+        # Decoding is done without holding the lock, so other threads are not blocked by it
+        obj = de_json(data, bot)
+        if hashable and obj._is_deeply_immutable():  # pylint: disable=protected-access
+            with self._lock:
+                self._cache[key] = obj
+                if len(self._cache) > self.maxsize:
+                    self._cache.popitem(last=False)
+        return obj
+
+    def clear(self) -> None:
+        """Removes all objects from the cache."""
+        with self._lock:
+            self._cache.clear()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2026
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains a helper function to import the public names of a package only on first
+access, see :pep:`562`.
+
+Warning:
+    Contents of this module are intended to be used internally by the library and *not* by the
+    user. Changes to this module are not considered breaking changes and may not be documented in
+    the changelog.
+"""
+
+import sys
+from collections.abc import Callable, Collection, Mapping
+from typing import Any
+
+
+def build_lazy_loader(
+    package: str,
+    namespace: dict[str, Any],
+    lazy_imports: Mapping[str, Collection[str]],
+    lazy_submodules: Collection[str] = (),
+) -> tuple[Callable[[str], object], Callable[[], list[str]]]:
+    """Builds the module level ``__getattr__`` and ``__dir__`` functions of a package.
+
+    Args:
+        package (:obj:`str`): The name of the package, i.e. ``__name__``.
+        namespace (dict[:obj:`str`, :obj:`object`]): The namespace of the package, i.e.
+            ``globals()``. Names are stored in it once imported, so that ``__getattr__`` is only
+            called once per name.
+        lazy_imports (Mapping[:obj:`str`, Collection[:obj:`str`]]): Maps relative module names
+            to the names that are imported from them.
+        lazy_submodules (Collection[:obj:`str`]): Names of submodules that are imported on
+            first access.
+
+    Returns:
+        tuple[Callable, Callable]: The ``__getattr__`` and ``__dir__`` functions.
+    """
+    name_to_module = {name: module for module, names in lazy_imports.items() for name in names}
+
+    def __getattr__(name: str) -> object:
+        # We use __import__ instead of importlib.import_module, as only the former shows up in
+        # the output of `python -X importtime`
+        if name in lazy_submodules:
+            module_name = f"{package}.{name}"
+            __import__(module_name)
+            value: object = sys.modules[module_name]
+        elif (module := name_to_module.get(name)) is not None:
+            module_name = f"{package}{module}"
+            __import__(module_name)
+            value = getattr(sys.modules[module_name], name)
+        else:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*namespace, *name_to_module, *lazy_submodules})
+
+    return __getattr__, __dir__
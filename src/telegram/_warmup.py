@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2026
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the warmup function."""
+
+import telegram
+from telegram._telegramobject import TelegramObject
+
+
+def warmup() -> None:
+    """Imports all public classes of :mod:`telegram` and prepares the internal tables that
+    :class:`telegram.TelegramObject` uses for :meth:`~telegram.TelegramObject.de_json`,
+    :meth:`~telegram.TelegramObject.to_dict`, pickling and copying.
+
+    By default, these tables are built on first use of each class, which makes processing the
+    first updates after a restart slower. Calling this function once on startup moves this work
+    to a point where latency does not matter. It is safe to call this function multiple times.
+
+    Note:
+        This imports all of :mod:`telegram`, which undoes the lazy imports of the package. It is
+        therefore not called automatically. Call it e.g. right before
+        :meth:`telegram.ext.Application.run_polling`, if the latency of the first updates matters
+        more than the time and memory needed for startup.
+
+    .. versionadded:: NEXT.VERSION
+    """
+    for name in telegram.__all__:
+        getattr(telegram, name)
+
+    # pylint: disable=protected-access
+    classes: list[type[TelegramObject]] = [TelegramObject]
+    while classes:
+        cls = classes.pop()
+        if "__DE_JSON_PLAN__" not in cls.__dict__:
+            cls._build_plan()
+        if "__ATTR_NAMES__" not in cls.__dict__:
+            cls._build_attr_names()
+        classes.extend(cls.__subclasses__())
@@ -23,6 +23,7 @@ __all__ = (
     "Application",
     "ApplicationBuilder",
     "ApplicationHandlerStop",
+    "BaseCallbackDataBackend",
     "BaseHandler",
     "BasePersistence",
     "BaseRateLimiter",
@@ -56,51 +57,111 @@ __all__ = (
     "PollHandler",
     "PreCheckoutQueryHandler",
     "PrefixHandler",
+    "SQLiteCallbackDataBackend",
     "ShippingQueryHandler",
     "SimpleUpdateProcessor",
     "StringCommandHandler",
     "StringRegexHandler",
     "TypeHandler",
+    "UpdateJournal",
     "Updater",
     "filters",
 )
 
-from . import filters
-from ._aioratelimiter import AIORateLimiter
-from ._application import Application, ApplicationHandlerStop
-from ._applicationbuilder import ApplicationBuilder
-from ._basepersistence import BasePersistence, PersistenceInput
-from ._baseratelimiter import BaseRateLimiter
-from ._baseupdateprocessor import BaseUpdateProcessor, SimpleUpdateProcessor
-from ._callbackcontext import CallbackContext
-from ._callbackdatacache import CallbackDataCache, InvalidCallbackData
-from ._contexttypes import ContextTypes
-from ._defaults import Defaults
-from ._dictpersistence import DictPersistence
-from ._extbot import ExtBot
-from ._handlers.basehandler import BaseHandler
-from ._handlers.businessconnectionhandler import BusinessConnectionHandler
-from ._handlers.businessmessagesdeletedhandler import BusinessMessagesDeletedHandler
-from ._handlers.callbackqueryhandler import CallbackQueryHandler
-from ._handlers.chatboosthandler import ChatBoostHandler
-from ._handlers.chatjoinrequesthandler import ChatJoinRequestHandler
-from ._handlers.chatmemberhandler import ChatMemberHandler
-from ._handlers.choseninlineresulthandler import ChosenInlineResultHandler
-from ._handlers.commandhandler import CommandHandler
-from ._handlers.conversationhandler import ConversationHandler
-from ._handlers.inlinequeryhandler import InlineQueryHandler
-from ._handlers.managedbotupdatedhandler import ManagedBotUpdatedHandler
-from ._handlers.messagehandler import MessageHandler
-from ._handlers.messagereactionhandler import MessageReactionHandler
-from ._handlers.paidmediapurchasedhandler import PaidMediaPurchasedHandler
-from ._handlers.pollanswerhandler import PollAnswerHandler
-from ._handlers.pollhandler import PollHandler
-from ._handlers.precheckoutqueryhandler import PreCheckoutQueryHandler
-from ._handlers.prefixhandler import PrefixHandler
-from ._handlers.shippingqueryhandler import ShippingQueryHandler
-from ._handlers.stringcommandhandler import StringCommandHandler
-from ._handlers.stringregexhandler import StringRegexHandler
-from ._handlers.typehandler import TypeHandler
-from ._jobqueue import Job, JobQueue
-from ._picklepersistence import PicklePersistence
-from ._updater import Updater
+from typing import TYPE_CHECKING
+
+# The public names are only imported on first access to keep the startup time low, see PEP 562.
+# Type checkers and IDEs still see the imports below.
+if TYPE_CHECKING:
+    from . import filters
+    from ._aioratelimiter import AIORateLimiter
+    from ._application import Application, ApplicationHandlerStop
+    from ._applicationbuilder import ApplicationBuilder
+    from ._basepersistence import BasePersistence, PersistenceInput
+    from ._baseratelimiter import BaseRateLimiter
+    from ._baseupdateprocessor import BaseUpdateProcessor, SimpleUpdateProcessor
+    from ._callbackcontext import CallbackContext
+    from ._callbackdatabackend import BaseCallbackDataBackend, SQLiteCallbackDataBackend
+    from ._callbackdatacache import CallbackDataCache, InvalidCallbackData
+    from ._contexttypes import ContextTypes
+    from ._defaults import Defaults
+    from ._dictpersistence import DictPersistence
+    from ._extbot import ExtBot
+    from ._handlers.basehandler import BaseHandler
+    from ._handlers.businessconnectionhandler import BusinessConnectionHandler
+    from ._handlers.businessmessagesdeletedhandler import BusinessMessagesDeletedHandler
+    from ._handlers.callbackqueryhandler import CallbackQueryHandler
+    from ._handlers.chatboosthandler import ChatBoostHandler
+    from ._handlers.chatjoinrequesthandler import ChatJoinRequestHandler
+    from ._handlers.chatmemberhandler import ChatMemberHandler
+    from ._handlers.choseninlineresulthandler import ChosenInlineResultHandler
+    from ._handlers.commandhandler import CommandHandler
+    from ._handlers.conversationhandler import ConversationHandler
+    from ._handlers.inlinequeryhandler import InlineQueryHandler
+    from ._handlers.managedbotupdatedhandler import ManagedBotUpdatedHandler
+    from ._handlers.messagehandler import MessageHandler
+    from ._handlers.messagereactionhandler import MessageReactionHandler
+    from ._handlers.paidmediapurchasedhandler import PaidMediaPurchasedHandler
+    from ._handlers.pollanswerhandler import PollAnswerHandler
+    from ._handlers.pollhandler import PollHandler
+    from ._handlers.precheckoutqueryhandler import PreCheckoutQueryHandler
+    from ._handlers.prefixhandler import PrefixHandler
+    from ._handlers.shippingqueryhandler import ShippingQueryHandler
+    from ._handlers.stringcommandhandler import StringCommandHandler
+    from ._handlers.stringregexhandler import StringRegexHandler
+    from ._handlers.typehandler import TypeHandler
+    from ._jobqueue import Job, JobQueue
+    from ._picklepersistence import PicklePersistence
+    from ._updatejournal import UpdateJournal
+    from ._updater import Updater
+else:
+    from telegram._utils.lazyimport import build_lazy_loader
+
+    # Maps the modules to the public names imported from them
+    _LAZY_IMPORTS = {
+        "._aioratelimiter": ("AIORateLimiter",),
+        "._application": ("Application", "ApplicationHandlerStop"),
+        "._applicationbuilder": ("ApplicationBuilder",),
+        "._basepersistence": ("BasePersistence", "PersistenceInput"),
+        "._baseratelimiter": ("BaseRateLimiter",),
+        "._baseupdateprocessor": ("BaseUpdateProcessor", "SimpleUpdateProcessor"),
+        "._callbackcontext": ("CallbackContext",),
+        "._callbackdatabackend": ("BaseCallbackDataBackend", "SQLiteCallbackDataBackend"),
+        "._callbackdatacache": ("CallbackDataCache", "InvalidCallbackData"),
+        "._contexttypes": ("ContextTypes",),
+        "._defaults": ("Defaults",),
+        "._dictpersistence": ("DictPersistence",),
+        "._extbot": ("ExtBot",),
+        "._handlers.basehandler": ("BaseHandler",),
+        "._handlers.businessconnectionhandler": ("BusinessConnectionHandler",),
+        "._handlers.businessmessagesdeletedhandler": ("BusinessMessagesDeletedHandler",),
+        "._handlers.callbackqueryhandler": ("CallbackQueryHandler",),
+        "._handlers.chatboosthandler": ("ChatBoostHandler",),
+        "._handlers.chatjoinrequesthandler": ("ChatJoinRequestHandler",),
+        "._handlers.chatmemberhandler": ("ChatMemberHandler",),
+        "._handlers.choseninlineresulthandler": ("ChosenInlineResultHandler",),
+        "._handlers.commandhandler": ("CommandHandler",),
+        "._handlers.conversationhandler": ("ConversationHandler",),
+        "._handlers.inlinequeryhandler": ("InlineQueryHandler",),
+        "._handlers.managedbotupdatedhandler": ("ManagedBotUpdatedHandler",),
+        "._handlers.messagehandler": ("MessageHandler",),
+        "._handlers.messagereactionhandler": ("MessageReactionHandler",),
+        "._handlers.paidmediapurchasedhandler": ("PaidMediaPurchasedHandler",),
+        "._handlers.pollanswerhandler": ("PollAnswerHandler",),
+        "._handlers.pollhandler": ("PollHandler",),
+        "._handlers.precheckoutqueryhandler": ("PreCheckoutQueryHandler",),
+        "._handlers.prefixhandler": ("PrefixHandler",),
+        "._handlers.shippingqueryhandler": ("ShippingQueryHandler",),
+        "._handlers.stringcommandhandler": ("StringCommandHandler",),
+        "._handlers.stringregexhandler": ("StringRegexHandler",),
+        "._handlers.typehandler": ("TypeHandler",),
+        "._jobqueue": ("Job", "JobQueue"),
+        "._picklepersistence": ("PicklePersistence",),
+        "._updatejournal": ("UpdateJournal",),
+        "._updater": ("Updater",),
+    }
+    _LAZY_SUBMODULES = ("filters",)
+
+    __getattr__, __dir__ = build_lazy_loader(
+        __name__, globals(), _LAZY_IMPORTS, lazy_submodules=_LAZY_SUBMODULES
+    )
@@ -51,7 +51,9 @@ from telegram.ext._contexttypes import ContextTypes
 from telegram.ext._extbot import ExtBot
 from telegram.ext._handlers.basehandler import BaseHandler
 from telegram.ext._updater import Updater
+from telegram.ext._utils._update_parsing import merge_update_types
 from telegram.ext._utils.networkloop import network_retry_loop
+from telegram.ext._utils.rawupdate import RawUpdate
 from telegram.ext._utils.stack import was_called_by
 from telegram.ext._utils.trackingdict import TrackingDict
 from telegram.ext._utils.types import BD, BT, CCT, CD, JQ, RT, UD, ConversationKey, HandlerCallback
@@ -61,7 +63,7 @@ if TYPE_CHECKING:
     from socket import socket
 
     from telegram import Message
-    from telegram.ext import ConversationHandler, JobQueue
+    from telegram.ext import CallbackDataCache, ConversationHandler, JobQueue
     from telegram.ext._applicationbuilder import InitApplicationBuilder
     from telegram.ext._baseupdateprocessor import BaseUpdateProcessor
     from telegram.ext._jobqueue import Job
@@ -239,6 +241,7 @@ class Application(
     __slots__ = (
         (
             "__create_task_tasks",
+            "__first_dropped_update_id",
             "__update_fetcher_task",
             "__update_persistence_event",
             "__update_persistence_lock",
@@ -350,6 +353,7 @@ class Application(
         self._running = False
         self._job_queue: JQ = job_queue
         self.__update_fetcher_task: asyncio.Task | None = None
+        self.__first_dropped_update_id: int | None = None
         self.__update_persistence_task: asyncio.Task | None = None
         self.__update_persistence_event = asyncio.Event()
         self.__update_persistence_lock = asyncio.Lock()
@@ -636,7 +640,7 @@ class Application(
             self._running = False
             raise
 
-    async def stop(self) -> None:
+    async def stop(self, drain_timeout: float | None = None) -> None:
         """Stops the process after processing any pending updates or tasks created by
         :meth:`create_task`. Also stops :attr:`job_queue`, if set.
         Finally, calls :meth:`update_persistence` and :meth:`BasePersistence.flush` on
@@ -646,6 +650,9 @@ class Application(
             Once this method is called, no more updates will be fetched from :attr:`update_queue`,
             even if it's not empty.
 
+        .. versionchanged:: NEXT.VERSION
+            Added the parameter :paramref:`drain_timeout`.
+
         .. seealso::
             :meth:`start`
 
@@ -656,6 +663,16 @@ class Application(
             * Does *not* call :attr:`post_stop` - that is only done by
               :meth:`run_polling` and :meth:`run_webhook`.
 
+        Args:
+            drain_timeout (:obj:`float`, optional): Maximum time in seconds to spend on processing
+                the updates that are pending in :attr:`update_queue`. Pending updates are
+                processed with the usual concurrency. Updates that are still in
+                :attr:`update_queue` once the time is up are dropped. Updates that were already
+                passed to the :attr:`update_processor` are still waited for. Defaults to
+                :obj:`None`, i.e. all pending updates are processed.
+
+                .. versionadded:: NEXT.VERSION
+
         Raises:
             :exc:`RuntimeError`: If the application is not running.
         """
@@ -663,6 +680,7 @@ class Application(
             raise RuntimeError("This Application is not running!")
 
         self._running = False
+        self.__first_dropped_update_id = None
         self.__stop_running_marker.clear()
         _LOGGER.info("Application is stopping. This might take a moment.")
 
@@ -681,7 +699,20 @@ class Application(
             else:
                 await self.update_queue.put(_STOP_SIGNAL)
                 _LOGGER.debug("Waiting for update_queue to join")
-                await self.update_queue.join()
+                try:
+                    await asyncio.wait_for(self.update_queue.join(), timeout=drain_timeout)
+                except asyncio.TimeoutError:
+                    _LOGGER.warning(
+                        "Pending updates could not be processed within %s seconds. Dropping "
+                        "%d pending updates.",
+                        drain_timeout,
+                        self.__drop_pending_updates(),
+                    )
+                    # The _STOP_SIGNAL was dropped as well, unless the fetcher already took it.
+                    # Updates that are already being processed concurrently are waited for
+                    # below, along with the other tasks created by `create_task`.
+                    if not self.__update_fetcher_task.done():
+                        await self.update_queue.put(_STOP_SIGNAL)
                 await self.__update_fetcher_task
         _LOGGER.debug("Application stopped fetching of updates.")
 
@@ -748,6 +779,7 @@ class Application(
         drop_pending_updates: bool | None = None,
         close_loop: bool = True,
         stop_signals: ODVInput[Sequence[int]] = DEFAULT_NONE,
+        drain_timeout: float | None = None,
     ) -> None:
         """Convenience method that takes care of initializing and starting the app,
         polling updates from Telegram using :meth:`telegram.ext.Updater.start_polling` and
@@ -768,6 +800,9 @@ class Application(
         - :meth:`shutdown`
         - :meth:`post_shutdown`
 
+        If :paramref:`drain_timeout` is passed, the fetched updates are confirmed to Telegram only
+        after :meth:`stop` is done, and only up to the first update that was dropped.
+
         A small wrapper is passed to :paramref:`telegram.ext.Updater.start_polling.error_callback`
         which forwards errors occurring during polling to
         :meth:`registered error handlers <add_error_handler>`. The update parameter of the callback
@@ -783,6 +818,10 @@ class Application(
         Args:
             poll_interval (:obj:`float`, optional): Time to wait between polling updates from
                 Telegram in seconds. Default is ``0.0``.
+
+                .. versionchanged:: NEXT.VERSION
+                    The interval is skipped as long as Telegram returns full batches of updates,
+                    i.e. while there is a backlog of pending updates.
             timeout (:obj:`int` | :class:`datetime.timedelta`, optional): Passed to
                 :paramref:`telegram.Bot.get_updates.timeout`.
                 Default is :obj:`timedelta(seconds=10)<datetime.timedelta>`.
@@ -807,6 +846,10 @@ class Application(
             allowed_updates (Sequence[:obj:`str`], optional): Passed to
                 :meth:`telegram.Bot.get_updates`.
 
+                Tip:
+                    Use :meth:`get_allowed_updates` to receive only the update types that the
+                    registered handlers can handle.
+
                 .. versionchanged:: 21.9
                     Accepts any :class:`collections.abc.Sequence` as input instead of just a list
             close_loop (:obj:`bool`, optional): If :obj:`True`, the current event loop will be
@@ -824,6 +867,12 @@ class Application(
                     :meth:`asyncio.loop.add_signal_handler`. Most notably, the standard event loop
                     on Windows, :class:`asyncio.ProactorEventLoop`, does not implement this method.
                     If this method is not available, stop signals can not be set.
+            drain_timeout (:obj:`float`, optional): Maximum time in seconds to spend on processing
+                pending updates on shutdown. Passed to :paramref:`stop.drain_timeout`. Updates that
+                are dropped are not confirmed to Telegram and will be fetched again on the next
+                start. Defaults to :obj:`None`, i.e. all pending updates are processed.
+
+                .. versionadded:: NEXT.VERSION
 
         Raises:
             :exc:`RuntimeError`: If the Application does not have an :class:`telegram.ext.Updater`.
@@ -848,6 +897,7 @@ class Application(
             stop_signals=stop_signals,
             bootstrap_retries=bootstrap_retries,
             close_loop=close_loop,
+            drain_timeout=drain_timeout,
         )
 
     def run_webhook(
@@ -867,6 +917,10 @@ class Application(
         stop_signals: ODVInput[Sequence[int]] = DEFAULT_NONE,
         secret_token: str | None = None,
         unix: "str | Path | socket | None" = None,
+        webhook_reply_timeout: float | None = None,
+        defer_update_decoding: bool = False,
+        reuse_port: bool = False,
+        drain_timeout: float | None = None,
     ) -> None:
         """Convenience method that takes care of initializing and starting the app,
         listening for updates from Telegram using :meth:`telegram.ext.Updater.start_webhook` and
@@ -930,6 +984,10 @@ class Application(
             allowed_updates (Sequence[:obj:`str`], optional): Passed to
                 :meth:`telegram.Bot.set_webhook`.
 
+                Tip:
+                    Use :meth:`get_allowed_updates` to receive only the update types that the
+                    registered handlers can handle.
+
                 .. versionchanged:: 21.9
                     Accepts any :class:`collections.abc.Sequence` as input instead of just a list
             drop_pending_updates (:obj:`bool`, optional): Whether to clean any pending updates on
@@ -983,6 +1041,40 @@ class Application(
                 .. versionadded:: 20.8
                 .. versionchanged:: 21.1
                     Added support to pass a socket instance itself.
+            webhook_reply_timeout (:obj:`float`, optional): Maximum time in seconds to wait for a
+                method call passed via :meth:`telegram.ext.ExtBot.reply_via_webhook` before
+                answering an incoming webhook request. Passed to
+                :paramref:`telegram.ext.Updater.start_webhook.webhook_reply_timeout`. Defaults to
+                :obj:`None`.
+
+                .. versionadded:: NEXT.VERSION
+            defer_update_decoding (:obj:`bool`, optional): Pass :obj:`True` to answer incoming
+                webhook requests before decoding the updates. Malformed updates are then passed to
+                the error handlers. Passed to
+                :paramref:`telegram.ext.Updater.start_webhook.defer_update_decoding`. Defaults to
+                :obj:`False`.
+
+                .. versionadded:: NEXT.VERSION
+            reuse_port (:obj:`bool`, optional): Whether to set the ``SO_REUSEPORT`` socket option,
+                allowing several bot processes to listen on the same port. Passed to
+                :paramref:`telegram.ext.Updater.start_webhook.reuse_port`. Defaults to
+                :obj:`False`.
+
+                Caution:
+                    Each process sets the webhook on startup. Pass :paramref:`drop_pending_updates`
+                    in at most one of them.
+
+                .. versionadded:: NEXT.VERSION
+            drain_timeout (:obj:`float`, optional): Maximum time in seconds to spend on processing
+                pending updates on shutdown. Passed to :paramref:`stop.drain_timeout`. Defaults to
+                :obj:`None`, i.e. all pending updates are processed.
+
+                Caution:
+                    Updates received via webhook are confirmed to Telegram upon receiving them.
+                    Dropped updates are therefore lost, unless an
+                    :class:`~telegram.ext.UpdateJournal` is used.
+
+                .. versionadded:: NEXT.VERSION
         """
         if not self.updater:
             raise RuntimeError(
@@ -1004,10 +1096,14 @@ class Application(
                 max_connections=max_connections,
                 secret_token=secret_token,
                 unix=unix,
+                webhook_reply_timeout=webhook_reply_timeout,
+                defer_update_decoding=defer_update_decoding,
+                reuse_port=reuse_port,
             ),
             stop_signals=stop_signals,
             bootstrap_retries=bootstrap_retries,
             close_loop=close_loop,
+            drain_timeout=drain_timeout,
         )
 
     async def _bootstrap_initialize(self, max_retries: int) -> None:
@@ -1024,6 +1120,7 @@ class Application(
         stop_signals: ODVInput[Sequence[int]],
         bootstrap_retries: int,
         close_loop: bool = True,
+        drain_timeout: float | None = None,
     ) -> None:
         # Try to get the running event loop first, and if there isn't one, create a new one.
         # This handles the Python 3.14+ behavior where get_event_loop() raises RuntimeError
@@ -1067,15 +1164,28 @@ class Application(
             # In case the coroutine wasn't awaited, we don't need to bother the user with a warning
             updater_coroutine.close()
 
+            # pylint: disable=protected-access
             try:
                 # Mypy doesn't know that we already check if updater is None
                 if self.updater.running:  # type: ignore[union-attr]
-                    loop.run_until_complete(self.updater.stop())  # type: ignore[union-attr]
+                    if drain_timeout is None:
+                        loop.run_until_complete(self.updater.stop())  # type: ignore[union-attr]
+                    else:
+                        # Fetched updates are confirmed only after they were processed
+                        loop.run_until_complete(
+                            self.updater._stop(confirm_updates=False)  # type: ignore[union-attr]
+                        )
                 if self.running:
-                    loop.run_until_complete(self.stop())
+                    loop.run_until_complete(self.stop(drain_timeout=drain_timeout))
                     # post_stop should be called only if stop was called!
                     if self.post_stop:
                         loop.run_until_complete(self.post_stop(self))
+                if drain_timeout is not None:
+                    loop.run_until_complete(
+                        self.updater._confirm_polled_updates(  # type: ignore[union-attr]
+                            self.__first_dropped_update_id
+                        )
+                    )
                 loop.run_until_complete(self.shutdown())
                 if self.post_shutdown:
                     loop.run_until_complete(self.post_shutdown(self))
@@ -1232,17 +1342,47 @@ class Application(
         try:
             await self.__update_fetcher()
         finally:
-            while not self.update_queue.empty():
-                _LOGGER.debug("Dropping pending update: %s", self.update_queue.get_nowait())
-                with contextlib.suppress(ValueError):
-                    # Since we're shutting down here, it's not too bad if we call task_done
-                    # on an empty queue
-                    self.update_queue.task_done()
+            self.__drop_pending_updates()
+
+    def __drop_pending_updates(self) -> int:
+        """Returns the number of dropped updates."""
+        dropped = 0
+        while not self.update_queue.empty():
+            update = self.update_queue.get_nowait()
+            if update is not _STOP_SIGNAL:
+                dropped += 1
+                _LOGGER.debug("Dropping pending update: %s", update)
+                # Remember the first dropped update so that run_polling does not confirm it
+                if isinstance(update, Update) and (
+                    self.__first_dropped_update_id is None
+                    or update.update_id < self.__first_dropped_update_id
+                ):
+                    self.__first_dropped_update_id = update.update_id
+            with contextlib.suppress(ValueError):
+                # Since we're shutting down here, it's not too bad if we call task_done
+                # on an empty queue
+                self.update_queue.task_done()
+        return dropped
 
     async def __process_update_wrapper(self, update: object) -> None:
         try:
+            if isinstance(update, RawUpdate):
+                # Updates received via webhook with deferred decoding
+                try:
+                    update = update.decode(self.bot)
+                except Exception as exc:
+                    _LOGGER.debug("Received data could not be decoded: %r", update, exc_info=exc)
+                    await self.process_error(update=None, error=exc)
+                    return
+
             await self._update_processor.process_update(update, self.process_update(update))
         finally:
+            if (
+                self.updater is not None
+                and self.updater.update_journal is not None
+                and isinstance(update, Update)
+            ):
+                self.updater.update_journal.mark_done(update.update_id)
             self.update_queue.task_done()
 
     async def process_update(self, update: object) -> None:
@@ -1332,6 +1472,11 @@ class Application(
             # (in __create_task_callback)
             self._mark_for_persistence_update(update=update)
 
+        # All blocking handlers are done, so a webhook request waiting for a method call
+        # to be passed in its response (see ExtBot.reply_via_webhook) can be answered now
+        if isinstance(update, Update) and isinstance(self.bot, ExtBot):
+            self.bot._discard_webhook_reply(update.update_id)  # pylint: disable=protected-access
+
     def add_handler(self, handler: BaseHandler[Any, CCT, Any], group: int = DEFAULT_GROUP) -> None:
         """Register a handler.
 
@@ -1487,6 +1632,36 @@ class Application(
             if not self.handlers[group]:
                 del self.handlers[group]
 
+    def get_allowed_updates(self) -> list[str]:
+        """Returns the types of updates that the handlers in :attr:`handlers` can handle, as
+        determined by :attr:`telegram.ext.BaseHandler.update_types`. Pass the result as
+        ``allowed_updates`` to :meth:`run_polling` or :meth:`run_webhook` such that Telegram
+        does not send updates that would not be handled anyway.
+
+        Example:
+            .. code:: python
+
+                application.run_polling(allowed_updates=application.get_allowed_updates())
+
+        Note:
+            The value is computed from the handlers registered at the time of the call. If
+            handlers are added or removed later on, call this method again and pass the result to
+            :meth:`telegram.Bot.set_webhook` or restart polling.
+
+        .. versionadded:: NEXT.VERSION
+
+        Returns:
+            list[:obj:`str`]: A sorted list of update types. If at least one handler may handle
+            updates of any type, this is :attr:`telegram.Update.ALL_TYPES`. Telegram treats an
+            empty list as the default set of update types instead of no updates at all. Hence,
+            this is :attr:`telegram.Update.ALL_TYPES` as well if none of the handlers handles
+            updates from Telegram, e.g. if there are no handlers at all.
+        """
+        update_types = merge_update_types(itertools.chain.from_iterable(self.handlers.values()))
+        if not update_types:
+            return list(Update.ALL_TYPES)
+        return sorted(update_types)
+
     def drop_chat_data(self, chat_id: int) -> None:
         """Drops the corresponding entry from the :attr:`chat_data`. Will also be deleted from
         the persistence on the next run of :meth:`update_persistence`, if applicable.
@@ -1695,11 +1870,11 @@ class Application(
         if self.persistence.store_data.callback_data and (
             self.bot.callback_data_cache is not None  # type: ignore[attr-defined]
         ):
+            cache: CallbackDataCache = self.bot.callback_data_cache  # type: ignore[attr-defined]
+            # The snapshot is already a deep copy, which only copies the keyboards that changed
             coroutines.add(
                 self.persistence.update_callback_data(
-                    deepcopy(
-                        self.bot.callback_data_cache.persistence_data  # type: ignore[attr-defined]
-                    )
+                    cache._get_persistence_snapshot()  # pylint: disable=protected-access
                 )
             )
 
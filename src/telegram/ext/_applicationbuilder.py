@@ -48,7 +48,14 @@ from telegram.request._httpxrequest import HTTPXRequest
 
 if TYPE_CHECKING:
     from telegram import Update
-    from telegram.ext import BasePersistence, BaseRateLimiter, CallbackContext, Defaults
+    from telegram.ext import (
+        BaseCallbackDataBackend,
+        BasePersistence,
+        BaseRateLimiter,
+        CallbackContext,
+        Defaults,
+        UpdateJournal,
+    )
     from telegram.ext._utils.types import RLARGS
 
 # Type hinting is a bit complicated here because we try to get to a sane level of
@@ -92,6 +99,8 @@ _BOT_CHECKS = [
     ("private_key", "private_key"),
     ("rate_limiter", "rate_limiter instance"),
     ("local_mode", "local_mode setting"),
+    ("bot_user_cache", "bot_user_cache"),
+    ("callback_data_backend", "callback_data_backend"),
 ]
 
 _TWO_ARGS_REQ = "The parameter `{}` may only be set, if no {} was set."
@@ -136,6 +145,8 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         "_base_file_url",
         "_base_url",
         "_bot",
+        "_bot_user_cache",
+        "_callback_data_backend",
         "_connect_timeout",
         "_connection_pool_size",
         "_context_types",
@@ -166,6 +177,7 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         "_request",
         "_socket_options",
         "_token",
+        "_update_journal",
         "_update_processor",
         "_update_queue",
         "_updater",
@@ -199,8 +211,11 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         self._defaults: ODVInput[Defaults] = DEFAULT_NONE
         self._arbitrary_callback_data: DefaultValue[bool] | int = DEFAULT_FALSE
         self._local_mode: DVType[bool] = DEFAULT_FALSE
+        self._bot_user_cache: ODVInput[FilePathInput] = DEFAULT_NONE
+        self._callback_data_backend: ODVInput[BaseCallbackDataBackend] = DEFAULT_NONE
         self._bot: DVInput[Bot] = DEFAULT_NONE
         self._update_queue: DVType[Queue[Update | object]] = DefaultValue(Queue())
+        self._update_journal: UpdateJournal | None = None
 
         try:
             self._job_queue: ODVInput[JobQueue] = DefaultValue(JobQueue())
@@ -280,6 +295,8 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
             get_updates_request=self._build_request(get_updates=True),
             rate_limiter=DefaultValue.get_value(self._rate_limiter),
             local_mode=DefaultValue.get_value(self._local_mode),
+            bot_user_cache=DefaultValue.get_value(self._bot_user_cache),
+            callback_data_backend=DefaultValue.get_value(self._callback_data_backend),
         )
 
     def _bot_check(self, name: str) -> None:
@@ -315,7 +332,9 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
             if self._updater is None:
                 updater = None
             else:
-                updater = Updater(bot=bot, update_queue=update_queue)
+                updater = Updater(
+                    bot=bot, update_queue=update_queue, update_journal=self._update_journal
+                )
         else:  # if they set an updater, get all necessary attributes for Application from Updater:
             updater = self._updater
             bot = self._updater.bot
@@ -979,6 +998,40 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         self._arbitrary_callback_data = arbitrary_callback_data
         return self
 
+    def callback_data_backend(
+        self: BuilderType, callback_data_backend: "BaseCallbackDataBackend"
+    ) -> BuilderType:
+        """Sets a :paramref:`telegram.ext.ExtBot.callback_data_backend` for
+        :attr:`telegram.ext.Application.bot`. The callback data is then stored in this backend in
+        addition to the memory, which allows e.g. several workers to share it. Requires
+        :meth:`arbitrary_callback_data` to be enabled.
+
+        Examples:
+            .. code:: python
+
+                application = (
+                    ApplicationBuilder()
+                    .token("TOKEN")
+                    .arbitrary_callback_data(True)
+                    .callback_data_backend(SQLiteCallbackDataBackend("callback_data.sqlite"))
+                    .build()
+                )
+
+        .. seealso:: :meth:`arbitrary_callback_data`
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            callback_data_backend (:class:`telegram.ext.BaseCallbackDataBackend`): The backend.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._bot_check("callback_data_backend")
+        self._updater_check("callback_data_backend")
+        self._callback_data_backend = callback_data_backend
+        return self
+
     def local_mode(self: BuilderType, local_mode: bool) -> BuilderType:
         """Specifies the value for :paramref:`~telegram.Bot.local_mode` for the
         :attr:`telegram.ext.Application.bot`.
@@ -997,6 +1050,25 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         self._local_mode = local_mode
         return self
 
+    def bot_user_cache(self: BuilderType, bot_user_cache: FilePathInput) -> BuilderType:
+        """Sets the file for :paramref:`telegram.ext.ExtBot.bot_user_cache` of
+        :attr:`telegram.ext.Application.bot`. The result of :meth:`~telegram.Bot.get_me` is cached
+        in this file, such that :meth:`telegram.ext.Application.initialize` does not need to wait
+        for it on the next startup.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            bot_user_cache (:obj:`str` | :obj:`pathlib.Path`): The path of the cache file.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._bot_check("bot_user_cache")
+        self._updater_check("bot_user_cache")
+        self._bot_user_cache = bot_user_cache
+        return self
+
     def bot(
         self: "ApplicationBuilder[BT, CCT, UD, CD, BD, JQ]",
         bot: InBT,
@@ -1037,6 +1109,25 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         self._update_queue = update_queue
         return self
 
+    def update_journal(self: BuilderType, update_journal: "UpdateJournal") -> BuilderType:
+        """Sets a :class:`telegram.ext.UpdateJournal` instance for the
+        :paramref:`telegram.ext.Updater.update_journal` parameter of
+        :attr:`telegram.ext.Application.updater`. Received updates are recorded in the journal
+        before they are confirmed to Telegram and marked as done once they are processed by the
+        application. Pending updates are processed again on the next startup.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            update_journal (:class:`telegram.ext.UpdateJournal`): The journal.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._updater_check("update_journal")
+        self._update_journal = update_journal
+        return self
+
     def concurrent_updates(
         self: BuilderType, concurrent_updates: "bool | int | BaseUpdateProcessor"
     ) -> BuilderType:
@@ -1198,6 +1289,9 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
             if not isinstance(getattr(self, f"_{attr_name}"), DefaultValue):
                 raise RuntimeError(_TWO_ARGS_REQ.format("updater", error))
 
+        if self._update_journal is not None:
+            raise RuntimeError(_TWO_ARGS_REQ.format("updater", "update_journal"))
+
         self._updater = updater
         return self
 
@@ -0,0 +1,270 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2026
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the BaseCallbackDataBackend and SQLiteCallbackDataBackend classes."""
+
+import datetime as dtm
+import pickle
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from pathlib import Path
+
+from telegram._utils.argumentparsing import to_timedelta
+from telegram._utils.repr import build_repr_with_selected_attrs
+from telegram._utils.types import FilePathInput
+
+# Expired keyboards are deleted at most once per this many seconds
+_PURGE_INTERVAL = 60
+
+
+class BaseCallbackDataBackend(ABC):
+    """Abstract interface class for storing the callback data of a
+    :class:`telegram.ext.CallbackDataCache` outside of the current process. An implementation of
+    this class must implement all abstract methods.
+
+    When a backend is set, the :class:`~telegram.ext.CallbackDataCache` writes all keyboards to
+    the backend in addition to its in-memory cache. If the data belonging to a callback query can
+    not be found in memory, it is looked up in the backend. This allows several processes that
+    share one backend to resolve callback data of keyboards that were sent by any of them, e.g.
+    when running several workers behind one webhook. Depending on the implementation, the data
+    may also survive restarts.
+
+    Note:
+        :meth:`store_keyboards` is called from a worker thread before each request to Telegram
+        that contains new keyboards, while the other methods are called synchronously from within
+        the event loop and thereby block it. :meth:`drop_keyboard` and :meth:`clear` are called
+        from the worker thread again if keyboards were being stored at the same time.
+        Implementations must hence be thread-safe. The methods should moreover be fast, which
+        usually means that the data should be stored locally.
+
+    .. seealso:: :wiki:`Arbitrary callback_data <Arbitrary-callback_data>`
+
+    .. versionadded:: NEXT.VERSION
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def store_keyboards(self, keyboards: Sequence[tuple[str, float, dict[str, object]]]) -> None:
+        """Stores keyboards. Keyboards that are already stored are overwritten. Must be
+        implemented by a subclass.
+
+        Args:
+            keyboards (Sequence[tuple[:obj:`str`, :obj:`float`, dict[:obj:`str`, \
+                :class:`object`]]]): The keyboards to store, each as tuple of the keyboard uuid,
+                the time the keyboard was created as UNIX timestamp and the button data, which
+                maps button uuids to the cached objects.
+        """
+
+    @abstractmethod
+    def get_keyboard(self, keyboard_uuid: str) -> dict[str, object] | None:
+        """Gives the button data of a stored keyboard. Must be implemented by a subclass.
+
+        Args:
+            keyboard_uuid (:obj:`str`): The uuid of the keyboard.
+
+        Returns:
+            dict[:obj:`str`, :class:`object`]: The button data of the keyboard or :obj:`None`,
+            if the keyboard is not stored or already expired.
+        """
+
+    @abstractmethod
+    def drop_keyboard(self, keyboard_uuid: str) -> None:
+        """Deletes a stored keyboard. Unknown keyboards must be ignored. Must be implemented by a
+        subclass.
+
+        Args:
+            keyboard_uuid (:obj:`str`): The uuid of the keyboard.
+        """
+
+    @abstractmethod
+    def clear(self, time_cutoff: float | None = None) -> None:
+        """Deletes the stored keyboards. Must be implemented by a subclass.
+
+        Args:
+            time_cutoff (:obj:`float`, optional): A UNIX timestamp. If passed, only keyboards that
+                were created before this time are deleted.
+        """
+
+    def close(self) -> None:  # noqa: B027
+        """Releases the resources used by this backend. Called by
+        :meth:`telegram.ext.ExtBot.shutdown`. The backend must still be usable after this method
+        was called. Does nothing by default.
+        """
+
+
+class SQLiteCallbackDataBackend(BaseCallbackDataBackend):
+    """A backend for :class:`telegram.ext.CallbackDataCache` that stores the callback data in a
+    local `SQLite <https://sqlite.org>`_ database. The database uses the
+    `write-ahead log <https://sqlite.org/wal.html>`_, so that several processes on the same
+    host can read and write the database concurrently. Keyboards are looked up by their uuid,
+    such that the lookup time does not depend on the number of stored keyboards.
+
+    Note:
+        * The button data is stored using :mod:`pickle`. Only use database files from trusted
+          sources.
+        * The connection to the database is opened on first use.
+        * Keyboards expire :attr:`ttl` after they were created, independent of how often they
+          are used. Expired keyboards are no longer found and are deleted from the file
+          regularly when new keyboards are stored.
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        filepath (:obj:`str` | :obj:`pathlib.Path`): The path of the database file. It is
+            created if it does not exist.
+        ttl (:obj:`float` | :obj:`datetime.timedelta`, optional): The time in seconds after which
+            stored keyboards expire. Pass :obj:`None` to keep keyboards until they are deleted
+            explicitly. Defaults to one day.
+
+    Attributes:
+        filepath (:obj:`pathlib.Path`): The path of the database file.
+        ttl (:obj:`datetime.timedelta`): Optional. The time after which stored keyboards expire.
+    """
+
+    __slots__ = ("_connection", "_last_purge", "_lock", "filepath", "ttl")
+
+    def __init__(
+        self,
+        filepath: FilePathInput,
+        ttl: float | dtm.timedelta | None = dtm.timedelta(days=1),
+    ):
+        self.filepath: Path = Path(filepath)
+        self.ttl: dtm.timedelta | None = to_timedelta(ttl)
+        self._connection: sqlite3.Connection | None = None
+        self._last_purge: float = 0.0
+        # Transactions on the shared connection must not interleave
+        self._lock = threading.RLock()
+
+    def __repr__(self) -> str:
+        """Give a string representation of the backend in the form
+        ``SQLiteCallbackDataBackend[filepath=...]``.
+
+        As this class doesn't implement :meth:`object.__str__`, the default implementation
+        will be used, which is equivalent to :meth:`__repr__`.
+
+        Returns:
+            :obj:`str`
+        """
+        return build_repr_with_selected_attrs(self, filepath=self.filepath)
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            # ExtBot may be used from several threads, e.g. via run_in_executor
+            connection = sqlite3.connect(self.filepath, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            # In WAL mode, this is safe against corruption and only loses the last transactions
+            # on power loss, while being much faster than FULL
+            connection.execute("PRAGMA synchronous=NORMAL")
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS keyboards ("
+                    "keyboard_uuid TEXT PRIMARY KEY, "
+                    "creation_time REAL NOT NULL, "
+                    "button_data BLOB NOT NULL"
+                    ") WITHOUT ROWID"
+                )
+            self._connection = connection
+        return self._connection
+
+    def _get_expiry_cutoff(self) -> float:
+        if self.ttl is None:
+            return 0.0
+        return time.time() - self.ttl.total_seconds()
+
+    def store_keyboards(self, keyboards: Sequence[tuple[str, float, dict[str, object]]]) -> None:
+        """Stores all keyboards in a single transaction. Also deletes expired keyboards, if that
+        was not done for a while.
+
+        Args:
+            keyboards (Sequence[tuple[:obj:`str`, :obj:`float`, dict[:obj:`str`, \
+                :class:`object`]]]): The keyboards to store.
+        """
+        # Pickle before starting the transaction, such that the error is raised early
+        rows = [
+            (keyboard_uuid, creation_time, pickle.dumps(button_data, pickle.HIGHEST_PROTOCOL))
+            for keyboard_uuid, creation_time, button_data in keyboards
+        ]
+        with self._lock:
+            connection = self._get_connection()
+            with connection:
+                connection.executemany("INSERT OR REPLACE INTO keyboards VALUES (?, ?, ?)", rows)
+
+            if self.ttl is not None and time.monotonic() - self._last_purge >= _PURGE_INTERVAL:
+                self._last_purge = time.monotonic()
+                self.clear(self._get_expiry_cutoff())
+
+    def get_keyboard(self, keyboard_uuid: str) -> dict[str, object] | None:
+        """Gives the button data of a stored keyboard.
+
+        Args:
+            keyboard_uuid (:obj:`str`): The uuid of the keyboard.
+
+        Returns:
+            dict[:obj:`str`, :class:`object`]: The button data of the keyboard or :obj:`None`,
+            if the keyboard is not stored or already expired.
+        """
+        with self._lock:
+            cursor = self._get_connection().execute(
+                "SELECT button_data FROM keyboards WHERE keyboard_uuid = ? AND creation_time >= ?",
+                (keyboard_uuid, self._get_expiry_cutoff()),
+            )
+            row = cursor.fetchone()
+        if row is None:
+            return None
+        return pickle.loads(row[0])  # noqa: S301 - written by this class
+
+    def drop_keyboard(self, keyboard_uuid: str) -> None:
+        """Deletes a stored keyboard. Unknown keyboards are ignored.
+
+        Args:
+            keyboard_uuid (:obj:`str`): The uuid of the keyboard.
+        """
+        with self._lock:
+            connection = self._get_connection()
+            with connection:
+                connection.execute(
+                    "DELETE FROM keyboards WHERE keyboard_uuid = ?", (keyboard_uuid,)
+                )
+
+    def clear(self, time_cutoff: float | None = None) -> None:
+        """Deletes the stored keyboards.
+
+        Args:
+            time_cutoff (:obj:`float`, optional): A UNIX timestamp. If passed, only keyboards that
+                were created before this time are deleted.
+        """
+        with self._lock:
+            connection = self._get_connection()
+            with connection:
+                if time_cutoff is None:
+                    connection.execute("DELETE FROM keyboards")
+                else:
+                    connection.execute(
+                        "DELETE FROM keyboards WHERE creation_time < ?", (time_cutoff,)
+                    )
+
+    def close(self) -> None:
+        """Closes the connection to the database. It is opened again on the next use."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
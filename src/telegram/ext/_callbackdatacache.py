@@ -18,12 +18,15 @@
 #  along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains the CallbackDataCache class."""
 
+import asyncio
 import datetime as dtm
+import secrets
 import time
-from collections.abc import MutableMapping
-from copy import copy
+from collections.abc import Callable, MutableMapping
+from copy import copy, deepcopy
+from functools import partial
+from itertools import chain
 from typing import TYPE_CHECKING, Any, cast
-from uuid import uuid4
 
 try:
     from cachetools import LRUCache
@@ -37,11 +40,21 @@ import contextlib
 
 from telegram import CallbackQuery, InlineKeyboardMarkup, Message, User
 from telegram._utils.datetime import to_float_timestamp
+from telegram._utils.logging import get_logger
 from telegram.error import TelegramError
 from telegram.ext._utils.types import CDCData
 
 if TYPE_CHECKING:
-    from telegram.ext import ExtBot
+    from telegram.ext import BaseCallbackDataBackend, ExtBot
+
+_LOGGER = get_logger(__name__, class_name="CallbackDataCache")
+
+# Keyboard IDs are random, so that callback data can't be guessed. 12 random bytes result in 16
+# URL-safe characters. Button IDs are just the index of the button within the keyboard.
+_KEYBOARD_ID_BYTES = 12
+_KEYBOARD_ID_LENGTH = 16
+# Keyboards created before NEXT.VERSION used two uuid4 hex strings of 32 characters each
+_LEGACY_UUID_LENGTH = 32
 
 
 class InvalidCallbackData(TelegramError):
@@ -84,7 +97,7 @@ class InvalidCallbackData(TelegramError):
 
 
 class _KeyboardData:
-    __slots__ = ("access_time", "button_data", "keyboard_uuid")
+    __slots__ = ("access_time", "button_data", "keyboard_uuid", "snapshot")
 
     def __init__(
         self,
@@ -95,10 +108,15 @@ class _KeyboardData:
         self.keyboard_uuid = keyboard_uuid
         self.button_data = button_data or {}
         self.access_time = access_time or time.time()
+        # Deep copy of to_tuple() that was handed to the persistence the last time, see
+        # CallbackDataCache._get_persistence_snapshot
+        self.snapshot: tuple[str, float, dict[str, object]] | None = None
 
     def update_access_time(self) -> None:
         """Updates the access time with the current time."""
         self.access_time = time.time()
+        # The button data may be changed by the user after it was accessed
+        self.snapshot = None
 
     def to_tuple(self) -> tuple[str, float, dict[str, object]]:
         """Gives a tuple representation consisting of the keyboard uuid, the access time and the
@@ -138,6 +156,9 @@ class CallbackDataCache:
         To use this class, PTB must be installed via
         ``pip install "python-telegram-bot[callback-data]"``.
 
+    .. versionchanged:: NEXT.VERSION
+        Added the parameter :paramref:`backend`.
+
     Args:
         bot (:class:`telegram.ext.ExtBot`): The bot this cache is for.
         maxsize (:obj:`int`, optional): Maximum number of items in each of the internal mappings.
@@ -147,19 +168,41 @@ class CallbackDataCache:
         dict[:obj:`str`, :class:`object`]]], dict[:obj:`str`, :obj:`str`]], optional): \
         Data to initialize the cache with, as returned by \
         :meth:`telegram.ext.BasePersistence.get_callback_data`.
+        backend (:class:`telegram.ext.BaseCallbackDataBackend`, optional): A backend to store
+            the callback data in additionally, e.g. to share it between several processes. Data
+            that is not found in memory is looked up in the backend.
+
+            Note:
+                New keyboards are stored in a worker thread. Looking up keyboards that are not in
+                memory, :meth:`drop_data` and :meth:`clear_callback_data` however call the
+                backend synchronously and hence block the event loop while doing so.
+
+            .. versionadded:: NEXT.VERSION
 
     Attributes:
         bot (:class:`telegram.ext.ExtBot`): The bot this cache is for.
 
     """
 
-    __slots__ = ("_callback_queries", "_keyboard_data", "_maxsize", "bot")
+    __slots__ = (
+        "_backend",
+        "_backend_operations",
+        "_callback_queries",
+        "_flush_lock",
+        "_keyboard_data",
+        "_maxsize",
+        "_pending_keyboards",
+        "_storing_keyboards",
+        "bot",
+    )
 
     def __init__(
         self,
         bot: "ExtBot[Any]",
         maxsize: int = 1024,
         persistent_data: CDCData | None = None,
+        *,
+        backend: "BaseCallbackDataBackend | None" = None,
     ):
         if not CACHE_TOOLS_AVAILABLE:
             raise RuntimeError(
@@ -171,6 +214,14 @@ class CallbackDataCache:
         self._maxsize: int = maxsize
         self._keyboard_data: MutableMapping[str, _KeyboardData] = LRUCache(maxsize=maxsize)
         self._callback_queries: MutableMapping[str, str] = LRUCache(maxsize=maxsize)
+        self._backend: BaseCallbackDataBackend | None = backend
+        # Keyboards that still need to be written to the backend, see flush
+        self._pending_keyboards: list[_KeyboardData] = []
+        # Keyboards that are being written to the backend by _flush_in_thread and operations on
+        # the backend that have to wait for that
+        self._storing_keyboards: list[_KeyboardData] = []
+        self._backend_operations: list[Callable[[], None]] = []
+        self._flush_lock = asyncio.Lock()
 
         if persistent_data:
             self.load_persistence_data(persistent_data)
@@ -206,6 +257,15 @@ class CallbackDataCache:
         """
         return self._maxsize
 
+    @property
+    def backend(self) -> "BaseCallbackDataBackend | None":
+        """:class:`telegram.ext.BaseCallbackDataBackend`: Optional. The backend that the callback
+        data is stored in additionally.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return self._backend
+
     @property
     def persistence_data(self) -> CDCData:
         """tuple[list[tuple[:obj:`str`, :obj:`float`, dict[:obj:`str`, :class:`object`]]],
@@ -219,6 +279,21 @@ class CallbackDataCache:
             self._callback_queries.items()
         )
 
+    def _get_persistence_snapshot(self) -> CDCData:
+        """Gives a deep copy of :attr:`persistence_data` for handing it over to the persistence.
+
+        Only the keyboards that were created or accessed since the last call are copied. The
+        copies of the other keyboards are reused from the last call. They are stored along with
+        the keyboards, such that they are dropped together. Note that this doubles the memory
+        needed for the callback data, once a persistence is used.
+        """
+        keyboards = []
+        for keyboard_data in self._keyboard_data.values():
+            if keyboard_data.snapshot is None:
+                keyboard_data.snapshot = deepcopy(keyboard_data.to_tuple())
+            keyboards.append(keyboard_data.snapshot)
+        return keyboards, dict(self._callback_queries.items())
+
     def process_keyboard(self, reply_markup: InlineKeyboardMarkup) -> InlineKeyboardMarkup:
         """Registers the reply markup to the cache. If any of the buttons have
         :attr:`~telegram.InlineKeyboardButton.callback_data`, stores that data and builds a new
@@ -232,7 +307,7 @@ class CallbackDataCache:
             :class:`telegram.InlineKeyboardMarkup`: The keyboard to be passed to Telegram.
 
         """
-        keyboard_uuid = uuid4().hex
+        keyboard_uuid = secrets.token_urlsafe(_KEYBOARD_ID_BYTES)
         keyboard_data = _KeyboardData(keyboard_uuid)
 
         # Built a new nested list of buttons by replacing the callback data if needed
@@ -258,17 +333,99 @@ class CallbackDataCache:
             return reply_markup
 
         self._keyboard_data[keyboard_uuid] = keyboard_data
+        if self._backend is not None:
+            self._pending_keyboards.append(keyboard_data)
         return InlineKeyboardMarkup(buttons)
 
+    def flush(self) -> None:
+        """Writes the keyboards that were registered via :meth:`process_keyboard` since the last
+        call to the :attr:`backend` in a single batch. Does nothing if no backend is set.
+
+        Note:
+            * :class:`telegram.ext.ExtBot` stores the keyboards before making a request to
+              Telegram, so that they are stored before any user can press their buttons. To not
+              block the event loop, it does so in a worker thread.
+            * Keyboards that can not be stored, e.g. because their callback data can not be
+              pickled, are only kept in memory. The error is logged.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        if self._backend is None or not self._pending_keyboards:
+            return
+
+        keyboards, self._pending_keyboards = self._pending_keyboards, []
+        self.__store_keyboards(keyboards)
+
+    async def _flush_in_thread(self) -> None:
+        """Like :meth:`flush`, but the keyboards are stored in a worker thread. Returns once all
+        keyboards that were pending when called are stored.
+        """
+        if self._backend is None:
+            return
+
+        # While waiting for the lock, the keyboards may have been stored by the previous call
+        async with self._flush_lock:
+            if not self._pending_keyboards:
+                return
+            keyboards, self._pending_keyboards = self._pending_keyboards, []
+            self._storing_keyboards = keyboards
+            try:
+                await asyncio.to_thread(self.__store_keyboards, keyboards)
+                # Drop or clear the keyboards that were dropped or cleared while being stored
+                while self._backend_operations:
+                    operations, self._backend_operations = self._backend_operations, []
+                    await asyncio.to_thread(self.__run_backend_operations, operations)
+            finally:
+                self._storing_keyboards = []
+
+    def __store_keyboards(self, keyboards: list[_KeyboardData]) -> None:
+        backend = cast("BaseCallbackDataBackend", self._backend)
+        try:
+            backend.store_keyboards([data.to_tuple() for data in keyboards])
+        except Exception as exc:
+            _LOGGER.warning(
+                "Storing %d keyboards in the backend failed. Trying to store them one by one.",
+                len(keyboards),
+                exc_info=exc,
+            )
+        else:
+            return
+
+        # Store as many keyboards as possible. The others would fail again on every try, so they
+        # are not retried. They can still be resolved by this process.
+        for data in keyboards:
+            try:
+                backend.store_keyboards([data.to_tuple()])
+            except Exception:
+                _LOGGER.exception(
+                    "Keyboard %s could not be stored in the backend. Its callback data can only "
+                    "be resolved by this process.",
+                    data.keyboard_uuid,
+                )
+
+    @staticmethod
+    def __run_backend_operations(operations: list[Callable[[], None]]) -> None:
+        for operation in operations:
+            try:
+                operation()
+            except Exception:
+                _LOGGER.exception("Dropping or clearing callback data in the backend failed.")
+
+    def __run_backend_operation(self, operation: Callable[[], None]) -> None:
+        operation()
+        if self._storing_keyboards:
+            # The keyboards that are being stored right now may be stored after the operation
+            self._backend_operations.append(operation)
+
     @staticmethod
     def __put_button(callback_data: object, keyboard_data: _KeyboardData) -> str:
         """Stores the data for a single button in :attr:`keyboard_data`.
         Returns the string that should be passed instead of the callback_data, which is
-        ``keyboard_uuid + button_uuids``.
+        ``keyboard_uuid + button_id``.
         """
-        uuid = uuid4().hex
-        keyboard_data.button_data[uuid] = callback_data
-        return f"{keyboard_data.keyboard_uuid}{uuid}"
+        button_id = str(len(keyboard_data.button_data))
+        keyboard_data.button_data[button_id] = callback_data
+        return f"{keyboard_data.keyboard_uuid}{button_id}"
 
     def __get_keyboard_uuid_and_button_data(
         self, callback_data: str
@@ -277,7 +434,7 @@ class CallbackDataCache:
         try:
             # we get the values before calling update() in case KeyErrors are raised
             # we don't want to update in that case
-            keyboard_data = self._keyboard_data[keyboard]
+            keyboard_data = self.__get_keyboard_data(keyboard)
             button_data = keyboard_data.button_data[button]
             # Update the timestamp for the LRU
             keyboard_data.update_access_time()
@@ -285,10 +442,39 @@ class CallbackDataCache:
             return None, InvalidCallbackData(callback_data)
         return keyboard, button_data
 
+    def __get_keyboard_data(self, keyboard_uuid: str) -> _KeyboardData:
+        """Gives the data of the keyboard from memory or, if it's not found there, from the
+        backend. Raises KeyError if the keyboard is not found at all.
+        """
+        keyboard_data = self._keyboard_data.get(keyboard_uuid)
+        if keyboard_data is not None:
+            return keyboard_data
+        if self._backend is None:
+            raise KeyError(keyboard_uuid)
+
+        # The keyboard may have been dropped from memory before it was written to the backend
+        for keyboard_data in chain(self._pending_keyboards, self._storing_keyboards):
+            if keyboard_data.keyboard_uuid == keyboard_uuid:
+                self._keyboard_data[keyboard_uuid] = keyboard_data
+                return keyboard_data
+
+        button_data = self._backend.get_keyboard(keyboard_uuid)
+        if button_data is None:
+            raise KeyError(keyboard_uuid)
+
+        keyboard_data = _KeyboardData(keyboard_uuid, button_data=button_data)
+        self._keyboard_data[keyboard_uuid] = keyboard_data
+        return keyboard_data
+
     @staticmethod
     def extract_uuids(callback_data: str) -> tuple[str, str]:
         """Extracts the keyboard uuid and the button uuid from the given :paramref:`callback_data`.
 
+        .. versionchanged:: NEXT.VERSION
+            The keyboard and button IDs are shorter now, such that more of the 64 bytes allowed
+            for :paramref:`~telegram.InlineKeyboardButton.callback_data` are left. Callback data
+            of keyboards created with previous versions is still supported.
+
         Args:
             callback_data (:obj:`str`): The
                 :paramref:`~telegram.InlineKeyboardButton.callback_data` as present in the button.
@@ -298,7 +484,9 @@ class CallbackDataCache:
 
         """
         # Extract the uuids as put in __put_button
-        return callback_data[:32], callback_data[32:]
+        if len(callback_data) == 2 * _LEGACY_UUID_LENGTH:
+            return callback_data[:_LEGACY_UUID_LENGTH], callback_data[_LEGACY_UUID_LENGTH:]
+        return callback_data[:_KEYBOARD_ID_LENGTH], callback_data[_KEYBOARD_ID_LENGTH:]
 
     def process_message(self, message: Message) -> None:
         """Replaces the data in the inline keyboard attached to the message with the cached
@@ -420,6 +608,9 @@ class CallbackDataCache:
         Args:
             callback_query (:class:`telegram.CallbackQuery`): The callback query.
 
+        .. versionchanged:: NEXT.VERSION
+            Also deletes the data from the :attr:`backend`, if set.
+
         Raises:
             KeyError: If the callback query can not be found in the cache
         """
@@ -432,38 +623,60 @@ class CallbackDataCache:
     def __drop_keyboard(self, keyboard_uuid: str) -> None:
         with contextlib.suppress(KeyError):
             self._keyboard_data.pop(keyboard_uuid)
+        if self._backend is not None:
+            self._pending_keyboards = [
+                data for data in self._pending_keyboards if data.keyboard_uuid != keyboard_uuid
+            ]
+            self.__run_backend_operation(partial(self._backend.drop_keyboard, keyboard_uuid))
 
     def clear_callback_data(self, time_cutoff: float | dtm.datetime | None = None) -> None:
         """Clears the stored callback data.
 
+        .. versionchanged:: NEXT.VERSION
+            Also clears the data stored in the :attr:`backend`, if set. There, the time the
+            keyboards were created is compared with :paramref:`time_cutoff`.
+
         Args:
             time_cutoff (:obj:`float` | :obj:`datetime.datetime`, optional): Pass a UNIX timestamp
                 or a :obj:`datetime.datetime` to clear only entries which are older.
                 |tz-naive-dtms|
 
         """
-        self.__clear(self._keyboard_data, time_cutoff=time_cutoff)
+        effective_cutoff = self.__get_effective_cutoff(time_cutoff)
+        self.__clear(self._keyboard_data, time_cutoff=effective_cutoff)
+        if self._backend is not None:
+            self._pending_keyboards = (
+                []
+                if effective_cutoff is None
+                else [
+                    data
+                    for data in self._pending_keyboards
+                    if data.access_time >= effective_cutoff
+                ]
+            )
+            self.__run_backend_operation(partial(self._backend.clear, effective_cutoff))
 
     def clear_callback_queries(self) -> None:
         """Clears the stored callback query IDs."""
         self.__clear(self._callback_queries)
 
-    def __clear(
-        self, mapping: MutableMapping, time_cutoff: float | dtm.datetime | None = None
-    ) -> None:
+    def __get_effective_cutoff(self, time_cutoff: float | dtm.datetime | None) -> float | None:
         if not time_cutoff:
-            mapping.clear()
-            return
-
+            return None
         if isinstance(time_cutoff, dtm.datetime):
-            effective_cutoff = to_float_timestamp(
+            return to_float_timestamp(
                 time_cutoff, tzinfo=self.bot.defaults.tzinfo if self.bot.defaults else None
             )
-        else:
-            effective_cutoff = time_cutoff
+        return time_cutoff
+
+    @staticmethod
+    def __clear(mapping: MutableMapping, time_cutoff: float | None = None) -> None:
+        if time_cutoff is None:
+            mapping.clear()
+            return
 
         # We need a list instead of a generator here, as the list doesn't change it's size
         # during the iteration
-        to_drop = [key for key, data in mapping.items() if data.access_time < effective_cutoff]
+        to_drop = [key for key, data in mapping.items() if data.access_time < time_cutoff]
         for key in to_drop:
             mapping.pop(key)
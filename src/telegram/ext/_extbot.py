@@ -19,9 +19,14 @@
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains an object that represents a Telegram Bot with convenience extensions."""
 
+import asyncio
+import contextlib
 import datetime as dtm
+import hashlib
+import json
 from collections.abc import Callable, Sequence
 from copy import copy
+from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -70,6 +75,7 @@ from telegram import (
     MenuButton,
     Message,
     MessageId,
+    MessageTemplate,
     OwnedGifts,
     PhotoSize,
     Poll,
@@ -96,13 +102,16 @@ from telegram import (
     WebhookInfo,
 )
 from telegram._utils.datetime import to_timestamp
+from telegram._utils.defaultinsertion import DefaultKind, copy_with, get_default_kind
 from telegram._utils.defaultvalue import DEFAULT_NONE, DefaultValue
 from telegram._utils.logging import get_logger
 from telegram._utils.repr import build_repr_with_selected_attrs
+from telegram._utils.strings import to_camel_case
 from telegram._utils.types import (
     BaseUrl,
     CorrectOptionIds,
     FileInput,
+    FilePathInput,
     JSONDict,
     ODVInput,
     ReplyMarkup,
@@ -110,7 +119,8 @@ from telegram._utils.types import (
 )
 from telegram.ext._callbackdatacache import CallbackDataCache
 from telegram.ext._utils.types import RLARGS
-from telegram.request import BaseRequest
+from telegram.request import BaseRequest, RequestData
+from telegram.request._requestparameter import RequestParameter
 from telegram.warnings import PTBUserWarning
 
 if TYPE_CHECKING:
@@ -136,7 +146,7 @@ if TYPE_CHECKING:
         SuggestedPostParameters,
         Venue,
     )
-    from telegram.ext import BaseRateLimiter, Defaults
+    from telegram.ext import BaseCallbackDataBackend, BaseRateLimiter, Defaults
 
 HandledTypes = TypeVar("HandledTypes", bound=Message | CallbackQuery | ChatFullInfo)
 KT = TypeVar("KT", bound=ReplyMarkup)
@@ -193,10 +203,38 @@ class ExtBot(Bot, Generic[RLARGS]):
             limiting the number of requests made by the bot per time interval.
 
             .. versionadded:: 20.0
+        bot_user_cache (:obj:`str` | :obj:`pathlib.Path`, optional): Path of a file to cache the
+            result of :meth:`~telegram.Bot.get_me` in. If the file contains an entry for the
+            token of this bot, :meth:`initialize` uses it instead of calling
+            :meth:`~telegram.Bot.get_me` and validates it in the background afterwards. The
+            entries are keyed by a hash of the token, so several bots can share one file.
+
+            Caution:
+                Since :meth:`initialize` does not make a request in this case, an invalid token
+                is only detected by the background validation, which logs an error.
+
+            .. versionadded:: NEXT.VERSION
+        callback_data_backend (:class:`telegram.ext.BaseCallbackDataBackend`, optional): A
+            backend for :attr:`callback_data_cache`, see
+            :paramref:`telegram.ext.CallbackDataCache.backend`. Can only be used if
+            :paramref:`arbitrary_callback_data` is not :obj:`False`.
+
+            .. versionadded:: NEXT.VERSION
+
+    Raises:
+        :exc:`ValueError`: If :paramref:`callback_data_backend` is passed, but
+            :paramref:`arbitrary_callback_data` is :obj:`False`.
 
     """
 
-    __slots__ = ("_callback_data_cache", "_defaults", "_rate_limiter")
+    __slots__ = (
+        "_bot_user_cache",
+        "_bot_user_validation_task",
+        "_callback_data_cache",
+        "_defaults",
+        "_rate_limiter",
+        "_webhook_replies",
+    )
 
     _LOGGER = get_logger(__name__, class_name="ExtBot")
 
@@ -216,6 +254,9 @@ class ExtBot(Bot, Generic[RLARGS]):
         defaults: "Defaults | None" = None,
         arbitrary_callback_data: bool | int = False,
         local_mode: bool = False,
+        *,
+        bot_user_cache: FilePathInput | None = None,
+        callback_data_backend: "BaseCallbackDataBackend | None" = None,
     ): ...
 
     @overload
@@ -232,6 +273,9 @@ class ExtBot(Bot, Generic[RLARGS]):
         arbitrary_callback_data: bool | int = False,
         local_mode: bool = False,
         rate_limiter: "BaseRateLimiter[RLARGS] | None" = None,
+        *,
+        bot_user_cache: FilePathInput | None = None,
+        callback_data_backend: "BaseCallbackDataBackend | None" = None,
     ): ...
 
     def __init__(
@@ -247,6 +291,9 @@ class ExtBot(Bot, Generic[RLARGS]):
         arbitrary_callback_data: bool | int = False,
         local_mode: bool = False,
         rate_limiter: "BaseRateLimiter[RLARGS] | None" = None,
+        *,
+        bot_user_cache: FilePathInput | None = None,
+        callback_data_backend: "BaseCallbackDataBackend | None" = None,
     ):
         super().__init__(
             token=token,
@@ -262,9 +309,19 @@ class ExtBot(Bot, Generic[RLARGS]):
             self._defaults: Defaults | None = defaults
             self._rate_limiter: BaseRateLimiter | None = rate_limiter
             self._callback_data_cache: CallbackDataCache | None = None
+            self._webhook_replies: dict[int, asyncio.Future[tuple[str, JSONDict] | None]] = {}
+            self._bot_user_cache: Path | None = (
+                Path(bot_user_cache) if bot_user_cache is not None else None
+            )
+            self._bot_user_validation_task: asyncio.Task | None = None
 
             # set up callback_data
             if arbitrary_callback_data is False:
+                if callback_data_backend is not None:
+                    raise ValueError(
+                        "`callback_data_backend` can only be used if `arbitrary_callback_data` "
+                        "is enabled."
+                    )
                 return
 
             if not isinstance(arbitrary_callback_data, bool):
@@ -272,7 +329,9 @@ class ExtBot(Bot, Generic[RLARGS]):
             else:
                 maxsize = 1024
 
-            self._callback_data_cache = CallbackDataCache(bot=self, maxsize=maxsize)
+            self._callback_data_cache = CallbackDataCache(
+                bot=self, maxsize=maxsize, backend=callback_data_backend
+            )
 
     def __repr__(self) -> str:
         """Give a string representation of the bot in the form ``ExtBot[token=...]``.
@@ -312,26 +371,122 @@ class ExtBot(Bot, Generic[RLARGS]):
         """
         return self._callback_data_cache
 
+    @property
+    def bot_user_cache(self) -> Path | None:
+        """:obj:`pathlib.Path`: Optional. The file that the result of
+        :meth:`~telegram.Bot.get_me` is cached in.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return self._bot_user_cache
+
     async def initialize(self) -> None:
         """See :meth:`telegram.Bot.initialize`. Also initializes the
         :paramref:`ExtBot.rate_limiter` (if set)
         by calling :meth:`telegram.ext.BaseRateLimiter.initialize`.
+
+        .. versionchanged:: NEXT.VERSION
+            Uses the :paramref:`~ExtBot.bot_user_cache` (if set) instead of calling
+            :meth:`~telegram.Bot.get_me`.
         """
         # Initialize before calling super, because super calls get_me
         if self.rate_limiter:
             await self.rate_limiter.initialize()
+
+        cached_user = None
+        if self._bot_user_cache is not None and not self._bot_initialized:
+            cached_user = self._load_cached_bot_user()
+            if cached_user is not None:
+                # super() does not call get_me in this case
+                self._bot_user = cached_user
+                self._bot_initialized = True
+
         await super().initialize()
 
+        if self._bot_user_cache is None:
+            return
+        if cached_user is None:
+            self._store_cached_bot_user()
+        else:
+            self._bot_user_validation_task = asyncio.create_task(
+                self._validate_cached_bot_user(), name="ExtBot:validate_cached_bot_user"
+            )
+
     async def shutdown(self) -> None:
         """See :meth:`telegram.Bot.shutdown`. Also shuts down the
         :paramref:`ExtBot.rate_limiter` (if set) by
         calling :meth:`telegram.ext.BaseRateLimiter.shutdown`.
+
+        .. versionchanged:: NEXT.VERSION
+            Also closes the :paramref:`~ExtBot.callback_data_backend` (if set) by calling
+            :meth:`telegram.ext.BaseCallbackDataBackend.close`.
         """
+        if self._bot_user_validation_task is not None:
+            self._bot_user_validation_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._bot_user_validation_task
+            self._bot_user_validation_task = None
+
+        if self.callback_data_cache is not None and self.callback_data_cache.backend is not None:
+            self.callback_data_cache.flush()
+            self.callback_data_cache.backend.close()
+
         # Shut down the rate limiter before shutting down the request objects!
         if self.rate_limiter:
             await self.rate_limiter.shutdown()
         await super().shutdown()
 
+    def _get_bot_user_cache_key(self) -> str:
+        # Don't store the token in plain text
+        return hashlib.sha256(self.token.encode()).hexdigest()
+
+    def _read_bot_user_cache(self) -> JSONDict:
+        path = cast("Path", self._bot_user_cache)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as exc:
+            self._LOGGER.warning("Could not read the bot user cache: %s", exc)
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _load_cached_bot_user(self) -> User | None:
+        data = self._read_bot_user_cache().get(self._get_bot_user_cache_key())
+        if data is None:
+            return None
+        try:
+            return User.de_json(data, self)
+        except Exception as exc:
+            self._LOGGER.warning("Ignoring invalid entry in the bot user cache: %s", exc)
+            return None
+
+    def _store_cached_bot_user(self) -> None:
+        data = self._read_bot_user_cache()
+        data[self._get_bot_user_cache_key()] = self.bot.to_dict()
+        path = cast("Path", self._bot_user_cache)
+        temp_path = path.with_name(f"{path.name}.tmp")
+        try:
+            temp_path.write_text(json.dumps(data), encoding="utf-8")
+            temp_path.replace(path)
+        except OSError as exc:
+            self._LOGGER.warning("Could not write the bot user cache: %s", exc)
+
+    async def _validate_cached_bot_user(self) -> None:
+        cached_user = self.bot
+        try:
+            user = await self.get_me()
+        except Exception as exc:
+            self._LOGGER.exception(
+                "Validating the cached bot user failed. Your token might be invalid.",
+                exc_info=exc,
+            )
+            return
+
+        if user.to_dict() != cached_user.to_dict():
+            self._LOGGER.info("The cached bot user is outdated. Updating the cache.")
+            self._store_cached_bot_user()
+
     @classmethod
     def _merge_api_rl_kwargs(
         cls, api_kwargs: JSONDict | None, rate_limit_args: RLARGS | None
@@ -366,6 +521,10 @@ class ExtBot(Bot, Generic[RLARGS]):
         """Order of method calls is: Bot.some_method -> Bot._post -> Bot._do_post.
         So we can override Bot._do_post to add rate limiting.
         """
+        # Keyboards must be stored in the backend before Telegram delivers them to any user
+        if self.callback_data_cache is not None:
+            await self.callback_data_cache._flush_in_thread()  # pylint: disable=protected-access
+
         rate_limit_args = self._extract_rl_kwargs(data)
         if not self.rate_limiter and rate_limit_args is not None:
             raise ValueError(
@@ -418,6 +577,129 @@ class ExtBot(Bot, Generic[RLARGS]):
         # This is a property because the rate limiter shouldn't be changed at runtime
         return self._rate_limiter
 
+    def _register_webhook_reply(
+        self, update_id: int
+    ) -> "asyncio.Future[tuple[str, JSONDict] | None]":
+        """Registers a future for the webhook request that delivered the update with the given
+        id. Used by the webhook handler of :class:`telegram.ext.Updater`.
+        """
+        future: asyncio.Future[tuple[str, JSONDict] | None] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._webhook_replies[update_id] = future
+        return future
+
+    def _discard_webhook_reply(self, update_id: int) -> None:
+        """Removes the future for the given update id. If the webhook request is still waiting,
+        it is answered without a method call.
+        """
+        future = self._webhook_replies.pop(update_id, None)
+        if future is not None and not future.done():
+            future.set_result(None)
+
+    async def reply_via_webhook(
+        self,
+        update: Update,
+        endpoint: str,
+        api_kwargs: JSONDict | None = None,
+        return_type: type[TelegramObject] | None = None,
+        *,
+        read_timeout: ODVInput[float] = DEFAULT_NONE,
+        write_timeout: ODVInput[float] = DEFAULT_NONE,
+        connect_timeout: ODVInput[float] = DEFAULT_NONE,
+        pool_timeout: ODVInput[float] = DEFAULT_NONE,
+        rate_limit_args: RLARGS | None = None,
+    ) -> Any:
+        """Makes a request to the Bot API by passing it in the response to the webhook request
+        that delivered :paramref:`update`. This saves one outbound HTTP request.
+
+        This only works if :paramref:`telegram.ext.Updater.start_webhook.webhook_reply_timeout`
+        is set, the webhook request is still waiting for its response and no files are to be
+        uploaded. Only one call per update can be passed this way. In all other cases, a regular
+        request is made, just like with :meth:`~telegram.Bot.do_api_request`.
+
+        Hint:
+            The webhook request is answered as soon as all blocking handlers have processed
+            :paramref:`update` or :paramref:`telegram.ext.Updater.start_webhook.\
+webhook_reply_timeout` has passed, whichever happens first. Handlers running with
+            :paramref:`~telegram.ext.BaseHandler.block` set to :obj:`False` will therefore in
+            most cases fall back to a regular request.
+
+        Caution:
+            When the call is passed via the webhook response, Telegram does not report the
+            result of the call nor any errors back. Moreover, such calls are not passed through
+            the :attr:`rate_limiter`.
+
+        .. seealso:: :meth:`~telegram.Bot.do_api_request`
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            update (:class:`telegram.Update`): The update whose webhook request should be used.
+            endpoint (:obj:`str`): The API endpoint to use, e.g. ``answerCallbackQuery`` or
+                ``answer_callback_query``.
+            api_kwargs (:obj:`dict`, optional): The keyword arguments to pass to the API call.
+            return_type (:class:`telegram.TelegramObject`, optional): Used only if a regular
+                request is made. See :paramref:`telegram.Bot.do_api_request.return_type`.
+
+        Keyword Args:
+            read_timeout (:obj:`float` | :obj:`None`, optional): Used only if a regular request
+                is made. See :paramref:`telegram.Bot.do_api_request.read_timeout`.
+            write_timeout (:obj:`float` | :obj:`None`, optional): Used only if a regular request
+                is made. See :paramref:`telegram.Bot.do_api_request.write_timeout`.
+            connect_timeout (:obj:`float` | :obj:`None`, optional): Used only if a regular
+                request is made. See :paramref:`telegram.Bot.do_api_request.connect_timeout`.
+            pool_timeout (:obj:`float` | :obj:`None`, optional): Used only if a regular request
+                is made. See :paramref:`telegram.Bot.do_api_request.pool_timeout`.
+            rate_limit_args (:obj:`object`, optional): Used only if a regular request is made.
+                Passed to the :attr:`rate_limiter`, see
+                :paramref:`telegram.ext.BaseRateLimiter.process_request.rate_limit_args`.
+
+        Returns:
+            :obj:`True`, if the call was passed via the webhook response. Otherwise the result of
+            the regular request, see :meth:`~telegram.Bot.do_api_request`.
+        """
+        camel_case_endpoint = to_camel_case(endpoint)
+        data = dict(api_kwargs or {})
+        if isinstance(markup := data.get("reply_markup"), InlineKeyboardMarkup):
+            data["reply_markup"] = self._replace_keyboard(markup)
+            if self.callback_data_cache is not None:
+                # pylint: disable=protected-access
+                await self.callback_data_cache._flush_in_thread()
+
+        future = self._webhook_replies.get(update.update_id)
+        if future is not None and not future.done():
+            request_data = RequestData(
+                parameters=[
+                    RequestParameter.from_input(key, value)
+                    for key, value in self._insert_defaults(data).items()
+                ]
+            )
+            if not request_data.contains_files:
+                del self._webhook_replies[update.update_id]
+                future.set_result((camel_case_endpoint, request_data.parameters))
+                self._LOGGER.debug(
+                    "Passing call to `%s` via webhook response to update %d",
+                    camel_case_endpoint,
+                    update.update_id,
+                )
+                return True
+
+        # Not using do_api_request, as it warns about endpoints that have a dedicated method
+        result = await self._post(
+            camel_case_endpoint,
+            api_kwargs=self._merge_api_rl_kwargs(data, rate_limit_args),
+            read_timeout=read_timeout,
+            write_timeout=write_timeout,
+            connect_timeout=connect_timeout,
+            pool_timeout=pool_timeout,
+        )
+        if return_type is None or isinstance(result, bool):
+            return result
+        if isinstance(result, list):
+            return return_type.de_list(result, self)
+        return return_type.de_json(result, self)
+
     def _merge_lpo_defaults(self, lpo: ODVInput[LinkPreviewOptions]) -> LinkPreviewOptions | None:
         # This is a standalone method because both _insert_defaults and
         # _insert_defaults_for_ilq_results need this logic
@@ -441,19 +723,18 @@ class ExtBot(Bot, Generic[RLARGS]):
             }
         )
 
-    def _insert_defaults(self, data: dict[str, object]) -> None:
+    def _insert_defaults(self, data: dict[str, object]) -> dict[str, object]:
         """Inserts the defaults values for optional kwargs for which tg.ext.Defaults provides
         convenience functionality, i.e. the kwargs with a tg.utils.helpers.DefaultValue default
 
-        data is edited in-place. As timeout is not passed via the kwargs, it needs to be passed
-        separately and gets returned.
+        Returns a new dict without `None` values, see Bot._insert_defaults. As timeout is not
+        passed via the kwargs, it needs to be passed separately.
 
         This can only work, if all kwargs that may have defaults are passed in data!
         """
         if self.defaults is None:
             # If we have no defaults to insert, the behavior is the same as in `tg.Bot`
-            super()._insert_defaults(data)
-            return
+            return super()._insert_defaults(data)
 
         # if we have Defaults, we
         # 1) replace all DefaultValue instances with the relevant Defaults value. If there is none,
@@ -463,77 +744,96 @@ class ExtBot(Bot, Generic[RLARGS]):
         # 4) handle the LinkPreviewOptions case (see below)
         # 5) handle the ReplyParameters case (see below)
         # 6) handle text_parse_mode in InputPollOption
-        for key, val in data.items():
+        # Which of these applies only depends on the type of the value, see get_default_kind.
+        # Objects are only copied if a default value is actually inserted.
+        result: dict[str, object] = {}
+        for key, value in data.items():
+            kind = get_default_kind(value)
+            new_value = value
             # 1)
-            if isinstance(val, DefaultValue):
-                data[key] = self.defaults.api_defaults.get(key, val.value)
+            if kind is DefaultKind.DEFAULT_VALUE:
+                new_value = self.defaults.api_defaults.get(
+                    key, cast("DefaultValue[object]", value).value
+                )
 
             # 2)
-            elif isinstance(val, dtm.datetime):
-                data[key] = to_timestamp(val, tzinfo=self.defaults.tzinfo)
+            elif kind is DefaultKind.DATETIME:
+                new_value = to_timestamp(cast("dtm.datetime", value), tzinfo=self.defaults.tzinfo)
 
             # 3)
-            elif isinstance(val, InputMedia) and val.parse_mode is DEFAULT_NONE:
-                # Copy object as not to edit it in-place
-                copied_val = copy(val)
-                with copied_val._unfrozen():
-                    copied_val.parse_mode = self.defaults.parse_mode
-                data[key] = copied_val
-            elif (
-                key == "media"
-                and isinstance(val, Sequence)
-                and not isinstance(val[0], InputPaidMedia)
-            ):
-                # Copy objects as not to edit them in-place
-                copy_list = [copy(media) for media in val]
-                for media in copy_list:
-                    if media.parse_mode is DEFAULT_NONE:
-                        with media._unfrozen():
-                            media.parse_mode = self.defaults.parse_mode
+            elif kind is DefaultKind.INPUT_MEDIA:
+                media = cast("InputMedia", value)
+                if media.parse_mode is DEFAULT_NONE:
+                    new_value = copy_with(media, parse_mode=self.defaults.parse_mode)
 
-                data[key] = copy_list
+            # 3) and 6)
+            elif kind is DefaultKind.SEQUENCE:
+                new_value = self.__insert_sequence_defaults(key, cast("Sequence[object]", value))
 
             # 4) LinkPreviewOptions:
-            elif isinstance(val, LinkPreviewOptions):
-                data[key] = self._merge_lpo_defaults(val)
+            elif kind is DefaultKind.LINK_PREVIEW_OPTIONS:
+                new_value = self._merge_lpo_defaults(cast("LinkPreviewOptions", value))
 
             # 5)
-            # Similar to LinkPreviewOptions, but only two of the arguments of RPs have a default
-            elif isinstance(val, ReplyParameters) and (
-                (defaults_aswr := self.defaults.allow_sending_without_reply) is not None
-                or self.defaults.quote_parse_mode is not None
-            ):
-                new_value = copy(val)
-                with new_value._unfrozen():
-                    new_value.allow_sending_without_reply = (
-                        defaults_aswr
-                        if isinstance(val.allow_sending_without_reply, DefaultValue)
-                        else val.allow_sending_without_reply
-                    )
-                    new_value.quote_parse_mode = (
-                        self.defaults.quote_parse_mode
-                        if isinstance(val.quote_parse_mode, DefaultValue)
-                        else val.quote_parse_mode
-                    )
+            elif kind is DefaultKind.REPLY_PARAMETERS:
+                new_value = self.__insert_reply_parameters_defaults(cast("ReplyParameters", value))
 
-                data[key] = new_value
+            if new_value is not None:
+                result[key] = new_value
+        return result
 
-            # 6)
-            elif (
-                isinstance(val, Sequence)
-                and val  # Check that the sequence is not empty, as all() returns True for []
-                and all(isinstance(obj, InputPollOption) for obj in val)
-            ):
-                new_val = []
-                for option in val:
-                    if not isinstance(option.text_parse_mode, DefaultValue):
-                        new_val.append(option)
-                    else:
-                        new_option = copy(option)
-                        with new_option._unfrozen():
-                            new_option.text_parse_mode = self.defaults.text_parse_mode
-                        new_val.append(new_option)
-                data[key] = new_val
+    def __insert_sequence_defaults(self, key: str, val: Sequence[object]) -> Sequence[object]:
+        # Check that the sequence is not empty, as all() returns True for []
+        if not val:
+            return val
+
+        defaults = cast("Defaults", self.defaults)
+        # 3)
+        if key == "media" and not isinstance(val[0], InputPaidMedia):
+            media_group = cast("Sequence[InputMedia]", val)
+            if not any(media.parse_mode is DEFAULT_NONE for media in media_group):
+                return val
+            return [
+                (
+                    copy_with(media, parse_mode=defaults.parse_mode)
+                    if media.parse_mode is DEFAULT_NONE
+                    else media
+                )
+                for media in media_group
+            ]
+
+        # 6)
+        if all(isinstance(obj, InputPollOption) for obj in val):
+            options = cast("Sequence[InputPollOption]", val)
+            if not any(isinstance(option.text_parse_mode, DefaultValue) for option in options):
+                return val
+            return [
+                (
+                    copy_with(option, text_parse_mode=defaults.text_parse_mode)
+                    if isinstance(option.text_parse_mode, DefaultValue)
+                    else option
+                )
+                for option in options
+            ]
+
+        return val
+
+    def __insert_reply_parameters_defaults(self, val: ReplyParameters) -> ReplyParameters:
+        # Similar to LinkPreviewOptions, but only two of the arguments of RPs have a default
+        defaults = cast("Defaults", self.defaults)
+        replacements: dict[str, object] = {}
+        if (aswr := defaults.allow_sending_without_reply) is not None and isinstance(
+            val.allow_sending_without_reply, DefaultValue
+        ):
+            replacements["allow_sending_without_reply"] = aswr
+        if (quote_parse_mode := defaults.quote_parse_mode) is not None and isinstance(
+            val.quote_parse_mode, DefaultValue
+        ):
+            replacements["quote_parse_mode"] = quote_parse_mode
+
+        if not replacements:
+            return val
+        return copy_with(val, **replacements)
 
     def _replace_keyboard(self, reply_markup: KT | None) -> KT | None:
         # If the reply_markup is an inline keyboard and we allow arbitrary callback data, let the
@@ -3174,6 +3474,66 @@ class ExtBot(Bot, Generic[RLARGS]):
             suggested_post_parameters=suggested_post_parameters,
         )
 
+    def create_message_template(
+        self,
+        text: str,
+        parse_mode: ODVInput[str] = DEFAULT_NONE,
+        entities: Sequence["MessageEntity"] | None = None,
+        disable_notification: ODVInput[bool] = DEFAULT_NONE,
+        protect_content: ODVInput[bool] = DEFAULT_NONE,
+        reply_markup: "ReplyMarkup | None" = None,
+        link_preview_options: ODVInput["LinkPreviewOptions"] = DEFAULT_NONE,
+        message_effect_id: str | None = None,
+        allow_paid_broadcast: bool | None = None,
+        *,
+        api_kwargs: JSONDict | None = None,
+    ) -> MessageTemplate:
+        # We override this method to call self._replace_keyboard. The keyboard is stored in the
+        # CallbackDataCache only once and shared by all messages sent from the template
+        return super().create_message_template(
+            text=text,
+            parse_mode=parse_mode,
+            entities=entities,
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+            reply_markup=self._replace_keyboard(reply_markup),
+            link_preview_options=link_preview_options,
+            message_effect_id=message_effect_id,
+            allow_paid_broadcast=allow_paid_broadcast,
+            api_kwargs=api_kwargs,
+        )
+
+    async def send_message_template(
+        self,
+        chat_id: int | str,
+        template: MessageTemplate,
+        message_thread_id: int | None = None,
+        reply_parameters: "ReplyParameters | None" = None,
+        business_connection_id: str | None = None,
+        direct_messages_topic_id: int | None = None,
+        *,
+        read_timeout: ODVInput[float] = DEFAULT_NONE,
+        write_timeout: ODVInput[float] = DEFAULT_NONE,
+        connect_timeout: ODVInput[float] = DEFAULT_NONE,
+        pool_timeout: ODVInput[float] = DEFAULT_NONE,
+        api_kwargs: JSONDict | None = None,
+        rate_limit_args: RLARGS | None = None,
+    ) -> Message:
+        result = await super().send_message_template(
+            chat_id=chat_id,
+            template=template,
+            message_thread_id=message_thread_id,
+            reply_parameters=reply_parameters,
+            business_connection_id=business_connection_id,
+            direct_messages_topic_id=direct_messages_topic_id,
+            read_timeout=read_timeout,
+            write_timeout=write_timeout,
+            connect_timeout=connect_timeout,
+            pool_timeout=pool_timeout,
+            api_kwargs=self._merge_api_rl_kwargs(api_kwargs, rate_limit_args),
+        )
+        return self._insert_callback_data(result)
+
     async def send_message_draft(
         self,
         chat_id: int,
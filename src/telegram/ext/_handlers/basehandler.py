@@ -113,6 +113,22 @@ class BaseHandler(ABC, Generic[UT, CCT, RT]):
             callback_name = repr(self.callback)
         return build_repr_with_selected_attrs(self, callback=callback_name)
 
+    @property
+    def update_types(self) -> frozenset[str] | None:
+        """The types of :class:`telegram.Update` that this handler can handle, as listed in
+        :class:`telegram.constants.UpdateType`. :obj:`None` means that the handler may handle
+        updates of any type. This is used by :meth:`telegram.ext.Application.get_allowed_updates`.
+
+        Custom handlers should override this property, if the update types they handle are known.
+        The default implementation returns :obj:`None`.
+
+        .. versionadded:: NEXT.VERSION
+
+        Returns:
+            frozenset[:obj:`str`] | :obj:`None`
+        """
+        return None
+
     @abstractmethod
     def check_update(self, update: object) -> bool | object | None:
         """
@@ -23,6 +23,7 @@ from typing import TypeVar
 from telegram import Update
 from telegram._utils.defaultvalue import DEFAULT_TRUE
 from telegram._utils.types import SCT, DVType
+from telegram.constants import UpdateType
 from telegram.ext._handlers.basehandler import BaseHandler
 from telegram.ext._utils._update_parsing import parse_chat_id, parse_username
 from telegram.ext._utils.types import CCT, HandlerCallback
@@ -77,6 +78,14 @@ class BusinessConnectionHandler(BaseHandler[Update, CCT, RT]):
         self._user_ids = parse_chat_id(user_id)
         self._usernames = parse_username(username)
 
+    @property
+    def update_types(self) -> frozenset[str]:
+        """See :attr:`telegram.ext.BaseHandler.update_types`.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return frozenset({UpdateType.BUSINESS_CONNECTION})
+
     def check_update(self, update: object) -> bool:
         """Determines whether an update should be passed to this handler's :attr:`callback`.
 
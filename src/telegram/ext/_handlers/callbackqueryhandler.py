@@ -27,6 +27,7 @@ from typing import TYPE_CHECKING, Any, TypeVar, cast
 from telegram import Update
 from telegram._utils.defaultvalue import DEFAULT_TRUE
 from telegram._utils.types import DVType
+from telegram.constants import UpdateType
 from telegram.ext._handlers.basehandler import BaseHandler
 from telegram.ext._utils.types import CCT, HandlerCallback
 
@@ -148,6 +149,14 @@ class CallbackQueryHandler(BaseHandler[Update, CCT, RT]):
         self.pattern: str | Pattern[str] | type | Callable[[object], bool] | None = pattern
         self.game_pattern: str | Pattern[str] | None = game_pattern
 
+    @property
+    def update_types(self) -> frozenset[str]:
+        """See :attr:`telegram.ext.BaseHandler.update_types`.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return frozenset({UpdateType.CALLBACK_QUERY})
+
     def check_update(self, update: object) -> bool | object | None:
         """Determines whether an update should be passed to this handler's :attr:`callback`.
 
@@ -21,6 +21,7 @@
 from typing import Final
 
 from telegram import Update
+from telegram.constants import UpdateType
 from telegram.ext._handlers.basehandler import BaseHandler
 from telegram.ext._utils._update_parsing import parse_chat_id, parse_username
 from telegram.ext._utils.types import CCT, RT, HandlerCallback
@@ -96,6 +97,18 @@ class ChatBoostHandler(BaseHandler[Update, CCT, RT]):
         self._chat_ids = parse_chat_id(chat_id)
         self._chat_usernames = parse_username(chat_username)
 
+    @property
+    def update_types(self) -> frozenset[str]:
+        """See :attr:`telegram.ext.BaseHandler.update_types`.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        if self.chat_boost_types == self.CHAT_BOOST:
+            return frozenset({UpdateType.CHAT_BOOST})
+        if self.chat_boost_types == self.REMOVED_CHAT_BOOST:
+            return frozenset({UpdateType.REMOVED_CHAT_BOOST})
+        return frozenset({UpdateType.CHAT_BOOST, UpdateType.REMOVED_CHAT_BOOST})
+
     def check_update(self, update: object) -> bool:
         """Determines whether an update should be passed to this handler's :attr:`callback`.
 
@@ -23,6 +23,7 @@ from typing import Final, TypeVar
 from telegram import Update
 from telegram._utils.defaultvalue import DEFAULT_TRUE
 from telegram._utils.types import SCT, DVType
+from telegram.constants import UpdateType
 from telegram.ext._handlers.basehandler import BaseHandler
 from telegram.ext._utils._update_parsing import parse_chat_id
 from telegram.ext._utils.types import CCT, HandlerCallback
@@ -99,6 +100,18 @@ class ChatMemberHandler(BaseHandler[Update, CCT, RT]):
         self.chat_member_types: int | None = chat_member_types
         self._chat_ids = parse_chat_id(chat_id)
 
+    @property
+    def update_types(self) -> frozenset[str]:
+        """See :attr:`telegram.ext.BaseHandler.update_types`.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        if self.chat_member_types == self.ANY_CHAT_MEMBER:
+            return frozenset({UpdateType.MY_CHAT_MEMBER, UpdateType.CHAT_MEMBER})
+        if self.chat_member_types == self.CHAT_MEMBER:
+            return frozenset({UpdateType.CHAT_MEMBER})
+        return frozenset({UpdateType.MY_CHAT_MEMBER})
+
     def check_update(self, update: object) -> bool:
         """Determines whether an update should be passed to this handler's :attr:`callback`.
 
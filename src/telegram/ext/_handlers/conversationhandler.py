@@ -20,6 +20,8 @@
 
 import asyncio
 import datetime as dtm
+import itertools
+import time
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Final, Generic, NoReturn, cast
 
@@ -38,6 +40,7 @@ from telegram.ext._handlers.inlinequeryhandler import InlineQueryHandler
 from telegram.ext._handlers.stringcommandhandler import StringCommandHandler
 from telegram.ext._handlers.stringregexhandler import StringRegexHandler
 from telegram.ext._handlers.typehandler import TypeHandler
+from telegram.ext._utils._update_parsing import merge_update_types
 from telegram.ext._utils.trackingdict import TrackingDict
 from telegram.ext._utils.types import CCT, ConversationDict, ConversationKey
 
@@ -54,12 +57,15 @@ class _ConversationTimeoutContext(Generic[CCT]):
     :paramref:`JobQueue.run_once.data` parameter. See :meth:`_trigger_timeout`.
     """
 
-    __slots__ = ("application", "callback_context", "conversation_key", "update")
+    __slots__ = ("application", "callback_context", "conversation_key", "deadline", "update")
 
     conversation_key: ConversationKey
     update: Update
     application: "Application[Any, CCT, Any, Any, Any, JobQueue]"
     callback_context: CCT
+    # Monotonic time at which the conversation times out. `None` while an update of the
+    # conversation is being handled, i.e. while the timeout is suspended.
+    deadline: float | None
 
 
 @dataclass
@@ -242,10 +248,20 @@ class ConversationHandler(BaseHandler[Update, CCT, object]):
 
             .. versionchanged:: 20.0
                 No longer overrides the handlers settings. Resolution order was changed.
+        max_conversations (:obj:`int`, optional): The maximum number of conversations that are
+            kept at the same time. If a new conversation would exceed this limit, the
+            conversation that was least recently active is ended without further notice. Use this
+            to limit the memory used by conversations that are never completed, e.g. because the
+            user abandoned them and no :paramref:`conversation_timeout` is set. If persistence is
+            used, ended conversations are removed from the persistence as well. Defaults to
+            :obj:`None`, i.e. no limit.
+
+            .. versionadded:: NEXT.VERSION
 
     Raises:
-        :exc:`ValueError`: If :paramref:`persistent` is used but :paramref:`name` was not set, or
-            when :attr:`per_message`, :attr:`per_chat`, :attr:`per_user` are all :obj:`False`.
+        :exc:`ValueError`: If :paramref:`persistent` is used but :paramref:`name` was not set,
+            when :attr:`per_message`, :attr:`per_chat`, :attr:`per_user` are all :obj:`False` or
+            when :paramref:`max_conversations` is not a positive integer.
 
     Attributes:
         block (:obj:`bool`): Determines whether the callback will run in a blocking way. Always
@@ -262,13 +278,13 @@ class ConversationHandler(BaseHandler[Update, CCT, object]):
         "_entry_points",
         "_fallbacks",
         "_map_to_parent",
+        "_max_conversations",
         "_name",
         "_per_chat",
         "_per_message",
         "_per_user",
         "_persistent",
         "_states",
-        "_timeout_jobs_lock",
         "timeout_jobs",
     )
 
@@ -297,6 +313,7 @@ class ConversationHandler(BaseHandler[Update, CCT, object]):
         persistent: bool = False,
         map_to_parent: dict[object, object] | None = None,
         block: DVType[bool] = DEFAULT_TRUE,
+        max_conversations: int | None = None,
     ):
         # these imports need to be here because of circular import error otherwise
         from telegram.ext import (  # pylint: disable=import-outside-toplevel  # noqa: PLC0415
@@ -324,10 +341,13 @@ class ConversationHandler(BaseHandler[Update, CCT, object]):
         self._name: str | None = name
         self._map_to_parent: dict[object, object] | None = map_to_parent
 
+        if max_conversations is not None and max_conversations < 1:
+            raise ValueError("`max_conversations` must be a positive integer.")
+        self._max_conversations: int | None = max_conversations
+
         # if conversation_timeout is used, this dict is used to schedule a job which runs when the
         # conv has timed out.
         self.timeout_jobs: dict[ConversationKey, Job[Any]] = {}
-        self._timeout_jobs_lock = asyncio.Lock()
         self._conversations: ConversationDict = {}
         self._child_conversations: set[ConversationHandler] = set()
 
@@ -575,6 +595,40 @@ class ConversationHandler(BaseHandler[Update, CCT, object]):
             "You can not assign a new value to map_to_parent after initialization."
         )
 
+    @property
+    def max_conversations(self) -> int | None:
+        """:obj:`int`: Optional. The maximum number of conversations that are kept at the same
+        time.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return self._max_conversations
+
+    @max_conversations.setter
+    def max_conversations(self, _: object) -> NoReturn:
+        raise AttributeError(
+            "You can not assign a new value to max_conversations after initialization."
+        )
+
+    @property
+    def update_types(self) -> frozenset[str] | None:
+        """See :attr:`telegram.ext.BaseHandler.update_types`. This is the union of the update
+        types of all handlers in :attr:`entry_points`, :attr:`states` and :attr:`fallbacks`.
+        The handlers of the :attr:`TIMEOUT` state are not included, as they are only called with
+        the update that started the timeout.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return merge_update_types(
+            itertools.chain(
+                self.entry_points,
+                self.fallbacks,
+                itertools.chain.from_iterable(
+                    handlers for state, handlers in self.states.items() if state != self.TIMEOUT
+                ),
+            )
+        )
+
     async def _initialize_persistence(
         self, application: "Application"
     ) -> dict[str, TrackingDict[ConversationKey, object]]:
@@ -687,17 +741,38 @@ class ConversationHandler(BaseHandler[Update, CCT, object]):
         context: CCT,
         conversation_key: ConversationKey,
     ) -> None:
-        """Schedules a job which executes :meth:`_trigger_timeout` upon conversation timeout."""
+        """Schedules a job which executes :meth:`_trigger_timeout` upon conversation timeout.
+        If the conversation already has a pending timeout job, only its deadline is moved. The job
+        itself is rescheduled lazily in :meth:`_trigger_timeout`, such that the job queue is not
+        touched for every single update.
+        """
+        timeout_job = self.timeout_jobs.get(conversation_key)
         if new_state == self.END:
+            if timeout_job is not None:
+                del self.timeout_jobs[conversation_key]
+                timeout_job.schedule_removal()
+            return
+
+        # both job_queue & conversation_timeout are checked before calling _schedule_job
+        timeout = self.conversation_timeout
+        seconds = timeout.total_seconds() if isinstance(timeout, dtm.timedelta) else timeout
+        deadline = time.monotonic() + seconds  # type: ignore[operator]
+
+        if timeout_job is not None and not timeout_job.removed:
+            ctxt = cast("_ConversationTimeoutContext", timeout_job.data)
+            ctxt.update = update
+            ctxt.callback_context = context
+            ctxt.deadline = deadline
             return
 
         try:
-            # both job_queue & conversation_timeout are checked before calling _schedule_job
             j_queue = application.job_queue
             self.timeout_jobs[conversation_key] = j_queue.run_once(  # type: ignore[union-attr]
                 self._trigger_timeout,
-                self.conversation_timeout,  # type: ignore[arg-type]
-                data=_ConversationTimeoutContext(conversation_key, update, application, context),
+                seconds,  # type: ignore[arg-type]
+                data=_ConversationTimeoutContext(
+                    conversation_key, update, application, context, deadline
+                ),
             )
         except Exception as exc:
             _LOGGER.exception("Failed to schedule timeout.", exc_info=exc)
@@ -816,12 +891,11 @@ class ConversationHandler(BaseHandler[Update, CCT, object]):
         current_state, conversation_key, handler, handler_check_result = check_result
         raise_dp_handler_stop = False
 
-        async with self._timeout_jobs_lock:
-            # Remove the old timeout job (if present)
-            timeout_job = self.timeout_jobs.pop(conversation_key, None)
-
-            if timeout_job is not None:
-                timeout_job.schedule_removal()
+        # Suspend the timeout (if present) while the update is being handled. The job is kept
+        # and reused by _schedule_job afterwards
+        timeout_job = self.timeout_jobs.get(conversation_key)
+        if timeout_job is not None:
+            cast("_ConversationTimeoutContext", timeout_job.data).deadline = None
 
         # Resolution order of "block":
         # 1. Setting of the selected handler
@@ -852,31 +926,31 @@ class ConversationHandler(BaseHandler[Update, CCT, object]):
         except ApplicationHandlerStop as exception:
             new_state = exception.state
             raise_dp_handler_stop = True
-        async with self._timeout_jobs_lock:
-            if self.conversation_timeout:
-                if application.job_queue is None:
-                    warn(
-                        "Ignoring `conversation_timeout` because the Application has no JobQueue.",
-                        stacklevel=1,
-                    )
-                elif not application.job_queue.scheduler.running:
-                    warn(
-                        "Ignoring `conversation_timeout` because the Applications JobQueue is "
-                        "not running.",
-                        stacklevel=1,
-                    )
-                elif isinstance(new_state, asyncio.Task):
-                    # Add the new timeout job
-                    # checking if the new state is self.END is done in _schedule_job
-                    application.create_task(
-                        self._schedule_job_delayed(
-                            new_state, application, update, context, conversation_key
-                        ),
-                        update=update,
-                        name=f"ConversationHandler:{update.update_id}:handle_update:timeout_job",
-                    )
-                else:
-                    self._schedule_job(new_state, application, update, context, conversation_key)
+
+        if self.conversation_timeout:
+            if application.job_queue is None:
+                warn(
+                    "Ignoring `conversation_timeout` because the Application has no JobQueue.",
+                    stacklevel=1,
+                )
+            elif not application.job_queue.scheduler.running:
+                warn(
+                    "Ignoring `conversation_timeout` because the Applications JobQueue is "
+                    "not running.",
+                    stacklevel=1,
+                )
+            elif isinstance(new_state, asyncio.Task):
+                # Add the new timeout job
+                # checking if the new state is self.END is done in _schedule_job
+                application.create_task(
+                    self._schedule_job_delayed(
+                        new_state, application, update, context, conversation_key
+                    ),
+                    update=update,
+                    name=f"ConversationHandler:{update.update_id}:handle_update:timeout_job",
+                )
+            else:
+                self._schedule_job(new_state, application, update, context, conversation_key)
 
         if isinstance(self.map_to_parent, dict) and new_state in self.map_to_parent:
             self._update_state(self.END, conversation_key, handler)
@@ -903,9 +977,11 @@ class ConversationHandler(BaseHandler[Update, CCT, object]):
                 del self._conversations[key]
 
         elif isinstance(new_state, asyncio.Task):
+            self._mark_as_recent(key)
             self._conversations[key] = PendingState(
                 old_state=self._conversations.get(key), task=new_state
             )
+            self._evict_least_recent()
 
         elif new_state is not None:
             if new_state not in self.states:
@@ -915,7 +991,42 @@ class ConversationHandler(BaseHandler[Update, CCT, object]):
                     f"ConversationHandler{' ' + self.name if self.name is not None else ''}.",
                     stacklevel=2,
                 )
+            self._mark_as_recent(key)
             self._conversations[key] = new_state
+            self._evict_least_recent()
+
+        else:
+            self._mark_as_recent(key)
+
+    def _mark_as_recent(self, key: ConversationKey) -> None:
+        """Moves the conversation to the end of the insertion order of the conversations dict, so
+        that the first key is always the least recently active conversation. This is only needed
+        if :attr:`max_conversations` is set.
+        """
+        if self.max_conversations is None:
+            return
+        # Reordering is not a change of the state, so we bypass the write-tracking of TrackingDict
+        data = (
+            self._conversations.data
+            if isinstance(self._conversations, TrackingDict)
+            else self._conversations
+        )
+        if key in data:
+            data[key] = data.pop(key)
+
+    def _evict_least_recent(self) -> None:
+        if self.max_conversations is None:
+            return
+        while len(self._conversations) > self.max_conversations:
+            key = next(iter(self._conversations))
+            _LOGGER.debug(
+                "Ending conversation %s since the limit of %d conversations is reached",
+                key,
+                self.max_conversations,
+            )
+            del self._conversations[key]
+            if (timeout_job := self.timeout_jobs.pop(key, None)) is not None:
+                timeout_job.schedule_removal()
 
     async def _trigger_timeout(self, context: CCT) -> None:
         """This is run whenever a conversation has timed out. Also makes sure that all handlers
@@ -931,12 +1042,27 @@ class ConversationHandler(BaseHandler[Update, CCT, object]):
 
         callback_context = ctxt.callback_context
 
-        async with self._timeout_jobs_lock:
-            found_job = self.timeout_jobs.get(ctxt.conversation_key)
-            if found_job is not job:
-                # The timeout has been cancelled in handle_update
-                return
+        found_job = self.timeout_jobs.get(ctxt.conversation_key)
+        if found_job is not job:
+            # The timeout has been cancelled in handle_update
+            return
+
+        if ctxt.deadline is None:
+            # An update of this conversation is currently being handled. handle_update will
+            # schedule a new job once it's done, if necessary
             del self.timeout_jobs[ctxt.conversation_key]
+            return
+
+        remaining = ctxt.deadline - time.monotonic()
+        if remaining > 0:
+            # The conversation was active since the job was scheduled, so we move the job to the
+            # current deadline
+            j_queue = ctxt.application.job_queue
+            self.timeout_jobs[ctxt.conversation_key] = j_queue.run_once(  # type: ignore[union-attr]
+                self._trigger_timeout, remaining, data=ctxt
+            )
+            return
+        del self.timeout_jobs[ctxt.conversation_key]
 
         # Now run all handlers which are in TIMEOUT state
         handlers = self.states.get(self.TIMEOUT, [])
@@ -25,6 +25,7 @@ from typing import TYPE_CHECKING, Any, TypeVar, cast
 from telegram import Update
 from telegram._utils.defaultvalue import DEFAULT_TRUE
 from telegram._utils.types import DVType
+from telegram.constants import UpdateType
 from telegram.ext._handlers.basehandler import BaseHandler
 from telegram.ext._utils.types import CCT, HandlerCallback
 
@@ -103,6 +104,14 @@ class InlineQueryHandler(BaseHandler[Update, CCT, RT]):
         self.pattern: str | Pattern[str] | None = pattern
         self.chat_types: list[str] | None = chat_types
 
+    @property
+    def update_types(self) -> frozenset[str]:
+        """See :attr:`telegram.ext.BaseHandler.update_types`.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return frozenset({UpdateType.INLINE_QUERY})
+
     def check_update(self, update: object) -> bool | Match[str] | None:
         """
         Determines whether an update should be passed to this handler's :attr:`callback`.
@@ -25,6 +25,7 @@ from telegram._utils.defaultvalue import DEFAULT_TRUE
 from telegram._utils.types import DVType
 from telegram.ext import filters as filters_module
 from telegram.ext._handlers.basehandler import BaseHandler
+from telegram.ext._utils._update_parsing import MESSAGE_UPDATE_TYPES
 from telegram.ext._utils.types import CCT, HandlerCallback
 
 if TYPE_CHECKING:
@@ -86,6 +87,15 @@ class MessageHandler(BaseHandler[Update, CCT, RT]):
             filters if filters is not None else filters_module.ALL
         )
 
+    @property
+    def update_types(self) -> frozenset[str]:
+        """See :attr:`telegram.ext.BaseHandler.update_types`.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        # The filters only pass updates that contain a message, see filters.BaseFilter
+        return MESSAGE_UPDATE_TYPES
+
     def check_update(self, update: object) -> bool | dict[str, list[Any]] | None:
         """Determines whether an update should be passed to this handler's :attr:`callback`.
 
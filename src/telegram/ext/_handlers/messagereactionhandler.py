@@ -23,6 +23,7 @@ from typing import Final
 from telegram import Update
 from telegram._utils.defaultvalue import DEFAULT_TRUE
 from telegram._utils.types import RT, SCT, DVType
+from telegram.constants import UpdateType
 from telegram.ext._handlers.basehandler import BaseHandler
 from telegram.ext._utils._update_parsing import parse_chat_id, parse_username
 from telegram.ext._utils.types import CCT, HandlerCallback
@@ -135,6 +136,18 @@ class MessageReactionHandler(BaseHandler[Update, CCT, RT]):
         self._user_ids = parse_chat_id(user_id)
         self._user_usernames = parse_username(user_username)
 
+    @property
+    def update_types(self) -> frozenset[str]:
+        """See :attr:`telegram.ext.BaseHandler.update_types`.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        if self.message_reaction_types == self.MESSAGE_REACTION_UPDATED:
+            return frozenset({UpdateType.MESSAGE_REACTION})
+        if self.message_reaction_types == self.MESSAGE_REACTION_COUNT_UPDATED:
+            return frozenset({UpdateType.MESSAGE_REACTION_COUNT})
+        return frozenset({UpdateType.MESSAGE_REACTION, UpdateType.MESSAGE_REACTION_COUNT})
+
     def check_update(self, update: object) -> bool:
         """Determines whether an update should be passed to this handler's :attr:`callback`.
 
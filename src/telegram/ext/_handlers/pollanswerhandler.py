@@ -19,6 +19,7 @@
 """This module contains the PollAnswerHandler class."""
 
 from telegram import Update
+from telegram.constants import UpdateType
 from telegram.ext._handlers.basehandler import BaseHandler
 from telegram.ext._utils.types import CCT, RT
 
@@ -57,6 +58,14 @@ class PollAnswerHandler(BaseHandler[Update, CCT, RT]):
 
     __slots__ = ()
 
+    @property
+    def update_types(self) -> frozenset[str]:
+        """See :attr:`telegram.ext.BaseHandler.update_types`.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return frozenset({UpdateType.POLL_ANSWER})
+
     def check_update(self, update: object) -> bool:
         """Determines whether an update should be passed to this handler's :attr:`callback`.
 
@@ -25,6 +25,7 @@ from typing import TypeVar
 from telegram import Update
 from telegram._utils.defaultvalue import DEFAULT_TRUE
 from telegram._utils.types import DVType
+from telegram.constants import UpdateType
 from telegram.ext._handlers.basehandler import BaseHandler
 from telegram.ext._utils.types import CCT, HandlerCallback
 
@@ -82,6 +83,14 @@ class PreCheckoutQueryHandler(BaseHandler[Update, CCT, RT]):
 
         self.pattern: Pattern[str] | None = re.compile(pattern) if pattern is not None else None
 
+    @property
+    def update_types(self) -> frozenset[str]:
+        """See :attr:`telegram.ext.BaseHandler.update_types`.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return frozenset({UpdateType.PRE_CHECKOUT_QUERY})
+
     def check_update(self, update: object) -> bool:
         """Determines whether an update should be passed to this handler's :attr:`callback`.
 
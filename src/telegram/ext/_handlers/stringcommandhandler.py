@@ -79,6 +79,15 @@ class StringCommandHandler(BaseHandler[str, CCT, RT]):
         super().__init__(callback, block=block)
         self.command: str = command
 
+    @property
+    def update_types(self) -> frozenset[str]:
+        """See :attr:`telegram.ext.BaseHandler.update_types`.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        # This handler only handles strings
+        return frozenset()
+
     def check_update(self, update: object) -> list[str] | None:
         """Determines whether an update should be passed to this handler's :attr:`callback`.
 
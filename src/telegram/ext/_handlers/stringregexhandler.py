@@ -87,6 +87,15 @@ class StringRegexHandler(BaseHandler[str, CCT, RT]):
 
         self.pattern: str | Pattern[str] = pattern
 
+    @property
+    def update_types(self) -> frozenset[str]:
+        """See :attr:`telegram.ext.BaseHandler.update_types`.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        # This handler only handles strings
+        return frozenset()
+
     def check_update(self, update: object) -> Match[str] | None:
         """Determines whether an update should be passed to this handler's :attr:`callback`.
 
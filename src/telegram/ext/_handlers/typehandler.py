@@ -20,6 +20,7 @@
 
 from typing import TypeVar
 
+from telegram import Update
 from telegram._utils.defaultvalue import DEFAULT_TRUE
 from telegram._utils.types import DVType
 from telegram.ext._handlers.basehandler import BaseHandler
@@ -83,6 +84,19 @@ class TypeHandler(BaseHandler[UT, CCT, RT]):
         self.type: GenericUT[UT] = type
         self.strict: bool | None = strict
 
+    @property
+    def update_types(self) -> frozenset[str] | None:
+        """See :attr:`telegram.ext.BaseHandler.update_types`. If :attr:`type` is neither a
+        subclass nor a superclass of :class:`telegram.Update`, this is an empty set.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        if isinstance(self.type, type) and not (
+            issubclass(self.type, Update) or issubclass(Update, self.type)
+        ):
+            return frozenset()
+        return None
+
     def check_update(self, update: object) -> bool:
         """Determines whether an update should be passed to this handler's :attr:`callback`.
 
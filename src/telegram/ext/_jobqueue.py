@@ -51,6 +51,35 @@ if TYPE_CHECKING:
 _ALL_DAYS = tuple(range(7))
 _LOGGER = get_logger(__name__, class_name="JobQueue")
 
+if APS_AVAILABLE:
+
+    class _AsyncIOScheduler(AsyncIOScheduler):
+        """Variant of :class:`~apscheduler.schedulers.asyncio.AsyncIOScheduler` that merges all
+        wakeups requested within the same iteration of the event loop into a single one.
+
+        APScheduler requests a wakeup for every job that is added, modified or removed and every
+        wakeup processes all job stores. When many jobs are scheduled at once, e.g. one reminder
+        per user, a single wakeup is enough to take all of them into account.
+        """
+
+        _wakeup_pending = False
+
+        def start(self, paused: bool = False) -> None:
+            # A wakeup may still have been pending when the event loop of a previous run was closed
+            self._wakeup_pending = False
+            super().start(paused)
+
+        def wakeup(self) -> None:
+            if self._wakeup_pending:
+                return
+            self._wakeup_pending = True
+            self._eventloop.call_soon_threadsafe(self._process_wakeup)
+
+        def _process_wakeup(self) -> None:
+            self._wakeup_pending = False
+            self._stop_timer()
+            self._start_timer(self._process_jobs())
+
 
 def _get_callback_name(callback: object) -> str:
     """Get the name of a callback function or callable object.
@@ -122,7 +151,7 @@ class JobQueue(Generic[CCT]):
 
         self._application: weakref.ReferenceType[Application] | None = None
         self._executor = AsyncIOExecutor()
-        self.scheduler: "AsyncIOScheduler" = AsyncIOScheduler(  # noqa: UP037
+        self.scheduler: "AsyncIOScheduler" = _AsyncIOScheduler(  # noqa: UP037
             **self.scheduler_configuration
         )
 
@@ -727,27 +756,27 @@ class JobQueue(Generic[CCT]):
         Returns:
             tuple[:class:`Job`]: Tuple of all *scheduled* jobs.
         """
-        jobs_generator: Iterable[Job] = (
-            Job.from_aps_job(job) for job in self.scheduler.get_jobs()
-        )
-        if pattern is None:
-            return tuple(jobs_generator)
-        return tuple(
-            job for job in jobs_generator if (job.name and re.compile(pattern).search(job.name))
-        )
+        aps_jobs: Iterable[APSJob] = self.scheduler.get_jobs()
+        if pattern is not None:
+            # The name is passed to APScheduler as well, so we filter before wrapping the jobs
+            regex = re.compile(pattern)
+            aps_jobs = (job for job in aps_jobs if (job.name and regex.search(job.name)))
+        return tuple(Job.from_aps_job(job) for job in aps_jobs)
 
     def get_jobs_by_name(self, name: str) -> tuple["Job[CCT]", ...]:
         """Returns a tuple of all *scheduled* jobs with the given name that are currently
         in the :class:`JobQueue`.
 
         Hint:
-            This method is a convenience wrapper for :meth:`jobs` with a pattern that matches the
-            given name.
+            This method is equivalent to calling :meth:`jobs` with a pattern that matches exactly
+            the given name, but compares the names directly instead.
 
         Returns:
             tuple[:class:`Job`]: Tuple of all *scheduled* jobs matching the name.
         """
-        return self.jobs(f"^{re.escape(name)}$")
+        return tuple(
+            Job.from_aps_job(job) for job in self.scheduler.get_jobs() if job.name == name
+        )
 
 
 class Job(Generic[CCT]):
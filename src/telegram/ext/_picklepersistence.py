@@ -18,11 +18,14 @@
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains the PicklePersistence class."""
 
+import bz2
+import gzip
+import lzma
 import pickle
 from collections.abc import Callable
 from copy import deepcopy
 from pathlib import Path
-from typing import Any, TypeVar, cast, overload
+from typing import IO, Any, Literal, TypeVar, cast, overload
 
 from telegram import Bot, TelegramObject
 from telegram._utils.types import FilePathInput
@@ -36,6 +39,10 @@ _REPLACED_UNKNOWN_BOT = "an unknown bot replaced by PTB's PicklePersistence"
 
 TelegramObj = TypeVar("TelegramObj", bound=TelegramObject)
 
+_COMPRESSION_MODULES = {"gzip": gzip, "bz2": bz2, "lzma": lzma}
+# Magic numbers used to detect the compression format of an existing file
+_COMPRESSION_MAGIC = ((b"\x1f\x8b", gzip), (b"BZh", bz2), (b"\xfd7zXZ\x00", lzma))
+
 
 def _all_subclasses(cls: type[TelegramObj]) -> set[type[TelegramObj]]:
     """Gets all subclasses of the specified object, recursively. from
@@ -50,23 +57,28 @@ def _reconstruct_to(cls: type[TelegramObj], kwargs: dict) -> TelegramObj:
     This method is used for unpickling. The data, which is in the form a dictionary, is
     converted back into a class. Works mostly the same as :meth:`TelegramObject.__setstate__`.
     This function should be kept in place for backwards compatibility even if the pickling logic
-    is changed, since `_custom_reduction` places references to this function into the pickled data.
+    is changed, since `_custom_reduction` places references to this function into the pickled data
+    for classes that customize their state.
     """
     obj = cls.__new__(cls)
     obj.__setstate__(kwargs)
     return obj
 
 
-def _custom_reduction(cls: TelegramObj) -> tuple[Callable, tuple[type[TelegramObj], dict]]:
+def _custom_reduction(cls: TelegramObj) -> tuple[Callable, tuple[object, ...]]:
     """
     This method is used for pickling. The bot attribute is preserved so _BotPickler().persistent_id
-    works as intended.
+    works as intended. Uses the same compact format as :meth:`TelegramObject.__reduce__`, unless
+    the class overrides :meth:`TelegramObject.__getstate__` or
+    :meth:`TelegramObject.__setstate__`.
     """
-    data = cls._get_attrs(include_private=True)  # pylint: disable=protected-access
-    # MappingProxyType is not pickable, so we convert it to a dict
-    # no need to convert back to MPT in _reconstruct_to, since it's done in __setstate__
-    data["api_kwargs"] = dict(data["api_kwargs"])  # type: ignore[arg-type]
-    return _reconstruct_to, (cls.__class__, data)
+    if not cls._has_default_state():  # pylint: disable=protected-access
+        data = cls._get_attrs(include_private=True)  # pylint: disable=protected-access
+        # MappingProxyType is not pickable, so we convert it to a dict
+        # no need to convert back to MPT in _reconstruct_to, since it's done in __setstate__
+        data["api_kwargs"] = dict(data["api_kwargs"])  # type: ignore[arg-type]
+        return _reconstruct_to, (cls.__class__, data)
+    return cls._reduce(remove_bot=False)  # pylint: disable=protected-access
 
 
 class _BotPickler(pickle.Pickler):
@@ -76,9 +88,7 @@ class _BotPickler(pickle.Pickler):
         self._bot = bot
         super().__init__(*args, **kwargs)
 
-    def reducer_override(
-        self, obj: TelegramObj
-    ) -> tuple[Callable, tuple[type[TelegramObj], dict]]:
+    def reducer_override(self, obj: TelegramObj) -> tuple[Callable, tuple[object, ...]]:
         """
         This method is used for pickling. The bot attribute is preserved so
         _BotPickler().persistent_id works as intended.
@@ -169,6 +179,21 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
             wait between two consecutive runs of updating the persistence. Defaults to 60 seconds.
 
             .. versionadded:: 20.0
+        compression (:obj:`str`, optional): If passed, the pickle files will be compressed with
+            the given format of the standard library. Must be one of ``"gzip"``, ``"bz2"`` or
+            ``"lzma"``. Since persisted data usually contains many repeated keys and strings,
+            this can reduce the file size drastically, at the cost of some CPU time on every
+            write. Files are compressed independently of each other, i.e. with
+            :paramref:`single_file` set to :obj:`False`, only the files of the changed kind of
+            data are rewritten.
+
+            Tip:
+                Files written by any of the supported formats or without compression at all are
+                detected and read automatically, as long as :paramref:`compression` is passed.
+                Existing files are therefore converted to the new format on the next write, e.g.
+                on :meth:`flush`.
+
+            .. versionadded:: NEXT.VERSION
     Attributes:
         filepath (:obj:`str` | :obj:`pathlib.Path`): The filepath for storing the pickle files.
             When :attr:`single_file` is :obj:`False` this will be used as a prefix.
@@ -185,12 +210,16 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
             in the ``context`` interface.
 
             .. versionadded:: 13.6
+        compression (:obj:`str`): Optional. The compression format used for the pickle files.
+
+            .. versionadded:: NEXT.VERSION
     """
 
     __slots__ = (
         "bot_data",
         "callback_data",
         "chat_data",
+        "compression",
         "context_types",
         "conversations",
         "filepath",
@@ -207,6 +236,8 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
         single_file: bool = True,
         on_flush: bool = False,
         update_interval: float = 60,
+        *,
+        compression: Literal["gzip", "bz2", "lzma"] | None = None,
     ): ...
 
     @overload
@@ -218,6 +249,8 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
         on_flush: bool = False,
         update_interval: float = 60,
         context_types: ContextTypes[Any, UD, CD, BD] | None = None,
+        *,
+        compression: Literal["gzip", "bz2", "lzma"] | None = None,
     ): ...
 
     def __init__(
@@ -228,8 +261,14 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
         on_flush: bool = False,
         update_interval: float = 60,
         context_types: ContextTypes[Any, UD, CD, BD] | None = None,
+        *,
+        compression: Literal["gzip", "bz2", "lzma"] | None = None,
     ):
         super().__init__(store_data=store_data, update_interval=update_interval)
+        if compression is not None and compression not in _COMPRESSION_MODULES:
+            raise ValueError(
+                f"`compression` must be one of {tuple(_COMPRESSION_MODULES)}, not {compression!r}"
+            )
         self.filepath: Path = Path(filepath)
         self.single_file: bool | None = single_file
         self.on_flush: bool | None = on_flush
@@ -241,10 +280,38 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
         self.context_types: ContextTypes[Any, UD, CD, BD] = cast(
             "ContextTypes[Any, UD, CD, BD]", context_types or ContextTypes()
         )
+        self.compression: Literal["gzip", "bz2", "lzma"] | None = compression
+
+    def _open_for_reading(self, filepath: Path) -> IO[bytes]:
+        if self.compression is None:
+            return filepath.open("rb")
+
+        with filepath.open("rb") as file:
+            magic = file.read(6)
+        for prefix, module in _COMPRESSION_MAGIC:
+            if magic.startswith(prefix):
+                return cast("IO[bytes]", module.open(filepath, "rb"))
+        # Uncompressed files are still accepted, so that existing files can be migrated
+        return filepath.open("rb")
+
+    def _open_for_writing(self, filepath: Path) -> IO[bytes]:
+        if self.compression is None:
+            return filepath.open("wb")
+        return cast("IO[bytes]", _COMPRESSION_MODULES[self.compression].open(filepath, "wb"))
 
     def _load_singlefile(self) -> None:
         try:
-            with self.filepath.open("rb") as file:
+            file = self._open_for_reading(self.filepath)
+        except OSError:
+            self.conversations = {}
+            self.user_data = {}
+            self.chat_data = {}
+            self.bot_data = self.context_types.bot_data()
+            self.callback_data = None
+            return
+
+        try:
+            with file:
                 data = _BotUnpickler(self.bot, file).load()
 
             self.user_data = data["user_data"]
@@ -253,13 +320,9 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
             self.bot_data = data.get("bot_data", self.context_types.bot_data())
             self.callback_data = data.get("callback_data", {})
             self.conversations = data["conversations"]
-        except OSError:
-            self.conversations = {}
-            self.user_data = {}
-            self.chat_data = {}
-            self.bot_data = self.context_types.bot_data()
-            self.callback_data = None
-        except pickle.UnpicklingError as exc:
+        # Errors raised while decompressing are OSErrors, but unlike a missing file, they
+        # must not be mistaken for an empty persistence
+        except (pickle.UnpicklingError, OSError, lzma.LZMAError) as exc:
             filename = self.filepath.name
             raise TypeError(f"File {filename} does not contain valid pickle data") from exc
         except Exception as exc:
@@ -267,12 +330,16 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
 
     def _load_file(self, filepath: Path) -> Any:
         try:
-            with filepath.open("rb") as file:
-                return _BotUnpickler(self.bot, file).load()
-
+            file = self._open_for_reading(filepath)
         except OSError:
             return None
-        except pickle.UnpicklingError as exc:
+
+        try:
+            with file:
+                return _BotUnpickler(self.bot, file).load()
+        # Errors raised while decompressing are OSErrors, but unlike a missing file, they
+        # must not be mistaken for an empty persistence
+        except (pickle.UnpicklingError, OSError, lzma.LZMAError) as exc:
             raise TypeError(f"File {filepath.name} does not contain valid pickle data") from exc
         except Exception as exc:
             raise TypeError(f"Something went wrong unpickling {filepath.name}") from exc
@@ -285,11 +352,11 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
             "bot_data": self.bot_data,
             "callback_data": self.callback_data,
         }
-        with self.filepath.open("wb") as file:
+        with self._open_for_writing(self.filepath) as file:
             _BotPickler(self.bot, file, protocol=pickle.HIGHEST_PROTOCOL).dump(data)
 
     def _dump_file(self, filepath: Path, data: object) -> None:
-        with filepath.open("wb") as file:
+        with self._open_for_writing(filepath) as file:
             _BotPickler(self.bot, file, protocol=pickle.HIGHEST_PROTOCOL).dump(data)
 
     async def get_user_data(self) -> dict[int, UD]:
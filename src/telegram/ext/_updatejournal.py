@@ -0,0 +1,258 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2026
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the UpdateJournal class."""
+
+import asyncio
+import os
+import pickle
+from collections.abc import Sequence
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any
+
+from telegram import Update
+from telegram._utils.logging import get_logger
+from telegram._utils.repr import build_repr_with_selected_attrs
+from telegram._utils.types import FilePathInput
+
+if TYPE_CHECKING:
+    from telegram import Bot
+
+_LOGGER = get_logger(__name__)
+
+# Tags of the records written to the journal file
+_RECORD = "update"
+_DONE = "done"
+
+
+class UpdateJournal:
+    """An append-only file that keeps track of updates that were received by the
+    :class:`telegram.ext.Updater` but not yet processed by the :class:`telegram.ext.Application`.
+
+    Updates are written to the journal *before* they are confirmed to Telegram, i.e. before the
+    next call to :meth:`~telegram.Bot.get_updates` or before the webhook request is answered.
+    Once the application is done processing an update, it is marked as done. Updates that are
+    still pending when the bot crashes or is shut down before processing them are loaded again on
+    the next startup and put into the :attr:`~telegram.ext.Updater.update_queue` before any new
+    updates.
+
+    Use :meth:`telegram.ext.ApplicationBuilder.update_journal` or the
+    :paramref:`~telegram.ext.Updater.update_journal` parameter of
+    :class:`telegram.ext.Updater` to use a journal.
+
+    Note:
+        * Updates are stored using :mod:`pickle`. Only load journal files from trusted sources.
+        * The file is synced to disk once for each batch of recorded updates. Marking an update
+          as done does not sync to disk. In the worst case, an update is hence processed twice,
+          but it is never lost.
+        * Each webhook request is answered only after its update was synced to disk, which adds
+          the latency of the disk to every request. Likewise, polled updates are passed on only
+          after they were synced to disk. The sync runs in a worker thread and is shared by all
+          requests that arrive in the meantime, such that concurrent requests are not
+          serialized on the disk and the event loop is not blocked.
+        * Once all recorded updates are processed, the file is truncated so it does not grow
+          indefinitely. Moreover, the file is compacted to the pending updates on startup.
+        * Updates that are passed to the :attr:`~telegram.ext.Application.update_queue` manually
+          are not recorded.
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        filepath (:obj:`str` | :obj:`pathlib.Path`): The path of the journal file.
+
+    Attributes:
+        filepath (:obj:`pathlib.Path`): The path of the journal file.
+    """
+
+    __slots__ = ("_file", "_next_sync", "_pending", "_sync_task", "filepath")
+
+    def __init__(self, filepath: FilePathInput):
+        self.filepath: Path = Path(filepath)
+        self._file: IO[bytes] | None = None
+        self._pending: dict[int, dict[str, Any]] = {}
+        self._next_sync: asyncio.Future[None] | None = None
+        self._sync_task: asyncio.Task[None] | None = None
+
+    def __repr__(self) -> str:
+        """Give a string representation of the journal in the form
+        ``UpdateJournal[filepath=...]``.
+
+        As this class doesn't implement :meth:`object.__str__`, the default implementation
+        will be used, which is equivalent to :meth:`__repr__`.
+
+        Returns:
+            :obj:`str`
+        """
+        return build_repr_with_selected_attrs(self, filepath=self.filepath)
+
+    @property
+    def pending_update_ids(self) -> frozenset[int]:
+        """frozenset[:obj:`int`]: The IDs of the updates that were recorded but not yet marked
+        as done.
+        """
+        return frozenset(self._pending)
+
+    def _read(self) -> None:
+        self._pending = {}
+        try:
+            with self.filepath.open("rb") as file:
+                while True:
+                    try:
+                        record = pickle.load(file)  # noqa: S301 - written by this class
+                    except EOFError:
+                        break
+                    except (pickle.UnpicklingError, ValueError, TypeError) as exc:
+                        # The last record was probably not written completely due to a crash.
+                        # As records are synced to disk before the update is confirmed, nothing
+                        # is lost by ignoring it.
+                        _LOGGER.warning(
+                            "Ignoring the incomplete tail of the update journal %s: %s",
+                            self.filepath,
+                            exc,
+                        )
+                        break
+
+                    if record[0] == _RECORD:
+                        self._pending[record[1]] = record[2]
+                    else:
+                        self._pending.pop(record[1], None)
+        except FileNotFoundError:
+            pass
+
+    def _write_records(self, records: Sequence[tuple[Any, ...]], sync: bool) -> None:
+        if self._file is None:
+            raise RuntimeError("This UpdateJournal is not opened. Call `load` first.")
+
+        for record in records:
+            pickle.dump(record, self._file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._file.flush()
+        if sync:
+            os.fsync(self._file.fileno())
+
+    def load(self, bot: "Bot") -> list[Update]:
+        """Opens the journal file for writing and loads the updates that were recorded but not
+        marked as done yet. The file is compacted such that it only contains these updates.
+
+        Args:
+            bot (:class:`telegram.Bot`): The bot to associate the loaded updates with.
+
+        Returns:
+            list[:class:`telegram.Update`]: The pending updates, sorted by their ID.
+        """
+        self.close()
+        self._read()
+
+        temp_path = self.filepath.with_name(f"{self.filepath.name}.tmp")
+        with temp_path.open("wb") as file:
+            for update_id, data in self._pending.items():
+                pickle.dump((_RECORD, update_id, data), file, protocol=pickle.HIGHEST_PROTOCOL)
+            file.flush()
+            os.fsync(file.fileno())
+        temp_path.replace(self.filepath)
+        self._file = self.filepath.open("ab")
+
+        if self._pending:
+            _LOGGER.info(
+                "Loaded %d pending updates from the update journal %s",
+                len(self._pending),
+                self.filepath,
+            )
+
+        updates = []
+        for update_id in sorted(self._pending):
+            update = Update.de_json(self._pending[update_id], bot)
+            updates.append(update)
+        return updates
+
+    def record(self, updates: Sequence[Update]) -> None:
+        """Writes the updates to the journal and syncs the file to disk. Updates that are already
+        pending are skipped.
+
+        Args:
+            updates (Sequence[:class:`telegram.Update`]): The updates.
+        """
+        if records := self._build_records(updates):
+            self._write_records(records, sync=True)
+
+    async def _record_batched(self, updates: Sequence[Update]) -> None:
+        """Like :meth:`record`, but the file is synced to disk in a worker thread. Calls made
+        while a sync is running share the next sync.
+        """
+        if not (records := self._build_records(updates)):
+            return
+        self._write_records(records, sync=False)
+
+        if self._next_sync is None:
+            self._next_sync = asyncio.get_running_loop().create_future()
+        next_sync = self._next_sync
+        if self._sync_task is None:
+            self._sync_task = asyncio.create_task(self._sync_pending())
+        await asyncio.shield(next_sync)
+
+    async def _sync_pending(self) -> None:
+        try:
+            # Records written while a sync is running are not covered by it, so we sync again
+            while self._next_sync is not None:
+                future, self._next_sync = self._next_sync, None
+                if self._file is None:
+                    future.set_exception(
+                        RuntimeError("This UpdateJournal was closed before syncing.")
+                    )
+                    continue
+                try:
+                    await asyncio.to_thread(os.fsync, self._file.fileno())
+                except Exception as exc:
+                    future.set_exception(exc)
+                else:
+                    future.set_result(None)
+        finally:
+            self._sync_task = None
+
+    def _build_records(self, updates: Sequence[Update]) -> list[tuple[Any, ...]]:
+        records: list[tuple[Any, ...]] = []
+        for update in updates:
+            if update.update_id in self._pending:
+                continue
+            data = update.to_dict()
+            self._pending[update.update_id] = data
+            records.append((_RECORD, update.update_id, data))
+        return records
+
+    def mark_done(self, update_id: int) -> None:
+        """Marks an update as done such that it is not loaded again on the next startup. Unknown
+        IDs are ignored.
+
+        Args:
+            update_id (:obj:`int`): The ID of the update.
+        """
+        if self._pending.pop(update_id, None) is None or self._file is None:
+            return
+
+        if not self._pending:
+            # Nothing is pending anymore, so the file can be emptied
+            self._file.seek(0)
+            self._file.truncate()
+            return
+
+        self._write_records([(_DONE, update_id)], sync=False)
+
+    def close(self) -> None:
+        """Closes the journal file. Does nothing if the file is not opened."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
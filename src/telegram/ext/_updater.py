@@ -19,6 +19,7 @@
 """This module contains the class Updater, which tries to make creating Telegram bots intuitive."""
 
 import asyncio
+import collections
 import contextlib
 import datetime as dtm
 import ssl
@@ -31,6 +32,7 @@ from telegram._utils.defaultvalue import DEFAULT_80, DEFAULT_IP, DefaultValue
 from telegram._utils.logging import get_logger
 from telegram._utils.repr import build_repr_with_selected_attrs
 from telegram._utils.types import DVType, TimePeriod
+from telegram.constants import PollingLimit
 from telegram.error import TelegramError
 from telegram.ext._utils.networkloop import network_retry_loop
 
@@ -44,7 +46,8 @@ except ImportError:
 if TYPE_CHECKING:
     from socket import socket
 
-    from telegram import Bot
+    from telegram import Bot, Update
+    from telegram.ext._updatejournal import UpdateJournal
 
 
 _UpdaterType = TypeVar("_UpdaterType", bound="Updater")  # pylint: disable=invalid-name
@@ -88,14 +91,25 @@ class Updater(contextlib.AbstractAsyncContextManager["Updater"]):
     Args:
         bot (:class:`telegram.Bot`): The bot used with this Updater.
         update_queue (:class:`asyncio.Queue`): Queue for the updates.
+        update_journal (:class:`telegram.ext.UpdateJournal`, optional): A journal to record the
+            received updates in before they are confirmed to Telegram. Pending updates from the
+            journal are put into the :attr:`update_queue` on :meth:`initialize`.
+
+            .. versionadded:: NEXT.VERSION
 
     Attributes:
         bot (:class:`telegram.Bot`): The bot used with this Updater.
         update_queue (:class:`asyncio.Queue`): Queue for the updates.
+        update_journal (:class:`telegram.ext.UpdateJournal`): Optional. The journal the received
+            updates are recorded in.
+
+            .. versionadded:: NEXT.VERSION
 
     """
 
     __slots__ = (
+        "__journal_backlog",
+        "__journal_backlog_task",
         "__lock",
         "__polling_cleanup_cb",
         "__polling_task",
@@ -105,6 +119,7 @@ class Updater(contextlib.AbstractAsyncContextManager["Updater"]):
         "_last_update_id",
         "_running",
         "bot",
+        "update_journal",
         "update_queue",
     )
 
@@ -112,9 +127,11 @@ class Updater(contextlib.AbstractAsyncContextManager["Updater"]):
         self,
         bot: "Bot",
         update_queue: "asyncio.Queue[object]",
+        update_journal: "UpdateJournal | None" = None,
     ):
         self.bot: Bot = bot
         self.update_queue: asyncio.Queue[object] = update_queue
+        self.update_journal: UpdateJournal | None = update_journal
 
         self._last_update_id = 0
         self._running = False
@@ -124,6 +141,8 @@ class Updater(contextlib.AbstractAsyncContextManager["Updater"]):
         self.__polling_task: asyncio.Task | None = None
         self.__polling_task_stop_event: asyncio.Event = asyncio.Event()
         self.__polling_cleanup_cb: Callable[[], Coroutine[Any, Any, None]] | None = None
+        self.__journal_backlog: collections.deque[Update] = collections.deque()
+        self.__journal_backlog_task: asyncio.Task | None = None
 
     async def __aenter__(self: _UpdaterType) -> _UpdaterType:
         """
@@ -171,7 +190,13 @@ class Updater(contextlib.AbstractAsyncContextManager["Updater"]):
 
     async def initialize(self) -> None:
         """Initializes the Updater & the associated :attr:`bot` by calling
-        :meth:`telegram.Bot.initialize`.
+        :meth:`telegram.Bot.initialize`. If an :attr:`update_journal` is set, the pending updates
+        are loaded from it and put into the :attr:`update_queue`. Updates that don't fit into
+        the queue are put into it once polling or the webhook is started. Polling continues
+        after the loaded updates, such that they are not fetched again.
+
+        .. versionchanged:: NEXT.VERSION
+            Loads pending updates from the :attr:`update_journal`.
 
         .. seealso::
             :meth:`shutdown`
@@ -181,11 +206,22 @@ class Updater(contextlib.AbstractAsyncContextManager["Updater"]):
             return
 
         await self.bot.initialize()
+        if self.update_journal is not None:
+            self.__journal_backlog.clear()
+            for update in self.update_journal.load(self.bot):
+                # Nothing consumes the queue yet, so we must not wait for free slots here
+                if self.__journal_backlog or self.update_queue.full():
+                    self.__journal_backlog.append(update)
+                else:
+                    self.update_queue.put_nowait(update)
+                # The loaded updates were not necessarily confirmed to Telegram
+                self._last_update_id = max(self._last_update_id, update.update_id + 1)
         self._initialized = True
 
     async def shutdown(self) -> None:
         """
         Shutdown the Updater & the associated :attr:`bot` by calling :meth:`telegram.Bot.shutdown`.
+        Also closes the :attr:`update_journal`, if set.
 
         .. seealso::
             :meth:`initialize`
@@ -201,6 +237,10 @@ class Updater(contextlib.AbstractAsyncContextManager["Updater"]):
             return
 
         await self.bot.shutdown()
+        if self.update_journal is not None:
+            # Updates that were not put into the queue are still pending in the journal
+            self.__journal_backlog.clear()
+            self.update_journal.close()
         self._initialized = False
         _LOGGER.debug("Shut down of Updater complete")
 
@@ -215,6 +255,11 @@ class Updater(contextlib.AbstractAsyncContextManager["Updater"]):
     ) -> "asyncio.Queue[object]":
         """Starts polling updates from Telegram.
 
+        Note:
+            If the :attr:`update_queue` has a ``maxsize``, at most as many updates are requested
+            as fit into the queue. While the queue is full, polling pauses until there is room
+            again instead of keeping fetched updates in memory.
+
         .. versionchanged:: 20.0
             Removed the ``clean`` argument in favor of :paramref:`drop_pending_updates`.
 
@@ -227,6 +272,10 @@ class Updater(contextlib.AbstractAsyncContextManager["Updater"]):
         Args:
             poll_interval (:obj:`float`, optional): Time to wait between polling updates from
                 Telegram in seconds. Default is ``0.0``.
+
+                .. versionchanged:: NEXT.VERSION
+                    The interval is skipped as long as Telegram returns full batches of updates,
+                    i.e. while there is a backlog of pending updates.
             timeout (:obj:`int` | :class:`datetime.timedelta`, optional): Passed to
                 :paramref:`telegram.Bot.get_updates.timeout`. Defaults to
                 ``timedelta(seconds=10)``.
@@ -311,6 +360,14 @@ class Updater(contextlib.AbstractAsyncContextManager["Updater"]):
                 raise
             return self.update_queue
 
+    async def _put_journal_backlog(self) -> None:
+        """Puts the updates loaded from the :attr:`update_journal` that did not fit into the
+        :attr:`update_queue` on :meth:`initialize` into it.
+        """
+        while self.__journal_backlog:
+            await self.update_queue.put(self.__journal_backlog[0])
+            self.__journal_backlog.popleft()
+
     async def _start_polling(
         self,
         poll_interval: float,
@@ -335,10 +392,31 @@ class Updater(contextlib.AbstractAsyncContextManager["Updater"]):
 
         _LOGGER.debug("Bootstrap done")
 
+        # Whether the last call to get_updates returned as many updates as requested. In that case
+        # there are most likely more pending updates, which we fetch without waiting.
+        backlog = False
+
+        def polling_interval() -> float:
+            return 0 if backlog else poll_interval
+
+        def polling_limit() -> int | None:
+            # For a bounded queue, we only request as many updates as fit into it. When the queue
+            # is full, the single requested update blocks in `put`, which pauses polling.
+            if self.update_queue.maxsize <= 0:
+                return None
+            free_slots = self.update_queue.maxsize - self.update_queue.qsize()
+            return max(PollingLimit.MIN_LIMIT, min(PollingLimit.MAX_LIMIT, free_slots))
+
         async def polling_action_cb() -> None:
+            nonlocal backlog
+            backlog = False
+            # The loaded updates must be processed before the ones fetched after them
+            await self._put_journal_backlog()
+            limit = polling_limit()
             try:
                 updates = await self.bot.get_updates(
                     offset=self._last_update_id,
+                    limit=limit,
                     timeout=timeout,
                     allowed_updates=allowed_updates,
                 )
@@ -361,9 +439,15 @@ class Updater(contextlib.AbstractAsyncContextManager["Updater"]):
                         "again on restart."
                     )
                 else:
+                    if self.update_journal is not None:
+                        # Record the updates before they are confirmed by the next call
+                        await self.update_journal._record_batched(  # pylint: disable=protected-access
+                            updates
+                        )
                     for update in updates:
                         await self.update_queue.put(update)
                     self._last_update_id = updates[-1].update_id + 1  # Add one to 'confirm' it
+                    backlog = len(updates) >= (limit or PollingLimit.MAX_LIMIT)
 
             return
 
@@ -379,7 +463,7 @@ class Updater(contextlib.AbstractAsyncContextManager["Updater"]):
                 action_cb=polling_action_cb,
                 on_err_cb=error_callback or default_error_callback,
                 description="Polling Updates",
-                interval=poll_interval,
+                interval=polling_interval,
                 stop_event=self.__polling_task_stop_event,
                 max_retries=-1,
                 repeat_on_success=True,
@@ -431,6 +515,9 @@ class Updater(contextlib.AbstractAsyncContextManager["Updater"]):
         max_connections: int = 40,
         secret_token: str | None = None,
         unix: "str | Path | socket | None" = None,
+        webhook_reply_timeout: float | None = None,
+        defer_update_decoding: bool = False,
+        reuse_port: bool = False,
     ) -> "asyncio.Queue[object]":
         """
         Starts a small http server to listen for updates via webhook. If :paramref:`cert`
@@ -523,6 +610,57 @@ class Updater(contextlib.AbstractAsyncContextManager["Updater"]):
                 .. versionadded:: 20.8
                 .. versionchanged:: 21.1
                     Added support to pass a socket instance itself.
+            webhook_reply_timeout (:obj:`float`, optional): If set, the web server waits up to
+                this many seconds before answering an incoming request, so that one method call
+                can be passed in the response via :meth:`telegram.ext.ExtBot.reply_via_webhook`.
+                Only has an effect if :attr:`bot` is a :class:`telegram.ext.ExtBot`. Defaults to
+                :obj:`None`, in which case requests are answered immediately.
+
+                Tip:
+                    Keep this value short, as Telegram does not deliver the next update to the
+                    same chat before the request is answered.
+
+                .. versionadded:: NEXT.VERSION
+            defer_update_decoding (:obj:`bool`, optional): Pass :obj:`True` to answer incoming
+                requests right after validating them and to put the undecoded payloads into
+                :attr:`update_queue`. Telegram delivers updates faster if the webhook responds
+                faster. Decoding is then done by :class:`telegram.ext.Application` right before
+                processing the update, and malformed payloads are passed to the error handlers
+                instead of being answered with
+                :class:`http.HTTPStatus.BAD_REQUEST <http.HTTPStatus>`. Defaults to
+                :obj:`False`.
+
+                Caution:
+                    The items in :attr:`update_queue` are not instances of
+                    :class:`telegram.Update` in this case. Only use this option if
+                    :attr:`update_queue` is consumed by a :class:`telegram.ext.Application`.
+                    Can not be combined with :paramref:`webhook_reply_timeout` or an
+                    :attr:`update_journal`.
+
+                .. versionadded:: NEXT.VERSION
+            reuse_port (:obj:`bool`, optional): Whether to set the ``SO_REUSEPORT`` socket option.
+                This allows several processes, each running its own bot instance, to listen on
+                the same port, with the operating system distributing incoming connections
+                between them. Defaults to :obj:`False`.
+
+                Caution:
+                    Each process processes only the updates it receives. Data stored in
+                    :attr:`telegram.ext.Application.user_data` & co. or in the states of a
+                    :class:`telegram.ext.ConversationHandler` is not shared between the
+                    processes.
+
+                Caution:
+                    Each process runs the bootstrapping phase, i.e. calls
+                    :meth:`telegram.Bot.set_webhook` with :paramref:`drop_pending_updates`. Pass
+                    the same webhook settings to all processes and pass
+                    :paramref:`drop_pending_updates` in at most one of them. Otherwise, a process
+                    that starts later drops the updates that are not yet delivered to the processes
+                    that are already running.
+
+                Note:
+                    Not available on all platforms. Can not be combined with :paramref:`unix`.
+
+                .. versionadded:: NEXT.VERSION
         Returns:
             :class:`queue.Queue`: The update queue that can be filled from the main thread.
 
@@ -534,6 +672,13 @@ class Updater(contextlib.AbstractAsyncContextManager["Updater"]):
                 "To use `start_webhook`, PTB must be installed via `pip install "
                 '"python-telegram-bot[webhooks]"`.'
             )
+        if defer_update_decoding and webhook_reply_timeout is not None:
+            raise ValueError(
+                "`defer_update_decoding` and `webhook_reply_timeout` can not be combined."
+            )
+        if defer_update_decoding and self.update_journal is not None:
+            raise ValueError("`defer_update_decoding` and `update_journal` can not be combined.")
+
         # unix has special requirements what must and mustn't be set when using it
         if unix:
             error_msg = (
@@ -544,6 +689,8 @@ class Updater(contextlib.AbstractAsyncContextManager["Updater"]):
                 raise RuntimeError(error_msg.format("listen"))
             if not isinstance(port, DefaultValue):
                 raise RuntimeError(error_msg.format("port"))
+            if reuse_port:
+                raise RuntimeError(error_msg.format("reuse_port"))
             if not webhook_url:
                 raise RuntimeError(
                     "Since you set unix, you also need to set the URL to the webhook "
@@ -577,6 +724,9 @@ class Updater(contextlib.AbstractAsyncContextManager["Updater"]):
                     max_connections=max_connections,
                     secret_token=secret_token,
                     unix=unix,
+                    webhook_reply_timeout=webhook_reply_timeout,
+                    defer_update_decoding=defer_update_decoding,
+                    reuse_port=reuse_port,
                 )
 
                 _LOGGER.debug("Waiting for webhook server to start")
@@ -605,6 +755,9 @@ class Updater(contextlib.AbstractAsyncContextManager["Updater"]):
         max_connections: int = 40,
         secret_token: str | None = None,
         unix: "str | Path | socket | None" = None,
+        webhook_reply_timeout: float | None = None,
+        defer_update_decoding: bool = False,
+        reuse_port: bool = False,
     ) -> None:
         _LOGGER.debug("Updater thread started (webhook)")
 
@@ -612,7 +765,15 @@ class Updater(contextlib.AbstractAsyncContextManager["Updater"]):
             url_path = f"/{url_path}"
 
         # Create Tornado app instance
-        app = WebhookAppClass(url_path, self.bot, self.update_queue, secret_token)
+        app = WebhookAppClass(
+            url_path,
+            self.bot,
+            self.update_queue,
+            secret_token,
+            webhook_reply_timeout,
+            defer_update_decoding,
+            self.update_journal,
+        )
 
         # Form SSL Context
         # An SSLError is raised if the private key does not match with the certificate
@@ -630,7 +791,7 @@ class Updater(contextlib.AbstractAsyncContextManager["Updater"]):
         else:
             ssl_ctx = None
         # Create and start server
-        self._httpd = WebhookServer(listen, port, app, ssl_ctx, unix)
+        self._httpd = WebhookServer(listen, port, app, ssl_ctx, unix, reuse_port)
 
         if not webhook_url:
             webhook_url = self._gen_webhook_url(
@@ -654,6 +815,11 @@ class Updater(contextlib.AbstractAsyncContextManager["Updater"]):
             secret_token=secret_token,
         )
 
+        if self.__journal_backlog:
+            self.__journal_backlog_task = asyncio.create_task(
+                self._put_journal_backlog(), name="Updater:start_webhook:journal_backlog_task"
+            )
+
         await self._httpd.serve_forever(ready=ready)
 
     @staticmethod
@@ -732,6 +898,12 @@ class Updater(contextlib.AbstractAsyncContextManager["Updater"]):
         Raises:
             :exc:`RuntimeError`: If the updater is not running.
         """
+        await self._stop()
+
+    async def _stop(self, confirm_updates: bool = True) -> None:
+        """Stops the polling/webhook. If :paramref:`confirm_updates` is :obj:`False`, the fetched
+        updates are not confirmed to Telegram until :meth:`_confirm_polled_updates` is called.
+        """
         async with self.__lock:
             if not self.running:
                 raise RuntimeError("This Updater is not running!")
@@ -741,7 +913,7 @@ class Updater(contextlib.AbstractAsyncContextManager["Updater"]):
             self._running = False
 
             await self._stop_httpd()
-            await self._stop_polling()
+            await self._stop_polling(confirm_updates=confirm_updates)
 
             _LOGGER.debug("Updater.stop() is complete")
 
@@ -751,8 +923,13 @@ class Updater(contextlib.AbstractAsyncContextManager["Updater"]):
             _LOGGER.debug("Waiting for current webhook connection to be closed.")
             await self._httpd.shutdown()
             self._httpd = None
+        if self.__journal_backlog_task:
+            self.__journal_backlog_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self.__journal_backlog_task
+            self.__journal_backlog_task = None
 
-    async def _stop_polling(self) -> None:
+    async def _stop_polling(self, confirm_updates: bool = True) -> None:
         """Stops the polling task by awaiting it."""
         if self.__polling_task:
             _LOGGER.debug("Waiting background polling task to finish up.")
@@ -766,11 +943,23 @@ class Updater(contextlib.AbstractAsyncContextManager["Updater"]):
             self.__polling_task = None
             self.__polling_task_stop_event.clear()
 
-            if self.__polling_cleanup_cb:
-                await self.__polling_cleanup_cb()
-                self.__polling_cleanup_cb = None
-            else:
+            if not self.__polling_cleanup_cb:
                 _LOGGER.warning(
                     "No polling cleanup callback defined. The last fetched updates may be "
                     "fetched again on the next polling start."
                 )
+            elif confirm_updates:
+                await self._confirm_polled_updates()
+
+    async def _confirm_polled_updates(self, offset: int | None = None) -> None:
+        """Marks the fetched updates as read on Telegrams side. If :paramref:`offset` is passed,
+        only updates with a lower ID are confirmed, such that the remaining ones are fetched again
+        on the next polling start. Does nothing if there is nothing to confirm.
+        """
+        if not self.__polling_cleanup_cb:
+            return
+
+        if offset is not None:
+            self._last_update_id = min(self._last_update_id, offset)
+        await self.__polling_cleanup_cb()
+        self.__polling_cleanup_cb = None
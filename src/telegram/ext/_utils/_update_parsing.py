@@ -26,7 +26,27 @@ Warning:
     the changelog.
 """
 
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, Final
+
 from telegram._utils.types import SCT
+from telegram.constants import UpdateType
+
+if TYPE_CHECKING:
+    from telegram.ext import BaseHandler
+
+MESSAGE_UPDATE_TYPES: Final[frozenset[str]] = frozenset(
+    {
+        UpdateType.MESSAGE,
+        UpdateType.EDITED_MESSAGE,
+        UpdateType.CHANNEL_POST,
+        UpdateType.EDITED_CHANNEL_POST,
+        UpdateType.BUSINESS_MESSAGE,
+        UpdateType.EDITED_BUSINESS_MESSAGE,
+        UpdateType.GUEST_MESSAGE,
+    }
+)
+"""The types of updates that :class:`telegram.ext.filters.BaseFilter` lets pass."""
 
 
 def parse_chat_id(chat_id: SCT[int] | None) -> frozenset[int]:
@@ -47,3 +67,15 @@ def parse_username(username: SCT[str] | None) -> frozenset[str]:
     if isinstance(username, str):
         return frozenset({username.removeprefix("@")})
     return frozenset(usr.removeprefix("@") for usr in username)
+
+
+def merge_update_types(handlers: Iterable["BaseHandler[Any, Any, Any]"]) -> frozenset[str] | None:
+    """Accepts a collection of handlers and returns the union of their update types. Returns
+    :obj:`None` if at least one of the handlers may handle updates of any type.
+    """
+    update_types: set[str] = set()
+    for handler in handlers:
+        if (handler_types := handler.update_types) is None:
+            return None
+        update_types.update(handler_types)
+    return frozenset(update_types)
@@ -46,7 +46,7 @@ async def network_retry_loop(
     action_cb: Callable[..., Coroutine],
     on_err_cb: Callable[[TelegramError], None] | None = None,
     description: str,
-    interval: float,
+    interval: float | Callable[[], float],
     stop_event: asyncio.Event | None = None,
     is_running: Callable[[], bool] | None = None,
     max_retries: int,
@@ -75,8 +75,12 @@ async def network_retry_loop(
             Important:
                 Must not raise exceptions! If it does, the loop will be aborted.
         description (:obj:`str`): Description text to use for logs and exception raised.
-        interval (:obj:`float` | :obj:`int`): Interval to sleep between each call to
-            `action_cb`.
+        interval (:obj:`float` | :obj:`int` | :obj:`callable`): Interval to sleep between each
+            call to `action_cb`. If a callable, it is called after each successful call to
+            `action_cb` to determine the interval.
+
+            .. versionchanged:: NEXT.VERSION
+                Accepts a callable.
         stop_event (:class:`asyncio.Event` | :obj:`None`): Event to wait on for stopping the
             loop. Setting the event will make the loop exit even if `action_cb` is currently
             running. Defaults to :obj:`None`.
@@ -102,6 +106,7 @@ async def network_retry_loop(
 
     log_prefix = f"Network Retry Loop ({description}):"
     effective_is_running = is_running or (lambda: True)
+    get_interval = interval if callable(interval) else (lambda: interval)
 
     def check_max_retries_and_log(current_retries: int, exception_info: str = "") -> bool:
         """Check if max retries reached and log accordingly.
@@ -154,7 +159,7 @@ async def network_retry_loop(
         action_cb_task.result()
 
     _LOGGER.debug("%s Starting", log_prefix)
-    cur_interval = interval
+    cur_interval = get_interval()
     retries = 0
     while effective_is_running():
         try:
@@ -192,7 +197,7 @@ async def network_retry_loop(
             # increase waiting times on subsequent errors up to 30secs
             cur_interval = 1 if cur_interval == 0 else min(30, 1.5 * cur_interval)
         else:
-            cur_interval = interval
+            cur_interval = get_interval()
         finally:
             retries += 1
 
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2026
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains a container for updates received via webhook that were not yet decoded.
+
+.. versionadded:: NEXT.VERSION
+
+Warning:
+    Contents of this module are intended to be used internally by the library and *not* by the
+    user. Changes to this module are not considered breaking changes and may not be documented in
+    the changelog.
+"""
+
+import json
+from typing import TYPE_CHECKING
+
+from telegram import Update
+from telegram.ext._extbot import ExtBot
+
+if TYPE_CHECKING:
+    from telegram import Bot
+
+
+class RawUpdate:
+    """The undecoded body of a webhook request. Put into the update queue by the webhook handler
+    if decoding was deferred, see ``Updater.start_webhook(defer_update_decoding=True)``, and
+    decoded by the ``Application`` right before processing.
+    """
+
+    __slots__ = ("payload",)
+
+    def __init__(self, payload: bytes):
+        self.payload: bytes = payload
+
+    def __repr__(self) -> str:
+        return f"RawUpdate(<{len(self.payload)} bytes>)"
+
+    def decode(self, bot: "Bot") -> Update:
+        """Decodes the payload into an update and inserts arbitrary callback data, if
+        necessary. Raises an exception if the payload is malformed.
+        """
+        update = Update.de_json(json.loads(self.payload), bot)
+        if isinstance(bot, ExtBot):
+            bot.insert_callback_data(update)
+        return update
@@ -41,9 +41,11 @@ except ImportError:
 from telegram import Update
 from telegram._utils.logging import get_logger
 from telegram.ext._extbot import ExtBot
+from telegram.ext._utils.rawupdate import RawUpdate
 
 if TYPE_CHECKING:
     from telegram import Bot
+    from telegram.ext._updatejournal import UpdateJournal
 
 # This module is not visible to users, so we log as Updater
 _LOGGER = get_logger(__name__, class_name="Updater")
@@ -59,6 +61,7 @@ class WebhookServer:
         "is_running",
         "listen",
         "port",
+        "reuse_port",
         "unix",
     )
 
@@ -69,12 +72,14 @@ class WebhookServer:
         webhook_app: "WebhookAppClass",
         ssl_ctx: SSLContext | None,
         unix: str | Path | socket | None = None,
+        reuse_port: bool = False,
     ):
         if unix and not UNIX_AVAILABLE:
             raise RuntimeError("This OS does not support binding unix sockets.")
         self._http_server = HTTPServer(webhook_app, ssl_options=ssl_ctx)
         self.listen = listen
         self.port = port
+        self.reuse_port = reuse_port
         self.is_running = False
         self.unix = None
         if unix and isinstance(unix, socket):
@@ -89,7 +94,9 @@ class WebhookServer:
             if self.unix:
                 self._http_server.add_socket(self.unix)
             else:
-                self._http_server.listen(self.port, address=self.listen)
+                self._http_server.listen(
+                    self.port, address=self.listen, reuse_port=self.reuse_port
+                )
 
             self.is_running = True
             if ready is not None:
@@ -117,11 +124,17 @@ class WebhookAppClass(tornado.web.Application):
         bot: "Bot",
         update_queue: asyncio.Queue,
         secret_token: str | None = None,
+        reply_timeout: float | None = None,
+        defer_decoding: bool = False,
+        journal: "UpdateJournal | None" = None,
     ):
         self.shared_objects = {
             "bot": bot,
             "update_queue": update_queue,
             "secret_token": secret_token,
+            "reply_timeout": reply_timeout,
+            "defer_decoding": defer_decoding,
+            "journal": journal,
         }
         handlers = [(rf"{webhook_path}/?", TelegramHandler, self.shared_objects)]
         tornado.web.Application.__init__(self, handlers)  # type: ignore
@@ -134,16 +147,34 @@ class WebhookAppClass(tornado.web.Application):
 class TelegramHandler(tornado.web.RequestHandler):
     """BaseHandler that processes incoming requests from Telegram"""
 
-    __slots__ = ("bot", "secret_token", "update_queue")
+    __slots__ = (
+        "bot",
+        "defer_decoding",
+        "journal",
+        "reply_timeout",
+        "secret_token",
+        "update_queue",
+    )
 
     SUPPORTED_METHODS = ("POST",)  # type: ignore[assignment]
 
-    def initialize(self, bot: "Bot", update_queue: asyncio.Queue, secret_token: str) -> None:
+    def initialize(
+        self,
+        bot: "Bot",
+        update_queue: asyncio.Queue,
+        secret_token: str,
+        reply_timeout: float | None = None,
+        defer_decoding: bool = False,
+        journal: "UpdateJournal | None" = None,
+    ) -> None:
         """Initialize for each request - that's the interface provided by tornado"""
         # pylint: disable=attribute-defined-outside-init
         self.bot = bot
         self.update_queue = update_queue
         self.secret_token = secret_token
+        self.reply_timeout = reply_timeout
+        self.defer_decoding = defer_decoding
+        self.journal = journal
         if secret_token:
             _LOGGER.debug(
                 "The webhook server has a secret token, expecting it in incoming requests now"
@@ -158,6 +189,12 @@ class TelegramHandler(tornado.web.RequestHandler):
         _LOGGER.debug("Webhook triggered")
         self._validate_post()
 
+        if self.defer_decoding:
+            # Decoding is done by the Application. This way, we can respond to Telegram asap.
+            self.set_status(HTTPStatus.OK)
+            await self.update_queue.put(RawUpdate(self.request.body))
+            return
+
         json_string = self.request.body.decode()
         data = json.loads(json_string)
         self.set_status(HTTPStatus.OK)
@@ -187,7 +224,34 @@ class TelegramHandler(tornado.web.RequestHandler):
             if isinstance(self.bot, ExtBot):
                 self.bot.insert_callback_data(update)
 
+            # Record the update before the request is answered, i.e. before it is confirmed
+            if self.journal is not None:
+                await self.journal._record_batched([update])  # pylint: disable=protected-access
+
+            if isinstance(self.bot, ExtBot) and self.reply_timeout is not None:
+                await self._put_and_wait_for_reply(self.bot, update)
+                return
+
+            await self.update_queue.put(update)
+
+    async def _put_and_wait_for_reply(self, bot: ExtBot, update: Update) -> None:
+        """Enqueues the update and waits for a method call that is to be passed in the response,
+        see ExtBot.reply_via_webhook.
+        """
+        # pylint: disable=protected-access
+        future = bot._register_webhook_reply(update.update_id)
+        try:
             await self.update_queue.put(update)
+            reply = await asyncio.wait_for(future, timeout=self.reply_timeout)
+        except asyncio.TimeoutError:
+            _LOGGER.debug("No webhook reply for Update with ID %d in time", update.update_id)
+            return
+        finally:
+            bot._discard_webhook_reply(update.update_id)
+
+        if reply is not None:
+            method, parameters = reply
+            self.write(json.dumps({"method": method, **parameters}))
 
     def _validate_post(self) -> None:
         """Only accept requests with content type JSON"""
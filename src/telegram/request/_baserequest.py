@@ -146,6 +146,20 @@ class BaseRequest(
             :obj:`float` | :obj:`None`: The read timeout in seconds.
         """
 
+    @property
+    def connection_pool_size(self) -> int | None:
+        """The maximum number of requests that this class can make concurrently, if limited.
+        Subclasses may override this to let e.g. :meth:`telegram.Bot.map` avoid running into
+        pool timeouts. The default implementation returns :obj:`None`.
+
+        .. versionadded:: NEXT.VERSION
+
+        Returns:
+            :obj:`int` | :obj:`None`: The maximum number of concurrent requests or :obj:`None`,
+            if unknown or unlimited.
+        """
+        return None
+
     @abc.abstractmethod
     async def initialize(self) -> None:
         """Initialize resources used by this class. Must be implemented by a subclass."""
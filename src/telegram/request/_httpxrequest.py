@@ -19,7 +19,7 @@
 """This module contains methods to make POST and GET requests using the httpx library."""
 
 from collections.abc import Collection
-from typing import Any
+from typing import Any, cast
 
 import httpx
 
@@ -223,6 +223,18 @@ class HTTPXRequest(BaseRequest):
         """
         return self._client.timeout.read
 
+    @property
+    def connection_pool_size(self) -> int | None:
+        """See :attr:`BaseRequest.connection_pool_size`.
+
+        .. versionadded:: NEXT.VERSION
+
+        Returns:
+            :obj:`int` | :obj:`None`: The maximum number of connections as passed to
+            :paramref:`HTTPXRequest.connection_pool_size` or via :paramref:`httpx_kwargs`.
+        """
+        return cast("httpx.Limits", self._client_kwargs["limits"]).max_connections
+
     def _build_client(self) -> httpx.AsyncClient:
         return httpx.AsyncClient(**self._client_kwargs)
 
@@ -22,7 +22,7 @@ import datetime as dtm
 import json
 from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import final
+from typing import Any, final
 
 from telegram._files.inputfile import InputFile
 from telegram._files.inputmedia import InputMedia, InputPaidMedia
@@ -34,6 +34,8 @@ from telegram._utils.datetime import to_timestamp
 from telegram._utils.enum import StringEnum
 from telegram._utils.types import UploadFileDict
 
+_NOT_ENCODED: Any = object()
+
 
 @final
 @dataclass(repr=True, eq=False, order=False, frozen=True)
@@ -61,23 +63,36 @@ class RequestParameter:
             be uploaded along with this parameter.
     """
 
-    __slots__ = ("input_files", "name", "value")
+    __slots__ = ("_json_value", "input_files", "name", "value")
 
     name: str
     value: object
     input_files: list[InputFile] | None
 
+    def __post_init__(self) -> None:
+        # The dataclass is frozen, so we have to circumvent its __setattr__
+        object.__setattr__(self, "_json_value", _NOT_ENCODED)
+
     @property
     def json_value(self) -> str | None:
         """The JSON dumped :attr:`value` or :obj:`None` if :attr:`value` is :obj:`None`.
         The latter can currently only happen if :attr:`input_files` has exactly one element that
         must not be uploaded via an attach:// URI.
+
+        .. versionchanged:: NEXT.VERSION
+            The value is computed only once, such that the same instance can be sent multiple
+            times without encoding :attr:`value` again.
         """
-        if isinstance(self.value, str):
-            return self.value
-        if self.value is None:
-            return None
-        return json.dumps(self.value)
+        # _json_value is not a dataclass field, so mypy doesn't know about it
+        if (json_value := getattr(self, "_json_value", _NOT_ENCODED)) is not _NOT_ENCODED:
+            return json_value
+
+        if isinstance(self.value, str) or self.value is None:
+            json_value = self.value
+        else:
+            json_value = json.dumps(self.value)
+        object.__setattr__(self, "_json_value", json_value)
+        return json_value
 
     @property
     def multipart_data(self) -> UploadFileDict | None:
@@ -192,7 +207,13 @@ class RequestParameter:
     def from_input(cls, key: str, value: object) -> "RequestParameter":
         """Builds an instance of this class for a given key-value pair that represents the raw
         input as passed along from a method of :class:`telegram.Bot`.
+
+        .. versionchanged:: NEXT.VERSION
+            If :paramref:`value` already is an instance of this class, e.g. because it was
+            prepared by :class:`telegram.MessageTemplate`, it is returned unchanged.
         """
+        if isinstance(value, RequestParameter):
+            return value
         if not isinstance(value, str | bytes) and isinstance(value, Sequence):
             param_values = []
             input_files = []
@@ -17,6 +17,8 @@
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 
+from copy import deepcopy
+
 import pytest
 
 from telegram import (
@@ -227,6 +229,15 @@ class TestInlineKeyboardButtonWithoutRequest(InlineKeyboardButtonTestBase):
         assert button == button_b
         assert hash(button) == hash(button_b)
 
+    def test_not_deeply_immutable(self):
+        # Buttons are changed in place by update_callback_data, so they must never be shared
+        button = InlineKeyboardButton(text="test", callback_data="data")
+        assert not button._is_deeply_immutable()
+        copied_button = deepcopy(button)
+        assert copied_button is not button
+        copied_button.update_callback_data("new data")
+        assert button.callback_data == "data"
+
         button.update_callback_data({})
         assert button.callback_data == {}
         with pytest.raises(TypeError, match="unhashable"):
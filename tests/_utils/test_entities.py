@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2026
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import pytest
+
+from telegram import MessageEntity
+from telegram._utils.entities import (
+    get_utf_16_slicer,
+    nest_message_entities,
+    parse_message_entities,
+    parse_message_entity,
+)
+
+
+class TestEntities:
+    @pytest.mark.parametrize(
+        ("text", "start", "end", "expected"),
+        [
+            ("ascii text", 0, 5, "ascii"),
+            ("ascii text", 6, None, "text"),
+            ("Привет мир", 7, 10, "мир"),
+            ("Привет мир", 7, None, "мир"),
+            ("🐍 snake 🐍", 3, 8, "snake"),
+            ("🐍 snake 🐍", 0, 2, "🐍"),
+            ("🐍 snake 🐍", 9, None, "🐍"),
+        ],
+    )
+    def test_get_utf_16_slicer(self, text, start, end, expected):
+        assert get_utf_16_slicer(text)(start, end) == expected
+
+    @pytest.mark.parametrize("text", ["some text", "Привет мир", "🐍 snake 🐍 and 😀"])
+    def test_parse_message_entities(self, text):
+        # The offsets of the characters in UTF-16 code units
+        offsets = [len(text[:idx].encode("utf-16-le")) // 2 for idx in range(len(text) + 1)]
+        entities = [
+            MessageEntity(MessageEntity.BOLD, start, end - start)
+            for start, end in zip(offsets, offsets[2:], strict=False)
+        ]
+        parsed = parse_message_entities(text, entities, types=[MessageEntity.BOLD])
+        assert parsed == {entity: parse_message_entity(text, entity) for entity in entities}
+        assert parse_message_entities(text, entities, types=[MessageEntity.ITALIC]) == {}
+        assert parse_message_entities(None, []) == {}
+
+    def test_nest_message_entities(self):
+        outer = MessageEntity(MessageEntity.BOLD, 0, 10)
+        inner = MessageEntity(MessageEntity.ITALIC, 2, 3)
+        innermost = MessageEntity(MessageEntity.CODE, 2, 1)
+        same_range = MessageEntity(MessageEntity.UNDERLINE, 0, 10)
+        overlapping = MessageEntity(MessageEntity.SPOILER, 8, 4)
+        separate = MessageEntity(MessageEntity.STRIKETHROUGH, 12, 1)
+
+        assert nest_message_entities(
+            [separate, innermost, overlapping, inner, same_range, outer]
+        ) == [
+            (same_range, [(outer, [(inner, [(innermost, [])])])]),
+            (overlapping, []),
+            (separate, []),
+        ]
+        assert nest_message_entities([]) == []
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2026
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+from concurrent.futures import ThreadPoolExecutor
+
+from telegram import BotCommand, TelegramObject
+from telegram._utils.interning import InterningCache
+
+
+class TestInterningCache:
+    def test_disabled_by_default(self):
+        cache = InterningCache(maxsize=2)
+        assert not cache.enabled
+        data = {"command": "start", "description": "Start the bot"}
+        assert cache.de_json(BotCommand, data, None, BotCommand.de_json) is not cache.de_json(
+            BotCommand, data, None, BotCommand.de_json
+        )
+
+    def test_de_json(self, offline_bot):
+        cache = InterningCache(maxsize=2)
+        cache.enabled = True
+        calls = []
+
+        def de_json(data, bot):
+            calls.append(data)
+            return BotCommand.de_json(data, bot)
+
+        data = {"command": "start", "description": "Start the bot"}
+        command = cache.de_json(BotCommand, data, offline_bot, de_json)
+        assert cache.de_json(BotCommand, dict(data), offline_bot, de_json) is command
+        assert len(calls) == 1
+
+        # A different bot gives a different object
+        assert cache.de_json(BotCommand, data, None, de_json) is not command
+        assert len(calls) == 2
+
+    def test_lru(self):
+        cache = InterningCache(maxsize=2)
+        cache.enabled = True
+        data = [{"command": str(i), "description": "description"} for i in range(3)]
+        first, second = (cache.de_json(BotCommand, d, None, BotCommand.de_json) for d in data[:2])
+
+        # Using the first object makes the second one the least recently used one
+        assert cache.de_json(BotCommand, data[0], None, BotCommand.de_json) is first
+        cache.de_json(BotCommand, data[2], None, BotCommand.de_json)
+        assert cache.de_json(BotCommand, data[0], None, BotCommand.de_json) is first
+        assert cache.de_json(BotCommand, data[1], None, BotCommand.de_json) is not second
+
+        cache.clear()
+        assert cache.de_json(BotCommand, data[0], None, BotCommand.de_json) is not first
+
+    def test_only_immutable_objects(self):
+        class Mutable(TelegramObject):
+            __slots__ = ("value",)
+
+            def __init__(self, value, *, api_kwargs=None):
+                super().__init__(api_kwargs=api_kwargs)
+                self.value = value
+                self._freeze()
+
+        cache = InterningCache(maxsize=2)
+        cache.enabled = True
+        immutable = {"value": (1, 2)}
+        assert cache.de_json(Mutable, immutable, None, Mutable.de_json) is cache.de_json(
+            Mutable, immutable, None, Mutable.de_json
+        )
+        # Unhashable data
+        mutable = {"value": [1, 2]}
+        assert cache.de_json(Mutable, mutable, None, Mutable.de_json) is not cache.de_json(
+            Mutable, mutable, None, Mutable.de_json
+        )
+        # Mutable api_kwargs
+        mutable = {"value": 1, "api_kwarg": object()}
+        assert cache.de_json(Mutable, mutable, None, Mutable.de_json) is not cache.de_json(
+            Mutable, mutable, None, Mutable.de_json
+        )
+
+    def test_unfrozen_objects_not_returned(self):
+        cache = InterningCache(maxsize=2)
+        cache.enabled = True
+        data = {"command": "start", "description": "Start the bot"}
+        command = cache.de_json(BotCommand, data, None, BotCommand.de_json)
+        with command._unfrozen():
+            pass
+        assert cache.de_json(BotCommand, data, None, BotCommand.de_json) is not command
+
+    def test_other_class(self):
+        class OtherCommand(BotCommand):
+            __slots__ = ()
+
+        cache = InterningCache(maxsize=2)
+        cache.enabled = True
+        data = {"command": "start", "description": "Start the bot"}
+        command = cache.de_json(BotCommand, data, None, BotCommand.de_json)
+        other = cache.de_json(OtherCommand, data, None, OtherCommand.de_json)
+        assert type(other) is OtherCommand
+        assert other is not command
+
+    def test_threads(self):
+        cache = InterningCache(maxsize=8)
+        cache.enabled = True
+        data = [{"command": str(i), "description": "description"} for i in range(16)]
+
+        def decode(_):
+            return [cache.de_json(BotCommand, d, None, BotCommand.de_json) for d in data * 50]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(decode, range(8)))
+
+        assert all(result == results[0] for result in results)
+        assert len(cache._cache) == cache.maxsize
@@ -243,3 +243,33 @@ class TestNetworkRetryLoop:
         )
 
         assert call_count == success_after
+
+    async def test_callable_interval(self, monkeypatch):
+        """Test that a callable interval is evaluated after each successful call."""
+        call_count = 0
+        intervals = iter([0.5, 0, 0.25, 0])
+        sleeps = []
+
+        async def sleep(delay):
+            sleeps.append(delay)
+
+        async def action():
+            nonlocal call_count
+            call_count += 1
+            if call_count == 2:
+                raise TimedOut("Test timeout")
+
+        monkeypatch.setattr("asyncio.sleep", sleep)
+        await network_retry_loop(
+            action_cb=action,
+            description="Test callable interval",
+            interval=lambda: next(intervals),
+            is_running=lambda: call_count < 4,
+            max_retries=-1,
+            repeat_on_success=True,
+        )
+
+        # The first value is the initial interval, which is only used for the backoff. After the
+        # timeout, we retry immediately.
+        assert call_count == 4
+        assert sleeps == [0.25]
@@ -21,6 +21,7 @@
 import asyncio
 import functools
 import inspect
+import json
 import logging
 import os
 import platform
@@ -36,7 +37,7 @@ from threading import Thread
 
 import pytest
 
-from telegram import Bot, Chat, Message, MessageEntity, User
+from telegram import Bot, Chat, Message, MessageEntity, Update, User
 from telegram.error import InvalidToken, TelegramError
 from telegram.ext import (
     Application,
@@ -44,6 +45,8 @@ from telegram.ext import (
     ApplicationHandlerStop,
     BaseHandler,
     CallbackContext,
+    CallbackQueryHandler,
+    ChatMemberHandler,
     CommandHandler,
     ContextTypes,
     Defaults,
@@ -51,10 +54,13 @@ from telegram.ext import (
     MessageHandler,
     PicklePersistence,
     SimpleUpdateProcessor,
+    StringCommandHandler,
     TypeHandler,
+    UpdateJournal,
     Updater,
     filters,
 )
+from telegram.ext._utils.rawupdate import RawUpdate
 from telegram.warnings import PTBDeprecationWarning, PTBUserWarning
 from tests.auxil.asyncio_helpers import call_after
 from tests.auxil.build_messages import make_message_update
@@ -434,6 +440,54 @@ class TestApplication:
         builder_1.token(app.bot.token)
         builder_2.token(app.bot.token)
 
+    async def test_stop_drain_timeout(self, app, caplog):
+        processed = []
+
+        async def callback(update, context):
+            await asyncio.sleep(0.1)
+            processed.append(update)
+
+        app.add_handler(TypeHandler(object, callback))
+        async with app:
+            await app.start()
+            for i in range(5):
+                await app.update_queue.put(i)
+            with caplog.at_level(logging.WARNING):
+                await app.stop(drain_timeout=0.15)
+
+        assert processed == [0, 1]
+        assert app.update_queue.empty()
+        assert len(caplog.records) == 1
+        # The second update was already being processed when the time was up
+        assert caplog.records[0].getMessage().endswith("Dropping 3 pending updates.")
+
+    async def test_stop_drain_timeout_concurrent_updates(self, one_time_bot, caplog):
+        app = ApplicationBuilder().bot(one_time_bot).concurrent_updates(2).build()
+        processed = []
+        blocker = asyncio.Event()
+
+        async def callback(update, context):
+            if update == 0:
+                await blocker.wait()
+            processed.append(update)
+
+        app.add_handler(TypeHandler(object, callback))
+        async with app:
+            await app.start()
+            for i in range(4):
+                await app.update_queue.put(i)
+            await asyncio.sleep(0.05)
+            # All updates were passed to the update processor and the fetcher took the
+            # _STOP_SIGNAL, while the first update is still being processed
+            asyncio.get_running_loop().call_later(0.3, blocker.set)
+            with caplog.at_level(logging.WARNING):
+                await asyncio.wait_for(app.stop(drain_timeout=0.1), timeout=5)
+
+        assert sorted(processed) == [0, 1, 2, 3]
+        assert app.update_queue.empty()
+        assert len(caplog.records) == 1
+        assert caplog.records[0].getMessage().endswith("Dropping 0 pending updates.")
+
     @pytest.mark.parametrize("job_queue", [True, False])
     @pytest.mark.filterwarnings("ignore::telegram.warnings.PTBUserWarning")
     async def test_start_stop_processing_updates(self, one_time_bot, job_queue, monkeypatch):
@@ -558,6 +612,68 @@ class TestApplication:
             assert self.count == 1
             await app.stop()
 
+    async def test_process_raw_update(self, app):
+        received = []
+
+        async def callback(update, context):
+            received.append(update)
+
+        async def error_handler(update, context):
+            received.append((update, context.error))
+
+        app.add_handler(TypeHandler(object, callback))
+        app.add_error_handler(error_handler)
+
+        async with app:
+            await app.start()
+            await app.update_queue.put(RawUpdate(self.message_update.to_json().encode()))
+            await app.update_queue.put(RawUpdate(b"not json"))
+            await asyncio.sleep(0.05)
+            await app.stop()
+
+        assert len(received) == 2
+        assert isinstance(received[0], Update)
+        assert received[0].to_dict() == self.message_update.to_dict()
+        assert received[0].get_bot() is app.bot
+        assert received[1][0] is None
+        assert isinstance(received[1][1], json.JSONDecodeError)
+
+    async def test_update_journal_mark_done(self, app, tmp_path):
+        pending = []
+
+        async def callback(update, context):
+            pending.append(app.updater.update_journal.pending_update_ids)
+
+        app.add_handler(TypeHandler(object, callback))
+        app.updater.update_journal = UpdateJournal(tmp_path / "journal")
+
+        async with app:
+            app.updater.update_journal.record([Update(update_id=1), Update(update_id=2)])
+            await app.start()
+            await app.update_queue.put(Update(update_id=1))
+            await app.update_queue.put(object())
+            await asyncio.sleep(0.05)
+            await app.stop()
+
+            # Updates are marked as done only after processing them
+            assert pending == [{1, 2}, {2}]
+            assert app.updater.update_journal.pending_update_ids == {2}
+
+    def test_get_allowed_updates(self, app):
+        # Telegram treats an empty list as the default set of update types
+        assert app.get_allowed_updates() == Update.ALL_TYPES
+        handler = StringCommandHandler("test", self.callback_increase_count)
+        app.add_handler(handler)
+        assert app.get_allowed_updates() == Update.ALL_TYPES
+        app.remove_handler(handler)
+
+        app.add_handler(CallbackQueryHandler(self.callback_increase_count))
+        app.add_handler(ChatMemberHandler(self.callback_increase_count), group=1)
+        assert app.get_allowed_updates() == ["callback_query", "my_chat_member"]
+
+        app.add_handler(TypeHandler(Update, self.callback_increase_count), group=2)
+        assert app.get_allowed_updates() == Update.ALL_TYPES
+
     async def test_add_remove_handler_non_default_group(self, app):
         handler = MessageHandler(filters.ALL, self.callback_increase_count)
         app.add_handler(handler, group=2)
@@ -1662,6 +1778,49 @@ class TestApplication:
             "updater.shutdown",
         ], "Wrong order of events detected!"
 
+    @pytest.mark.skipif(
+        platform.system() == "Windows",
+        reason="Can't send signals without stopping whole process on windows",
+    )
+    def test_run_polling_drain_timeout(self, app, monkeypatch):
+        offsets = []
+        processed = []
+
+        def thread_target():
+            waited = 0
+            while not app.running:
+                time.sleep(0.05)
+                waited += 0.05
+                if waited > 5:
+                    pytest.fail("App apparently won't start")
+
+            time.sleep(0.1)
+            os.kill(os.getpid(), signal.SIGINT)
+
+        async def get_updates(*args, offset=None, **kwargs):
+            offsets.append(offset)
+            if len(offsets) == 1:
+                return [Update(update_id=i) for i in range(1, 6)]
+            await asyncio.sleep(0.01)
+            return []
+
+        async def callback(update, context):
+            await asyncio.sleep(0.2)
+            processed.append(update.update_id)
+
+        monkeypatch.setattr(app.bot, "get_updates", get_updates)
+        monkeypatch.setattr(app.bot, "delete_webhook", return_true)
+        app.add_handler(TypeHandler(Update, callback))
+
+        thread = Thread(target=thread_target)
+        thread.start()
+        app.run_polling(close_loop=False, drain_timeout=0.3)
+        thread.join(timeout=10)
+
+        assert 0 < len(processed) < 5
+        # Only the processed updates were confirmed on shutdown
+        assert offsets[-1] == max(processed) + 1
+
     @pytest.mark.skipif(
         platform.system() == "Windows",
         reason="Can't send signals without stopping whole process on windows",
@@ -2711,6 +2870,20 @@ class TestApplication:
         # process_update was called
         assert checked_handlers == {"remove"}
 
+    async def test_process_update_answers_webhook_reply(self, app):
+        # Once all blocking handlers are done, a pending webhook reply must be released
+        async def callback(update, context):
+            assert not future.done()
+
+        app.add_handler(TypeHandler(Update, callback))
+        update = make_message_update("text")
+        async with app:
+            future = app.bot._register_webhook_reply(update.update_id)
+            await app.process_update(update)
+
+        assert future.result() is None
+        assert app.bot._webhook_replies == {}
+
     async def test_process_error_exception_in_building_context(self, monkeypatch, caplog, app):
         # Makes sure that exceptions in building the context don't stop the application
         exception = ValueError("TestException")
@@ -21,6 +21,7 @@ import datetime as dtm
 import inspect
 from dataclasses import dataclass
 from http import HTTPStatus
+from pathlib import Path
 
 import httpx
 import pytest
@@ -37,6 +38,8 @@ from telegram.ext import (
     ExtBot,
     JobQueue,
     PicklePersistence,
+    SQLiteCallbackDataBackend,
+    UpdateJournal,
     Updater,
 )
 from telegram.ext._applicationbuilder import _BOT_CHECKS
@@ -276,6 +279,7 @@ class TestApplicationBuilder:
             "bot",
             "update_queue",
             "rate_limiter",
+            "update_journal",
         ]
         + [entry[0] for entry in _BOT_CHECKS],
     )
@@ -340,11 +344,14 @@ class TestApplicationBuilder:
         request = HTTPXRequest()
         get_updates_request = HTTPXRequest()
         rate_limiter = AIORateLimiter()
+        callback_data_backend = SQLiteCallbackDataBackend("callback_data.sqlite")
         builder.token(bot.token).base_url("base_url").base_file_url("base_file_url").private_key(
             PRIVATE_KEY
         ).defaults(defaults).arbitrary_callback_data(42).request(request).get_updates_request(
             get_updates_request
-        ).rate_limiter(rate_limiter).local_mode(True)
+        ).rate_limiter(rate_limiter).local_mode(True).bot_user_cache(
+            "bot_user.json"
+        ).callback_data_backend(callback_data_backend)
         built_bot = builder.build().bot
 
         # In the following we access some private attributes of bot and request. this is not
@@ -361,6 +368,8 @@ class TestApplicationBuilder:
         assert built_bot.private_key
         assert built_bot.rate_limiter is rate_limiter
         assert built_bot.local_mode is True
+        assert built_bot.bot_user_cache == Path("bot_user.json")
+        assert built_bot.callback_data_cache.backend is callback_data_backend
 
         @dataclass
         class Client:
@@ -553,6 +562,14 @@ class TestApplicationBuilder:
         assert isinstance(app.job_queue, JobQueue)
         assert app.job_queue.application is app
 
+    def test_update_journal(self, bot, builder, tmp_path):
+        journal = UpdateJournal(tmp_path / "journal")
+        app = builder.token(bot.token).update_journal(journal).build()
+        assert app.updater.update_journal is journal
+
+        app = ApplicationBuilder().token(bot.token).build()
+        assert app.updater.update_journal is None
+
     @pytest.mark.filterwarnings("ignore::telegram.warnings.PTBUserWarning")
     def test_no_job_queue(self, bot, builder):
         app = builder.token(bot.token).job_queue(None).build()
@@ -37,6 +37,18 @@ class TestHandler:
             assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
         assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
 
+    def test_update_types(self):
+        class SubclassHandler(BaseHandler):
+            __slots__ = ()
+
+            def __init__(self):
+                super().__init__(lambda x: None)
+
+            def check_update(self, update: object):
+                pass
+
+        assert SubclassHandler().update_types is None
+
     def test_repr(self):
         async def some_func():
             return None
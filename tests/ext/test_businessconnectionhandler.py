@@ -103,6 +103,9 @@ class TestBusinessConnectionHandler:
             assert getattr(action, attr, "err") != "err", f"got extra slot '{attr}'"
         assert len(mro_slots(action)) == len(set(mro_slots(action))), "duplicate slot"
 
+    def test_update_types(self):
+        assert BusinessConnectionHandler(self.callback).update_types == {"business_connection"}
+
     @pytest.fixture(autouse=True)
     def _reset(self):
         self.test_flag = False
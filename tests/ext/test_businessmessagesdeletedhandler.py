@@ -99,6 +99,11 @@ class TestBusinessMessagesDeletedHandler:
             assert getattr(action, attr, "err") != "err", f"got extra slot '{attr}'"
         assert len(mro_slots(action)) == len(set(mro_slots(action))), "duplicate slot"
 
+    def test_update_types(self):
+        assert BusinessMessagesDeletedHandler(self.callback).update_types == {
+            "deleted_business_messages"
+        }
+
     @pytest.fixture(autouse=True)
     def _reset(self):
         self.test_flag = False
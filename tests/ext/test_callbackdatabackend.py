@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2026
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import datetime as dtm
+import time
+from pathlib import Path
+
+import pytest
+
+from telegram.ext import SQLiteCallbackDataBackend
+from tests.auxil.slots import mro_slots
+
+
+@pytest.fixture
+def backend(tmp_path):
+    backend = SQLiteCallbackDataBackend(tmp_path / "callback_data.sqlite")
+    yield backend
+    backend.close()
+
+
+class TestSQLiteCallbackDataBackend:
+    def test_slot_behaviour(self, backend):
+        for attr in backend.__slots__:
+            assert getattr(backend, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(backend)) == len(set(mro_slots(backend))), "duplicate slot"
+
+    @pytest.mark.parametrize(
+        ("ttl", "expected"),
+        [
+            (42, dtm.timedelta(seconds=42)),
+            (dtm.timedelta(minutes=1), dtm.timedelta(minutes=1)),
+            (None, None),
+        ],
+    )
+    def test_init(self, tmp_path, ttl, expected):
+        backend = SQLiteCallbackDataBackend(str(tmp_path / "db"), ttl=ttl)
+        assert backend.filepath == tmp_path / "db"
+        assert isinstance(backend.filepath, Path)
+        assert backend.ttl == expected
+        assert SQLiteCallbackDataBackend(tmp_path / "db").ttl == dtm.timedelta(days=1)
+        # The database is only opened on first use
+        assert not backend.filepath.exists()
+
+    def test_repr(self, backend):
+        assert repr(backend) == f"SQLiteCallbackDataBackend[filepath={backend.filepath}]"
+
+    def test_store_and_get(self, backend):
+        now = time.time()
+        backend.store_keyboards(
+            [("keyboard_1", now, {"0": 1, "1": [2, 3]}), ("keyboard_2", now, {"0": object})]
+        )
+        assert backend.get_keyboard("keyboard_1") == {"0": 1, "1": [2, 3]}
+        assert backend.get_keyboard("keyboard_2") == {"0": object}
+        assert backend.get_keyboard("keyboard_3") is None
+
+        backend.store_keyboards([("keyboard_1", now, {"0": "new"})])
+        assert backend.get_keyboard("keyboard_1") == {"0": "new"}
+
+    def test_shared_between_instances(self, backend):
+        backend.store_keyboards([("keyboard", time.time(), {"0": "data"})])
+
+        # Simulate another process
+        other = SQLiteCallbackDataBackend(backend.filepath)
+        try:
+            assert other.get_keyboard("keyboard") == {"0": "data"}
+            other.drop_keyboard("keyboard")
+        finally:
+            other.close()
+        assert backend.get_keyboard("keyboard") is None
+
+    def test_close_and_reopen(self, backend):
+        backend.store_keyboards([("keyboard", time.time(), {"0": "data"})])
+        backend.close()
+        backend.close()
+        assert backend.get_keyboard("keyboard") == {"0": "data"}
+
+    def test_ttl(self, tmp_path):
+        backend = SQLiteCallbackDataBackend(tmp_path / "db", ttl=10)
+        now = time.time()
+        backend.store_keyboards([("old", now - 11, {"0": 0}), ("new", now - 9, {"0": 1})])
+        assert backend.get_keyboard("old") is None
+        assert backend.get_keyboard("new") == {"0": 1}
+
+        # The first call to store_keyboards also deleted the expired keyboards from the file
+        backend.ttl = None
+        assert backend.get_keyboard("old") is None
+        assert backend.get_keyboard("new") == {"0": 1}
+        backend.close()
+
+    def test_no_ttl(self, tmp_path):
+        backend = SQLiteCallbackDataBackend(tmp_path / "db", ttl=None)
+        backend.store_keyboards([("old", 1.0, {"0": 0})])
+        assert backend.get_keyboard("old") == {"0": 0}
+        backend.close()
+
+    def test_drop_keyboard(self, backend):
+        backend.store_keyboards([("keyboard", time.time(), {"0": 0})])
+        backend.drop_keyboard("keyboard")
+        backend.drop_keyboard("unknown")
+        assert backend.get_keyboard("keyboard") is None
+
+    def test_clear(self, backend):
+        now = time.time()
+        backend.store_keyboards(
+            [("a", now - 100, {"0": 0}), ("b", now - 50, {"0": 1}), ("c", now, {"0": 2})]
+        )
+        backend.clear(now - 60)
+        assert backend.get_keyboard("a") is None
+        assert backend.get_keyboard("b") == {"0": 1}
+
+        backend.clear()
+        assert backend.get_keyboard("b") is None
+        assert backend.get_keyboard("c") is None
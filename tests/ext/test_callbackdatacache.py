@@ -16,7 +16,10 @@
 #
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
+import asyncio
 import datetime as dtm
+import logging
+import threading
 import time
 from copy import deepcopy
 from uuid import uuid4
@@ -25,7 +28,7 @@ import pytest
 
 from telegram import CallbackQuery, Chat, InlineKeyboardButton, InlineKeyboardMarkup, Message, User
 from telegram._utils.datetime import UTC
-from telegram.ext import ExtBot
+from telegram.ext import BaseCallbackDataBackend, ExtBot, SQLiteCallbackDataBackend
 from telegram.ext._callbackdatacache import CallbackDataCache, InvalidCallbackData, _KeyboardData
 from tests.auxil.envvars import TEST_WITH_OPT_DEPS
 from tests.auxil.slots import mro_slots
@@ -175,6 +178,335 @@ class TestCallbackDataCache:
         assert cdc.persistence_data[0][0][0] != keyboard_1
         assert cdc.persistence_data[0][0][0] == keyboard_2
 
+    def test_process_keyboard_short_ids(self, callback_data_cache):
+        reply_markup = InlineKeyboardMarkup(
+            [[InlineKeyboardButton(str(i), callback_data=i) for i in range(8)] for _ in range(8)]
+        )
+        out = callback_data_cache.process_keyboard(reply_markup)
+
+        keyboard_uuids = set()
+        buttons = [button for row in out.inline_keyboard for button in row]
+        for i, button in enumerate(buttons):
+            keyboard_uuid, button_id = callback_data_cache.extract_uuids(button.callback_data)
+            keyboard_uuids.add(keyboard_uuid)
+            assert len(keyboard_uuid) == 16
+            assert button_id == str(i)
+            button_data = callback_data_cache._keyboard_data[keyboard_uuid].button_data
+            assert button_data[button_id] == i % 8
+        assert len(keyboard_uuids) == 1
+
+        # keyboard IDs are random
+        other = callback_data_cache.process_keyboard(reply_markup)
+        other_uuid, _ = callback_data_cache.extract_uuids(
+            other.inline_keyboard[0][0].callback_data
+        )
+        assert other_uuid not in keyboard_uuids
+
+    def test_legacy_callback_data(self, bot):
+        # Keyboards that were created and persisted with previous versions
+        keyboard_uuid, button_uuid = uuid4().hex, uuid4().hex
+        cdc = CallbackDataCache(
+            bot, persistent_data=([(keyboard_uuid, time.time(), {button_uuid: "data"})], {})
+        )
+        assert cdc.extract_uuids(keyboard_uuid + button_uuid) == (keyboard_uuid, button_uuid)
+
+        callback_query = CallbackQuery(
+            "1", from_user=None, chat_instance=None, data=keyboard_uuid + button_uuid
+        )
+        cdc.process_callback_query(callback_query)
+        assert callback_query.data == "data"
+
+    def test_persistence_snapshot(self, callback_data_cache):
+        reply_markup = InlineKeyboardMarkup.from_button(
+            InlineKeyboardButton("changing", callback_data={"some": "data"})
+        )
+        out_1 = callback_data_cache.process_keyboard(reply_markup)
+        callback_data_cache.process_keyboard(reply_markup)
+
+        snapshot_1 = callback_data_cache._get_persistence_snapshot()
+        assert snapshot_1 == callback_data_cache.persistence_data
+        # the snapshot is a deep copy
+        keyboard_data = callback_data_cache._keyboard_data[snapshot_1[0][0][0]]
+        assert snapshot_1[0][0][2]["0"] is not keyboard_data.button_data["0"]
+
+        # Nothing changed, so the copies are reused
+        snapshot_2 = callback_data_cache._get_persistence_snapshot()
+        assert snapshot_2 == snapshot_1
+        assert snapshot_2[0][0] is snapshot_1[0][0]
+        assert snapshot_2[0][1] is snapshot_1[0][1]
+
+        # Accessing the first keyboard updates its access time, so only that one is copied again
+        callback_query = CallbackQuery(
+            "1",
+            from_user=None,
+            chat_instance=None,
+            data=out_1.inline_keyboard[0][0].callback_data,
+        )
+        callback_data_cache.process_callback_query(callback_query)
+        snapshot_3 = callback_data_cache._get_persistence_snapshot()
+        assert snapshot_3 == callback_data_cache.persistence_data
+        assert snapshot_3[0][0] is not snapshot_1[0][0]
+        assert snapshot_3[0][1] is snapshot_1[0][1]
+        assert snapshot_3[1] == {"1": snapshot_1[0][0][0]}
+
+        # Dropped keyboards are dropped from the snapshot as well
+        callback_data_cache.drop_data(callback_query)
+        snapshot_4 = callback_data_cache._get_persistence_snapshot()
+        assert snapshot_4 == callback_data_cache.persistence_data
+        assert snapshot_4 == ([snapshot_1[0][1]], {})
+
+    def test_persistence_snapshot_bounded(self, bot):
+        cache = CallbackDataCache(bot, maxsize=10)
+        reply_markup = InlineKeyboardMarkup.from_button(
+            InlineKeyboardButton("test", callback_data="data")
+        )
+        for _ in range(50):
+            cache.process_keyboard(reply_markup)
+        # Without a persistence, no copies are made
+        assert all(data.snapshot is None for data in cache._keyboard_data.values())
+
+        snapshot = cache._get_persistence_snapshot()
+        assert snapshot == cache.persistence_data
+        assert len(snapshot[0]) == 10
+        for _ in range(10):
+            cache.process_keyboard(reply_markup)
+        # The copies were evicted along with the keyboards
+        assert all(data.snapshot is None for data in cache._keyboard_data.values())
+
+    def test_backend(self, bot, tmp_path):
+        backend = SQLiteCallbackDataBackend(tmp_path / "db")
+        cache = CallbackDataCache(bot, backend=backend)
+        assert cache.backend is backend
+        assert CallbackDataCache(bot).backend is None
+
+        reply_markup = InlineKeyboardMarkup.from_row(
+            [
+                InlineKeyboardButton("button", callback_data={"some": "data"}),
+                InlineKeyboardButton("button", callback_data=42),
+            ]
+        )
+        out = cache.process_keyboard(reply_markup)
+        # Keyboards are written only on flush
+        keyboard_uuid, _ = cache.extract_uuids(out.inline_keyboard[0][0].callback_data)
+        assert backend.get_keyboard(keyboard_uuid) is None
+        cache.flush()
+        assert backend.get_keyboard(keyboard_uuid) == {"0": {"some": "data"}, "1": 42}
+
+        # Simulate another process that shares the backend
+        other_backend = SQLiteCallbackDataBackend(tmp_path / "db")
+        other_cache = CallbackDataCache(bot, backend=other_backend)
+        callback_query = CallbackQuery(
+            "1",
+            from_user=None,
+            chat_instance=None,
+            data=out.inline_keyboard[0][1].callback_data,
+        )
+        other_cache.process_callback_query(callback_query)
+        assert callback_query.data == 42
+        # The keyboard is now cached in memory, too
+        assert keyboard_uuid in other_cache._keyboard_data
+
+        other_cache.drop_data(callback_query)
+        assert backend.get_keyboard(keyboard_uuid) is None
+
+        callback_query = CallbackQuery(
+            "2",
+            from_user=None,
+            chat_instance=None,
+            data=out.inline_keyboard[0][1].callback_data,
+        )
+        other_cache.process_callback_query(callback_query)
+        assert isinstance(callback_query.data, InvalidCallbackData)
+
+        backend.close()
+        other_backend.close()
+
+    def test_backend_batched_writes(self, bot):
+        class RecordingBackend(BaseCallbackDataBackend):
+            def __init__(self):
+                self.calls = []
+
+            def store_keyboards(self, keyboards):
+                self.calls.append(list(keyboards))
+
+            def get_keyboard(self, keyboard_uuid):
+                return None
+
+            def drop_keyboard(self, keyboard_uuid):
+                pass
+
+            def clear(self, time_cutoff=None):
+                pass
+
+        backend = RecordingBackend()
+        cache = CallbackDataCache(bot, maxsize=1, backend=backend)
+        for i in range(3):
+            cache.process_keyboard(
+                InlineKeyboardMarkup.from_button(InlineKeyboardButton("button", callback_data=i))
+            )
+        cache.process_keyboard(
+            InlineKeyboardMarkup.from_button(InlineKeyboardButton("button", url="https://a.b"))
+        )
+        assert backend.calls == []
+
+        cache.flush()
+        assert len(backend.calls) == 1
+        assert [data for _, _, data in backend.calls[0]] == [{"0": 0}, {"0": 1}, {"0": 2}]
+        cache.flush()
+        assert len(backend.calls) == 1
+
+        # Keyboards that were dropped from memory before flushing are still found, without
+        # writing them on the lookup
+        out = cache.process_keyboard(
+            InlineKeyboardMarkup.from_button(InlineKeyboardButton("button", callback_data=3))
+        )
+        cache.process_keyboard(
+            InlineKeyboardMarkup.from_button(InlineKeyboardButton("button", callback_data=4))
+        )
+        callback_query = CallbackQuery(
+            "1", from_user=None, chat_instance=None, data=out.inline_keyboard[0][0].callback_data
+        )
+        cache.process_callback_query(callback_query)
+        assert callback_query.data == 3
+        assert len(backend.calls) == 1
+        cache.flush()
+        assert [data for _, _, data in backend.calls[1]] == [{"0": 3}, {"0": 4}]
+
+    def test_backend_unpicklable_data(self, bot, tmp_path, caplog):
+        backend = SQLiteCallbackDataBackend(tmp_path / "db")
+        cache = CallbackDataCache(bot, backend=backend)
+        uuids = []
+        for callback_data in ["data", lambda: None, 42]:
+            out = cache.process_keyboard(
+                InlineKeyboardMarkup.from_button(
+                    InlineKeyboardButton("button", callback_data=callback_data)
+                )
+            )
+            uuids.append(cache.extract_uuids(out.inline_keyboard[0][0].callback_data)[0])
+
+        with caplog.at_level(logging.WARNING):
+            cache.flush()
+        assert backend.get_keyboard(uuids[0]) == {"0": "data"}
+        assert backend.get_keyboard(uuids[1]) is None
+        assert backend.get_keyboard(uuids[2]) == {"0": 42}
+        assert [record.levelno for record in caplog.records] == [logging.WARNING, logging.ERROR]
+        assert uuids[1] in caplog.records[1].getMessage()
+
+        # The keyboard is not retried, such that it doesn't break all following flushes
+        caplog.clear()
+        cache.flush()
+        assert not caplog.records
+        # It can still be resolved by this process
+        assert uuids[1] in cache._keyboard_data
+        backend.close()
+
+    async def test_backend_flush_in_thread(self, bot):
+        class RecordingBackend(BaseCallbackDataBackend):
+            def __init__(self):
+                self.calls = []
+
+            def store_keyboards(self, keyboards):
+                time.sleep(0.05)
+                self.calls.append((threading.current_thread(), len(keyboards)))
+
+            def get_keyboard(self, keyboard_uuid):
+                return None
+
+            def drop_keyboard(self, keyboard_uuid):
+                pass
+
+            def clear(self, time_cutoff=None):
+                pass
+
+        backend = RecordingBackend()
+        cache = CallbackDataCache(bot, backend=backend)
+        reply_markup = InlineKeyboardMarkup.from_button(
+            InlineKeyboardButton("button", callback_data="data")
+        )
+
+        async def send():
+            cache.process_keyboard(reply_markup)
+            await cache._flush_in_thread()
+            # The own keyboard must be stored before returning
+            return sum(count for _, count in backend.calls)
+
+        first = asyncio.create_task(send())
+        await asyncio.sleep(0.01)
+        stored = await asyncio.gather(first, send(), send())
+        assert stored == [1, 3, 3]
+        # The keyboards of the last two calls were stored in one batch
+        assert [count for _, count in backend.calls] == [1, 2]
+        assert all(thread is not threading.current_thread() for thread, _ in backend.calls)
+
+    def test_backend_clear(self, bot, tmp_path):
+        backend = SQLiteCallbackDataBackend(tmp_path / "db")
+        cache = CallbackDataCache(bot, backend=backend)
+        reply_markup = InlineKeyboardMarkup.from_button(
+            InlineKeyboardButton("button", callback_data="data")
+        )
+        old_uuid, _ = cache.extract_uuids(
+            cache.process_keyboard(reply_markup).inline_keyboard[0][0].callback_data
+        )
+        cache.flush()
+        time.sleep(0.05)
+        cutoff = time.time()
+        new_uuid, _ = cache.extract_uuids(
+            cache.process_keyboard(reply_markup).inline_keyboard[0][0].callback_data
+        )
+
+        cache.clear_callback_data(cutoff)
+        assert backend.get_keyboard(old_uuid) is None
+        # The new keyboard was not written yet and is still pending
+        cache.flush()
+        assert backend.get_keyboard(new_uuid) == {"0": "data"}
+
+        # Pending keyboards are cleared without writing them
+        pending_uuid, _ = cache.extract_uuids(
+            cache.process_keyboard(reply_markup).inline_keyboard[0][0].callback_data
+        )
+        cache.clear_callback_data()
+        cache.flush()
+        assert backend.get_keyboard(new_uuid) is None
+        assert backend.get_keyboard(pending_uuid) is None
+        backend.close()
+
+    async def test_backend_while_flushing_in_thread(self, bot, tmp_path):
+        stored = threading.Event()
+        proceed = threading.Event()
+
+        class SlowBackend(SQLiteCallbackDataBackend):
+            def store_keyboards(self, keyboards):
+                stored.set()
+                proceed.wait(timeout=5)
+                super().store_keyboards(keyboards)
+
+        backend = SlowBackend(tmp_path / "db")
+        cache = CallbackDataCache(bot, maxsize=1, backend=backend)
+        uuids = []
+        for i in range(2):
+            out = cache.process_keyboard(
+                InlineKeyboardMarkup.from_button(InlineKeyboardButton("button", callback_data=i))
+            )
+            uuids.append(cache.extract_uuids(out.inline_keyboard[0][0].callback_data)[0])
+
+        flush_task = asyncio.create_task(cache._flush_in_thread())
+        await asyncio.to_thread(stored.wait, 5)
+
+        # The first keyboard was dropped from memory and is being stored. It's still found.
+        callback_query = CallbackQuery(
+            "1", from_user=None, chat_instance=None, data=f"{uuids[0]}0"
+        )
+        cache.process_callback_query(callback_query)
+        assert callback_query.data == 0
+
+        # Dropping it while it's being stored must not bring it back afterwards
+        cache.drop_data(callback_query)
+        proceed.set()
+        await flush_task
+        assert backend.get_keyboard(uuids[0]) is None
+        assert backend.get_keyboard(uuids[1]) == {"0": 1}
+        backend.close()
+
     @pytest.mark.parametrize("data", [True, False])
     @pytest.mark.parametrize("message", [True, False])
     @pytest.mark.parametrize("invalid", [True, False])
@@ -82,6 +82,9 @@ class TestCallbackQueryHandler:
             assert getattr(handler, attr, "err") != "err", f"got extra slot '{attr}'"
         assert len(mro_slots(handler)) == len(set(mro_slots(handler))), "duplicate slot"
 
+    def test_update_types(self):
+        assert CallbackQueryHandler(self.callback_data_1).update_types == {"callback_query"}
+
     @pytest.fixture(autouse=True)
     def _reset(self):
         self.test_flag = False
@@ -107,6 +107,18 @@ class TestChatBoostHandler:
             assert getattr(action, attr, "err") != "err", f"got extra slot '{attr}'"
         assert len(mro_slots(action)) == len(set(mro_slots(action))), "duplicate slot"
 
+    @pytest.mark.parametrize(
+        ("chat_boost_types", "expected"),
+        [
+            (ChatBoostHandler.CHAT_BOOST, {"chat_boost"}),
+            (ChatBoostHandler.REMOVED_CHAT_BOOST, {"removed_chat_boost"}),
+            (ChatBoostHandler.ANY_CHAT_BOOST, {"chat_boost", "removed_chat_boost"}),
+        ],
+    )
+    def test_update_types(self, chat_boost_types, expected):
+        handler = ChatBoostHandler(self.cb_chat_boost_any, chat_boost_types=chat_boost_types)
+        assert handler.update_types == expected
+
     @pytest.fixture(autouse=True)
     def _reset(self):
         self.test_flag = False
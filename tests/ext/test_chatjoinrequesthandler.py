@@ -110,6 +110,9 @@ class TestChatJoinRequestHandler:
             assert getattr(action, attr, "err") != "err", f"got extra slot '{attr}'"
         assert len(mro_slots(action)) == len(set(mro_slots(action))), "duplicate slot"
 
+    def test_update_types(self):
+        assert ChatJoinRequestHandler(self.callback).update_types == {"chat_join_request"}
+
     @pytest.fixture(autouse=True)
     def _reset(self):
         self.test_flag = False
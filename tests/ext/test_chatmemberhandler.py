@@ -97,6 +97,18 @@ class TestChatMemberHandler:
             assert getattr(action, attr, "err") != "err", f"got extra slot '{attr}'"
         assert len(mro_slots(action)) == len(set(mro_slots(action))), "duplicate slot"
 
+    @pytest.mark.parametrize(
+        ("chat_member_types", "expected"),
+        [
+            (ChatMemberHandler.MY_CHAT_MEMBER, {"my_chat_member"}),
+            (ChatMemberHandler.CHAT_MEMBER, {"chat_member"}),
+            (ChatMemberHandler.ANY_CHAT_MEMBER, {"my_chat_member", "chat_member"}),
+        ],
+    )
+    def test_update_types(self, chat_member_types, expected):
+        handler = ChatMemberHandler(self.callback, chat_member_types=chat_member_types)
+        assert handler.update_types == expected
+
     @pytest.fixture(autouse=True)
     def _reset(self):
         self.test_flag = False
@@ -91,6 +91,11 @@ class TestChosenInlineResultHandler:
             assert getattr(handler, attr, "err") != "err", f"got extra slot '{attr}'"
         assert len(mro_slots(handler)) == len(set(mro_slots(handler))), "duplicate slot"
 
+    def test_update_types(self):
+        assert ChosenInlineResultHandler(self.callback_basic).update_types == {
+            "chosen_inline_result"
+        }
+
     def callback_basic(self, update, context):
         test_bot = isinstance(context.bot, Bot)
         test_update = isinstance(update, Update)
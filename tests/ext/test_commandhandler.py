@@ -141,6 +141,17 @@ class TestCommandHandler(BaseTest):
             assert getattr(handler, attr, "err") != "err", f"got extra slot '{attr}'"
         assert len(mro_slots(handler)) == len(set(mro_slots(handler))), "duplicate slot"
 
+    def test_update_types(self):
+        assert self.make_default_handler().update_types == {
+            "message",
+            "edited_message",
+            "channel_post",
+            "edited_channel_post",
+            "business_message",
+            "edited_business_message",
+            "guest_message",
+        }
+
     @pytest.fixture(scope="class")
     def command(self):
         return self.CMD
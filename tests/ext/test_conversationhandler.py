@@ -275,6 +275,7 @@ class TestConversationHandler:
             allow_reentry="allow_reentry",
             conversation_timeout=42,
             map_to_parent=map_to_parent,
+            max_conversations=7,
         )
         assert ch.entry_points is entry_points
         assert ch.states is states
@@ -286,6 +287,17 @@ class TestConversationHandler:
         assert ch.persistent == "persistent"
         assert ch.name == "name"
         assert ch.allow_reentry == "allow_reentry"
+        assert ch.max_conversations == 7
+
+    @pytest.mark.parametrize("max_conversations", [0, -1])
+    def test_init_invalid_max_conversations(self, max_conversations):
+        with pytest.raises(ValueError, match="must be a positive integer"):
+            ConversationHandler(
+                self.entry_points,
+                states=self.states,
+                fallbacks=[],
+                max_conversations=max_conversations,
+            )
 
     def test_init_persistent_no_name(self):
         with pytest.raises(ValueError, match="can't be persistent when handler is unnamed"):
@@ -520,6 +532,7 @@ class TestConversationHandler:
             "allow_reentry",
             "conversation_timeout",
             "map_to_parent",
+            "max_conversations",
         ],
         indirect=False,
     )
@@ -528,6 +541,52 @@ class TestConversationHandler:
         with pytest.raises(AttributeError, match=f"You can not assign a new value to {attr}"):
             setattr(ch, attr, True)
 
+    @pytest.mark.filterwarnings("ignore::telegram.warnings.PTBUserWarning")
+    def test_update_types(self):
+        handler = ConversationHandler(
+            entry_points=[CommandHandler("start", self.start)],
+            states={self.THIRSTY: [CallbackQueryHandler(self.drink)]},
+            fallbacks=[PollAnswerHandler(self.end)],
+        )
+        assert handler.update_types == {
+            "message",
+            "edited_message",
+            "channel_post",
+            "edited_channel_post",
+            "business_message",
+            "edited_business_message",
+            "guest_message",
+            "callback_query",
+            "poll_answer",
+        }
+
+        handler = ConversationHandler(
+            entry_points=[CommandHandler("start", self.start)],
+            states={self.THIRSTY: [TypeHandler(Update, self.drink)]},
+            fallbacks=[],
+        )
+        assert handler.update_types is None
+
+        # The handlers of the TIMEOUT state never receive updates from Telegram
+        handler = ConversationHandler(
+            entry_points=[CommandHandler("start", self.start)],
+            states={
+                self.THIRSTY: [CallbackQueryHandler(self.drink)],
+                ConversationHandler.TIMEOUT: [TypeHandler(Update, self.passout)],
+            },
+            fallbacks=[],
+        )
+        assert handler.update_types == {
+            "message",
+            "edited_message",
+            "channel_post",
+            "edited_channel_post",
+            "business_message",
+            "edited_business_message",
+            "guest_message",
+            "callback_query",
+        }
+
     def test_per_all_false(self):
         with pytest.raises(ValueError, match="can't all be 'False'"):
             ConversationHandler(
@@ -539,6 +598,43 @@ class TestConversationHandler:
                 per_message=False,
             )
 
+    async def test_max_conversations(self, app, bot, user1, user2):
+        handler = ConversationHandler(
+            entry_points=self.entry_points,
+            states=self.states,
+            fallbacks=self.fallbacks,
+            max_conversations=2,
+        )
+        app.add_handler(handler)
+        user3 = User(first_name="Misses Test", id=789, is_bot=False)
+
+        def make_update(user, text):
+            message = Message(
+                0,
+                None,
+                self.group,
+                from_user=user,
+                text=text,
+                entities=[
+                    MessageEntity(type=MessageEntity.BOT_COMMAND, offset=0, length=len(text))
+                ],
+            )
+            message.set_bot(bot)
+            return Update(update_id=0, message=message)
+
+        async with app:
+            await app.process_update(make_update(user1, "/start"))
+            await app.process_update(make_update(user2, "/start"))
+            # user1 is active again, so user2 is now the least recently active conversation
+            await app.process_update(make_update(user1, "/brew"))
+            await app.process_update(make_update(user3, "/start"))
+
+            assert handler.check_update(make_update(user1, "/pourCoffee"))
+            assert handler.check_update(make_update(user3, "/brew"))
+            # The conversation of user2 has ended, so only the entry point is accepted
+            assert not handler.check_update(make_update(user2, "/brew"))
+            assert handler.check_update(make_update(user2, "/start"))
+
     @pytest.mark.parametrize("raise_ahs", [True, False])
     async def test_basic_and_app_handler_stop(self, app, bot, user1, user2, raise_ahs):
         handler = ConversationHandler(
@@ -1541,6 +1637,54 @@ class TestConversationHandler:
 
             await app.stop()
 
+    async def test_conversation_timeout_reuses_job(self, app, bot, user1):
+        handler = ConversationHandler(
+            entry_points=self.entry_points,
+            states=self.states,
+            fallbacks=self.fallbacks,
+            conversation_timeout=0.5,
+        )
+        app.add_handler(handler)
+
+        message = Message(
+            0,
+            None,
+            self.group,
+            from_user=user1,
+            text="/start",
+            entities=[
+                MessageEntity(type=MessageEntity.BOT_COMMAND, offset=0, length=len("/start"))
+            ],
+        )
+        message.set_bot(bot)
+        message._unfreeze()
+        message.entities[0]._unfreeze()
+
+        async with app:
+            await app.start()
+
+            await app.process_update(Update(update_id=0, message=message))
+            assert len(handler.timeout_jobs) == 1
+            job = next(iter(handler.timeout_jobs.values()))
+
+            message.text = "/brew"
+            message.entities[0].length = len("/brew")
+            await app.process_update(Update(update_id=0, message=message))
+            # The pending job is reused instead of being replaced for every update
+            assert next(iter(handler.timeout_jobs.values())) is job
+            assert len(app.job_queue.jobs()) == 1
+
+            message.text = "/pourCoffee"
+            message.entities[0].length = len("/pourCoffee")
+            await app.process_update(Update(update_id=0, message=message))
+            message.text = "/end"
+            message.entities[0].length = len("/end")
+            await app.process_update(Update(update_id=0, message=message))
+            assert handler.timeout_jobs == {}
+            assert job.removed
+
+            await app.stop()
+
     async def test_conversation_timeout_two_users(self, app, bot, user1, user2):
         handler = ConversationHandler(
             entry_points=self.entry_points,
@@ -94,6 +94,9 @@ class TestInlineQueryHandler:
             assert getattr(handler, attr, "err") != "err", f"got extra slot '{attr}'"
         assert len(mro_slots(handler)) == len(set(mro_slots(handler))), "duplicate slot"
 
+    def test_update_types(self):
+        assert InlineQueryHandler(self.callback).update_types == {"inline_query"}
+
     @pytest.fixture(autouse=True)
     def _reset(self):
         self.test_flag = False
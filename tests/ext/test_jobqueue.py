@@ -297,6 +297,24 @@ class TestJobQueue:
         await asyncio.sleep(0.55)
         assert self.result == 4
 
+    async def test_wakeups_are_merged(self, job_queue, monkeypatch):
+        process_jobs = job_queue.scheduler._process_jobs
+        calls = 0
+
+        def _process_jobs():
+            nonlocal calls
+            calls += 1
+            return process_jobs()
+
+        monkeypatch.setattr(job_queue.scheduler, "_process_jobs", _process_jobs)
+        for _ in range(10):
+            job_queue.run_once(self.job_run_once, 0.05)
+        await asyncio.sleep(0)
+        assert calls == 1
+
+        await asyncio.sleep(0.15)
+        assert self.result == 10
+
     async def test_disabled(self, job_queue):
         j1 = job_queue.run_once(self.job_run_once, 0.1)
         j2 = job_queue.run_repeating(self.job_run_once, 0.5)
@@ -542,6 +560,25 @@ class TestJobQueue:
         assert job_queue.get_jobs_by_name("is|a|match") == (job1, job2)
         assert job_queue.get_jobs_by_name("something_else") == (job5,)
 
+    async def test_get_jobs_wraps_only_matches(self, job_queue, monkeypatch):
+        match = job_queue.run_once(self.job_run_once, 10, name="match")
+        for i in range(5):
+            job_queue.run_once(self.job_run_once, 10, name=f"other_{i}")
+
+        wrapped = []
+        from_aps_job = Job.from_aps_job
+
+        def tracking_from_aps_job(aps_job):
+            wrapped.append(aps_job.name)
+            return from_aps_job(aps_job)
+
+        monkeypatch.setattr(Job, "from_aps_job", tracking_from_aps_job)
+
+        assert job_queue.jobs("^match$") == (match,)
+        assert wrapped == ["match"]
+        assert job_queue.get_jobs_by_name("match") == (match,)
+        assert wrapped == ["match", "match"]
+
     async def test_job_run(self, app):
         job = app.job_queue.run_repeating(self.job_run_once, 0.02)
         await asyncio.sleep(0.05)  # the job queue has not started yet
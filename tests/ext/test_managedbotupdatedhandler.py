@@ -98,6 +98,9 @@ class TestManagedBotUpdatedHandler:
             assert getattr(action, attr, "err") != "err", f"got extra slot '{attr}'"
         assert len(mro_slots(action)) == len(set(mro_slots(action))), "duplicate slot"
 
+    def test_update_types(self):
+        assert ManagedBotUpdatedHandler(self.callback).update_types == {"managed_bot"}
+
     @pytest.fixture(autouse=True)
     def _reset(self):
         self.test_flag = False
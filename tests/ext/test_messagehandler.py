@@ -36,6 +36,8 @@ from telegram import (
 from telegram.ext import CallbackContext, JobQueue, MessageHandler, filters
 from telegram.ext.filters import MessageFilter
 from tests.auxil.slots import mro_slots
+from tests.test_update import ids as all_ids
+from tests.test_update import params as all_params
 
 message = Message(1, None, Chat(1, ""), from_user=User(1, "", False), text="Text")
 
@@ -82,6 +84,14 @@ class TestMessageHandler:
             assert getattr(handler, attr, "err") != "err", f"got extra slot '{attr}'"
         assert len(mro_slots(handler)) == len(set(mro_slots(handler))), "duplicate slot"
 
+    @pytest.mark.parametrize("param", all_params, ids=all_ids)
+    def test_update_types(self, param):
+        handler = MessageHandler(filters.ALL, self.callback)
+        (update_type,) = param
+        assert bool(handler.check_update(Update(1, **param))) == (
+            update_type in handler.update_types
+        )
+
     @pytest.fixture(autouse=True)
     def _reset(self):
         self.test_flag = False
@@ -131,6 +131,23 @@ class TestMessageReactionHandler:
             assert getattr(action, attr, "err") != "err", f"got extra slot '{attr}'"
         assert len(mro_slots(action)) == len(set(mro_slots(action))), "duplicate slot"
 
+    @pytest.mark.parametrize(
+        ("message_reaction_types", "expected"),
+        [
+            (MessageReactionHandler.MESSAGE_REACTION_UPDATED, {"message_reaction"}),
+            (MessageReactionHandler.MESSAGE_REACTION_COUNT_UPDATED, {"message_reaction_count"}),
+            (
+                MessageReactionHandler.MESSAGE_REACTION,
+                {"message_reaction", "message_reaction_count"},
+            ),
+        ],
+    )
+    def test_update_types(self, message_reaction_types, expected):
+        handler = MessageReactionHandler(
+            self.callback, message_reaction_types=message_reaction_types
+        )
+        assert handler.update_types == expected
+
     @pytest.fixture(autouse=True)
     def _reset(self):
         self.test_flag = False
@@ -1023,3 +1023,58 @@ class TestPicklePersistence:
         await pickle_persistence.update_callback_data(callback_data)
 
         assert not pickle_persistence.filepath.is_file()
+
+    @pytest.mark.parametrize("compression", ["gzip", "bz2", "lzma"])
+    @pytest.mark.parametrize("singlefile", [True, False])
+    async def test_compression(self, compression, singlefile, user_data, chat_data, bot_data):
+        persistence = PicklePersistence(
+            "pickletest", single_file=singlefile, compression=compression
+        )
+        for user_id, data in user_data.items():
+            await persistence.update_user_data(user_id, data)
+        for chat_id, data in chat_data.items():
+            await persistence.update_chat_data(chat_id, data)
+        await persistence.update_bot_data(bot_data)
+        await persistence.flush()
+
+        filepath = Path("pickletest" if singlefile else "pickletest_user_data")
+        with pytest.raises(pickle.UnpicklingError), filepath.open("rb") as file:
+            pickle.load(file)
+
+        persistence = PicklePersistence(
+            "pickletest", single_file=singlefile, compression=compression
+        )
+        assert await persistence.get_user_data() == user_data
+        assert await persistence.get_chat_data() == chat_data
+        assert await persistence.get_bot_data() == bot_data
+
+    @pytest.mark.parametrize("old_compression", [None, "gzip", "bz2", "lzma"])
+    async def test_compression_migration(self, good_pickle_files, old_compression, user_data):
+        if old_compression is not None:
+            old = PicklePersistence("pickletest", single_file=False, compression=old_compression)
+            await old.update_user_data(12345, user_data[12345])
+            await old.update_user_data(67890, user_data[67890])
+
+        persistence = PicklePersistence("pickletest", single_file=False, compression="lzma")
+        assert await persistence.get_user_data() == user_data
+        await persistence.flush()
+        assert Path("pickletest_user_data").read_bytes().startswith(b"\xfd7zXZ\x00")
+        assert (
+            await PicklePersistence(
+                "pickletest", single_file=False, compression="gzip"
+            ).get_user_data()
+            == user_data
+        )
+
+    @pytest.mark.parametrize("magic", [b"\x1f\x8b", b"BZh", b"\xfd7zXZ\x00"])
+    @pytest.mark.parametrize("singlefile", [True, False])
+    async def test_corrupt_compressed_file(self, magic, singlefile):
+        filepath = Path("pickletest" if singlefile else "pickletest_user_data")
+        filepath.write_bytes(magic + b"not compressed data")
+        persistence = PicklePersistence("pickletest", single_file=singlefile, compression="gzip")
+        with pytest.raises(TypeError, match="does not contain valid pickle data"):
+            await persistence.get_user_data()
+
+    def test_invalid_compression(self):
+        with pytest.raises(ValueError, match="`compression` must be one of"):
+            PicklePersistence("pickletest", compression="zip")
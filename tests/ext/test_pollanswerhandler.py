@@ -90,6 +90,9 @@ class TestPollAnswerHandler:
             assert getattr(handler, attr, "err") != "err", f"got extra slot '{attr}'"
         assert len(mro_slots(handler)) == len(set(mro_slots(handler))), "duplicate slot"
 
+    def test_update_types(self):
+        assert PollAnswerHandler(self.callback).update_types == {"poll_answer"}
+
     @pytest.fixture(autouse=True)
     def _reset(self):
         self.test_flag = False
@@ -99,6 +99,9 @@ class TestPollHandler:
             assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
         assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
 
+    def test_update_types(self):
+        assert PollHandler(self.callback).update_types == {"poll"}
+
     @pytest.fixture(autouse=True)
     def _reset(self):
         self.test_flag = False
@@ -40,6 +40,10 @@ class TestPrefixHandler(BaseTest):
             assert getattr(handler, attr, "err") != "err", f"got extra slot '{attr}'"
         assert len(mro_slots(handler)) == len(set(mro_slots(handler))), "duplicate slot"
 
+    def test_update_types(self):
+        assert "message" in self.make_default_handler().update_types
+        assert "callback_query" not in self.make_default_handler().update_types
+
     @pytest.fixture(params=PREFIXES)
     def prefix(self, request):
         return request.param
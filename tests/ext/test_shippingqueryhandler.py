@@ -90,6 +90,9 @@ class TestShippingQueryHandler:
             assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
         assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
 
+    def test_update_types(self):
+        assert ShippingQueryHandler(self.callback).update_types == {"shipping_query"}
+
     @pytest.fixture(autouse=True)
     def _reset(self):
         self.test_flag = False
@@ -78,6 +78,9 @@ class TestStringCommandHandler:
             assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
         assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
 
+    def test_update_types(self):
+        assert StringCommandHandler("sleepy", self.callback).update_types == set()
+
     @pytest.fixture(autouse=True)
     def _reset(self):
         self.test_flag = False
@@ -79,6 +79,9 @@ class TestStringRegexHandler:
             assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
         assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
 
+    def test_update_types(self):
+        assert StringRegexHandler("pfft", self.callback).update_types == set()
+
     @pytest.fixture(autouse=True)
     def _reset(self):
         self.test_flag = False
@@ -21,7 +21,7 @@ from collections import OrderedDict
 
 import pytest
 
-from telegram import Bot
+from telegram import Bot, Update
 from telegram.ext import CallbackContext, JobQueue, TypeHandler
 from tests.auxil.slots import mro_slots
 
@@ -35,6 +35,12 @@ class TestTypeHandler:
             assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
         assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
 
+    @pytest.mark.parametrize(
+        ("type_", "expected"), [(dict, set()), (Update, None), (object, None), (str, set())]
+    )
+    def test_update_types(self, type_, expected):
+        assert TypeHandler(type_, self.callback).update_types == expected
+
     @pytest.fixture(autouse=True)
     def _reset(self):
         self.test_flag = False
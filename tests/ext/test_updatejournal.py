@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2026
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import asyncio
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+from telegram import Update
+from telegram.ext import UpdateJournal
+from tests.auxil.build_messages import make_message
+from tests.auxil.slots import mro_slots
+
+
+@pytest.fixture
+def journal(tmp_path):
+    journal = UpdateJournal(tmp_path / "journal")
+    yield journal
+    journal.close()
+
+
+class TestUpdateJournal:
+    def test_slot_behaviour(self, journal):
+        for attr in journal.__slots__:
+            assert getattr(journal, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(journal)) == len(set(mro_slots(journal))), "duplicate slot"
+
+    def test_init(self, tmp_path):
+        journal = UpdateJournal(str(tmp_path / "journal"))
+        assert journal.filepath == tmp_path / "journal"
+        assert isinstance(journal.filepath, Path)
+        assert journal.pending_update_ids == frozenset()
+
+    def test_repr(self, journal):
+        assert repr(journal) == f"UpdateJournal[filepath={journal.filepath}]"
+
+    def test_not_loaded(self, journal):
+        with pytest.raises(RuntimeError, match="Call `load` first"):
+            journal.record([Update(update_id=1)])
+
+    def test_load_no_file(self, journal, bot):
+        assert journal.load(bot) == []
+        assert journal.filepath.exists()
+
+    def test_record_and_load(self, journal, bot):
+        journal.load(bot)
+        updates = [Update(update_id=i, message=make_message(str(i))) for i in range(1, 4)]
+        journal.record(updates[1:])
+        journal.record(updates[:2])
+        assert journal.pending_update_ids == {1, 2, 3}
+
+        journal.mark_done(2)
+        journal.mark_done(42)
+        assert journal.pending_update_ids == {1, 3}
+        journal.close()
+
+        # Simulate a new process
+        new_journal = UpdateJournal(journal.filepath)
+        loaded = new_journal.load(bot)
+        assert [update.update_id for update in loaded] == [1, 3]
+        assert loaded[0].to_dict() == updates[0].to_dict()
+        assert loaded[1].to_dict() == updates[2].to_dict()
+        assert loaded[0].message.get_bot() is bot
+        new_journal.close()
+
+    def test_truncate_when_all_done(self, journal, bot):
+        journal.load(bot)
+        journal.record([Update(update_id=1), Update(update_id=2)])
+        assert journal.filepath.stat().st_size > 0
+
+        journal.mark_done(1)
+        assert journal.filepath.stat().st_size > 0
+        journal.mark_done(2)
+        assert journal.filepath.stat().st_size == 0
+
+        journal.record([Update(update_id=3)])
+        journal.close()
+        assert [update.update_id for update in journal.load(bot)] == [3]
+
+    def test_load_compacts(self, journal, bot):
+        journal.load(bot)
+        journal.record([Update(update_id=i) for i in range(1, 11)])
+        for i in range(1, 10):
+            journal.mark_done(i)
+        size = journal.filepath.stat().st_size
+
+        assert [update.update_id for update in journal.load(bot)] == [10]
+        assert journal.filepath.stat().st_size < size
+
+    def test_mark_done_after_close(self, journal, bot):
+        journal.load(bot)
+        journal.record([Update(update_id=1), Update(update_id=2)])
+        journal.close()
+        journal.mark_done(1)
+        assert [update.update_id for update in journal.load(bot)] == [1, 2]
+
+    def test_incomplete_tail(self, journal, bot):
+        journal.load(bot)
+        journal.record([Update(update_id=1), Update(update_id=2)])
+        journal.close()
+        data = journal.filepath.read_bytes()
+        journal.filepath.write_bytes(data[:-3])
+
+        # The record of the second update was not written completely
+        assert [update.update_id for update in journal.load(bot)] == [1]
+
+    async def test_record_batched(self, journal, bot, monkeypatch):
+        synced = []
+        original_fsync = os.fsync
+
+        def fsync(fd):
+            synced.append(threading.current_thread())
+            original_fsync(fd)
+
+        monkeypatch.setattr(os, "fsync", fsync)
+        journal.load(bot)
+        synced.clear()
+
+        # Concurrent calls share a single sync, which does not block the event loop
+        await asyncio.gather(*(journal._record_batched([Update(update_id=i)]) for i in range(5)))
+        assert len(synced) == 1
+        assert synced[0] is not threading.current_thread()
+        assert journal.pending_update_ids == set(range(5))
+
+        await journal._record_batched([Update(update_id=1)])
+        assert len(synced) == 1
+        await journal._record_batched([Update(update_id=5)])
+        assert len(synced) == 2
+
+        journal.close()
+        assert [update.update_id for update in journal.load(bot)] == list(range(6))
+
+    async def test_record_batched_closed(self, journal, bot):
+        journal.load(bot)
+        task = asyncio.create_task(journal._record_batched([Update(update_id=1)]))
+        await asyncio.sleep(0)
+        journal.close()
+        with pytest.raises(RuntimeError, match="closed before syncing"):
+            await task
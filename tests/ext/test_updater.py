@@ -29,7 +29,8 @@ import pytest
 
 from telegram import Bot, InlineKeyboardButton, InlineKeyboardMarkup, Update
 from telegram.error import InvalidToken, RetryAfter, TelegramError, TimedOut
-from telegram.ext import ExtBot, InvalidCallbackData, Updater
+from telegram.ext import ExtBot, InvalidCallbackData, UpdateJournal, Updater
+from telegram.ext._utils.rawupdate import RawUpdate
 from tests.auxil.build_messages import make_message, make_message_update
 from tests.auxil.envvars import TEST_WITH_OPT_DEPS
 from tests.auxil.files import TEST_DATA_PATH, data_file
@@ -112,6 +113,7 @@ class TestUpdater:
         updater = Updater(bot=bot, update_queue=queue)
         assert updater.bot is bot
         assert updater.update_queue is queue
+        assert updater.update_journal is None
 
     def test_repr(self, bot):
         queue = asyncio.Queue()
@@ -287,6 +289,102 @@ class TestUpdater:
         assert self.message_count == 4
         assert self.received == [1, 2, 3, 4]
 
+    async def test_polling_update_journal(self, monkeypatch, updater, tmp_path):
+        updates = asyncio.Queue()
+        await updates.put([Update(update_id=1), Update(update_id=2)])
+        await updates.put([Update(update_id=3)])
+        recorded = []
+
+        async def get_updates(*args, **kwargs):
+            # The updates fetched so far must be recorded before they are confirmed
+            recorded.append(updater.update_journal.pending_update_ids)
+            if not updates.empty():
+                next_updates = await updates.get()
+                updates.task_done()
+                return next_updates
+            await asyncio.sleep(0)
+            return []
+
+        monkeypatch.setattr(updater.bot, "get_updates", get_updates)
+        updater.update_journal = UpdateJournal(tmp_path / "journal")
+
+        async with updater:
+            await updater.start_polling()
+            await updates.join()
+            await updater.stop()
+
+        assert recorded[0] == set()
+        assert recorded[1] == {1, 2}
+        assert recorded[-1] == {1, 2, 3}
+
+        # Updates that were not marked as done are put into the queue on the next startup
+        updater.update_journal.mark_done(2)
+        new_updater = Updater(
+            bot=updater.bot,
+            update_queue=asyncio.Queue(),
+            update_journal=UpdateJournal(tmp_path / "journal"),
+        )
+        async with new_updater:
+            assert new_updater.update_queue.qsize() == 3
+
+        # The journal is closed on shutdown, so update 2 was not marked as done
+        assert [new_updater.update_queue.get_nowait().update_id for _ in range(3)] == [1, 2, 3]
+
+    async def test_polling_update_journal_bounded_queue(self, monkeypatch, updater, tmp_path):
+        journal = UpdateJournal(tmp_path / "journal")
+        journal.load(updater.bot)
+        journal.record([Update(update_id=i) for i in range(1, 6)])
+        journal.close()
+
+        offsets = []
+
+        async def get_updates(*args, **kwargs):
+            offsets.append(kwargs["offset"])
+            await asyncio.sleep(0)
+            return []
+
+        monkeypatch.setattr(updater.bot, "get_updates", get_updates)
+        updater.update_queue = asyncio.Queue(maxsize=2)
+        updater.update_journal = UpdateJournal(tmp_path / "journal")
+
+        # Loading more updates than fit into the queue must not block
+        await asyncio.wait_for(updater.initialize(), timeout=1)
+        assert updater.update_queue.qsize() == 2
+
+        received = []
+        async with updater:
+            await updater.start_polling()
+            while len(received) < 5:
+                received.append((await updater.update_queue.get()).update_id)
+            await updater.stop()
+
+        # The remaining updates are put into the queue before new updates are fetched
+        assert received == [1, 2, 3, 4, 5]
+        assert set(offsets) == {6}
+
+    async def test_polling_update_journal_restart(self, monkeypatch, updater, tmp_path):
+        # Telegram delivers the updates again as they were never confirmed before the crash
+        async def get_updates(*args, **kwargs):
+            await asyncio.sleep(0)
+            return [Update(update_id=i) for i in (1, 2, 3, 4) if i >= (kwargs["offset"] or 0)]
+
+        monkeypatch.setattr(updater.bot, "get_updates", get_updates)
+        journal = UpdateJournal(tmp_path / "journal")
+        journal.load(updater.bot)
+        journal.record([Update(update_id=1), Update(update_id=2)])
+        journal.close()
+
+        updater.update_journal = UpdateJournal(tmp_path / "journal")
+        async with updater:
+            await updater.start_polling()
+            received = [(await updater.update_queue.get()).update_id for _ in range(4)]
+            await asyncio.sleep(0.05)
+            await updater.stop()
+
+        # Each update is put into the queue exactly once
+        assert received == [1, 2, 3, 4]
+        assert updater.update_queue.empty()
+
     async def test_polling_mark_updates_as_read(self, monkeypatch, updater, caplog):
         updates = asyncio.Queue()
         max_update_id = 3
@@ -415,6 +513,7 @@ class TestUpdater:
         on_stop_flag = False
 
         expected = {
+            "limit": None,
             "timeout": dtm.timedelta(seconds=10),
             "allowed_updates": None,
             "api_kwargs": None,
@@ -455,6 +554,7 @@ class TestUpdater:
             on_stop_flag = False
 
             expected = {
+                "limit": None,
                 "timeout": dtm.timedelta(seconds=42),
                 "allowed_updates": ["message"],
                 "api_kwargs": None,
@@ -469,6 +569,65 @@ class TestUpdater:
             on_stop_flag = True
             await updater.stop()
 
+    async def test_polling_backlog_skips_poll_interval(self, monkeypatch, updater):
+        batch_sizes = [100, 100, 3, 5]
+        calls = []
+        done = asyncio.Event()
+
+        async def get_updates(*args, offset=None, **kwargs):
+            calls.append(offset)
+            if len(calls) == 3:
+                done.set()
+            if not batch_sizes:
+                await asyncio.sleep(0)
+                return []
+            offset = offset or 1
+            return [Update(update_id=offset + i) for i in range(batch_sizes.pop(0))]
+
+        monkeypatch.setattr(updater.bot, "get_updates", get_updates)
+
+        async with updater:
+            await updater.start_polling(poll_interval=2)
+            # The first two batches are full, so the next ones are fetched without waiting
+            await asyncio.wait_for(done.wait(), timeout=1)
+            await asyncio.sleep(0.1)
+            # After the third batch, we wait for the poll interval again
+            assert calls == [0, 101, 201]
+            await updater.stop()
+
+    async def test_polling_bounded_update_queue(self, monkeypatch, bot):
+        updater = Updater(bot=bot, update_queue=asyncio.Queue(maxsize=3))
+        limits = []
+
+        async def get_updates(*args, offset=None, limit=None, **kwargs):
+            if limit is None:
+                # This is the call to mark the updates as read on stop
+                return []
+            limits.append(limit)
+            offset = offset or 1
+            return [Update(update_id=offset + i) for i in range(limit)]
+
+        monkeypatch.setattr(updater.bot, "get_updates", get_updates)
+        monkeypatch.setattr(updater.bot, "delete_webhook", return_true)
+
+        async with updater:
+            await updater.start_polling()
+            await asyncio.sleep(0.1)
+            # The queue is full, so we only fetch a single update, which can't be put into the
+            # queue yet. It is hence not confirmed.
+            assert limits == [3, 1]
+            assert updater.update_queue.qsize() == 3
+            assert updater._last_update_id == 4
+
+            for _ in range(2):
+                updater.update_queue.get_nowait()
+            await asyncio.sleep(0.1)
+            assert limits == [3, 1, 1, 1]
+            assert updater._last_update_id == 6
+            assert [updater.update_queue.get_nowait().update_id for _ in range(3)] == [3, 4, 5]
+
+            await updater.stop()
+
     @pytest.mark.parametrize("exception_class", [InvalidToken, TelegramError])
     @pytest.mark.parametrize("retries", [3, 0])
     async def test_start_polling_bootstrap_retries(
@@ -840,9 +999,32 @@ class TestUpdater:
                 await updater.start_webhook(listen="127.0.0.1", unix="DoesntMatter")
             with pytest.raises(RuntimeError, match="You can not pass unix and port"):
                 await updater.start_webhook(port=20, unix="DoesntMatter")
+            with pytest.raises(RuntimeError, match="You can not pass unix and reuse_port"):
+                await updater.start_webhook(unix="DoesntMatter", reuse_port=True)
             with pytest.raises(RuntimeError, match="you set unix, you also need to set the URL"):
                 await updater.start_webhook(unix="DoesntMatter")
 
+    @pytest.mark.skipif(
+        platform.system() == "Windows", reason="Windows does not support SO_REUSEPORT"
+    )
+    async def test_webhook_reuse_port(self, updater, one_time_bot):
+        ip = "127.0.0.1"
+        port = randrange(1024, 49152)  # Select random port
+        second_updater = Updater(bot=one_time_bot, update_queue=updater.update_queue)
+        second_updater.bot.set_webhook = return_true
+
+        async with updater, second_updater:
+            await updater.start_webhook(ip, port, url_path="TOKEN", reuse_port=True)
+            # Would raise an OSError if the port was not shared
+            await second_updater.start_webhook(ip, port, url_path="TOKEN", reuse_port=True)
+
+            update = make_message_update("Webhook")
+            await send_webhook_message(ip, port, update.to_json(), "TOKEN")
+            assert (await updater.update_queue.get()).to_dict() == update.to_dict()
+
+            await second_updater.stop()
+            await updater.stop()
+
     @pytest.mark.skipif(
         platform.system() != "Windows",
         reason="Windows is the only platform without unix",
@@ -994,6 +1176,144 @@ class TestUpdater:
             updater.bot.callback_data_cache.clear_callback_data()
             updater.bot.callback_data_cache.clear_callback_queries()
 
+    @pytest.mark.parametrize("in_time", [True, False], ids=("in time", "too late"))
+    async def test_webhook_reply(self, monkeypatch, updater, in_time):
+        posted = []
+
+        async def _post(endpoint, data=None, **kwargs):
+            posted.append((endpoint, kwargs["api_kwargs"]))
+            return True
+
+        monkeypatch.setattr(updater.bot, "_post", _post)
+
+        ip = "127.0.0.1"
+        port = randrange(1024, 49152)  # Select random port
+
+        async with updater:
+            await updater.start_webhook(
+                ip, port, url_path="TOKEN", webhook_reply_timeout=5 if in_time else 0.1
+            )
+            update = make_message_update("Webhook")
+            request = asyncio.create_task(
+                send_webhook_message(ip, port, update.to_json(), "TOKEN")
+            )
+            received_update = await updater.update_queue.get()
+            if not in_time:
+                response = await request
+
+            assert (
+                await updater.bot.reply_via_webhook(
+                    received_update,
+                    "send_message",
+                    {"chat_id": 1, "text": "reply", "parse_mode": None},
+                )
+                is True
+            )
+            if in_time:
+                response = await request
+                assert response.status_code == HTTPStatus.OK
+                assert response.json() == {"method": "sendMessage", "chat_id": 1, "text": "reply"}
+                assert posted == []
+            else:
+                assert response.status_code == HTTPStatus.OK
+                assert response.content == b""
+                assert posted == [
+                    ("sendMessage", {"chat_id": 1, "text": "reply", "parse_mode": None})
+                ]
+
+            # only one call can be passed per update
+            posted.clear()
+            await updater.bot.reply_via_webhook(received_update, "sendMessage", {"chat_id": 1})
+            assert posted == [("sendMessage", {"chat_id": 1})]
+            assert updater.bot._webhook_replies == {}
+
+            await updater.stop()
+
+    async def test_webhook_reply_fallback(self, monkeypatch, updater):
+        posted = []
+
+        async def _post(endpoint, data=None, **kwargs):
+            posted.append((endpoint, kwargs))
+            return True
+
+        monkeypatch.setattr(updater.bot, "_post", _post)
+
+        # No webhook request is waiting for the update, so a regular request is made
+        update = make_message_update("Webhook")
+        assert (
+            await updater.bot.reply_via_webhook(
+                update,
+                "send_message",
+                {"chat_id": 1},
+                read_timeout=1,
+                write_timeout=2,
+                connect_timeout=3,
+                pool_timeout=4,
+                rate_limit_args="rate_limit_args",
+            )
+            is True
+        )
+        assert posted == [
+            (
+                "sendMessage",
+                {
+                    "api_kwargs": updater.bot._merge_api_rl_kwargs(
+                        {"chat_id": 1}, "rate_limit_args"
+                    ),
+                    "read_timeout": 1,
+                    "write_timeout": 2,
+                    "connect_timeout": 3,
+                    "pool_timeout": 4,
+                },
+            )
+        ]
+
+    async def test_webhook_defer_update_decoding(self, updater):
+        ip = "127.0.0.1"
+        port = randrange(1024, 49152)  # Select random port
+
+        async with updater:
+            await updater.start_webhook(ip, port, url_path="TOKEN", defer_update_decoding=True)
+            update = make_message_update("Webhook")
+            response = await send_webhook_message(ip, port, update.to_json(), "TOKEN")
+            assert response.status_code == HTTPStatus.OK
+
+            # Malformed data is not rejected, as it is not decoded
+            response = await send_webhook_message(ip, port, "not json", "TOKEN")
+            assert response.status_code == HTTPStatus.OK
+
+            raw_update = await updater.update_queue.get()
+            assert isinstance(raw_update, RawUpdate)
+            decoded = raw_update.decode(updater.bot)
+            assert decoded.to_dict() == update.to_dict()
+            assert decoded.get_bot() is updater.bot
+
+            raw_update = await updater.update_queue.get()
+            assert raw_update.payload == b"not json"
+            await updater.stop()
+
+    async def test_webhook_defer_update_decoding_and_reply(self, updater):
+        with pytest.raises(ValueError, match="can not be combined"):
+            await updater.start_webhook(defer_update_decoding=True, webhook_reply_timeout=1)
+
+    async def test_webhook_update_journal(self, updater, tmp_path):
+        ip = "127.0.0.1"
+        port = randrange(1024, 49152)  # Select random port
+        updater.update_journal = UpdateJournal(tmp_path / "journal")
+
+        async with updater:
+            await updater.start_webhook(ip, port, url_path="TOKEN")
+            update = make_message_update("Webhook")
+            response = await send_webhook_message(ip, port, update.to_json(), "TOKEN")
+            assert response.status_code == HTTPStatus.OK
+            assert updater.update_journal.pending_update_ids == {update.update_id}
+            await updater.stop()
+
+    async def test_webhook_defer_update_decoding_and_journal(self, updater, tmp_path):
+        updater.update_journal = UpdateJournal(tmp_path / "journal")
+        with pytest.raises(ValueError, match="can not be combined"):
+            await updater.start_webhook(defer_update_decoding=True)
+
     async def test_webhook_invalid_ssl(self, monkeypatch, updater):
         ip = "127.0.0.1"
         port = randrange(1024, 49152)  # Select random port
@@ -455,6 +455,12 @@ class TestHTTPXRequestWithoutRequest:
         assert request._client.limits == httpx.Limits(max_connections=42)
         assert request._client.timeout == httpx.Timeout(connect=43, read=44, write=45, pool=46)
 
+    def test_connection_pool_size(self):
+        assert HTTPXRequest().connection_pool_size == 256
+        assert HTTPXRequest(connection_pool_size=42).connection_pool_size == 42
+        request = HTTPXRequest(httpx_kwargs={"limits": httpx.Limits(max_connections=None)})
+        assert request.connection_pool_size is None
+
     async def test_multiple_inits_and_shutdowns(self, monkeypatch):
         self.test_flag = defaultdict(int)
 
@@ -44,6 +44,7 @@ from telegram import (
     ChatAdministratorRights,
     ChatFullInfo,
     ChatInviteLink,
+    ChatMemberMember,
     ChatPermissions,
     Dice,
     InlineKeyboardButton,
@@ -102,7 +103,7 @@ from telegram.constants import (
     ReactionEmoji,
 )
 from telegram.error import BadRequest, EndPointNotFound, InvalidToken, TimedOut
-from telegram.ext import ExtBot, InvalidCallbackData
+from telegram.ext import Defaults, ExtBot, InvalidCallbackData, SQLiteCallbackDataBackend
 from telegram.helpers import escape_markdown
 from telegram.request import BaseRequest, HTTPXRequest, RequestData
 from telegram.warnings import PTBUserWarning
@@ -188,6 +189,10 @@ def bot_methods(ext_bot=True, include_camel_case=False, include_do_api_request=F
         "initialize",
         "shutdown",
         "insert_callback_data",
+        "reply_via_webhook",
+        "create_message_template",
+        "send_message_template",
+        "map",
     ]
     if not include_do_api_request:
         non_api_methods.append("do_api_request")
@@ -444,6 +449,102 @@ class TestBotWithoutRequest:
         finally:
             await test_bot.shutdown()
 
+    async def test_extbot_bot_user_cache(self, offline_bot, monkeypatch, tmp_path):
+        cache = tmp_path / "bot_user.json"
+        get_me_calls = 0
+        validation_allowed = asyncio.Event()
+
+        async def get_me(self, *args, **kwargs):
+            nonlocal get_me_calls
+            get_me_calls += 1
+            if get_me_calls > 1:
+                await validation_allowed.wait()
+            self._bot_user = offline_bot.bot
+            return offline_bot.bot
+
+        monkeypatch.setattr(PytestExtBot, "get_me", get_me)
+
+        test_bot = PytestExtBot(
+            token=offline_bot.token, request=OfflineRequest(), bot_user_cache=str(cache)
+        )
+        assert test_bot.bot_user_cache == cache
+        async with test_bot:
+            assert get_me_calls == 1
+        assert offline_bot.token not in cache.read_text()
+
+        # On the next startup, get_me is not awaited but called in the background
+        test_bot = PytestExtBot(
+            token=offline_bot.token, request=OfflineRequest(), bot_user_cache=cache
+        )
+        async with test_bot:
+            assert test_bot.bot == offline_bot.bot
+            await asyncio.sleep(0)
+            assert get_me_calls == 2
+            validation_allowed.set()
+            await test_bot._bot_user_validation_task
+
+        # A bot with a different token does not use the cache entry
+        test_bot = PytestExtBot(token="123:abc", request=OfflineRequest(), bot_user_cache=cache)
+        async with test_bot:
+            assert get_me_calls == 3
+
+    async def test_extbot_bot_user_cache_validation_fails(
+        self, offline_bot, monkeypatch, tmp_path, caplog
+    ):
+        cache = tmp_path / "bot_user.json"
+        test_bot = PytestExtBot(
+            token=offline_bot.token, request=OfflineRequest(), bot_user_cache=cache
+        )
+        async with test_bot:
+            pass
+
+        async def get_me(*args, **kwargs):
+            raise InvalidToken
+
+        test_bot = PytestExtBot(
+            token=offline_bot.token, request=OfflineRequest(), bot_user_cache=cache
+        )
+        monkeypatch.setattr(test_bot, "get_me", get_me)
+        with caplog.at_level(logging.ERROR):
+            async with test_bot:
+                await test_bot._bot_user_validation_task
+
+        assert test_bot.bot == offline_bot.bot
+        assert caplog.records[-1].getMessage().startswith("Validating the cached bot user failed")
+
+    async def test_extbot_callback_data_backend(self, offline_bot, monkeypatch, tmp_path):
+        backend = SQLiteCallbackDataBackend(tmp_path / "callback_data.sqlite")
+        with pytest.raises(ValueError, match="`arbitrary_callback_data` is enabled"):
+            PytestExtBot(token=offline_bot.token, callback_data_backend=backend)
+
+        test_bot = PytestExtBot(
+            token=offline_bot.token,
+            request=OfflineRequest(),
+            arbitrary_callback_data=True,
+            callback_data_backend=backend,
+        )
+        assert test_bot.callback_data_cache.backend is backend
+        stored_keyboards = []
+
+        async def do_post(self, endpoint, data, **kwargs):
+            # The keyboard must already be in the backend when the request is made
+            callback_data = data["reply_markup"].inline_keyboard[0][0].callback_data
+            keyboard_uuid, _ = test_bot.callback_data_cache.extract_uuids(callback_data)
+            stored_keyboards.append(backend.get_keyboard(keyboard_uuid))
+            return True
+
+        monkeypatch.setattr(Bot, "_do_post", do_post)
+        reply_markup = InlineKeyboardMarkup.from_button(
+            InlineKeyboardButton("button", callback_data={"some": "data"})
+        )
+        assert await test_bot.edit_message_reply_markup(
+            inline_message_id="1", reply_markup=reply_markup
+        )
+        assert stored_keyboards == [{"0": {"some": "data"}}]
+
+        await test_bot.shutdown()
+        assert backend._connection is None
+
     async def test_context_manager(self, monkeypatch, offline_bot):
         async def initialize():
             self.test_flag = ["initialize"]
@@ -662,7 +763,16 @@ class TestBotWithoutRequest:
         # Some methods of ext.ExtBot
         global_extra_args = {"rate_limit_args"}
         extra_args_per_method = defaultdict(
-            set, {"__init__": {"arbitrary_callback_data", "defaults", "rate_limiter"}}
+            set,
+            {
+                "__init__": {
+                    "arbitrary_callback_data",
+                    "bot_user_cache",
+                    "callback_data_backend",
+                    "defaults",
+                    "rate_limiter",
+                }
+            },
         )
         different_hints_per_method = defaultdict(set, {"__setattr__": {"ext_bot"}})
 
@@ -2089,9 +2199,8 @@ class TestBotWithoutRequest:
             inline_keyboard = data["results"][0]["reply_markup"].inline_keyboard
             assertion_1 = inline_keyboard[0][1] == no_replace_button
             assertion_2 = inline_keyboard[0][0] != replace_button
-            keyboard, button = (
-                inline_keyboard[0][0].callback_data[:32],
-                inline_keyboard[0][0].callback_data[32:],
+            keyboard, button = offline_bot.callback_data_cache.extract_uuids(
+                inline_keyboard[0][0].callback_data
             )
             assertion_3 = (
                 offline_bot.callback_data_cache._keyboard_data[keyboard].button_data[button]
@@ -2609,6 +2718,192 @@ class TestBotWithoutRequest:
             api_kwargs={"chat_id": 2, "user_id": 32, "until_date": until_timestamp},
         )
 
+    @pytest.mark.parametrize("ordered", [True, False])
+    async def test_map(self, offline_bot, monkeypatch, ordered):
+        async def make_assertion(url, request_data: RequestData, *args, **kwargs):
+            user_id = request_data.parameters["user_id"]
+            if user_id == 0:
+                # Make the first call finish last
+                await asyncio.sleep(0.05)
+            if user_id % 3 == 0:
+                raise BadRequest(f"User {user_id} not found")
+            return ChatMemberMember(User(user_id, "name", False)).to_dict()
+
+        monkeypatch.setattr(offline_bot.request, "post", make_assertion)
+        arguments = [{"chat_id": 1, "user_id": user_id} for user_id in range(10)]
+        results = [
+            result
+            async for result in offline_bot.map(
+                offline_bot.get_chat_member, iter(arguments), ordered=ordered
+            )
+        ]
+
+        if ordered:
+            assert [kwargs for kwargs, _ in results] == arguments
+        else:
+            assert results[-1][0] == arguments[0]
+            results.sort(key=lambda result: result[0]["user_id"])
+        for kwargs, result in results:
+            if kwargs["user_id"] % 3 == 0:
+                assert isinstance(result, BadRequest)
+                assert str(result) == f"User {kwargs['user_id']} not found"
+            else:
+                assert isinstance(result, ChatMemberMember)
+                assert result.user.id == kwargs["user_id"]
+
+    @pytest.mark.parametrize(("concurrency", "expected"), [(None, 4), (2, 2)])
+    async def test_map_concurrency(self, offline_bot, monkeypatch, concurrency, expected):
+        running = max_running = 0
+
+        async def method(value):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+            return value
+
+        monkeypatch.setattr(BaseRequest, "connection_pool_size", 4)
+        results = [
+            result
+            async for result in offline_bot.map(
+                method, ({"value": value} for value in range(10)), concurrency=concurrency
+            )
+        ]
+        assert results == [({"value": value}, value) for value in range(10)]
+        assert max_running == expected
+
+        with pytest.raises(ValueError, match="at least 1"):
+            await anext(offline_bot.map(method, [], concurrency=0))
+
+    async def test_map_stop_iterating(self, offline_bot):
+        started = []
+        cancelled = []
+
+        async def method(value):
+            started.append(value)
+            try:
+                await asyncio.sleep(value)
+            except asyncio.CancelledError:
+                cancelled.append(value)
+                raise
+            return value
+
+        iterator = offline_bot.map(method, ({"value": v} for v in (0, 10, 10, 10)), concurrency=2)
+        assert await anext(iterator) == ({"value": 0}, 0)
+        # aclose waits for the cancelled calls
+        await iterator.aclose()
+        assert started == [0, 10]
+        assert cancelled == [10]
+
+    async def test_map_ordered_buffer(self, offline_bot):
+        started = []
+        event = asyncio.Event()
+
+        async def method(value):
+            started.append(value)
+            if value == 0:
+                await event.wait()
+            return value
+
+        iterator = offline_bot.map(method, ({"value": v} for v in range(10)), concurrency=2)
+        first = asyncio.create_task(anext(iterator))
+        await asyncio.sleep(0.01)
+        # The results of 1 and 2 are buffered until 0 is done, so no more calls are made
+        assert started == [0, 1, 2]
+        assert not first.done()
+
+        event.set()
+        assert await first == ({"value": 0}, 0)
+        assert [result async for result in iterator] == [
+            ({"value": value}, value) for value in range(1, 10)
+        ]
+        assert started == list(range(10))
+
+    async def test_map_delete_message(self, offline_bot, monkeypatch):
+        requests = []
+
+        async def make_assertion(url, request_data: RequestData, *args, **kwargs):
+            requests.append((url.rsplit("/", 1)[-1], request_data.parameters))
+            if request_data.parameters["chat_id"] == 3:
+                raise BadRequest("Chat not found")
+            return True
+
+        monkeypatch.setattr(offline_bot.request, "post", make_assertion)
+        arguments = [
+            *({"chat_id": 1, "message_id": message_id} for message_id in range(150)),
+            {"chat_id": 2, "message_id": 1},
+            {"chat_id": 1, "message_id": 150, "read_timeout": 3},
+            {"chat_id": 3, "message_id": 1},
+            {"chat_id": 3, "message_id": 2},
+        ]
+        results = [
+            result async for result in offline_bot.map(offline_bot.delete_message, arguments)
+        ]
+
+        assert [kwargs for kwargs, _ in results] == arguments
+        assert all(result is True for _, result in results[:-2])
+        assert all(isinstance(result, BadRequest) for _, result in results[-2:])
+        assert requests == [
+            # Calls with other arguments can't be combined
+            ("deleteMessage", {"chat_id": 1, "message_id": 150}),
+            ("deleteMessages", {"chat_id": 1, "message_ids": list(range(100))}),
+            ("deleteMessages", {"chat_id": 1, "message_ids": list(range(100, 150))}),
+            ("deleteMessage", {"chat_id": 2, "message_id": 1}),
+            ("deleteMessages", {"chat_id": 3, "message_ids": [1, 2]}),
+        ]
+
+    @pytest.mark.parametrize("bot_class", [Bot, ExtBot])
+    def test_insert_defaults_copies_only_if_needed(self, offline_bot, bot_class):
+        test_bot = bot_class(token=offline_bot.token)
+        explicit = InputMediaPhoto("photo", parse_mode="HTML")
+        implicit = InputMediaPhoto("photo")
+        data = {"a": None, "b": DEFAULT_NONE, "c": 1, "media": (explicit, implicit)}
+        original = dict(data)
+
+        result = test_bot._insert_defaults(data)
+        assert data == original
+        assert result.keys() == {"c", "media"}
+        assert result["media"][0] is explicit
+        assert result["media"][1] is not implicit
+        assert result["media"][1].parse_mode is None
+        assert implicit.parse_mode is DEFAULT_NONE
+
+        media = (explicit, InputMediaPhoto("photo", parse_mode=None))
+        assert test_bot._insert_defaults({"media": media})["media"] is media
+        assert test_bot._insert_defaults({"media": explicit})["media"] is explicit
+
+    def test_ext_bot_insert_defaults_copies_only_if_needed(self, offline_bot):
+        test_bot = ExtBot(token=offline_bot.token, defaults=Defaults(parse_mode="HTML"))
+        explicit_media = InputMediaPhoto("photo", parse_mode=None)
+        implicit_media = InputMediaPhoto("photo")
+        explicit_options = [InputPollOption("a", text_parse_mode=None)]
+        implicit_options = [InputPollOption("a"), InputPollOption("b", text_parse_mode=None)]
+        reply_parameters = ReplyParameters(1, quote_parse_mode=None)
+        data = {
+            "parse_mode": DEFAULT_NONE,
+            "disable_notification": DEFAULT_NONE,
+            "media": implicit_media,
+            "photo": explicit_media,
+            "options": explicit_options,
+            "other_options": implicit_options,
+            "reply_parameters": reply_parameters,
+        }
+
+        result = test_bot._insert_defaults(data)
+        assert result["parse_mode"] == "HTML"
+        # There is no default value for disable_notification
+        assert "disable_notification" not in result
+        assert result["media"].parse_mode == "HTML"
+        assert implicit_media.parse_mode is DEFAULT_NONE
+        assert result["photo"] is explicit_media
+        assert result["options"] is explicit_options
+        assert result["other_options"][0].text_parse_mode == "HTML"
+        assert result["other_options"][1] is implicit_options[1]
+        assert implicit_options[0].text_parse_mode is DEFAULT_NONE
+        # The default for allow_sending_without_reply is None, so nothing has to be changed
+        assert result["reply_parameters"] is reply_parameters
+
     async def test_business_connection_id_argument(
         self, offline_bot, monkeypatch, dummy_message_dict
     ):
@@ -28,6 +28,7 @@ from telegram import (
     InputChecklistTask,
     ReactionTypeEmoji,
     User,
+    set_interning,
 )
 from telegram.constants import ChatAction, ChatType, ReactionEmoji
 from telegram.helpers import escape_markdown
@@ -95,6 +96,19 @@ class TestChatWithoutRequest(ChatTestBase):
         assert chat.last_name == self.last_name
         assert chat.is_direct_messages == self.is_direct_messages
 
+    def test_de_json_interned(self, offline_bot):
+        json_dict = {"id": self.id_, "type": self.type_, "title": self.title}
+        set_interning(True)
+        try:
+            chat = Chat.de_json(json_dict, offline_bot)
+            assert Chat.de_json(dict(json_dict), offline_bot) is chat
+            assert Chat.de_json({**json_dict, "title": "other"}, offline_bot) is not chat
+            # Unhashable values are not interned
+            json_dict["list"] = [1]
+            assert Chat.de_json(json_dict, offline_bot) is not Chat.de_json(json_dict, offline_bot)
+        finally:
+            set_interning(False)
+
     def test_to_dict(self, chat):
         chat_dict = chat.to_dict()
 
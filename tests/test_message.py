@@ -18,6 +18,7 @@
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 
 import datetime as dtm
+import pickle
 from copy import copy, deepcopy
 from zoneinfo import ZoneInfo
 
@@ -1132,6 +1133,52 @@ class TestMessageWithoutRequest(MessageTestBase):
         )
         assert expected == message.text_html
 
+    @pytest.mark.parametrize("char", ["a", "ä", "\U0001f40d"])
+    def test_text_formatted_many_entities(self, char):
+        # Long text with many and deeply nested entities, as they occur in formatted posts
+        char_length = len(char.encode("utf-16-le")) // 2
+        segment = char * 8 + " "
+        segment_length = 8 * char_length + 1
+        text = segment * 400
+        entities = []
+        for idx in range(400):
+            offset = idx * segment_length
+            entities.append(MessageEntity(MessageEntity.BOLD, offset, 8 * char_length))
+            entities.append(MessageEntity(MessageEntity.ITALIC, offset, 4 * char_length))
+            entities.append(MessageEntity(MessageEntity.UNDERLINE, offset, 2 * char_length))
+        message = Message(
+            1, self.date, self.chat, self.from_user, text=text, entities=entities[::-1]
+        )
+
+        html_segment = f"<b><i><u>{char * 2}</u>{char * 2}</i>{char * 4}</b> "
+        assert message.text_html == html_segment * 400
+        markdown_segment = f"*___{char * 2}__{char * 2}_{char * 4}* "
+        assert message.text_markdown_v2 == markdown_segment * 400
+        assert len(message.parse_entities()) == 1200
+
+    def test_text_formatted_memoized(self):
+        bold_entity = MessageEntity(type=MessageEntity.BOLD, offset=0, length=4)
+        message = Message(
+            1, self.date, self.chat, self.from_user, text="Test", entities=[bold_entity]
+        )
+        assert message.text_html is message.text_html
+        assert message.text_markdown_v2 is message.text_markdown_v2
+        assert message.text_html == "<b>Test</b>"
+        assert message.text_markdown_v2 == "*Test*"
+
+        # Unfrozen messages may change, so nothing is cached
+        with message._unfrozen():
+            message.text = "Text"
+            assert message.text_html == "<b>Text</b>"
+        # The memo from before the change is not used anymore
+        assert message.text_markdown_v2 == "*Text*"
+
+        # The memo is neither pickled nor copied
+        assert message.text_html == "<b>Text</b>"
+        assert "_formatted_texts" not in message.__getstate__()
+        assert getattr(pickle.loads(pickle.dumps(message)), "_formatted_texts", None) is None
+        assert getattr(deepcopy(message), "_formatted_texts", None) is None
+
     def test_text_markdown_emoji(self):
         text = b"\\U0001f469\\u200d\\U0001f469\\u200d ABC".decode("unicode-escape")
         expected = b"\\U0001f469\\u200d\\U0001f469\\u200d *ABC*".decode("unicode-escape")
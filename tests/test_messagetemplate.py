@@ -0,0 +1,189 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2026
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import datetime as dtm
+import json
+
+import pytest
+
+from telegram import (
+    CallbackQuery,
+    Chat,
+    InlineKeyboardButton,
+    InlineKeyboardMarkup,
+    InputFile,
+    LinkPreviewOptions,
+    Message,
+    MessageEntity,
+    MessageTemplate,
+    ReplyParameters,
+    TelegramObject,
+)
+from telegram.ext import Defaults, InvalidCallbackData
+from telegram.request import RequestData
+from tests.auxil.pytest_classes import make_bot
+from tests.auxil.slots import mro_slots
+
+
+@pytest.fixture
+def template(offline_bot):
+    return offline_bot.create_message_template(
+        "text",
+        entities=[MessageEntity(MessageEntity.BOLD, 0, 4)],
+        reply_markup=InlineKeyboardMarkup.from_button(InlineKeyboardButton("button", url="url")),
+        link_preview_options=LinkPreviewOptions(is_disabled=True),
+        protect_content=True,
+    )
+
+
+def message_from_request(request_data: RequestData) -> dict:
+    parameters = request_data.parameters
+    return Message(
+        message_id=1,
+        date=dtm.datetime.now(dtm.timezone.utc),
+        chat=Chat(parameters["chat_id"], Chat.PRIVATE),
+        text=parameters["text"],
+        reply_markup=InlineKeyboardMarkup.de_json(parameters.get("reply_markup"), None),
+    ).to_dict()
+
+
+class TestMessageTemplateWithoutRequest:
+    def test_slot_behaviour(self, template):
+        for attr in template.__slots__:
+            assert getattr(template, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(template)) == len(set(mro_slots(template))), "duplicate slot"
+
+    def test_text_and_repr(self, template):
+        assert template.text == "text"
+        assert repr(template) == "MessageTemplate[text=text]"
+
+    def test_immutable(self, template):
+        with pytest.raises(TypeError):
+            template._parameters["text"] = "other"
+
+    def test_files_not_allowed(self, offline_bot):
+        with pytest.raises(ValueError, match="`document` of a message template can't upload"):
+            offline_bot.create_message_template(
+                "text", api_kwargs={"document": InputFile(b"content", attach=True)}
+            )
+
+    async def test_send_message_template(self, offline_bot, template, monkeypatch):
+        json_parameters = []
+
+        async def make_assertion(url, request_data: RequestData, *args, **kwargs):
+            assert url.endswith("/sendMessage")
+            json_parameters.append(request_data.json_parameters)
+            return message_from_request(request_data)
+
+        monkeypatch.setattr(offline_bot.request, "post", make_assertion)
+        message = await offline_bot.send_message_template(
+            1, template, reply_parameters=ReplyParameters(42), api_kwargs={"extra": "kwarg"}
+        )
+        await offline_bot.send_message_template(2, template, message_thread_id=3)
+
+        assert isinstance(message, Message)
+        assert message.text == "text"
+        assert json_parameters[0] == {
+            "chat_id": "1",
+            "text": "text",
+            "entities": json.dumps([MessageEntity(MessageEntity.BOLD, 0, 4).to_dict()]),
+            "reply_markup": InlineKeyboardMarkup.from_button(
+                InlineKeyboardButton("button", url="url")
+            ).to_json(),
+            "link_preview_options": LinkPreviewOptions(is_disabled=True).to_json(),
+            "protect_content": "true",
+            "reply_parameters": ReplyParameters(42).to_json(),
+            "extra": "kwarg",
+        }
+        assert json_parameters[1]["chat_id"] == "2"
+        assert json_parameters[1]["message_thread_id"] == "3"
+        assert "reply_parameters" not in json_parameters[1]
+
+    async def test_send_message_template_encodes_only_once(
+        self, offline_bot, template, monkeypatch
+    ):
+        response = Message(1, dtm.datetime.now(dtm.timezone.utc), Chat(1, Chat.PRIVATE)).to_dict()
+
+        async def make_assertion(url, request_data: RequestData, *args, **kwargs):
+            _ = request_data.json_parameters
+            return response
+
+        def to_dict(*args, **kwargs):
+            pytest.fail("The parameters of the template were converted again")
+
+        monkeypatch.setattr(offline_bot.request, "post", make_assertion)
+        monkeypatch.setattr(TelegramObject, "to_dict", to_dict)
+        for chat_id in range(3):
+            await offline_bot.send_message_template(chat_id, template)
+
+    async def test_defaults_and_callback_data(self, bot_info, monkeypatch):
+        bot = make_bot(
+            bot_info, defaults=Defaults(parse_mode="HTML"), arbitrary_callback_data=True
+        )
+        reply_markup = InlineKeyboardMarkup.from_button(
+            InlineKeyboardButton("button", callback_data=("some", "data"))
+        )
+        template = bot.create_message_template("text", reply_markup=reply_markup)
+        # The defaults are inserted on creation
+        assert template._parameters["parse_mode"].value == "HTML"
+        assert len(bot.callback_data_cache.persistence_data[0]) == 1
+
+        async def make_assertion(url, request_data: RequestData, *args, **kwargs):
+            return message_from_request(request_data)
+
+        monkeypatch.setattr(bot.request, "post", make_assertion)
+        for chat_id in range(2):
+            message = await bot.send_message_template(chat_id, template)
+            assert message.reply_markup == reply_markup
+        # All messages share the same keyboard
+        assert len(bot.callback_data_cache.persistence_data[0]) == 1
+
+    async def test_callback_data_dropped_for_all(self, bot_info, monkeypatch):
+        bot = make_bot(bot_info, arbitrary_callback_data=True)
+        reply_markup = InlineKeyboardMarkup.from_button(
+            InlineKeyboardButton("button", callback_data="data")
+        )
+        template = bot.create_message_template("text", reply_markup=reply_markup)
+        sent_callback_data = []
+
+        async def make_assertion(url, request_data: RequestData, *args, **kwargs):
+            sent_callback_data.append(
+                request_data.parameters["reply_markup"]["inline_keyboard"][0][0]["callback_data"]
+            )
+            return message_from_request(request_data)
+
+        monkeypatch.setattr(bot.request, "post", make_assertion)
+        for chat_id in range(2):
+            await bot.send_message_template(chat_id, template)
+        assert sent_callback_data[0] == sent_callback_data[1]
+
+        # The first recipient presses the button and the data is dropped afterwards
+        first_query = CallbackQuery("1", None, "1", data=sent_callback_data[0])
+        bot.callback_data_cache.process_callback_query(first_query)
+        assert first_query.data == "data"
+        bot.callback_data_cache.drop_data(first_query)
+
+        # ... which invalidates the button of the second recipient as well
+        second_query = CallbackQuery("2", None, "2", data=sent_callback_data[1])
+        bot.callback_data_cache.process_callback_query(second_query)
+        assert isinstance(second_query.data, InvalidCallbackData)
+
+    async def test_created_manually(self):
+        template = MessageTemplate({"text": "text", "disable_notification": True})
+        assert template.text == "text"
+        assert template._parameters["disable_notification"].json_value == "true"
@@ -17,13 +17,18 @@
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This tests whether our submodules have __all__ or not.
-Additionally also tests if all public submodules are included in __all__ for __init__'s.
+Additionally also tests if all public submodules are included in __all__ for __init__'s and that
+the public names of the packages are imported lazily.
 """
 
 import importlib
 import os
+import subprocess
+import sys
 from pathlib import Path
 
+import pytest
+
 from tests.auxil.files import SOURCE_ROOT_PATH
 
 
@@ -65,3 +70,109 @@ def load_module(path: Path):
 
 def get_public_submodules_in_folder(path: Path):
     return [i.stem for i in path.glob("[!_]*.py")]
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess:
+    """Runs the python interpreter in a fresh process, such that no modules are imported yet."""
+    return subprocess.run(
+        [sys.executable, *args],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": str(SOURCE_ROOT_PATH.parent)},
+    )
+
+
+@pytest.mark.parametrize("package", ["telegram", "telegram.ext"])
+@pytest.mark.parametrize("order", ["", "reversed"])
+def test_lazy_public_names(package, order):
+    # Accessing the names in a fresh interpreter makes sure that there are no circular imports
+    # that are hidden by the modules that were already imported
+    run_python(
+        "-c",
+        f"""
+import {package} as mod
+
+assert set(mod.__all__) <= set(dir(mod))
+for name in {order}(mod.__all__):
+    obj = getattr(mod, name)
+    # once imported, the name is stored in the namespace of the package
+    assert vars(mod)[name] is obj
+""",
+    )
+
+    mod = importlib.import_module(package)
+    with pytest.raises(AttributeError, match=f"module '{package}' has no attribute 'FooBar'"):
+        mod.FooBar
+
+
+@pytest.mark.parametrize(
+    ("package", "eager_names"),
+    [
+        (
+            "telegram",
+            {
+                "constants",
+                "__version__",
+                "__version_info__",
+                "__bot_api_version__",
+                "__bot_api_version_info__",
+            },
+        ),
+        ("telegram.ext", set()),
+    ],
+)
+def test_lazy_imports_match_dunder_all(package, eager_names):
+    # Makes sure that the names in __all__ and the names that are imported lazily don't get out of
+    # sync when names are added or removed
+    run_python(
+        "-c",
+        f"""
+import importlib
+import {package} as mod
+
+lazy_names = [name for names in mod._LAZY_IMPORTS.values() for name in names]
+lazy_names.extend(mod._LAZY_SUBMODULES)
+assert len(lazy_names) == len(set(lazy_names)), "Some names are imported lazily twice"
+assert len(mod.__all__) == len(set(mod.__all__)), "__all__ contains duplicates"
+
+eager_names = {eager_names!r}
+assert eager_names <= set(vars(mod)), "The eager names are not imported eagerly"
+assert not eager_names & set(lazy_names), "Some names are imported both eagerly and lazily"
+assert set(mod.__all__) == eager_names | set(lazy_names), (
+    set(mod.__all__) ^ (eager_names | set(lazy_names))
+)
+
+for module_name, names in mod._LAZY_IMPORTS.items():
+    module = importlib.import_module(module_name, mod.__name__)
+    for name in names:
+        assert getattr(mod, name) is getattr(module, name), name
+for name in mod._LAZY_SUBMODULES:
+    assert getattr(mod, name) is importlib.import_module(f"{{mod.__name__}}.{{name}}"), name
+""",
+    )
+
+
+@pytest.mark.parametrize(
+    ("statement", "expected", "not_expected"),
+    [
+        ("import telegram", set(), {"telegram._bot", "telegram._message", "telegram.request"}),
+        ("import telegram.ext", set(), {"telegram._bot", "telegram.ext._application"}),
+        ("from telegram import User", {"telegram._user"}, {"telegram._bot"}),
+        ("from telegram.constants import ParseMode", {"telegram.constants"}, {"telegram._bot"}),
+        ("from telegram.ext import filters", {"telegram.ext.filters"}, {"telegram._bot"}),
+    ],
+)
+def test_import_time(statement, expected, not_expected):
+    # Uses `python -X importtime` to make sure that importing the package doesn't import all the
+    # modules of the package. This is what dominates the startup time.
+    result = run_python("-X", "importtime", "-c", statement)
+    # Lines have the format "import time: <self [us]> | <cumulative> | <module name>"
+    imported = {
+        line.rsplit("|", 1)[-1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+    assert "telegram" in imported
+    assert expected <= imported
+    assert not not_expected & imported
@@ -33,7 +33,8 @@ if TYPE_CHECKING:
     from tests.test_official.scraper import TelegramParameter
 
 
-tg_objects = vars(telegram)
+# The public names of `telegram` are imported lazily, so `vars` would miss most of them
+tg_objects = {name: getattr(telegram, name) for name in dir(telegram)}
 tg_objects.update(vars(telegram._utils.types))
 tg_objects.update(vars(telegram._utils.defaultvalue))
 
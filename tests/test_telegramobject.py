@@ -21,7 +21,7 @@ import inspect
 import pickle
 import re
 from collections.abc import Sequence
-from copy import deepcopy
+from copy import copy, deepcopy
 from pathlib import Path
 from types import MappingProxyType
 
@@ -31,13 +31,17 @@ from telegram import (
     Bot,
     BotCommand,
     Chat,
+    LinkPreviewOptions,
     Message,
+    MessageEntity,
     MessageOrigin,
     MessageOriginUser,
     PhotoSize,
     TelegramObject,
     User,
+    warmup,
 )
+from telegram._telegramobject import _DATETIME_FIELD
 from telegram._utils.defaultvalue import DEFAULT_FALSE, DEFAULT_NONE, DefaultValue
 from telegram._utils.types import JSONDict
 from telegram.ext import PicklePersistence
@@ -329,6 +333,46 @@ class TestDeJsonWithoutRequest:
         assert isinstance(telegram_objects, tuple)
         assert [telegram_object.value for telegram_object in telegram_objects] == [1, 2]
 
+    def test_warmup_builds_plans(self):
+        class WarmupTestObject(TelegramObject):
+            __slots__ = ("_private", "date", "user")
+
+            def __init__(
+                self, date: dtm.datetime, user: User, *, api_kwargs: JSONDict | None = None
+            ):
+                super().__init__(api_kwargs=api_kwargs)
+                self.date = date
+                self.user = user
+                self._private = None
+
+        assert "__DE_JSON_PLAN__" not in WarmupTestObject.__dict__
+        assert "__ATTR_NAMES__" not in WarmupTestObject.__dict__
+        warmup()
+
+        for cls in all_subclasses(TelegramObject):
+            assert "__DE_JSON_PLAN__" in cls.__dict__
+            assert "__ATTR_NAMES__" in cls.__dict__
+
+        plan = WarmupTestObject.__DE_JSON_PLAN__
+        assert plan == {"user": User, "date": _DATETIME_FIELD}
+        attr_names = WarmupTestObject.__ATTR_NAMES__
+        assert attr_names == (
+            (
+                "_private",
+                "date",
+                "user",
+                "_bot",
+                "_deeply_immutable",
+                "_frozen",
+                "_id_attrs",
+                "api_kwargs",
+            ),
+            ("date", "user", "api_kwargs"),
+            ("_private", "date", "user", "_id_attrs"),
+        )
+        # calling it again is fine
+        warmup()
+
 
 class TestTelegramObject:
     class Sub(TelegramObject):
@@ -338,6 +382,23 @@ class TestTelegramObject:
             self.normal = normal
             self._bot = b
 
+    class CustomState(TelegramObject):
+        __slots__ = ("value",)
+
+        def __init__(self, value):
+            super().__init__()
+            self.value = value
+            self._freeze()
+
+        def __getstate__(self):
+            state = super().__getstate__()
+            state["value"] = state["value"].upper()
+            return state
+
+        def __setstate__(self, state):
+            state["value"] = f"restored {state['value']}"
+            super().__setstate__(state)
+
     class ChangingTO(TelegramObject):
         # Don't use in any tests, this is just for testing the pickle behaviour and the
         # class is altered during the test procedure
@@ -453,6 +514,23 @@ class TestTelegramObject:
         subclass_instance = TelegramObjectSubclass()
         assert subclass_instance.to_dict() == {"a": 1}
 
+    def test_attr_names_without_slots(self):
+        class TelegramObjectSubclass(TelegramObject):
+            def __init__(self):
+                super().__init__()
+                self.a = 1
+                self._b = 2
+
+        first = TelegramObjectSubclass()
+        assert first.to_dict() == {"a": 1}
+        assert "_b" in first.__getstate__()
+
+        # the attribute names of the slots are cached, but __dict__ is read on every call
+        second = TelegramObjectSubclass()
+        second.c = 3
+        assert second.to_dict() == {"a": 1, "c": 3}
+        assert first.to_dict() == {"a": 1}
+
     def test_to_dict_api_kwargs(self):
         to = TelegramObject(api_kwargs={"foo": "bar"})
         assert to.to_dict() == {"foo": "bar"}
@@ -504,6 +582,40 @@ class TestTelegramObject:
         assert "default_none" not in to_dict
         assert to_dict["default_false"] is False
 
+    def test_to_dict_conversions(self):
+        date = dtm.datetime(2020, 1, 1, tzinfo=dtm.timezone.utc)
+        user = User(1, "name", False)
+        message = Message(
+            1,
+            date,
+            Chat(1, "private"),
+            from_user=user,
+            text="text",
+            entities=[MessageEntity("bold", 0, 1)],
+            photo=[],
+            api_kwargs={"api": "kwargs"},
+        )
+
+        message_dict = message.to_dict()
+        assert message_dict["date"] == 1577836800
+        assert message_dict["chat"] == {"id": 1, "type": "private"}
+        assert message_dict["entities"] == [{"type": "bold", "offset": 0, "length": 1}]
+        assert message_dict["from"] == user.to_dict()
+        assert message_dict["api"] == "kwargs"
+        assert "from_user" not in message_dict
+        assert "photo" not in message_dict
+        assert "caption" not in message_dict
+        # from_user is renamed to from and added after the other attributes
+        assert list(message_dict)[-2:] == ["from", "api"]
+
+        message_dict = message.to_dict(recursive=False)
+        assert message_dict["from_user"] is user
+        assert message_dict["chat"] is message.chat
+        assert message_dict["entities"] == [message.entities[0].to_dict(recursive=False)]
+        assert message_dict["date"] == 1577836800
+        assert message_dict["caption"] is None
+        assert "photo" not in message_dict
+
     def test_slot_behaviour(self):
         inst = TelegramObject()
         for attr in inst.__slots__:
@@ -611,6 +723,50 @@ class TestTelegramObject:
         assert obj.foo == "bar"
         assert obj.api_kwargs == {}
 
+    def test_pickle_compact(self):
+        users = [User(i, "name", False) for i in range(10)]
+        users[0]._unfreeze()
+        pickled = pickle.dumps(users)
+        # The attribute names are stored once per class, not once per object
+        assert pickled.count(b"first_name") == 1
+
+        unpickled = pickle.loads(pickled)
+        assert unpickled == users
+        assert [u.first_name for u in unpickled] == ["name"] * 10
+        assert not unpickled[0]._frozen
+        assert all(u._frozen for u in unpickled[1:])
+
+    def test_pickle_dict_attributes(self):
+        obj = self.Sub("private", "normal", None)
+        obj.extra = "extra"
+        unpickled = pickle.loads(pickle.dumps(obj))
+        assert unpickled._private == "private"
+        assert unpickled.normal == "normal"
+        assert unpickled.extra == "extra"
+
+    def test_pickle_custom_state(self):
+        obj = self.CustomState("value")
+        assert pickle.loads(pickle.dumps(obj)).value == "restored VALUE"
+        assert copy(obj).value == "restored VALUE"
+        assert copy(obj)._frozen
+
+    def test_pickle_unknown_version(self):
+        func, args = User(1, "first_name", False).__reduce__()
+        with pytest.raises(ValueError, match="Unknown version 0 of the pickled state of User"):
+            func(0, *args[1:])
+
+    def test_copy(self, bot):
+        user = User(1, "first_name", False, api_kwargs={"api": "kwargs"})
+        user.set_bot(bot)
+        copied = copy(user)
+        assert copied is not user
+        assert copied == user
+        assert copied.first_name == user.first_name
+        assert copied.api_kwargs == {"api": "kwargs"}
+        assert copied._frozen
+        with pytest.raises(RuntimeError):
+            copied.get_bot()
+
     async def test_pickle_backwards_compatibility(self):
         """Test when newer versions of the library remove or add attributes from classes (which
         the old pickled versions still/don't have).
@@ -751,6 +907,75 @@ class PicklePropertyTest(TelegramObject):
         new_message.text = "new text"
         assert new_message.text == "new text"
 
+    def test_deeply_immutable(self):
+        user = User(3, "first_name", False)
+        msg = Message(
+            1,
+            dtm.datetime.now(),
+            Chat(2, Chat.PRIVATE),
+            from_user=user,
+            text="foobar",
+            entities=[MessageEntity(MessageEntity.BOLD, 0, 3)],
+            link_preview_options=LinkPreviewOptions(is_disabled=True),
+            api_kwargs={"foo": ("bar", 1)},
+        )
+        assert user._is_deeply_immutable()
+        assert msg._is_deeply_immutable()
+
+        # Unfrozen objects are not immutable
+        with msg._unfrozen():
+            assert not msg._is_deeply_immutable()
+            msg.reply_markup = [[1]]
+        # ... and the objects are checked again after changes
+        assert not msg._is_deeply_immutable()
+
+        # Unfreezing a contained object also affects the containing objects
+        msg = Message(1, dtm.datetime.now(), Chat(2, Chat.PRIVATE), from_user=user)
+        assert msg._is_deeply_immutable()
+        with msg.chat._unfrozen():
+            assert not msg._is_deeply_immutable()
+        assert msg._is_deeply_immutable()
+
+    def test_deeply_immutable_private_attributes(self):
+        class Sub(TelegramObject):
+            __slots__ = ("_private",)
+
+            def __init__(self, private):
+                super().__init__()
+                self._private = private
+                self._freeze()
+
+        assert Sub(("immutable",))._is_deeply_immutable()
+        assert not Sub(["mutable"])._is_deeply_immutable()
+
+    def test_deepcopy_independent(self, bot):
+        user = User(3, "first_name", False)
+        user.set_bot(bot)
+        msg = Message(1, dtm.datetime.now(), Chat(2, Chat.PRIVATE), from_user=user)
+        assert msg._is_deeply_immutable()
+        data = {"message": msg, "list": [user]}
+
+        new_data = deepcopy(data)
+        assert new_data == data
+        assert new_data["message"] is not msg
+        assert new_data["list"][0] is not user
+        # Objects contained multiple times are copied once
+        assert new_data["message"].from_user is new_data["list"][0]
+        assert new_data["list"][0].get_bot() is bot
+
+        # Changing the copy does not change the original
+        new_user = new_data["message"].from_user
+        with new_user._unfrozen():
+            new_user.first_name = "changed"
+        assert user.first_name == "first_name"
+
+    def test_deeply_immutable_not_pickled(self):
+        user = User(3, "first_name", False)
+        assert user._is_deeply_immutable()
+        assert "_deeply_immutable" not in user.__getstate__()
+        unpickled = pickle.loads(pickle.dumps(user))
+        assert unpickled._is_deeply_immutable()
+
     def test_deepcopy_subclass_telegram_obj(self, bot):
         s = self.Sub("private", "normal", bot)
         d = deepcopy(s)
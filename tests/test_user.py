@@ -18,7 +18,7 @@
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 import pytest
 
-from telegram import Bot, InlineKeyboardButton, Update, User
+from telegram import Bot, InlineKeyboardButton, Update, User, set_interning
 from telegram.helpers import escape_markdown
 from tests.auxil.bot_method_checks import (
     check_defaults_handling,
@@ -125,6 +125,36 @@ class TestUserWithoutRequest(UserTestBase):
         assert user.can_manage_bots == self.can_manage_bots
         assert user.supports_guest_queries == self.supports_guest_queries
 
+    def test_de_json_interned(self, json_dict, offline_bot):
+        # Interning is disabled by default
+        assert User.de_json(json_dict, offline_bot) is not User.de_json(json_dict, offline_bot)
+
+        set_interning(True)
+        try:
+            user = User.de_json(json_dict, offline_bot)
+            assert User.de_json(dict(json_dict), offline_bot) is user
+            assert User.de_json(json_dict, None) is not user
+            assert User.de_json({**json_dict, "first_name": "other"}, offline_bot) is not user
+
+            user._unfreeze()
+            assert User.de_json(json_dict, offline_bot) is not user
+        finally:
+            set_interning(False)
+
+    def test_de_json_interning_disabled(self, json_dict, offline_bot):
+        set_interning(True)
+        try:
+            user = User.de_json(json_dict, offline_bot)
+            assert User.de_json(json_dict, offline_bot) is user
+            set_interning(False)
+            assert User.de_json(json_dict, offline_bot) is not user
+            assert User.de_json(json_dict, offline_bot) is not User.de_json(json_dict, offline_bot)
+            # The previously interned objects were removed
+            set_interning(True)
+            assert User.de_json(json_dict, offline_bot) is not user
+        finally:
+            set_interning(False)
+
     def test_to_dict(self, user):
         user_dict = user.to_dict()
 